@@ -112,6 +112,8 @@ psql -v ON_ERROR_STOP=1 --username "$POSTGRES_USER" --dbname "$TEST_DB_NAME" <<-
         tapology_url VARCHAR,
         latitude FLOAT,
         longitude FLOAT,
+        detail_scraped_at TIMESTAMP,
+        match_stats_scraped_at TIMESTAMP,
         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
         updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
     );
@@ -250,6 +252,8 @@ psql -v ON_ERROR_STOP=1 --username "$POSTGRES_USER" --dbname "$TEST_DB_NAME" <<-
         id SERIAL PRIMARY KEY,
         user_id INTEGER NOT NULL,
         title TEXT,
+        last_activity_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        message_count INTEGER NOT NULL DEFAULT 0,
         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
         updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
 
@@ -275,6 +279,7 @@ psql -v ON_ERROR_STOP=1 --username "$POSTGRES_USER" --dbname "$TEST_DB_NAME" <<-
     -- 인덱스 생성
     CREATE INDEX IF NOT EXISTS idx_fighter_name ON fighter(name);
     CREATE INDEX IF NOT EXISTS idx_fighter_tapology_url ON fighter(tapology_url);
+    CREATE UNIQUE INDEX IF NOT EXISTS uq_fighter_detail_url ON fighter(detail_url) WHERE detail_url IS NOT NULL;
     CREATE INDEX IF NOT EXISTS idx_fighter_promotion_record_fighter_id ON fighter_promotion_record(fighter_id);
     CREATE INDEX IF NOT EXISTS idx_fighter_promotion_record_name ON fighter_promotion_record(promotion_name);
     CREATE UNIQUE INDEX IF NOT EXISTS uq_fighter_promotion_record_key ON fighter_promotion_record(fighter_id, promotion_name);
@@ -283,16 +288,22 @@ psql -v ON_ERROR_STOP=1 --username "$POSTGRES_USER" --dbname "$TEST_DB_NAME" <<-
     CREATE INDEX IF NOT EXISTS idx_match_event_id ON match(event_id);
     CREATE INDEX IF NOT EXISTS idx_match_weight_class_id ON match(weight_class_id);
     CREATE INDEX IF NOT EXISTS idx_match_tapology_bout_url ON match(tapology_bout_url);
+    CREATE UNIQUE INDEX IF NOT EXISTS uq_match_detail_url ON match(detail_url) WHERE detail_url IS NOT NULL;
     CREATE INDEX IF NOT EXISTS idx_match_bout_status ON match(bout_status);
     CREATE INDEX IF NOT EXISTS idx_fighter_match_fighter_id ON fighter_match(fighter_id);
     CREATE INDEX IF NOT EXISTS idx_fighter_match_match_id ON fighter_match(match_id);
+    CREATE UNIQUE INDEX IF NOT EXISTS uq_fighter_match_fighter_match ON fighter_match(fighter_id, match_id);
     CREATE INDEX IF NOT EXISTS idx_ranking_fighter_id ON ranking(fighter_id);
     CREATE INDEX IF NOT EXISTS idx_strike_detail_fighter_match_id ON strike_detail(fighter_match_id);
+    CREATE UNIQUE INDEX IF NOT EXISTS uq_strike_detail_fm_round ON strike_detail(fighter_match_id, round);
     CREATE INDEX IF NOT EXISTS idx_match_statistics_fighter_match_id ON match_statistics(fighter_match_id);
+    CREATE UNIQUE INDEX IF NOT EXISTS uq_match_statistics_fm_round ON match_statistics(fighter_match_id, round);
     CREATE INDEX IF NOT EXISTS idx_user_email ON "user"(email);
     CREATE INDEX IF NOT EXISTS idx_user_provider_id ON "user"(provider_id);
     CREATE INDEX IF NOT EXISTS idx_conversation_user_id ON conversation(user_id);
+    CREATE INDEX IF NOT EXISTS idx_conversation_user_activity ON conversation(user_id, last_activity_at DESC, id DESC);
     CREATE INDEX IF NOT EXISTS idx_message_conversation_id ON message(conversation_id);
+    CREATE INDEX IF NOT EXISTS idx_message_conversation_created ON message(conversation_id, created_at, id);
     CREATE INDEX IF NOT EXISTS idx_message_message_id ON message(message_id);
     CREATE INDEX IF NOT EXISTS idx_message_created_at ON message(created_at);
     CREATE INDEX IF NOT EXISTS idx_message_role ON message(role);
@@ -308,6 +319,30 @@ if [ -f "$VIEW_SQL" ]; then
     echo "✅ [INIT] SQL agent views applied to test database"
 fi
 
+STATS_VIEW_SQL="/docker-entrypoint-initdb.d/07_create_dashboard_stats_views.sql"
+if [ -f "$STATS_VIEW_SQL" ]; then
+    echo "🔧 [INIT] Applying dashboard stats views to test database..."
+    psql -v ON_ERROR_STOP=1 --username "$POSTGRES_USER" --dbname "$TEST_DB_NAME" -f "$STATS_VIEW_SQL"
+    echo "✅ [INIT] Dashboard stats views applied to test database"
+fi
+
+# 파이터 이름 fuzzy 검색용 pg_trgm 인덱스 (09_add_fighter_trigram_search.sql)
+# contrib 패키지가 없는 서버에서는 건너뜀 (검색은 ILIKE로 동작)
+TRGM_AVAILABLE=$(psql -tA --username "$POSTGRES_USER" --dbname "$TEST_DB_NAME" \
+    -c "SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+
+if [ "$TRGM_AVAILABLE" = "1" ]; then
+    echo "🔧 [INIT] Creating fighter trigram search indexes..."
+
+    psql -v ON_ERROR_STOP=1 --username "$POSTGRES_USER" --dbname "$TEST_DB_NAME" <<-EOSQL
+        CREATE EXTENSION IF NOT EXISTS pg_trgm;
+        CREATE INDEX IF NOT EXISTS idx_fighter_name_trgm ON fighter USING gin (lower(name) gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS idx_fighter_nickname_trgm ON fighter USING gin (lower(nickname) gin_trgm_ops);
+EOSQL
+else
+    echo "⚠️ [INIT] pg_trgm is not available, skipping fighter trigram search indexes"
+fi
+
 # weight_class 기본 데이터 삽입
 echo "🔧 [INIT] Seeding weight_class data..."
 
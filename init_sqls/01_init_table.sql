@@ -87,7 +87,9 @@ CREATE TABLE IF NOT EXISTS event (
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     latitude FLOAT,
     longitude FLOAT,
-    tapology_url VARCHAR
+    tapology_url VARCHAR,
+    detail_scraped_at TIMESTAMP,
+    match_stats_scraped_at TIMESTAMP
 );
 
 -- match 테이블
@@ -299,3 +301,23 @@ CREATE INDEX IF NOT EXISTS idx_message_role ON message(role);
 ALTER TABLE conversation ADD COLUMN IF NOT EXISTS compressed_context TEXT;
 ALTER TABLE conversation ADD COLUMN IF NOT EXISTS compressed_sql_context JSONB;
 ALTER TABLE conversation ADD COLUMN IF NOT EXISTS compressed_until_message_id VARCHAR;
+
+-- 세션 목록/히스토리 keyset 페이지네이션용 대화 활동 정보 (10_add_conversation_activity.sql)
+ALTER TABLE conversation ADD COLUMN IF NOT EXISTS last_activity_at TIMESTAMP;
+ALTER TABLE conversation ADD COLUMN IF NOT EXISTS message_count INTEGER NOT NULL DEFAULT 0;
+
+UPDATE conversation c
+SET last_activity_at = COALESCE(
+        (SELECT MAX(m.created_at) FROM message m WHERE m.conversation_id = c.id),
+        c.updated_at,
+        c.created_at,
+        CURRENT_TIMESTAMP
+    ),
+    message_count = (SELECT COUNT(*) FROM message m WHERE m.conversation_id = c.id)
+WHERE c.last_activity_at IS NULL;
+
+ALTER TABLE conversation ALTER COLUMN last_activity_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE conversation ALTER COLUMN last_activity_at SET NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_conversation_user_activity ON conversation(user_id, last_activity_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_message_conversation_created ON message(conversation_id, created_at, id);
@@ -0,0 +1,180 @@
+-- Dashboard aggregate materialized views.
+-- Chart queries in dashboard/repositories.py read these instead of re-aggregating
+-- fighter_match / match_statistics / strike_detail on every cache miss.
+-- Refreshed (CONCURRENTLY) at the end of ufc_stats_flow. Safe to run repeatedly.
+
+-- 파이터별 집계: weight_class_id = 0 은 전체 체급 합계 행
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_fighter_stats AS
+WITH basic AS (
+    SELECT
+        fighter_match_id,
+        SUM(sig_str_landed) AS sig_str_landed,
+        SUM(sig_str_attempted) AS sig_str_attempted,
+        SUM(td_landed) AS td_landed,
+        SUM(td_attempted) AS td_attempted,
+        SUM(knockdowns) AS knockdowns,
+        SUM(submission_attempts) AS submission_attempts,
+        BOOL_OR(knockdowns > 0) AS has_knockdown
+    FROM match_statistics
+    GROUP BY fighter_match_id
+),
+strikes AS (
+    SELECT
+        fighter_match_id,
+        SUM(ground_strikes_landed) AS ground_strikes_landed,
+        SUM(ground_strikes_attempts) AS ground_strikes_attempts
+    FROM strike_detail
+    GROUP BY fighter_match_id
+),
+exchange AS (
+    -- 같은 라운드끼리 매칭한 본인 유효타 / 상대 유효타
+    SELECT
+        fm_mine.id AS fighter_match_id,
+        SUM(ms_mine.sig_str_landed) AS sig_landed,
+        SUM(ms_opp.sig_str_landed) AS sig_absorbed
+    FROM fighter_match fm_mine
+    JOIN fighter_match fm_opp
+        ON fm_mine.match_id = fm_opp.match_id AND fm_mine.id != fm_opp.id
+    JOIN match_statistics ms_mine ON fm_mine.id = ms_mine.fighter_match_id
+    JOIN match_statistics ms_opp
+        ON fm_opp.id = ms_opp.fighter_match_id AND ms_mine.round = ms_opp.round
+    GROUP BY fm_mine.id
+),
+opp_td AS (
+    SELECT
+        fm_mine.id AS fighter_match_id,
+        SUM(ms_opp.td_attempted) AS opp_td_attempted,
+        SUM(ms_opp.td_landed) AS opp_td_landed
+    FROM fighter_match fm_mine
+    JOIN fighter_match fm_opp
+        ON fm_mine.match_id = fm_opp.match_id AND fm_mine.id != fm_opp.id
+    JOIN match_statistics ms_opp ON fm_opp.id = ms_opp.fighter_match_id
+    WHERE ms_opp.round > 0
+    GROUP BY fm_mine.id
+),
+per_fight AS (
+    SELECT
+        fm.fighter_id,
+        m.weight_class_id,
+        fm.result,
+        m.method,
+        b.fighter_match_id AS basic_id,
+        b.sig_str_landed,
+        b.sig_str_attempted,
+        b.td_landed,
+        b.td_attempted,
+        b.knockdowns,
+        b.submission_attempts,
+        b.has_knockdown,
+        s.fighter_match_id AS strikes_id,
+        s.ground_strikes_landed,
+        s.ground_strikes_attempts,
+        x.fighter_match_id AS exchange_id,
+        x.sig_landed,
+        x.sig_absorbed,
+        o.fighter_match_id AS opp_td_id,
+        o.opp_td_attempted,
+        o.opp_td_landed
+    FROM fighter_match fm
+    JOIN match m ON fm.match_id = m.id
+    LEFT JOIN basic b ON b.fighter_match_id = fm.id
+    LEFT JOIN strikes s ON s.fighter_match_id = fm.id
+    LEFT JOIN exchange x ON x.fighter_match_id = fm.id
+    LEFT JOIN opp_td o ON o.fighter_match_id = fm.id
+)
+SELECT
+    pf.fighter_id,
+    CASE WHEN GROUPING(pf.weight_class_id) = 1 THEN 0 ELSE pf.weight_class_id END AS weight_class_id,
+    f.name,
+    COUNT(*) AS total_fights,
+    COUNT(*) FILTER (WHERE pf.result = 'win') AS wins,
+    COUNT(*) FILTER (WHERE pf.result = 'loss') AS losses,
+    COUNT(*) FILTER (WHERE pf.result = 'draw') AS draws,
+    COUNT(*) FILTER (WHERE pf.result = 'win' AND pf.method LIKE 'KO/TKO%') AS ko_tko_wins,
+    COUNT(*) FILTER (WHERE pf.result = 'win' AND pf.method LIKE 'SUB-%') AS sub_wins,
+    -- match_statistics 기반
+    COUNT(pf.basic_id) AS stat_fights,
+    SUM(pf.sig_str_landed) AS sig_str_landed,
+    SUM(pf.sig_str_attempted) AS sig_str_attempted,
+    SUM(pf.td_landed) AS td_landed,
+    SUM(pf.td_attempted) AS td_attempted,
+    SUM(pf.knockdowns) AS knockdowns,
+    COUNT(*) FILTER (WHERE pf.has_knockdown) AS knockdown_fights,
+    SUM(pf.submission_attempts) AS submission_attempts,
+    COUNT(*) FILTER (
+        WHERE pf.basic_id IS NOT NULL AND pf.result = 'win' AND pf.method LIKE 'SUB-%'
+    ) AS stat_sub_wins,
+    -- strike_detail 기반
+    COUNT(pf.strikes_id) AS strike_detail_fights,
+    SUM(pf.ground_strikes_landed) AS ground_strikes_landed,
+    SUM(pf.ground_strikes_attempts) AS ground_strikes_attempts,
+    -- 상대 기록 기반
+    COUNT(pf.exchange_id) AS exchange_fights,
+    SUM(pf.sig_landed) AS exchange_sig_landed,
+    SUM(pf.sig_absorbed) AS exchange_sig_absorbed,
+    COUNT(pf.opp_td_id) AS opp_td_fights,
+    SUM(pf.opp_td_attempted) AS opp_td_attempted,
+    SUM(pf.opp_td_landed) AS opp_td_landed
+FROM per_fight pf
+JOIN fighter f ON pf.fighter_id = f.id
+GROUP BY GROUPING SETS ((pf.fighter_id, f.name, pf.weight_class_id), (pf.fighter_id, f.name))
+HAVING GROUPING(pf.weight_class_id) = 1 OR pf.weight_class_id IS NOT NULL;
+
+-- REFRESH ... CONCURRENTLY 에 필요한 unique index (체급 필터 조회에도 사용)
+CREATE UNIQUE INDEX IF NOT EXISTS uq_mv_fighter_stats_wc_fighter
+    ON mv_fighter_stats(weight_class_id, fighter_id);
+
+-- 체급별 집계
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_weight_class_stats AS
+WITH bouts AS (
+    SELECT
+        m.weight_class_id,
+        COUNT(*) AS total_fights,
+        COUNT(*) FILTER (WHERE m.method LIKE 'KO/TKO%') AS ko_tko_count,
+        COUNT(*) FILTER (WHERE m.method LIKE 'SUB-%') AS sub_count
+    FROM match m
+    WHERE m.method IS NOT NULL
+    GROUP BY m.weight_class_id
+),
+stats AS (
+    SELECT
+        m.weight_class_id,
+        COUNT(DISTINCT fm.match_id) AS stat_fights,
+        SUM(ms.sig_str_landed) AS sig_str_landed,
+        COUNT(*) FILTER (WHERE ms.control_time_seconds > 0) AS control_rounds,
+        SUM(ms.control_time_seconds) FILTER (WHERE ms.control_time_seconds > 0) AS control_time_seconds,
+        COUNT(DISTINCT fm.match_id) FILTER (WHERE ms.control_time_seconds > 0) AS control_fights
+    FROM match_statistics ms
+    JOIN fighter_match fm ON ms.fighter_match_id = fm.id
+    JOIN match m ON fm.match_id = m.id
+    GROUP BY m.weight_class_id
+)
+SELECT
+    wc.id AS weight_class_id,
+    wc.name AS weight_class,
+    COALESCE(b.total_fights, 0) AS total_fights,
+    COALESCE(b.ko_tko_count, 0) AS ko_tko_count,
+    COALESCE(b.sub_count, 0) AS sub_count,
+    COALESCE(s.stat_fights, 0) AS stat_fights,
+    s.sig_str_landed,
+    COALESCE(s.control_rounds, 0) AS control_rounds,
+    s.control_time_seconds,
+    COALESCE(s.control_fights, 0) AS control_fights
+FROM weight_class wc
+LEFT JOIN bouts b ON b.weight_class_id = wc.id
+LEFT JOIN stats s ON s.weight_class_id = wc.id;
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_mv_weight_class_stats_wc
+    ON mv_weight_class_stats(weight_class_id);
+
+-- Dashboard read paths may run on the readonly account.
+-- The role is created by 02_create_readonly_user.sh; skip the grant where it does not exist
+-- (test databases, CI) so the views can still be created there.
+\set dashboard_readonly_user `printf '%s' "${DB_READONLY_USER:-mma_readonly}"`
+
+SELECT format(
+    'GRANT SELECT ON mv_fighter_stats, mv_weight_class_stats TO %I',
+    :'dashboard_readonly_user'
+)
+WHERE EXISTS (SELECT 1 FROM pg_roles WHERE rolname = :'dashboard_readonly_user')
+\gexec
@@ -0,0 +1,6 @@
+-- Per-event UFCStats scrape state for incremental event-detail / match-detail runs.
+-- An event is re-scraped until it has been scraped once after its settle window
+-- (event_date + UFCSTATS_EVENT_SETTLE_DAYS). Safe to run repeatedly.
+
+ALTER TABLE event ADD COLUMN IF NOT EXISTS detail_scraped_at TIMESTAMP;
+ALTER TABLE event ADD COLUMN IF NOT EXISTS match_stats_scraped_at TIMESTAMP;
@@ -0,0 +1,16 @@
+-- Fuzzy fighter name search (fighter/repositories.search_fighters_by_name).
+-- Trigram GIN indexes on the lower-cased name/nickname serve both the ILIKE
+-- substring match and the pg_trgm word-similarity (<%) match. Safe to run repeatedly.
+-- Skipped when the server has no pg_trgm (contrib) package; search then uses ILIKE only.
+
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm') THEN
+        CREATE EXTENSION IF NOT EXISTS pg_trgm;
+        CREATE INDEX IF NOT EXISTS idx_fighter_name_trgm ON fighter USING gin (lower(name) gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS idx_fighter_nickname_trgm ON fighter USING gin (lower(nickname) gin_trgm_ops);
+    ELSE
+        RAISE NOTICE 'pg_trgm is not available, skipping fighter trigram search indexes';
+    END IF;
+END
+$$;
@@ -0,0 +1,22 @@
+-- Denormalized conversation activity for keyset-paginated session lists / chat history.
+-- last_activity_at: latest message time (creation time when empty), message_count: number of messages.
+-- Both are maintained by conversation/repositories on message insert. Safe to run repeatedly.
+
+ALTER TABLE conversation ADD COLUMN IF NOT EXISTS last_activity_at TIMESTAMP;
+ALTER TABLE conversation ADD COLUMN IF NOT EXISTS message_count INTEGER NOT NULL DEFAULT 0;
+
+UPDATE conversation c
+SET last_activity_at = COALESCE(
+        (SELECT MAX(m.created_at) FROM message m WHERE m.conversation_id = c.id),
+        c.updated_at,
+        c.created_at,
+        CURRENT_TIMESTAMP
+    ),
+    message_count = (SELECT COUNT(*) FROM message m WHERE m.conversation_id = c.id)
+WHERE c.last_activity_at IS NULL;
+
+ALTER TABLE conversation ALTER COLUMN last_activity_at SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE conversation ALTER COLUMN last_activity_at SET NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_conversation_user_activity ON conversation(user_id, last_activity_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_message_conversation_created ON message(conversation_id, created_at, id);
@@ -1,16 +1,17 @@
 """
 FastAPI 인증 의존성
 """
-from typing import Optional
+from typing import Optional, Tuple
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .jwt_handler import jwt_handler, TokenData
 from database.connection.postgres_conn import get_async_db
-from user.models import UserModel
+from user.models import UserModel, UserSchema
 from user import repositories as user_repo
 from user import services as user_service
+from user.principal_cache import principal_cache, principal_cache_key
 
 
 # HTTP Bearer 토큰 스키마 (auto_error=False: 헤더 없을 때 403 대신 None 전달)
@@ -44,28 +45,12 @@ async def get_current_user_token(
     return token_data
 
 
-async def get_user_from_token_data(
+async def _load_user_schema(
     token_data: TokenData,
     db: AsyncSession,
-    *,
-    auto_create_oauth_user: bool = True
-) -> UserModel:
-    """
-    토큰 데이터로 사용자 조회/생성 (공통 로직)
-
-    Args:
-        token_data: 디코딩된 JWT 토큰 데이터
-        db: 데이터베이스 세션
-        auto_create_oauth_user: OAuth 사용자 자동 생성 여부
-
-    Returns:
-        UserModel: 조회된 사용자
-
-    Raises:
-        HTTPException: 사용자를 찾을 수 없거나 비활성 상태인 경우
-    """
-    user_schema = None
-
+    auto_create_oauth_user: bool,
+) -> Tuple[UserSchema, bool]:
+    """토큰 subject로 DB에서 사용자 조회/생성. Returns: (사용자, 새로 생성 여부)"""
     # 1. 일반 로그인 (user_id가 있는 경우)
     if token_data.user_id:
         user_schema = await user_repo.get_user_by_id(db, token_data.user_id)
@@ -89,6 +74,7 @@ async def get_user_from_token_data(
                 picture=token_data.picture,
                 provider_id=token_data.sub
             )
+            return user_schema, True
         elif not user_schema:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -105,7 +91,42 @@ async def get_user_from_token_data(
                 detail="User not found",
             )
 
-    # UserSchema를 UserModel로 변환
+    return user_schema, False
+
+
+async def get_user_from_token_data(
+    token_data: TokenData,
+    db: AsyncSession,
+    *,
+    auto_create_oauth_user: bool = True
+) -> UserModel:
+    """
+    토큰 데이터로 사용자 조회/생성 (공통 로직)
+
+    principal 캐시에 있으면 DB를 조회하지 않는다 (user.principal_cache 참고).
+
+    Args:
+        token_data: 디코딩된 JWT 토큰 데이터
+        db: 데이터베이스 세션
+        auto_create_oauth_user: OAuth 사용자 자동 생성 여부
+
+    Returns:
+        UserModel: 조회된 사용자
+
+    Raises:
+        HTTPException: 사용자를 찾을 수 없거나 비활성 상태인 경우
+    """
+    cache_key = principal_cache_key(token_data.user_id, token_data.email, token_data.sub)
+    user_schema = principal_cache.get(cache_key)
+
+    if user_schema is None:
+        generation = principal_cache.generation
+        user_schema, created = await _load_user_schema(token_data, db, auto_create_oauth_user)
+        # 방금 생성된 사용자는 commit 전일 수 있으므로 캐시하지 않음
+        if not created:
+            principal_cache.set(cache_key, user_schema, generation=generation)
+
+    # UserSchema를 UserModel로 변환 (요청마다 새 인스턴스)
     user = UserModel.from_schema(user_schema)
 
     # 사용자 활성 상태 확인
@@ -14,6 +14,7 @@ from conversation.models import (
     ChatMessageResponse, ChatHistoryResponse, ChatSessionListResponse
 )
 from conversation import services as conv_service
+from conversation.exceptions import InvalidPageCursorError
 
 
 router = APIRouter(prefix="/api/chat", tags=["Chat Session Management"])
@@ -49,6 +50,7 @@ async def create_chat_session(
 async def get_user_chat_sessions(
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정 시 offset 무시)"),
     current_user: UserModel = Depends(get_current_user),
     db: AsyncSession = Depends(get_async_db)
 ):
@@ -61,11 +63,14 @@ async def get_user_chat_sessions(
             db=db,
             user_id=current_user.id,
             limit=limit,
-            offset=offset
+            offset=offset,
+            cursor=cursor,
         )
         print(f"✅ Sessions retrieved successfully: {len(sessions_response.sessions) if sessions_response else 0}")
         return sessions_response
         
+    except InvalidPageCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
     except Exception as e:
         print(f"❌ Error getting sessions: {str(e)}")
         print_exc()
@@ -193,6 +198,7 @@ async def get_chat_history(
     conversation_id: int = Query(..., description="Conversation ID"),
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정 시 offset 무시)"),
     current_user: UserModel = Depends(get_current_user),
     db: AsyncSession = Depends(get_async_db)
 ):
@@ -205,7 +211,8 @@ async def get_chat_history(
             conversation_id=conversation_id,
             user_id=current_user.id,
             limit=limit,
-            offset=offset
+            offset=offset,
+            cursor=cursor,
         )
         
         if not history_response:
@@ -218,6 +225,8 @@ async def get_chat_history(
         
     except HTTPException:
         raise
+    except InvalidPageCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
     except Exception as e:
         print(f"❌ Error getting chat history: {str(e)}")
         print_exc()
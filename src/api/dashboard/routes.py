@@ -6,7 +6,7 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from database.connection.postgres_conn import get_async_db
+from database.connection.postgres_conn import get_async_read_db
 from dashboard import services as dashboard_service
 from dashboard.dto import (
     HomeResponseDTO,
@@ -49,7 +49,7 @@ router = APIRouter(prefix="/api/dashboard", tags=["Dashboard"])
 @router.post("/cache/invalidate")
 async def invalidate_cache():
     """dashboard:* 패턴의 Redis 캐시를 모두 삭제"""
-    deleted = dashboard_service.invalidate_all_cache()
+    deleted = await dashboard_service.invalidate_all_cache()
     return {"deleted_keys": deleted}
 
 
@@ -58,14 +58,12 @@ async def invalidate_cache():
 # ===========================
 
 @router.get("/home", response_model=HomeResponseDTO)
-async def get_home(
-    db: AsyncSession = Depends(get_async_db),
-):
+async def get_home():
     """
     Home 탭 데이터: 요약 카드 + 최근/향후 이벤트 + 랭킹
     """
     try:
-        return await dashboard_service.get_home(db)
+        return await dashboard_service.get_home()
     except DashboardQueryError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -77,13 +75,12 @@ async def get_home(
 async def get_overview(
     weight_class_id: Optional[int] = None,
     ufc_only: bool = True,
-    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Overview 탭 데이터: 피니시 분포, 체급별 활동, 이벤트 추이, 리더보드, 종료 라운드
     """
     try:
-        return await dashboard_service.get_overview(db, weight_class_id, ufc_only)
+        return await dashboard_service.get_overview(weight_class_id=weight_class_id, ufc_only=ufc_only)
     except DashboardQueryError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -96,13 +93,14 @@ async def get_striking(
     weight_class_id: Optional[int] = None,
     min_fights: int = 10,
     limit: int = 10,
-    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Striking 탭 데이터: 타격 부위, 타격 정확도, KO/TKO TOP, 경기당 유효타격
     """
     try:
-        return await dashboard_service.get_striking(db, weight_class_id, min_fights, limit)
+        return await dashboard_service.get_striking(
+            weight_class_id=weight_class_id, min_fights=min_fights, limit=limit
+        )
     except DashboardQueryError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -115,13 +113,14 @@ async def get_grappling(
     weight_class_id: Optional[int] = None,
     min_fights: int = 10,
     limit: int = 10,
-    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Grappling 탭 데이터: 테이크다운, 서브미션 기술, 컨트롤 타임, 그라운드 스트라이크, 서브미션 효율
     """
     try:
-        return await dashboard_service.get_grappling(db, weight_class_id, min_fights, limit)
+        return await dashboard_service.get_grappling(
+            weight_class_id=weight_class_id, min_fights=min_fights, limit=limit
+        )
     except DashboardQueryError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -136,7 +135,7 @@ async def get_grappling(
 @router.get("/chart/finish-methods", response_model=List[FinishMethodDTO])
 async def get_chart_finish_methods(
     weight_class_id: Optional[int] = None,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     """피니시 방법 분포 (Overview)"""
     try:
@@ -151,7 +150,7 @@ async def get_chart_finish_methods(
 @router.get("/chart/fight-duration", response_model=FightDurationDTO)
 async def get_chart_fight_duration(
     weight_class_id: Optional[int] = None,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     """경기 종료 라운드 분포 및 평균 (Overview)"""
     try:
@@ -167,7 +166,7 @@ async def get_chart_fight_duration(
 async def get_chart_leaderboard(
     weight_class_id: Optional[int] = None,
     ufc_only: bool = True,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     """리더보드: 다승, 승률 (Overview)"""
     try:
@@ -182,7 +181,7 @@ async def get_chart_leaderboard(
 @router.get("/chart/strike-targets", response_model=List[StrikeTargetDTO])
 async def get_chart_strike_targets(
     weight_class_id: Optional[int] = None,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     """타격 부위별 유효타 수 (Striking)"""
     try:
@@ -199,7 +198,7 @@ async def get_chart_striking_accuracy(
     weight_class_id: Optional[int] = None,
     min_fights: int = 10,
     limit: int = 10,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     """타격 정확도 리더보드 (Striking)"""
     try:
@@ -215,7 +214,7 @@ async def get_chart_striking_accuracy(
 async def get_chart_ko_tko_leaders(
     weight_class_id: Optional[int] = None,
     limit: int = 10,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     """KO/TKO 리더 (Striking)"""
     try:
@@ -232,7 +231,7 @@ async def get_chart_sig_strikes(
     weight_class_id: Optional[int] = None,
     min_fights: int = 10,
     limit: int = 10,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     """경기당 유효타격 리더보드 (Striking)"""
     try:
@@ -249,7 +248,7 @@ async def get_chart_takedown_accuracy(
     weight_class_id: Optional[int] = None,
     min_fights: int = 10,
     limit: int = 10,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     """테이크다운 정확도 리더보드 (Grappling)"""
     try:
@@ -264,7 +263,7 @@ async def get_chart_takedown_accuracy(
 @router.get("/chart/submission-techniques", response_model=List[SubmissionTechniqueDTO])
 async def get_chart_submission_techniques(
     weight_class_id: Optional[int] = None,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     """서브미션 기술 분포 (Grappling)"""
     try:
@@ -281,7 +280,7 @@ async def get_chart_ground_strikes(
     weight_class_id: Optional[int] = None,
     min_fights: int = 10,
     limit: int = 10,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     """그라운드 스트라이크 리더보드 (Grappling)"""
     try:
@@ -298,7 +297,7 @@ async def get_chart_submission_efficiency(
     weight_class_id: Optional[int] = None,
     min_fights: int = 10,
     limit: int = 10,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     """서브미션 효율 (Grappling)"""
     try:
@@ -316,7 +315,7 @@ async def get_chart_submission_efficiency(
 
 @router.get("/chart/category-leaders", response_model=List[CategoryLeaderDTO])
 async def get_chart_category_leaders(
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     """분야별 1등 선수 카드 (Home)"""
     try:
@@ -330,7 +329,7 @@ async def get_chart_category_leaders(
 
 @router.get("/chart/event-map", response_model=List[EventMapDTO])
 async def get_chart_event_map(
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     """이벤트 개최지 맵 (Home)"""
     try:
@@ -345,7 +344,7 @@ async def get_chart_event_map(
 @router.get("/chart/nationality-distribution", response_model=List[NationalityDistributionDTO])
 async def get_chart_nationality_distribution(
     weight_class_id: Optional[int] = None,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     """선수 국적 분포 (Overview)"""
     try:
@@ -360,7 +359,7 @@ async def get_chart_nationality_distribution(
 @router.get("/chart/finish-rate-trend", response_model=List[FinishRateTrendDTO])
 async def get_chart_finish_rate_trend(
     weight_class_id: Optional[int] = None,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     """연도별 피니시율 추이 (Overview)"""
     try:
@@ -376,7 +375,7 @@ async def get_chart_finish_rate_trend(
 async def get_chart_knockdown_leaders(
     weight_class_id: Optional[int] = None,
     limit: int = 10,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     """넉다운 리더 TOP (Striking)"""
     try:
@@ -390,7 +389,7 @@ async def get_chart_knockdown_leaders(
 
 @router.get("/chart/sig-strikes-by-weight-class", response_model=List[SigStrikesByWeightClassDTO])
 async def get_chart_sig_strikes_by_wc(
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     """체급별 경기당 평균 유효타격 (Striking)"""
     try:
@@ -407,7 +406,7 @@ async def get_chart_strike_exchange(
     weight_class_id: Optional[int] = None,
     min_fights: int = 10,
     limit: int = 10,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     """공방 효율 리더보드 (Striking)"""
     try:
@@ -422,7 +421,7 @@ async def get_chart_strike_exchange(
 @router.get("/chart/stance-winrate", response_model=List[StanceWinrateDTO])
 async def get_chart_stance_winrate(
     weight_class_id: Optional[int] = None,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     """스탠스별 승률 (Striking)"""
     try:
@@ -439,7 +438,7 @@ async def get_chart_td_attempts_leaders(
     weight_class_id: Optional[int] = None,
     min_fights: int = 10,
     limit: int = 10,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     """경기당 테이크다운 시도 리더보드 (Grappling)"""
     try:
@@ -454,7 +453,7 @@ async def get_chart_td_attempts_leaders(
 @router.get("/chart/td-sub-correlation", response_model=TdSubCorrelationDTO)
 async def get_chart_td_sub_correlation(
     weight_class_id: Optional[int] = None,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     """테이크다운-서브미션 상관관계 (Grappling)"""
     try:
@@ -471,7 +470,7 @@ async def get_chart_td_defense_leaders(
     weight_class_id: Optional[int] = None,
     min_fights: int = 10,
     limit: int = 10,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     """테이크다운 디펜스 리더보드 (Grappling)"""
     try:
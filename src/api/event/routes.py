@@ -3,7 +3,7 @@ from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from database.connection.postgres_conn import get_async_db
+from database.connection.postgres_conn import get_async_read_db
 from event import services as event_service
 from event.dto import EventDetailDTO, EventListDTO, EventSearchDTO
 from event.exceptions import EventNotFoundError, EventValidationError, EventDateError, EventQueryError
@@ -18,7 +18,7 @@ async def get_events(
     limit: int = Query(10, ge=1, le=100),
     year: Optional[int] = None,
     month: Optional[int] = None,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     try:
         return await event_service.get_events(db, page=page, limit=limit, year=year, month=month)
@@ -34,7 +34,7 @@ async def get_events(
 async def search_events(
     q: str = Query(..., min_length=1),
     limit: int = Query(20, ge=1, le=100),
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     try:
         return await event_service.search_events(db, query=q, search_type="name", limit=limit)
@@ -47,7 +47,7 @@ async def search_events(
 @router.get("/{event_id}", response_model=EventDetailDTO)
 async def get_event_detail(
     event_id: int,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     try:
         return await event_service.get_event_detail(db, event_id)
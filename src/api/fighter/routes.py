@@ -3,7 +3,7 @@ from typing import List
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from database.connection.postgres_conn import get_async_db
+from database.connection.postgres_conn import get_async_read_db
 from fighter import services as fighter_service
 from fighter.dto import FighterDetailResponseDTO, FighterWithRankingsDTO
 from fighter.exceptions import FighterNotFoundError, FighterValidationError, FighterQueryError, FighterSearchError
@@ -16,7 +16,7 @@ router = APIRouter(prefix="/api/fighters", tags=["Fighter"])
 async def search_fighters(
     q: str = Query(..., min_length=1, description="Search term"),
     limit: int = Query(20, ge=1, le=50),
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     try:
         return await fighter_service.search_fighters(db, q, limit)
@@ -29,7 +29,7 @@ async def search_fighters(
 @router.get("/{fighter_id}", response_model=FighterDetailResponseDTO)
 async def get_fighter_detail(
     fighter_id: int,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     try:
         return await fighter_service.get_fighter_detail(db, fighter_id)
@@ -0,0 +1,231 @@
+"""
+WebSocket 이벤트 브로커
+여러 uvicorn 워커가 떠 있을 때 send_to_user / send_to_conversation / broadcast 이벤트를
+다른 워커에 연결된 클라이언트까지 전달하기 위한 pub/sub 백엔드.
+
+백엔드 (WS_BROKER_BACKEND)
+- local: 브로커 없음, 현재 프로세스 연결에만 전달 (기본값, 단일 워커)
+- memory: 프로세스 내 hub 공유 (테스트용)
+- redis: Redis pub/sub 채널(WS_BROKER_CHANNEL)로 워커 간 fan-out
+
+각 워커는 자기 연결에 먼저 직접 전달한 뒤 이벤트를 publish하고
+(로컬 전송이 실패해도 publish는 수행), 수신 측은 origin이 자기 자신인 이벤트를 무시한다.
+principal 대상 이벤트는 연결 전송이 아니라 각 워커의 인증 principal 캐시 무효화에 쓰인다.
+"""
+import asyncio
+import json
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from config import Config
+from common.logging_config import get_logger
+
+LOGGER = get_logger(__name__)
+
+BROKER_BACKEND_LOCAL = "local"
+BROKER_BACKEND_MEMORY = "memory"
+BROKER_BACKEND_REDIS = "redis"
+
+TARGET_USER = "user"
+TARGET_CONVERSATION = "conversation"
+TARGET_BROADCAST = "broadcast"
+# 인증 principal 캐시 무효화 (WebSocket 연결이 아닌 각 워커의 principal 캐시 대상)
+TARGET_PRINCIPAL = "principal"
+
+EventHandler = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+class WebSocketBroker:
+    """브로커 공통 인터페이스 (local 백엔드는 no-op)"""
+
+    def __init__(self):
+        self.worker_id = uuid.uuid4().hex
+        self._handler: Optional[EventHandler] = None
+        self.published = 0
+        self.received = 0
+
+    @property
+    def enabled(self) -> bool:
+        return False
+
+    async def start(self, handler: EventHandler) -> None:
+        self._handler = handler
+
+    async def stop(self) -> None:
+        self._handler = None
+
+    async def publish(self, target: str, target_id: Optional[int], message: dict) -> None:
+        return None
+
+    def _envelope(self, target: str, target_id: Optional[int], message: dict) -> Dict[str, Any]:
+        return {"origin": self.worker_id, "target": target, "target_id": target_id, "message": message}
+
+    async def _dispatch(self, envelope: Dict[str, Any]) -> None:
+        """다른 워커가 보낸 이벤트만 핸들러로 전달"""
+        if self._handler is None or envelope.get("origin") == self.worker_id:
+            return
+        self.received += 1
+        try:
+            await self._handler(envelope)
+        except Exception as e:
+            LOGGER.warning(f"⚠️ WebSocket broker handler failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": BROKER_BACKEND_LOCAL,
+            "worker_id": self.worker_id,
+            "published": self.published,
+            "received": self.received,
+        }
+
+
+class InMemoryBrokerHub:
+    """InMemoryBroker들이 공유하는 구독자 목록 (같은 hub = 같은 채널)"""
+
+    def __init__(self):
+        self.brokers: List["InMemoryBroker"] = []
+
+
+_default_hub = InMemoryBrokerHub()
+
+
+class InMemoryBroker(WebSocketBroker):
+    """프로세스 내 pub/sub (테스트에서 여러 워커를 흉내 낼 때 hub를 공유)"""
+
+    def __init__(self, hub: Optional[InMemoryBrokerHub] = None):
+        super().__init__()
+        self.hub = hub or _default_hub
+
+    @property
+    def enabled(self) -> bool:
+        return True
+
+    async def start(self, handler: EventHandler) -> None:
+        await super().start(handler)
+        if self not in self.hub.brokers:
+            self.hub.brokers.append(self)
+
+    async def stop(self) -> None:
+        if self in self.hub.brokers:
+            self.hub.brokers.remove(self)
+        await super().stop()
+
+    async def publish(self, target: str, target_id: Optional[int], message: dict) -> None:
+        self.published += 1
+        # 실제 전송처럼 직렬화 가능한 사본을 전달
+        envelope = json.loads(json.dumps(self._envelope(target, target_id, message), ensure_ascii=False))
+        for broker in list(self.hub.brokers):
+            await broker._dispatch(envelope)
+
+    def stats(self) -> Dict[str, Any]:
+        return {**super().stats(), "backend": BROKER_BACKEND_MEMORY}
+
+
+class RedisBroker(WebSocketBroker):
+    """Redis pub/sub 기반 워커 간 fan-out"""
+
+    RECONNECT_DELAY_SECONDS = 1.0
+    MAX_RECONNECT_DELAY_SECONDS = 30.0
+
+    def __init__(self, channel: Optional[str] = None, client=None):
+        super().__init__()
+        self.channel = channel or Config.WS_BROKER_CHANNEL
+        self._client = client
+        self._listener: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        return True
+
+    def _get_client(self):
+        if self._client is None:
+            # pub/sub 구독은 커넥션을 점유하므로 캐시용 클라이언트와 분리
+            from redis import asyncio as aioredis
+            self._client = aioredis.Redis(
+                host=Config.REDIS_HOST,
+                port=Config.REDIS_PORT,
+                password=Config.REDIS_PASSWORD,
+                decode_responses=True,
+                socket_connect_timeout=Config.REDIS_SOCKET_CONNECT_TIMEOUT,
+                retry_on_timeout=Config.REDIS_RETRY_ON_TIMEOUT,
+            )
+        return self._client
+
+    async def start(self, handler: EventHandler) -> None:
+        await super().start(handler)
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen(), name="ws-broker-listener")
+        LOGGER.info(f"📡 WebSocket Redis broker started: channel={self.channel} worker={self.worker_id}")
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+        if self._client is not None:
+            try:
+                await self._client.aclose()
+            except Exception as e:
+                LOGGER.warning(f"⚠️ WebSocket broker close failed: {e}")
+            self._client = None
+        await super().stop()
+
+    async def publish(self, target: str, target_id: Optional[int], message: dict) -> None:
+        payload = json.dumps(self._envelope(target, target_id, message), ensure_ascii=False, default=str)
+        try:
+            await self._get_client().publish(self.channel, payload)
+            self.published += 1
+        except Exception as e:
+            # 다른 워커 전달 실패가 현재 워커의 전송을 막지 않도록 로그만 남김
+            LOGGER.warning(f"⚠️ WebSocket broker publish failed: {e}")
+
+    async def _listen(self) -> None:
+        """구독 루프 (연결이 끊기면 지수 백오프로 재구독)"""
+        delay = self.RECONNECT_DELAY_SECONDS
+        while True:
+            pubsub = None
+            try:
+                pubsub = self._get_client().pubsub(ignore_subscribe_messages=True)
+                await pubsub.subscribe(self.channel)
+                delay = self.RECONNECT_DELAY_SECONDS
+                async for raw in pubsub.listen():
+                    if raw.get("type") != "message":
+                        continue
+                    try:
+                        envelope = json.loads(raw["data"])
+                    except (TypeError, ValueError):
+                        LOGGER.warning("⚠️ Invalid WebSocket broker payload ignored")
+                        continue
+                    await self._dispatch(envelope)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                LOGGER.warning(f"⚠️ WebSocket broker subscription lost, retrying in {delay:.0f}s: {e}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.MAX_RECONNECT_DELAY_SECONDS)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose()
+                    except Exception:
+                        pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **super().stats(),
+            "backend": BROKER_BACKEND_REDIS,
+            "channel": self.channel,
+            "listening": self._listener is not None and not self._listener.done(),
+        }
+
+
+def create_broker(backend: Optional[str] = None) -> WebSocketBroker:
+    """Config(WS_BROKER_BACKEND) 기반 브로커 생성"""
+    backend = (backend or Config.WS_BROKER_BACKEND).lower()
+    if backend == BROKER_BACKEND_LOCAL:
+        return WebSocketBroker()
+    if backend == BROKER_BACKEND_MEMORY:
+        return InMemoryBroker()
+    if backend == BROKER_BACKEND_REDIS:
+        return RedisBroker()
+    raise ValueError(f"Unknown WebSocket broker backend: {backend}")
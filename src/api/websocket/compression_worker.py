@@ -0,0 +1,136 @@
+"""
+대화 압축 백그라운드 워커
+응답 전송 경로에서 LLM 압축 호출을 분리하여 final_result 지연을 없앤다.
+
+- 대화 단위 중복 제거: 대기/실행 중인 대화는 다시 큐에 넣지 않고,
+  실행 중에 요청이 오면 완료 후 한 번만 재실행한다.
+- 감독(supervision): 작업 예외는 로그만 남기고 워커는 계속 동작하며,
+  워커 태스크가 예기치 않게 종료되면 다음 enqueue 시 재시작한다.
+"""
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+
+from common.logging_config import get_logger
+
+LOGGER = get_logger(__name__)
+
+CompressJob = Callable[[int], Awaitable[None]]
+
+
+class CompressionWorker:
+    """conversation_id 큐를 소비하며 압축 작업을 실행하는 워커"""
+
+    def __init__(self, job: CompressJob, concurrency: int = 1):
+        self._job = job
+        self._concurrency = max(1, concurrency)
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._pending: Set[int] = set()   # 큐 대기 중
+        self._running: Set[int] = set()   # 실행 중
+        self._rerun: Set[int] = set()     # 실행 중 재요청됨
+        self._stopping = False
+        self.completed = 0
+        self.failed = 0
+        self.deduplicated = 0
+
+    def enqueue(self, conversation_id: int) -> bool:
+        """압축 요청 등록. 이미 대기 중이면 False"""
+        if not conversation_id or self._stopping:
+            return False
+
+        if conversation_id in self._pending:
+            self.deduplicated += 1
+            return False
+        if conversation_id in self._running:
+            self.deduplicated += 1
+            self._rerun.add(conversation_id)
+            return False
+
+        self._ensure_workers()
+        self._pending.add(conversation_id)
+        self._queue.put_nowait(conversation_id)
+        return True
+
+    def _ensure_workers(self) -> None:
+        alive = [task for task in self._workers if not task.done()]
+        if len(alive) < len(self._workers):
+            LOGGER.warning(f"⚠️ Restarting {len(self._workers) - len(alive)} compression worker(s)")
+        self._workers = alive
+
+        if self._queue is None or not self._workers:
+            # 워커가 모두 종료된 경우 큐를 새로 만들고 대기 중이던 대화를 다시 채운다
+            self._queue = asyncio.Queue()
+            for conversation_id in self._pending:
+                self._queue.put_nowait(conversation_id)
+
+        while len(self._workers) < self._concurrency:
+            task = asyncio.create_task(self._run(), name=f"compression-worker-{len(self._workers)}")
+            task.add_done_callback(self._on_worker_done)
+            self._workers.append(task)
+
+    def _on_worker_done(self, task: asyncio.Task) -> None:
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            LOGGER.error(f"❌ Compression worker crashed: {exc}")
+
+    async def _run(self) -> None:
+        while True:
+            conversation_id = await self._queue.get()
+            self._pending.discard(conversation_id)
+            self._running.add(conversation_id)
+            try:
+                await self._run_job(conversation_id)
+                # 실행 중 들어온 요청은 최신 메시지 기준으로 한 번 더 확인
+                while conversation_id in self._rerun:
+                    self._rerun.discard(conversation_id)
+                    await self._run_job(conversation_id)
+            finally:
+                self._running.discard(conversation_id)
+                self._rerun.discard(conversation_id)
+                self._queue.task_done()
+
+    async def _run_job(self, conversation_id: int) -> None:
+        try:
+            await self._job(conversation_id)
+            self.completed += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.failed += 1
+            LOGGER.warning(f"⚠️ Background compression failed for conversation {conversation_id}: {e}")
+
+    async def join(self) -> None:
+        """대기 중인 작업이 모두 끝날 때까지 대기 (테스트/종료 처리용)"""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def stop(self, timeout: float = 5.0) -> None:
+        """남은 작업을 timeout 안에서 처리한 뒤 워커 종료 (미처리분은 다음 턴에 재시도)"""
+        self._stopping = True
+        try:
+            if self._queue is not None:
+                try:
+                    await asyncio.wait_for(self._queue.join(), timeout)
+                except asyncio.TimeoutError:
+                    LOGGER.warning(f"⚠️ Compression worker stopped with {len(self._pending)} pending")
+            for task in self._workers:
+                task.cancel()
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        finally:
+            self._workers = []
+            self._queue = None
+            self._pending.clear()
+            self._running.clear()
+            self._rerun.clear()
+            self._stopping = False
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "pending": len(self._pending),
+            "running": len(self._running),
+            "completed": self.completed,
+            "failed": self.failed,
+            "deduplicated": self.deduplicated,
+        }
@@ -12,7 +12,9 @@ from fastapi import WebSocket
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from user.models import UserModel
-from user.services import check_usage_limit, get_user_usage, update_user_usage
+from user import repositories as user_repo
+from user.services import DEFAULT_DAILY_LIMIT, get_user_usage
+from user.principal_cache import get_principal_cache_stats, principal_cache, set_invalidation_publisher
 from conversation.services import get_or_create_session
 from conversation.repositories import (
     get_recent_messages, add_message_direct,
@@ -20,6 +22,13 @@ from conversation.repositories import (
     get_message_count_after, update_conversation_compression,
 )
 from llm.service import get_graph_service, MMAGraphService
+from api.websocket.broker import (
+    TARGET_BROADCAST, TARGET_CONVERSATION, TARGET_PRINCIPAL, TARGET_USER, WebSocketBroker, create_broker,
+)
+from api.websocket.compression_worker import CompressionWorker
+from api.websocket.token_coalescer import TokenCoalescer
+from database.connection.postgres_conn import get_async_db_context
+from config import Config
 from common.logging_config import get_logger
 from common.utils import utc_now
 from common.ws_types import ErrorCode, WSErrorPayload
@@ -52,10 +61,19 @@ class ConnectionManager:
         # 대화별 연결: {conversation_id: Set[connection_id]}
         self.conversation_connections: Dict[int, Set[str]] = {}
         
+        # 워커 간 이벤트 fan-out 브로커 (기본 local: 현재 프로세스에만 전달)
+        self.broker: WebSocketBroker = create_broker()
+
         # LLM 서비스 (StateGraph 기반)
         self.llm_service: MMAGraphService = None
         self._initializing = False
 
+        # 대화 압축 워커 (응답 경로와 분리, 대화별 중복 제거)
+        self.compression_worker = CompressionWorker(
+            self._compress_in_background,
+            concurrency=Config.CONVERSATION_COMPRESSION_WORKERS,
+        )
+
     async def _ensure_llm_service(self):
         """LLM 서비스 초기화 보장"""
         if self.llm_service is not None:
@@ -195,26 +213,80 @@ class ConnectionManager:
     
     async def send_to_user(self, user_id: int, message: dict):
         """
-        특정 사용자의 모든 연결에 메시지 전송
+        특정 사용자의 모든 연결에 메시지 전송 (다른 워커의 연결은 브로커로 전달)
         """
-        if user_id in self.user_connections:
-            for connection_id in self.user_connections[user_id].copy():
-                await self.send_to_connection(connection_id, message)
+        try:
+            await self._deliver_to_user(user_id, message)
+        finally:
+            # 로컬 전송이 publish 지연에 막히지 않도록 먼저 전달하고, 로컬 전송 실패와 무관하게 publish
+            await self.broker.publish(TARGET_USER, user_id, message)
     
     async def send_to_conversation(self, conversation_id: int, message: dict):
         """
-        특정 대화의 모든 연결에 메시지 전송
+        특정 대화의 모든 연결에 메시지 전송 (다른 워커의 연결은 브로커로 전달)
         """
-        if conversation_id in self.conversation_connections:
-            for connection_id in self.conversation_connections[conversation_id].copy():
-                await self.send_to_connection(connection_id, message)
+        try:
+            await self._deliver_to_conversation(conversation_id, message)
+        finally:
+            await self.broker.publish(TARGET_CONVERSATION, conversation_id, message)
     
     async def broadcast(self, message: dict):
         """
-        모든 연결에 메시지 브로드캐스트
+        모든 연결에 메시지 브로드캐스트 (다른 워커의 연결은 브로커로 전달)
         """
+        try:
+            await self._deliver_to_all(message)
+        finally:
+            await self.broker.publish(TARGET_BROADCAST, None, message)
+
+    async def _deliver_to_user(self, user_id: int, message: dict):
+        """현재 워커에 연결된 사용자 연결에만 전송"""
+        if user_id in self.user_connections:
+            for connection_id in self.user_connections[user_id].copy():
+                await self.send_to_connection(connection_id, message)
+
+    async def _deliver_to_conversation(self, conversation_id: int, message: dict):
+        """현재 워커에 연결된 대화 연결에만 전송"""
+        if conversation_id in self.conversation_connections:
+            for connection_id in self.conversation_connections[conversation_id].copy():
+                await self.send_to_connection(connection_id, message)
+
+    async def _deliver_to_all(self, message: dict):
+        """현재 워커의 모든 연결에 전송"""
         for connection_id in list(self.active_connections.keys()):
             await self.send_to_connection(connection_id, message)
+
+    async def start_broker(self) -> None:
+        """브로커 구독 시작 (애플리케이션 시작 시 호출)"""
+        await self.broker.start(self._handle_broker_event)
+        if self.broker.enabled:
+            set_invalidation_publisher(self._publish_principal_invalidation)
+
+    async def stop_broker(self) -> None:
+        """브로커 구독 종료 (애플리케이션 종료 시 호출)"""
+        set_invalidation_publisher(None)
+        await self.broker.stop()
+
+    async def _publish_principal_invalidation(self, user_id: int) -> None:
+        """commit된 사용자 변경을 다른 워커의 principal 캐시에 전달"""
+        await self.broker.publish(TARGET_PRINCIPAL, user_id, {})
+
+    async def _handle_broker_event(self, envelope: Dict[str, Any]) -> None:
+        """다른 워커가 publish한 이벤트를 현재 워커의 연결에 전달"""
+        target = envelope.get("target")
+        target_id = envelope.get("target_id")
+        message = envelope.get("message") or {}
+
+        if target == TARGET_USER:
+            await self._deliver_to_user(target_id, message)
+        elif target == TARGET_CONVERSATION:
+            await self._deliver_to_conversation(target_id, message)
+        elif target == TARGET_BROADCAST:
+            await self._deliver_to_all(message)
+        elif target == TARGET_PRINCIPAL:
+            principal_cache.invalidate_user(target_id)
+        else:
+            LOGGER.warning(f"⚠️ Unknown broker target ignored: {target}")
     
     async def handle_user_message(
         self,
@@ -229,18 +301,24 @@ class ConnectionManager:
         """
         try:
             user = await self._validate_user_connection(connection_id)
-
-            is_within_limit = await self._check_usage_limit(connection_id, db, user.id)
-            if not is_within_limit:
-                return
-
             content = await self._validate_message_data(connection_id, message_data)
             conversation_id = message_data.get("conversation_id")
 
-            await self._send_typing_indicator(connection_id)
-            await self._process_llm_streaming_response(
-                connection_id, content, user.id, db, conversation_id
-            )
+            # LLM 호출 전에 사용량을 원자적으로 선차감 (동시 요청이 제한을 넘지 못함)
+            is_reserved = await self._reserve_usage(connection_id, db, user.id)
+            if not is_reserved:
+                return
+
+            is_served = False
+            try:
+                await self._send_typing_indicator(connection_id)
+                is_served = await self._process_llm_streaming_response(
+                    connection_id, content, user.id, db, conversation_id
+                )
+            finally:
+                # 응답이 저장되지 않았으면 선차감한 사용량을 되돌림
+                if not is_served:
+                    await self._refund_usage(db, user.id)
 
         except Exception as e:
             await self._handle_message_error(connection_id, e)
@@ -259,18 +337,20 @@ class ConnectionManager:
             raise ValueError(f"User not found for connection {connection_id}")
         return user
 
-    async def _check_usage_limit(self, connection_id: str, db: AsyncSession, user_id: int) -> bool:
+    async def _reserve_usage(self, connection_id: str, db: AsyncSession, user_id: int) -> bool:
         """
-        사용자의 일일 사용량 제한 확인
+        사용자의 일일 사용량 1회를 선차감 (제한 검사 + 증가를 단일 조건부 UPDATE로 처리)
         Returns:
-            True: 사용 가능
-            False: 제한 초과
+            True: 차감 완료 (LLM 호출 가능)
+            False: 제한 초과 또는 확인 실패
         """
         try:
-            is_within_limit = await check_usage_limit(db, user_id)
+            reserved = await user_repo.consume_daily_requests(db, user_id, 1, DEFAULT_DAILY_LIMIT)
+            # 행 잠금을 스트리밍 동안 유지하지 않도록 즉시 commit
+            await db.commit()
 
-            if not is_within_limit:
-                # 사용량 정보 조회하여 상세 메시지 제공
+            if reserved is None:
+                # 사용량 정보 조회하여 상세 메시지 제공 (실패 경로에서만 조회)
                 usage = await get_user_usage(db, user_id)
                 LOGGER.warning(f"🚫 User {user_id} exceeded daily limit: {usage.daily_requests}/{usage.daily_limit}")
 
@@ -287,7 +367,8 @@ class ConnectionManager:
             return True
 
         except Exception as e:
-            LOGGER.error(f"❌ Error checking usage limit for user {user_id}: {e}")
+            LOGGER.error(f"❌ Error reserving usage for user {user_id}: {e}")
+            await db.rollback()
             await self.send_to_connection(connection_id, WSErrorPayload(
                 error="서비스에 일시적인 문제가 발생했습니다. 잠시 후 다시 시도해주세요.",
                 error_code=ErrorCode.USAGE_CHECK_FAILED,
@@ -295,6 +376,17 @@ class ConnectionManager:
             ).to_ws_message())
             return False
 
+    async def _refund_usage(self, db: AsyncSession, user_id: int) -> None:
+        """응답이 저장되지 않은 요청의 선차감 사용량 환불 (실패해도 예외를 전파하지 않음)"""
+        try:
+            # 실패 경로의 미완료 트랜잭션을 정리한 뒤 환불
+            await db.rollback()
+            await user_repo.refund_daily_requests(db, user_id)
+            await db.commit()
+            LOGGER.info(f"↩️ Usage refunded for user {user_id}")
+        except Exception as e:
+            LOGGER.error(f"❌ Failed to refund usage for user {user_id}: {e}")
+
     async def _validate_message_data(self, connection_id: str, message_data: Dict[str, Any]) -> str:
         """메시지 내용 검증"""
         content = message_data.get("content", "").strip()
@@ -363,11 +455,14 @@ class ConnectionManager:
         user_id: int,
         db: AsyncSession,
         conversation_id: Optional[int] = None,
-    ) -> None:
+    ) -> bool:
         """
         LLM 스트리밍 응답 처리
         - conversation_id 없음: 새 대화 → LLM 성공 후 세션 생성 + 저장
         - conversation_id 있음: 기존 대화 → 히스토리 로드 + 기존 세션에 저장
+        Returns:
+            True: 응답이 저장됨 (사용량 차감 유지)
+            False: 에러 또는 연결 끊김으로 응답이 저장되지 않음
         """
         await self._ensure_llm_service()
 
@@ -380,6 +475,15 @@ class ConnectionManager:
         if conversation_id:
             chat_history_data = await self._load_chat_history(db, conversation_id, user_id)
 
+        # stream_token은 짧은 창 단위로 묶어 전송 (다른 이벤트 전에는 항상 flush)
+        coalescer = TokenCoalescer(
+            lambda token: self.send_to_connection(connection_id, _ws_message(
+                "stream_token", assistant_message_id, token=token,
+            )),
+            window_ms=Config.WS_TOKEN_COALESCE_WINDOW_MS,
+            max_chars=Config.WS_TOKEN_COALESCE_MAX_CHARS,
+        )
+
         try:
             async for chunk in self.llm_service.generate_streaming_chat_response(
                 user_message=content,
@@ -391,16 +495,17 @@ class ConnectionManager:
             ):
                 chunk_type = chunk.get("type")
 
+                if chunk_type == "stream_token":
+                    await coalescer.add(chunk["token"])
+                    continue
+
+                await coalescer.flush()
+
                 if chunk_type == "stream_start":
                     await self.send_to_connection(connection_id, _ws_message(
                         "stream_start", assistant_message_id, timestamp=chunk["timestamp"],
                     ))
 
-                elif chunk_type == "stream_token":
-                    await self.send_to_connection(connection_id, _ws_message(
-                        "stream_token", assistant_message_id, token=chunk["token"],
-                    ))
-
                 elif chunk_type == "stream_visualization":
                     await self.send_to_connection(connection_id, _ws_message(
                         "stream_visualization", assistant_message_id,
@@ -423,19 +528,23 @@ class ConnectionManager:
                             connection_id, chunk, assistant_message_id, conversation_id or 0
                         )
 
+            await coalescer.flush()
+
         except ConnectionError:
             LOGGER.warning(f"🔌 WebSocket disconnected during streaming for {connection_id}")
-            return
+            return False
+        finally:
+            await coalescer.aclose()
 
-        if not has_error and final_result_chunk:
-            conversation_id = await self._save_successful_conversation(
-                db, user_id, content, final_result_chunk, connection_id,
-                existing_conversation_id=conversation_id,
-            )
+        if has_error or not final_result_chunk:
+            return False
 
-            # 그래프 완료 후 압축 (비동기, 실패 무시)
-            await self._maybe_compress_conversation(db, conversation_id)
+        conversation_id = await self._save_successful_conversation(
+            db, user_id, content, final_result_chunk, connection_id,
+            existing_conversation_id=conversation_id,
+        )
 
+        try:
             await self._send_final_result(
                 connection_id, final_result_chunk, assistant_message_id, conversation_id
             )
@@ -444,6 +553,18 @@ class ConnectionManager:
             await self.send_to_connection(connection_id, _ws_message(
                 "response_end", assistant_message_id, conversation_id=conversation_id,
             ))
+        except ConnectionError:
+            # 응답은 이미 저장되어 기록에서 볼 수 있으므로 사용량 차감은 유지
+            LOGGER.warning(f"🔌 WebSocket disconnected after response was saved for {connection_id}")
+        except Exception as e:
+            # 전송 단계 실패도 저장된 응답을 되돌리지 않음 — 로그만 남기고 성공으로 처리
+            LOGGER.error(f"❌ Error delivering saved response for {connection_id}: {e}")
+            LOGGER.error(format_exc())
+        finally:
+            # 응답은 이미 저장됨 — 압축은 연결 상태와 무관하게 백그라운드에서 실행
+            self.compression_worker.enqueue(conversation_id)
+
+        return True
 
     async def _send_final_result(
         self,
@@ -546,16 +667,6 @@ class ConnectionManager:
                 except Exception:
                     pass
 
-        # 사용량 증가 (LLM 성공 시 1회 차감)
-        try:
-            from user.dto import UserUsageUpdateDTO
-            await update_user_usage(db, UserUsageUpdateDTO(
-                user_id=user_id, increment_requests=1,
-            ))
-            LOGGER.info(f"📊 Usage incremented for user {user_id}")
-        except Exception as e:
-            LOGGER.error(f"❌ Failed to increment usage for user {user_id}: {e}")
-
         # 모든 작업 성공 후 단일 commit (트랜잭션 원자성 보장)
         await db.commit()
 
@@ -563,6 +674,12 @@ class ConnectionManager:
 
     COMPRESS_THRESHOLD = 10  # 압축 트리거 메시지 수
 
+    async def _compress_in_background(self, conversation_id: int) -> None:
+        """압축 워커 작업: 요청 세션과 분리된 별도 DB 세션으로 압축 실행"""
+        await self._ensure_llm_service()
+        async with get_async_db_context() as db:
+            await self._maybe_compress_conversation(db, conversation_id)
+
     async def _maybe_compress_conversation(
         self, db: AsyncSession, conversation_id: int,
     ) -> None:
@@ -570,80 +687,76 @@ class ConnectionManager:
 
         - boundary 이후 메시지 수 <= COMPRESS_THRESHOLD → 스킵
         - 압축 대상 메시지 분리 → LLM 압축 → DB 저장
-        - 실패 시 로그만 남기고 다음 턴에 재시도
+        - 실패 시 예외를 전파 → CompressionWorker가 실패로 집계하고 다음 턴에 재시도
         """
-        try:
-            compression = await get_conversation_compression(db, conversation_id)
-
-            existing_boundary = (
-                compression["compressed_until_message_id"] if compression else None
-            )
-            existing_summary = (
-                compression["compressed_context"] if compression else None
-            )
-            existing_sql_ctx = (
-                compression["compressed_sql_context"] if compression else None
-            )
-
-            msg_count = await get_message_count_after(
-                db, conversation_id, existing_boundary,
-            )
-            if msg_count <= self.COMPRESS_THRESHOLD:
-                return
-
-            # boundary 이후 모든 메시지 로드
-            if existing_boundary:
-                all_messages = await get_messages_after(db, conversation_id, existing_boundary)
-            else:
-                all_messages = await get_recent_messages(db, conversation_id, limit=100)
-
-            if len(all_messages) <= self.COMPRESS_THRESHOLD:
-                return
-
-            # older (압축 대상) / recent (유지) 분리
-            split_idx = len(all_messages) - self.COMPRESS_THRESHOLD
-            older = all_messages[:split_idx]
-            new_boundary_msg = older[-1]  # 마지막 압축 대상 메시지
-
-            # older에서 sql_context 추출
-            new_sql_entries = []
-            older_as_dicts = []
-            for msg in older:
-                older_as_dicts.append({"role": msg.role, "content": msg.content})
-                if msg.role == "assistant" and msg.tool_results:
-                    new_sql_entries.extend(msg.tool_results)
-
-            # 기존 compressed_sql_context와 병합 (최대 10개)
-            merged_sql_ctx = (existing_sql_ctx or []) + new_sql_entries
-            merged_sql_ctx = merged_sql_ctx[-10:]
-
-            # LLM 압축 호출
-            new_summary = await self.llm_service.compress_conversation(
-                messages_to_compress=older_as_dicts,
-                existing_summary=existing_summary,
-                sql_context=merged_sql_ctx,
-            )
+        compression = await get_conversation_compression(db, conversation_id)
+
+        existing_boundary = (
+            compression["compressed_until_message_id"] if compression else None
+        )
+        existing_summary = (
+            compression["compressed_context"] if compression else None
+        )
+        existing_sql_ctx = (
+            compression["compressed_sql_context"] if compression else None
+        )
+
+        msg_count = await get_message_count_after(
+            db, conversation_id, existing_boundary,
+        )
+        if msg_count <= self.COMPRESS_THRESHOLD:
+            return
 
-            if new_summary is None:
-                LOGGER.warning(f"⚠️ Compression skipped for conversation {conversation_id}")
-                return
+        # boundary 이후 모든 메시지 로드
+        if existing_boundary:
+            all_messages = await get_messages_after(db, conversation_id, existing_boundary)
+        else:
+            all_messages = await get_recent_messages(db, conversation_id, limit=100)
 
-            # DB 저장
-            await update_conversation_compression(
-                session=db,
-                conversation_id=conversation_id,
-                compressed_context=new_summary,
-                compressed_sql_context=merged_sql_ctx if merged_sql_ctx else None,
-                compressed_until_message_id=new_boundary_msg.message_id,
-            )
-            await db.commit()
-            LOGGER.info(
-                f"✅ Conversation {conversation_id} compressed: "
-                f"{len(older)} msgs → summary, boundary={new_boundary_msg.message_id}"
-            )
+        if len(all_messages) <= self.COMPRESS_THRESHOLD:
+            return
 
-        except Exception as e:
-            LOGGER.warning(f"⚠️ Compression error for conversation {conversation_id}: {e}")
+        # older (압축 대상) / recent (유지) 분리
+        split_idx = len(all_messages) - self.COMPRESS_THRESHOLD
+        older = all_messages[:split_idx]
+        new_boundary_msg = older[-1]  # 마지막 압축 대상 메시지
+
+        # older에서 sql_context 추출
+        new_sql_entries = []
+        older_as_dicts = []
+        for msg in older:
+            older_as_dicts.append({"role": msg.role, "content": msg.content})
+            if msg.role == "assistant" and msg.tool_results:
+                new_sql_entries.extend(msg.tool_results)
+
+        # 기존 compressed_sql_context와 병합 (최대 10개)
+        merged_sql_ctx = (existing_sql_ctx or []) + new_sql_entries
+        merged_sql_ctx = merged_sql_ctx[-10:]
+
+        # LLM 압축 호출
+        new_summary = await self.llm_service.compress_conversation(
+            messages_to_compress=older_as_dicts,
+            existing_summary=existing_summary,
+            sql_context=merged_sql_ctx,
+        )
+
+        if new_summary is None:
+            # compress_conversation은 LLM 실패를 None으로 반환 — 워커 실패 통계에 포함
+            raise RuntimeError(f"LLM compression returned no summary for conversation {conversation_id}")
+
+        # DB 저장
+        await update_conversation_compression(
+            session=db,
+            conversation_id=conversation_id,
+            compressed_context=new_summary,
+            compressed_sql_context=merged_sql_ctx if merged_sql_ctx else None,
+            compressed_until_message_id=new_boundary_msg.message_id,
+        )
+        await db.commit()
+        LOGGER.info(
+            f"✅ Conversation {conversation_id} compressed: "
+            f"{len(older)} msgs → summary, boundary={new_boundary_msg.message_id}"
+        )
 
     async def _handle_error_chunk(
         self,
@@ -730,6 +843,9 @@ class ConnectionManager:
             "total_connections": len(self.active_connections),
             "total_users": len(self.user_connections),
             "total_conversations": len(self.conversation_connections),
+            "compression": self.compression_worker.stats(),
+            "broker": self.broker.stats(),
+            "auth_cache": get_principal_cache_stats(),
             "timestamp": utc_now().isoformat()
         }
 
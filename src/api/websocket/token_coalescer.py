@@ -0,0 +1,107 @@
+"""
+WebSocket stream_token 병합(coalescing)
+빠른 프로바이더가 토큰마다 프레임을 보내는 대신, 연결별로 짧은 시간/크기 창 안의 토큰을
+하나의 stream_token 프레임으로 묶어 전송한다. 프론트엔드는 token 문자열을 이어 붙이므로
+프로토콜 변경은 없다.
+
+적응형 동작:
+- 직전 전송 후 window 이상 지났으면 토큰을 즉시 전송 (느린 스트림/첫 토큰 지연 없음)
+- window 안에 도착한 토큰은 버퍼링 후 window 만료 또는 max_chars 도달 시 전송
+- window_ms <= 0 이면 병합하지 않음 (토큰당 1 프레임)
+"""
+import asyncio
+import time
+from typing import Awaitable, Callable, List, Optional
+
+from common.logging_config import get_logger
+
+LOGGER = get_logger(__name__)
+
+SendToken = Callable[[str], Awaitable[None]]
+
+
+class TokenCoalescer:
+    """한 응답 스트림의 토큰을 묶어 send_token으로 전달"""
+
+    def __init__(self, send_token: SendToken, window_ms: float, max_chars: int):
+        self._send_token = send_token
+        self._window = max(0.0, window_ms) / 1000
+        self._max_chars = max(1, max_chars)
+        self._buffer: List[str] = []
+        self._buffered_chars = 0
+        self._last_sent_at = float("-inf")
+        self._flush_task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+        self._error: Optional[BaseException] = None
+        self.tokens = 0
+        self.frames = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._window > 0
+
+    async def add(self, token: str) -> None:
+        """토큰 추가 (필요 시 즉시 전송)"""
+        self._raise_pending_error()
+        self.tokens += 1
+
+        if not self.enabled:
+            await self._send(token)
+            return
+
+        self._buffer.append(token)
+        self._buffered_chars += len(token)
+
+        elapsed = time.monotonic() - self._last_sent_at
+        if elapsed >= self._window or self._buffered_chars >= self._max_chars:
+            await self.flush()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later(self._window - elapsed))
+
+    async def flush(self) -> None:
+        """버퍼에 남은 토큰 즉시 전송 (다른 이벤트 전송 전 순서 보장용으로도 호출)"""
+        self._cancel_timer()
+        self._raise_pending_error()
+        await self._drain()
+
+    async def aclose(self) -> None:
+        """스트림 종료 시 타이머 정리 (버퍼는 전송하지 않음)"""
+        self._cancel_timer()
+        self._buffer.clear()
+        self._buffered_chars = 0
+
+    async def _drain(self) -> None:
+        async with self._lock:
+            if not self._buffer:
+                return
+            text = "".join(self._buffer)
+            self._buffer.clear()
+            self._buffered_chars = 0
+            await self._send(text)
+
+    async def _send(self, text: str) -> None:
+        self._last_sent_at = time.monotonic()
+        self.frames += 1
+        await self._send_token(text)
+
+    async def _flush_later(self, delay: float) -> None:
+        try:
+            await asyncio.sleep(delay)
+            # 이 시점 이후로는 flush()가 타이머를 취소하지 않음 (전송 도중 취소 방지)
+            self._flush_task = None
+            await self._drain()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # 타이머 전송 실패(연결 끊김 등)는 다음 add/flush 호출에서 전파
+            self._error = e
+
+    def _cancel_timer(self) -> None:
+        task, self._flush_task = self._flush_task, None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+
+    def _raise_pending_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
@@ -24,4 +24,5 @@ class LLMProvider(str, Enum):
     ANTHROPIC = "anthropic"
     HUGGINGFACE = "huggingface"
     OPENROUTER = "openrouter"
-    OPENAI = "openai"
\ No newline at end of file
+    OPENAI = "openai"
+    FAKE = "fake"  # 오프라인 벤치마크/테스트용 scripted 모델
@@ -33,8 +33,8 @@ class WeightClassSchema(BaseSchema):
         WeightClassEnum.MENS_POUND_FOR_POUND.value: 15,
         WeightClassEnum.WOMENS_POUND_FOR_POUND.value: 16,
     }
-    
-    
+    # 역방향 매핑 (ID -> 이름) - import 시 한 번만 생성
+    WEIGHT_CLASS_NAMES: ClassVar[Dict[int, str]] = {v: k for k, v in WEIGHT_CLASS_IDS.items()}
     
     model_config = ConfigDict(from_attributes=True)
     
@@ -46,9 +46,7 @@ class WeightClassSchema(BaseSchema):
     @classmethod
     def get_name_by_id(cls, weight_class_id: int) -> Optional[str]:
         """체급 ID로 체급 이름을 조회합니다."""
-        # 역방향 매핑 (ID -> 이름) - 조회 성능 최적화용
-        WEIGHT_CLASS_NAMES = {v: k for k, v in cls.WEIGHT_CLASS_IDS.items()}
-        return WEIGHT_CLASS_NAMES.get(weight_class_id)
+        return cls.WEIGHT_CLASS_NAMES.get(weight_class_id)
 
 #############################
 ########## MODEL ###########
@@ -3,7 +3,7 @@ import json
 import logging
 import os
 from typing import Callable, Dict
-from functools import wraps
+from functools import lru_cache, wraps
 from unidecode import unidecode
 from datetime import datetime, date, timezone
 
@@ -151,9 +151,11 @@ def remove_timestamps_from_tool_result(tool_result):
         return tool_result
 
 
+@lru_cache(maxsize=1)
 def load_schema_prompt() -> str:
     """
     프롬프트용 스키마 정보를 로드합니다. 전체 schema.json을 사용하여 포괄적인 데이터베이스 정보 제공.
+    프로세스당 한 번만 읽고 포맷하며, 파일 변경을 반영하려면 reload_schema_prompt()를 호출합니다.
     
     Returns:
         str: 프롬프트용 스키마 텍스트, 로드 실패 시 fallback 텍스트
@@ -174,6 +176,12 @@ def load_schema_prompt() -> str:
         raise e
 
 
+def reload_schema_prompt() -> str:
+    """schema.json을 다시 읽어 캐시를 갱신 (개발용)"""
+    load_schema_prompt.cache_clear()
+    return load_schema_prompt()
+
+
 def _append_query_map(lines: list[str], schema_data: Dict) -> None:
     query_map = schema_data.get('query_map', [])
     if not query_map:
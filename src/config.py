@@ -12,6 +12,8 @@ class Config:
     DB_PASSWORD: str = os.getenv("DB_PASSWORD", "postgres")
     DB_NAME: str = os.getenv("DB_NAME", "savant_db")
     TEST_DB_NAME: str = os.getenv("TEST_DB_NAME", "test_savant_db")
+    # 파이터 이름 검색에 pg_trgm 유사도 랭킹 사용 (확장이 설치되지 않은 DB는 ILIKE 검색으로 폴백)
+    FIGHTER_SEARCH_TRIGRAM_ENABLED: bool = os.getenv("FIGHTER_SEARCH_TRIGRAM_ENABLED", "true").lower() == "true"
 
     REDIS_HOST: str = os.getenv("REDIS_HOST", "localhost")
     REDIS_PORT: int = int(os.getenv("REDIS_PORT", "6379"))
@@ -44,6 +46,11 @@ class Config:
     NEXTAUTH_SECRET: str = os.getenv("NEXTAUTH_SECRET")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 60 * 24))
     TOKEN_ALGORITHM: str = os.getenv("TOKEN_ALGORITHM")
+    # 인증 principal 캐시 (0이면 비활성화) - 사용자 변경 시 즉시 무효화, 다른 워커는 TTL 내 stale 가능
+    AUTH_PRINCIPAL_CACHE_TTL_SECONDS: int = int(os.getenv("AUTH_PRINCIPAL_CACHE_TTL_SECONDS", "30"))
+    AUTH_PRINCIPAL_CACHE_MAX_SIZE: int = int(os.getenv("AUTH_PRINCIPAL_CACHE_MAX_SIZE", "10000"))
+    # 일일 사용량(daily_requests) 리셋 기준 타임존 (해당 타임존 자정에 리셋)
+    USAGE_RESET_TIMEZONE: str = os.getenv("USAGE_RESET_TIMEZONE", "UTC")
 
     # Admin 계정 설정 (필수)
     ADMIN_USERNAME: str = os.getenv("ADMIN_USERNAME")
@@ -58,11 +65,22 @@ class Config:
     DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "40"))
     DB_READONLY_POOL_SIZE: int = int(os.getenv("DB_READONLY_POOL_SIZE", "10"))
     DB_READONLY_MAX_OVERFLOW: int = int(os.getenv("DB_READONLY_MAX_OVERFLOW", "20"))
+    # Read replica (DB_REPLICA_HOST 미설정 시 비활성화 → 읽기 전용 요청도 primary 사용)
+    DB_REPLICA_HOST: str | None = os.getenv("DB_REPLICA_HOST") or None
+    DB_REPLICA_PORT: int = int(os.getenv("DB_REPLICA_PORT", os.getenv("DB_PORT", "5432")))
+    DB_REPLICA_CONNECT_TIMEOUT_SECONDS: float = float(os.getenv("DB_REPLICA_CONNECT_TIMEOUT_SECONDS", "3"))
+    # replica 연결 실패 후 primary로 우회하는 시간 (이후 다시 replica 시도)
+    DB_REPLICA_RETRY_SECONDS: float = float(os.getenv("DB_REPLICA_RETRY_SECONDS", "30"))
+    # Dashboard 탭 응답 조립 시 동시에 실행할 차트 쿼리 수 (요청당 readonly 커넥션 사용량 상한)
+    DASHBOARD_TAB_CONCURRENCY: int = int(os.getenv("DASHBOARD_TAB_CONCURRENCY", "4"))
 
     # Redis Connection Settings
     REDIS_SOCKET_TIMEOUT: int = int(os.getenv("REDIS_SOCKET_TIMEOUT", "5"))
     REDIS_SOCKET_CONNECT_TIMEOUT: int = int(os.getenv("REDIS_SOCKET_CONNECT_TIMEOUT", "5"))
     REDIS_RETRY_ON_TIMEOUT: bool = os.getenv("REDIS_RETRY_ON_TIMEOUT", "true").lower() == "true"
+    # 비동기 캐시 클라이언트: "redis" (서버 사용) | "memory" (in-process, 테스트용)
+    REDIS_CACHE_BACKEND: str = os.getenv("REDIS_CACHE_BACKEND", "redis").lower()
+    REDIS_ASYNC_MAX_CONNECTIONS: int = int(os.getenv("REDIS_ASYNC_MAX_CONNECTIONS", "50"))
 
     # API Server Settings
     SERVER_HOST: str = os.getenv("SERVER_HOST", "0.0.0.0")
@@ -79,6 +97,27 @@ class Config:
 
     # Agent Settings
     AGENT_MAX_ITERATIONS: int = int(os.getenv("AGENT_MAX_ITERATIONS", "5"))
+    # ReAct 에이전트 한 턴의 tool call 동시 실행 수
+    AGENT_TOOL_CONCURRENCY: int = int(os.getenv("AGENT_TOOL_CONCURRENCY", "4"))
+    # WebSocket stream_token 병합 창 (0이면 토큰당 1 프레임) / 프레임당 최대 문자 수
+    WS_TOKEN_COALESCE_WINDOW_MS: float = float(os.getenv("WS_TOKEN_COALESCE_WINDOW_MS", "25"))
+    WS_TOKEN_COALESCE_MAX_CHARS: int = int(os.getenv("WS_TOKEN_COALESCE_MAX_CHARS", "512"))
+    # WebSocket 워커 간 이벤트 fan-out 브로커 (local | memory | redis)
+    WS_BROKER_BACKEND: str = os.getenv("WS_BROKER_BACKEND", "local").lower()
+    WS_BROKER_CHANNEL: str = os.getenv("WS_BROKER_CHANNEL", "mma_savant:ws_events")
+    # 대화 압축 백그라운드 워커 수 (final_result 전송 후 비동기 실행)
+    CONVERSATION_COMPRESSION_WORKERS: int = int(os.getenv("CONVERSATION_COMPRESSION_WORKERS", "1"))
+
+    # SQL Tool 결과 캐시 (수집 flow 종료 시 무효화)
+    SQL_TOOL_CACHE_ENABLED: bool = os.getenv("SQL_TOOL_CACHE_ENABLED", "true").lower() == "true"
+    SQL_TOOL_CACHE_TTL_SECONDS: int = int(os.getenv("SQL_TOOL_CACHE_TTL_SECONDS", str(60 * 60 * 24)))
+    # SQL Tool 쿼리당 DB statement timeout (ms)
+    SQL_TOOL_STATEMENT_TIMEOUT_MS: int = int(os.getenv("SQL_TOOL_STATEMENT_TIMEOUT_MS", "10000"))
+
+    # Scripted fake LLM (LLM_PROVIDER=fake 또는 MAIN_MODEL=fake/scripted) - 오프라인 벤치마크용
+    FAKE_LLM_SCRIPT_PATH: str = os.getenv("FAKE_LLM_SCRIPT_PATH")
+    FAKE_LLM_LATENCY_MS: float = float(os.getenv("FAKE_LLM_LATENCY_MS", "0"))
+    FAKE_LLM_TOKEN_LATENCY_MS: float = float(os.getenv("FAKE_LLM_TOKEN_LATENCY_MS", "0"))
 
     # Multi-Agent Model Settings (format: "provider/model_name")
     MAIN_MODEL: str = os.getenv("MAIN_MODEL", "")
@@ -87,6 +126,17 @@ class Config:
     # Environment
     ENVIRONMENT: str = os.getenv("ENVIRONMENT", "development")
 
+    # UFCStats incremental scraping: 이벤트 종료 후 결과/보너스가 확정되기까지의 기간(일)
+    UFCSTATS_EVENT_SETTLE_DAYS: int = int(os.getenv("UFCSTATS_EVENT_SETTLE_DAYS", "7"))
+
+    # Crawler HTML 디스크 캐시: off | on | replay
+    CRAWLER_CACHE_MODE: str = os.getenv("CRAWLER_CACHE_MODE", "off").lower()
+    CRAWLER_CACHE_DIR: str = os.getenv("CRAWLER_CACHE_DIR")
+    CRAWLER_CACHE_TTL_SECONDS: int = int(os.getenv("CRAWLER_CACHE_TTL_SECONDS", str(60 * 60 * 24)))
+    CRAWLER_CACHE_TTL_UFCSTATS_SECONDS: int = int(os.getenv("CRAWLER_CACHE_TTL_UFCSTATS_SECONDS", str(60 * 60 * 24)))
+    CRAWLER_CACHE_TTL_UFC_SECONDS: int = int(os.getenv("CRAWLER_CACHE_TTL_UFC_SECONDS", str(60 * 60)))
+    CRAWLER_CACHE_TTL_TAPOLOGY_SECONDS: int = int(os.getenv("CRAWLER_CACHE_TTL_TAPOLOGY_SECONDS", str(60 * 60 * 24 * 7)))
+
     # Tapology Scrapling worker settings
     TAPOLOGY_FAILED_ATTEMPT_RETRY_DAYS: int = int(os.getenv("TAPOLOGY_FAILED_ATTEMPT_RETRY_DAYS", "10"))
     TAPOLOGY_SCRAPLING_DELAY_RANGE: str = os.getenv("TAPOLOGY_SCRAPLING_DELAY_RANGE", "4.0,8.0")
@@ -113,6 +163,12 @@ def get_database_url(is_test : bool = False) -> str:
         return f"postgresql+asyncpg://{Config.DB_USER}:{Config.DB_PASSWORD}@{Config.DB_HOST}:{Config.DB_PORT}/{Config.TEST_DB_NAME}"
     return f"postgresql+asyncpg://{Config.DB_USER}:{Config.DB_PASSWORD}@{Config.DB_HOST}:{Config.DB_PORT}/{Config.DB_NAME}"
 
+def get_replica_database_url(user: str, password: str) -> str | None:
+    """read replica URL (DB_REPLICA_HOST 미설정 시 None)"""
+    if not Config.DB_REPLICA_HOST:
+        return None
+    return f"postgresql+asyncpg://{user}:{password}@{Config.DB_REPLICA_HOST}:{Config.DB_REPLICA_PORT}/{Config.DB_NAME}"
+
 def get_logging_config() -> Dict[str, Any]:
     """로깅 설정을 반환합니다. Docker 환경에서는 stdout만 사용."""
     log_level = os.getenv("LOG_LEVEL", "INFO").upper()
@@ -0,0 +1,22 @@
+"""
+Conversation 도메인 예외 클래스
+"""
+from typing import Optional
+
+
+class ConversationException(Exception):
+    """Conversation 도메인의 기본 예외 클래스"""
+
+    def __init__(self, message: str, details: Optional[dict] = None):
+        self.message = message
+        self.details = details or {}
+        super().__init__(self.message)
+
+
+class InvalidPageCursorError(ConversationException):
+    """페이지네이션 커서 형식 오류"""
+
+    def __init__(self, cursor: str):
+        message = f"Invalid page cursor: {cursor}"
+        details = {"cursor": cursor}
+        super().__init__(message, details)
@@ -2,11 +2,12 @@ from typing import List, Optional, Dict
 from datetime import datetime
 
 from pydantic import ConfigDict
-from sqlalchemy import Column, String, Integer, ForeignKey, Text
+from sqlalchemy import Column, String, Integer, ForeignKey, Text, DateTime
 from sqlalchemy.dialects.postgresql import JSONB
 
 from sqlalchemy.orm import relationship
 from common.base_model import BaseModel, BaseSchema
+from common.utils import utc_now
 
 #############################
 ########## SCHEMA ###########
@@ -72,6 +73,7 @@ class ChatHistoryResponse(BaseSchema):
     messages: List[ChatMessageResponse]
     total_messages: int
     has_more: bool
+    next_cursor: Optional[str] = None  # 다음 페이지 조회용 keyset 커서
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -80,6 +82,7 @@ class ChatSessionListResponse(BaseSchema):
     """채팅 세션 목록 응답"""
     sessions: List[ChatSessionResponse]
     total_sessions: int
+    next_cursor: Optional[str] = None  # 다음 페이지 조회용 keyset 커서
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -121,6 +124,10 @@ class ConversationModel(BaseModel):
     user_id = Column(Integer, ForeignKey("user.id"), nullable=False)
     title = Column(Text, nullable=True)  # 채팅 세션 제목
 
+    # 세션 목록/히스토리 페이지네이션용 비정규화 컬럼 (메시지 추가 시 갱신)
+    last_activity_at = Column(DateTime, nullable=False, default=utc_now)  # 마지막 메시지 시간 (없으면 생성 시간)
+    message_count = Column(Integer, nullable=False, default=0)
+
     # 대화 압축 영속화
     compressed_context = Column(Text, nullable=True)
     compressed_sql_context = Column(JSONB, nullable=True)
@@ -137,7 +144,7 @@ class ConversationModel(BaseModel):
             id=self.id,
             user_id=self.user_id,
             title=self.title,
-            last_message_at=last_message_at or self.updated_at,
+            last_message_at=last_message_at or self.last_activity_at or self.updated_at,
             created_at=self.created_at,
             updated_at=self.updated_at,
         )
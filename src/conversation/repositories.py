@@ -1,16 +1,37 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
+import base64
+import binascii
 import uuid
 from datetime import datetime
 
-from sqlalchemy import select, update, desc, asc, func
+from sqlalchemy import select, update, desc, asc, func, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from conversation.models import (
     ConversationModel, MessageModel,
     ChatSessionResponse, ChatMessageResponse, ChatHistoryResponse
 )
+from conversation.exceptions import InvalidPageCursorError
 from common.utils import utc_now
 
+# 페이지네이션 커서 (created_at/last_activity_at, id) keyset
+
+def encode_page_cursor(timestamp: datetime, row_id: int) -> str:
+    """(timestamp, id) → URL-safe 커서 문자열"""
+    raw = f"{timestamp.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_page_cursor(cursor: str) -> Tuple[datetime, int]:
+    """커서 문자열 → (timestamp, id). 형식이 잘못되면 InvalidPageCursorError"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        timestamp, row_id = base64.urlsafe_b64decode(padded.encode()).decode().split("|")
+        return datetime.fromisoformat(timestamp), int(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidPageCursorError(cursor) from e
+
+
 # 채팅 세션 관리 함수들
 
 async def create_chat_session(
@@ -42,31 +63,52 @@ async def get_user_chat_sessions(
     session: AsyncSession, 
     user_id: int,
     limit: int = 20,
-    offset: int = 0
+    offset: int = 0,
+    cursor: Optional[str] = None,
 ) -> List[ChatSessionResponse]:
     """
-    사용자의 채팅 세션 목록 조회 (최신순).
+    사용자의 채팅 세션 목록 조회 (마지막 활동 최신순).
+    cursor가 있으면 (last_activity_at, id) keyset으로 다음 페이지를 조회하고 offset은 무시합니다.
     """
-    # 세션 목록과 마지막 메시지 시간 조회
-    result = await session.execute(
-        select(
-            ConversationModel,
-            func.max(MessageModel.created_at).label('last_message_at')
-        )
-        .outerjoin(MessageModel, ConversationModel.id == MessageModel.conversation_id)
+    sessions, _ = await get_user_chat_sessions_page(session, user_id, limit, offset, cursor)
+    return sessions
+
+
+async def get_user_chat_sessions_page(
+    session: AsyncSession,
+    user_id: int,
+    limit: int = 20,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+) -> Tuple[List[ChatSessionResponse], Optional[str]]:
+    """
+    get_user_chat_sessions와 같은 목록과 다음 페이지 커서를 반환합니다.
+    get_chat_history와 같이 limit + 1개를 조회하여 다음 페이지가 있을 때만 커서를 만듭니다.
+    """
+    stmt = (
+        select(ConversationModel)
         .where(ConversationModel.user_id == user_id)
-        .group_by(ConversationModel.id)
-        .order_by(desc(ConversationModel.updated_at))
-        .offset(offset)
-        .limit(limit)
+        .order_by(desc(ConversationModel.last_activity_at), desc(ConversationModel.id))
+        .limit(limit + 1)
     )
-    
-    sessions = []
-    for row in result:
-        conv, last_message_at = row
-        sessions.append(conv.to_session_response(last_message_at=last_message_at))
-    
-    return sessions
+    if cursor:
+        last_activity_at, conversation_id = decode_page_cursor(cursor)
+        stmt = stmt.where(
+            tuple_(ConversationModel.last_activity_at, ConversationModel.id)
+            < tuple_(last_activity_at, conversation_id)
+        )
+    elif offset:
+        stmt = stmt.offset(offset)
+
+    result = await session.execute(stmt)
+    conversations = list(result.scalars().all())
+
+    has_more = len(conversations) > limit
+    conversations = conversations[:limit]
+    next_cursor = (
+        encode_page_cursor(conversations[-1].last_activity_at, conversations[-1].id) if has_more else None
+    )
+    return [conv.to_session_response() for conv in conversations], next_cursor
 
 
 async def get_chat_session_by_id(
@@ -146,10 +188,13 @@ async def get_chat_history(
     conversation_id: int,
     user_id: int,
     limit: int = 50,
-    offset: int = 0
+    offset: int = 0,
+    cursor: Optional[str] = None,
 ) -> Optional[ChatHistoryResponse]:
     """
-    채팅 히스토리 조회 (페이지네이션 지원, 새로운 Message 테이블 사용).
+    채팅 히스토리 조회 (시간순, 페이지네이션 지원).
+    cursor가 있으면 (created_at, id) keyset으로 이후 메시지를 조회하고 offset은 무시합니다.
+    전체 메시지 수는 conversation.message_count를 사용합니다.
     """
     # 세션 존재 확인
     conv_result = await session.execute(
@@ -164,32 +209,34 @@ async def get_chat_history(
     if not conversation:
         return None
 
-    # 전체 메시지 수 조회
-    total_count_result = await session.execute(
-        select(func.count(MessageModel.id))
-        .where(MessageModel.conversation_id == conversation_id)
-    )
-    total_messages = total_count_result.scalar() or 0
-
-    # 메시지 목록 조회 (페이지네이션 적용)
-    messages_result = await session.execute(
+    # 메시지 목록 조회 (has_more 판단을 위해 limit + 1개)
+    stmt = (
         select(MessageModel)
         .where(MessageModel.conversation_id == conversation_id)
-        .order_by(MessageModel.created_at)
-        .offset(offset)
-        .limit(limit)
+        .order_by(MessageModel.created_at, MessageModel.id)
+        .limit(limit + 1)
     )
+    if cursor:
+        created_at, message_pk = decode_page_cursor(cursor)
+        stmt = stmt.where(
+            tuple_(MessageModel.created_at, MessageModel.id) > tuple_(created_at, message_pk)
+        )
+    elif offset:
+        stmt = stmt.offset(offset)
 
-    messages = messages_result.scalars().all()
-    message_responses = [msg.to_response() for msg in messages]
+    messages_result = await session.execute(stmt)
+    messages = list(messages_result.scalars().all())
 
-    has_more = offset + limit < total_messages
+    has_more = len(messages) > limit
+    messages = messages[:limit]
+    next_cursor = encode_page_cursor(messages[-1].created_at, messages[-1].id) if has_more else None
 
     return ChatHistoryResponse(
         conversation_id=conversation_id,
-        messages=message_responses,
-        total_messages=total_messages,
-        has_more=has_more
+        messages=[msg.to_response() for msg in messages],
+        total_messages=conversation.message_count or 0,
+        has_more=has_more,
+        next_cursor=next_cursor,
     )
 
 
@@ -231,8 +278,11 @@ async def add_message_to_session(
     
     session.add(new_message)
     
-    # 대화 세션의 updated_at 갱신
-    conversation.updated_at = utc_now()
+    # 대화 세션의 updated_at / 마지막 활동 / 메시지 수 갱신
+    now = utc_now()
+    conversation.updated_at = now
+    conversation.last_activity_at = now
+    conversation.message_count = ConversationModel.message_count + 1
     session.add(conversation)
     
     await session.flush()
@@ -283,11 +333,16 @@ async def add_message_direct(
     )
     session.add(message)
 
-    # 대화 세션의 updated_at 갱신
+    # 대화 세션의 updated_at / 마지막 활동 / 메시지 수 갱신
+    now = utc_now()
     await session.execute(
         update(ConversationModel)
         .where(ConversationModel.id == conversation_id)
-        .values(updated_at=utc_now())
+        .values(
+            updated_at=now,
+            last_activity_at=now,
+            message_count=ConversationModel.message_count + 1,
+        )
     )
 
     await session.flush()
@@ -31,23 +31,26 @@ async def get_user_sessions(
     db: AsyncSession,
     user_id: int,
     limit: int = 20,
-    offset: int = 0
+    offset: int = 0,
+    cursor: Optional[str] = None,
 ) -> ChatSessionListResponse:
     """
-    사용자의 채팅 세션 목록 조회
+    사용자의 채팅 세션 목록 조회 (cursor가 있으면 keyset 페이지네이션)
     """
-    sessions = await conv_repo.get_user_chat_sessions(
+    sessions, next_cursor = await conv_repo.get_user_chat_sessions_page(
         session=db,
         user_id=user_id,
         limit=limit,
-        offset=offset
+        offset=offset,
+        cursor=cursor,
     )
 
     total_count = await conv_repo.get_user_chat_sessions_count(db, user_id)
 
     return ChatSessionListResponse(
         sessions=sessions,
-        total_sessions=total_count
+        total_sessions=total_count,
+        next_cursor=next_cursor,
     )
 
 
@@ -103,17 +106,19 @@ async def get_session_history(
     conversation_id: int,
     user_id: int,
     limit: int = 50,
-    offset: int = 0
+    offset: int = 0,
+    cursor: Optional[str] = None,
 ) -> Optional[ChatHistoryResponse]:
     """
-    채팅 히스토리 조회
+    채팅 히스토리 조회 (cursor가 있으면 keyset 페이지네이션)
     """
     return await conv_repo.get_chat_history(
         session=db,
         conversation_id=conversation_id,
         user_id=user_id,
         limit=limit,
-        offset=offset
+        offset=offset,
+        cursor=cursor,
     )
 
 
@@ -17,6 +17,28 @@ def _wc_filter(
     return "", {}
 
 
+# ===========================
+# Materialized stats views
+# ===========================
+
+# 07_create_dashboard_stats_views.sql 에 정의. weight_class_id = 0 은 전체 체급 합계 행
+STATS_VIEWS = ("mv_fighter_stats", "mv_weight_class_stats")
+ALL_WEIGHT_CLASSES = 0
+
+
+def _scope_params(weight_class_id: Optional[int], **params: Any) -> dict:
+    """mv_fighter_stats 조회용 파라미터 (체급 미지정 시 전체 합계 행 사용)"""
+    params["weight_class_id"] = weight_class_id if weight_class_id is not None else ALL_WEIGHT_CLASSES
+    return params
+
+
+async def refresh_stats_views(session: AsyncSession, concurrently: bool = True) -> None:
+    """집계 materialized view 갱신. CONCURRENTLY는 갱신 중에도 조회를 막지 않음."""
+    option = "CONCURRENTLY " if concurrently else ""
+    for view in STATS_VIEWS:
+        await session.execute(text(f"REFRESH MATERIALIZED VIEW {option}{view}"))
+
+
 # ===========================
 # Tab 1: Home
 # ===========================
@@ -148,19 +170,15 @@ async def get_finish_methods(
 async def get_weight_class_activity(session: AsyncSession) -> List[Dict[str, Any]]:
     result = await session.execute(text("""
         SELECT
-            wc.name AS weight_class,
-            COUNT(*) AS total_fights,
-            COUNT(CASE WHEN m.method LIKE 'KO/TKO%' THEN 1 END) AS ko_tko_count,
-            COUNT(CASE WHEN m.method LIKE 'SUB-%' THEN 1 END) AS sub_count,
-            ROUND(
-                COUNT(CASE WHEN m.method LIKE 'KO/TKO%' OR m.method LIKE 'SUB-%' THEN 1 END) * 100.0 / COUNT(*), 1
-            ) AS finish_rate,
-            ROUND(COUNT(CASE WHEN m.method LIKE 'KO/TKO%' THEN 1 END) * 100.0 / COUNT(*), 1) AS ko_tko_rate,
-            ROUND(COUNT(CASE WHEN m.method LIKE 'SUB-%' THEN 1 END) * 100.0 / COUNT(*), 1) AS sub_rate
-        FROM match m
-        JOIN weight_class wc ON m.weight_class_id = wc.id
-        WHERE m.method IS NOT NULL
-        GROUP BY wc.name
+            weight_class,
+            total_fights,
+            ko_tko_count,
+            sub_count,
+            ROUND((ko_tko_count + sub_count) * 100.0 / total_fights, 1) AS finish_rate,
+            ROUND(ko_tko_count * 100.0 / total_fights, 1) AS ko_tko_rate,
+            ROUND(sub_count * 100.0 / total_fights, 1) AS sub_rate
+        FROM mv_weight_class_stats
+        WHERE total_fights > 0
         ORDER BY total_fights DESC
     """))
     return [dict(row) for row in result.mappings().all()]
@@ -185,67 +203,25 @@ async def get_leaderboard_wins(
     limit: int = 10,
     ufc_only: bool = False,
 ) -> List[Dict[str, Any]]:
-    method_cols = """
-                COUNT(CASE WHEN fm.result = 'win' AND m.method LIKE 'KO/TKO%' THEN 1 END) AS ko_tko_wins,
-                COUNT(CASE WHEN fm.result = 'win' AND m.method LIKE 'SUB-%' THEN 1 END) AS sub_wins,
-                COUNT(CASE WHEN fm.result = 'win' THEN 1 END)
-                  - COUNT(CASE WHEN fm.result = 'win' AND m.method LIKE 'KO/TKO%' THEN 1 END)
-                  - COUNT(CASE WHEN fm.result = 'win' AND m.method LIKE 'SUB-%' THEN 1 END) AS dec_wins
-    """
-
-    if weight_class_id is not None:
-        result = await session.execute(text(f"""
-            SELECT
-                f.id AS fighter_id,
-                f.name,
-                COUNT(CASE WHEN fm.result = 'win' THEN 1 END) AS wins,
-                COUNT(CASE WHEN fm.result = 'loss' THEN 1 END) AS losses,
-                COUNT(CASE WHEN fm.result = 'draw' THEN 1 END) AS draws,
-                {method_cols}
-            FROM fighter f
-            JOIN fighter_match fm ON f.id = fm.fighter_id
-            JOIN match m ON fm.match_id = m.id
-            WHERE m.weight_class_id = :weight_class_id
-            GROUP BY f.id, f.name
-            ORDER BY wins DESC
-            LIMIT :limit
-        """), {"weight_class_id": weight_class_id, "limit": limit})
-    elif ufc_only:
-        result = await session.execute(text(f"""
-            SELECT
-                f.id AS fighter_id,
-                f.name,
-                COUNT(CASE WHEN fm.result = 'win' THEN 1 END) AS wins,
-                COUNT(CASE WHEN fm.result = 'loss' THEN 1 END) AS losses,
-                COUNT(CASE WHEN fm.result = 'draw' THEN 1 END) AS draws,
-                {method_cols}
-            FROM fighter f
-            JOIN fighter_match fm ON f.id = fm.fighter_id
-            JOIN match m ON fm.match_id = m.id
-            GROUP BY f.id, f.name
-            ORDER BY wins DESC
-            LIMIT :limit
-        """), {"limit": limit})
-    else:
-        result = await session.execute(text(f"""
-            SELECT
-                f.id AS fighter_id,
-                f.name,
-                COUNT(CASE WHEN fm.result = 'win' THEN 1 END) AS wins,
-                COUNT(CASE WHEN fm.result = 'loss' THEN 1 END) AS losses,
-                COUNT(CASE WHEN fm.result = 'draw' THEN 1 END) AS draws,
-                {method_cols}
-            FROM fighter f
-            JOIN fighter_match fm ON f.id = fm.fighter_id
-            JOIN match m ON fm.match_id = m.id
-            GROUP BY f.id, f.name
-            ORDER BY wins DESC
-            LIMIT :limit
-        """), {"limit": limit})
+    # ufc_only: fighter_match 집계는 UFC 경기 기록만 담으므로 결과 동일 (시그니처 호환용)
+    result = await session.execute(text("""
+        SELECT
+            fighter_id,
+            name,
+            wins,
+            losses,
+            draws,
+            ko_tko_wins,
+            sub_wins,
+            wins - ko_tko_wins - sub_wins AS dec_wins
+        FROM mv_fighter_stats
+        WHERE weight_class_id = :weight_class_id
+        ORDER BY wins DESC
+        LIMIT :limit
+    """), _scope_params(weight_class_id, limit=limit))
     return [dict(row) for row in result.mappings().all()]
 
 
-
 async def get_win_streak_leaders(
     session: AsyncSession,
     weight_class_id: Optional[int] = None,
@@ -433,82 +409,55 @@ async def get_strike_targets(
 async def get_striking_accuracy(
     session: AsyncSession, weight_class_id: Optional[int] = None, min_fights: int = 10, limit: int = 10
 ) -> List[Dict[str, Any]]:
-    wc_clause, params = _wc_filter(weight_class_id)
-    params["min_fights"] = min_fights
-    params["limit"] = limit
-    if not wc_clause:
-        where_clause = ""
-    else:
-        where_clause = f"WHERE {wc_clause.lstrip('AND ')}"
-    result = await session.execute(text(f"""
+    result = await session.execute(text("""
         SELECT
-            f.id AS fighter_id,
-            f.name,
-            SUM(ms.sig_str_landed) AS total_sig_landed,
-            SUM(ms.sig_str_attempted) AS total_sig_attempted,
-            ROUND(SUM(ms.sig_str_landed) * 100.0 / NULLIF(SUM(ms.sig_str_attempted), 0), 1) AS accuracy
-        FROM match_statistics ms
-        JOIN fighter_match fm ON ms.fighter_match_id = fm.id
-        JOIN fighter f ON fm.fighter_id = f.id
-        JOIN match m ON fm.match_id = m.id
-        {where_clause}
-        GROUP BY f.id, f.name
-        HAVING COUNT(DISTINCT fm.match_id) >= :min_fights AND SUM(ms.sig_str_attempted) > 0
+            fighter_id,
+            name,
+            sig_str_landed AS total_sig_landed,
+            sig_str_attempted AS total_sig_attempted,
+            ROUND(sig_str_landed * 100.0 / NULLIF(sig_str_attempted, 0), 1) AS accuracy
+        FROM mv_fighter_stats
+        WHERE weight_class_id = :weight_class_id
+            AND stat_fights >= :min_fights
+            AND sig_str_attempted > 0
         ORDER BY accuracy DESC
         LIMIT :limit
-    """), params)
+    """), _scope_params(weight_class_id, min_fights=min_fights, limit=limit))
     return [dict(row) for row in result.mappings().all()]
 
 
 async def get_ko_tko_leaders(
     session: AsyncSession, weight_class_id: Optional[int] = None, limit: int = 10
 ) -> List[Dict[str, Any]]:
-    wc_clause, params = _wc_filter(weight_class_id)
-    params["limit"] = limit
-    result = await session.execute(text(f"""
+    result = await session.execute(text("""
         SELECT
-            f.id AS fighter_id,
-            f.name,
-            COUNT(*) AS ko_tko_finishes
-        FROM fighter_match fm
-        JOIN fighter f ON fm.fighter_id = f.id
-        JOIN match m ON fm.match_id = m.id
-        WHERE fm.result = 'win'
-            AND m.method LIKE 'KO/TKO%'
-            {wc_clause}
-        GROUP BY f.id, f.name
+            fighter_id,
+            name,
+            ko_tko_wins AS ko_tko_finishes
+        FROM mv_fighter_stats
+        WHERE weight_class_id = :weight_class_id
+            AND ko_tko_wins > 0
         ORDER BY ko_tko_finishes DESC
         LIMIT :limit
-    """), params)
+    """), _scope_params(weight_class_id, limit=limit))
     return [dict(row) for row in result.mappings().all()]
 
 
 async def get_sig_strikes_per_fight(
     session: AsyncSession, weight_class_id: Optional[int] = None, min_fights: int = 10, limit: int = 10
 ) -> List[Dict[str, Any]]:
-    wc_clause, params = _wc_filter(weight_class_id)
-    params["min_fights"] = min_fights
-    params["limit"] = limit
-    if not wc_clause:
-        where_clause = ""
-    else:
-        where_clause = f"WHERE {wc_clause.lstrip('AND ')}"
-    result = await session.execute(text(f"""
+    result = await session.execute(text("""
         SELECT
-            f.id AS fighter_id,
-            f.name,
-            ROUND(SUM(ms.sig_str_landed)::numeric / COUNT(DISTINCT fm.match_id), 2) AS sig_str_per_fight,
-            COUNT(DISTINCT fm.match_id) AS total_fights
-        FROM match_statistics ms
-        JOIN fighter_match fm ON ms.fighter_match_id = fm.id
-        JOIN fighter f ON fm.fighter_id = f.id
-        JOIN match m ON fm.match_id = m.id
-        {where_clause}
-        GROUP BY f.id, f.name
-        HAVING COUNT(DISTINCT fm.match_id) >= :min_fights
+            fighter_id,
+            name,
+            ROUND(sig_str_landed::numeric / stat_fights, 2) AS sig_str_per_fight,
+            stat_fights AS total_fights
+        FROM mv_fighter_stats
+        WHERE weight_class_id = :weight_class_id
+            AND stat_fights >= :min_fights
         ORDER BY sig_str_per_fight DESC
         LIMIT :limit
-    """), params)
+    """), _scope_params(weight_class_id, min_fights=min_fights, limit=limit))
     return [dict(row) for row in result.mappings().all()]
 
 
@@ -519,30 +468,20 @@ async def get_sig_strikes_per_fight(
 async def get_takedown_accuracy(
     session: AsyncSession, weight_class_id: Optional[int] = None, min_fights: int = 10, limit: int = 10
 ) -> List[Dict[str, Any]]:
-    wc_clause, params = _wc_filter(weight_class_id)
-    params["min_fights"] = min_fights
-    params["limit"] = limit
-    if not wc_clause:
-        where_clause = ""
-    else:
-        where_clause = f"WHERE {wc_clause.lstrip('AND ')}"
-    result = await session.execute(text(f"""
+    result = await session.execute(text("""
         SELECT
-            f.id AS fighter_id,
-            f.name,
-            SUM(ms.td_landed) AS total_td_landed,
-            SUM(ms.td_attempted) AS total_td_attempted,
-            ROUND(SUM(ms.td_landed) * 100.0 / NULLIF(SUM(ms.td_attempted), 0), 1) AS td_accuracy
-        FROM match_statistics ms
-        JOIN fighter_match fm ON ms.fighter_match_id = fm.id
-        JOIN fighter f ON fm.fighter_id = f.id
-        JOIN match m ON fm.match_id = m.id
-        {where_clause}
-        GROUP BY f.id, f.name
-        HAVING COUNT(DISTINCT fm.match_id) >= :min_fights AND SUM(ms.td_attempted) >= :min_fights
+            fighter_id,
+            name,
+            td_landed AS total_td_landed,
+            td_attempted AS total_td_attempted,
+            ROUND(td_landed * 100.0 / NULLIF(td_attempted, 0), 1) AS td_accuracy
+        FROM mv_fighter_stats
+        WHERE weight_class_id = :weight_class_id
+            AND stat_fights >= :min_fights
+            AND td_attempted >= :min_fights
         ORDER BY td_accuracy DESC
         LIMIT :limit
-    """), params)
+    """), _scope_params(weight_class_id, min_fights=min_fights, limit=limit))
     return [dict(row) for row in result.mappings().all()]
 
 
@@ -568,15 +507,11 @@ async def get_submission_techniques(
 async def get_control_time(session: AsyncSession) -> List[Dict[str, Any]]:
     result = await session.execute(text("""
         SELECT
-            wc.name AS weight_class,
-            ROUND(AVG(ms.control_time_seconds), 0)::int AS avg_control_seconds,
-            COUNT(DISTINCT fm.match_id) AS total_fights
-        FROM match_statistics ms
-        JOIN fighter_match fm ON ms.fighter_match_id = fm.id
-        JOIN match m ON fm.match_id = m.id
-        JOIN weight_class wc ON m.weight_class_id = wc.id
-        WHERE ms.control_time_seconds > 0
-        GROUP BY wc.name
+            weight_class,
+            ROUND(control_time_seconds::numeric / control_rounds, 0)::int AS avg_control_seconds,
+            control_fights AS total_fights
+        FROM mv_weight_class_stats
+        WHERE control_rounds > 0
         ORDER BY avg_control_seconds DESC
     """))
     return [dict(row) for row in result.mappings().all()]
@@ -585,65 +520,38 @@ async def get_control_time(session: AsyncSession) -> List[Dict[str, Any]]:
 async def get_ground_strikes(
     session: AsyncSession, weight_class_id: Optional[int] = None, min_fights: int = 10, limit: int = 10
 ) -> List[Dict[str, Any]]:
-    wc_clause, params = _wc_filter(weight_class_id)
-    params["min_fights"] = min_fights
-    params["limit"] = limit
-    if not wc_clause:
-        where_clause = ""
-    else:
-        where_clause = f"WHERE {wc_clause.lstrip('AND ')}"
-    result = await session.execute(text(f"""
+    result = await session.execute(text("""
         SELECT
-            f.id AS fighter_id,
-            f.name,
-            SUM(sd.ground_strikes_landed) AS total_ground_landed,
-            SUM(sd.ground_strikes_attempts) AS total_ground_attempted,
-            ROUND(SUM(sd.ground_strikes_landed) * 100.0 / NULLIF(SUM(sd.ground_strikes_attempts), 0), 1) AS accuracy
-        FROM strike_detail sd
-        JOIN fighter_match fm ON sd.fighter_match_id = fm.id
-        JOIN fighter f ON fm.fighter_id = f.id
-        JOIN match m ON fm.match_id = m.id
-        {where_clause}
-        GROUP BY f.id, f.name
-        HAVING COUNT(DISTINCT fm.match_id) >= :min_fights AND SUM(sd.ground_strikes_attempts) > 0
+            fighter_id,
+            name,
+            ground_strikes_landed AS total_ground_landed,
+            ground_strikes_attempts AS total_ground_attempted,
+            ROUND(ground_strikes_landed * 100.0 / NULLIF(ground_strikes_attempts, 0), 1) AS accuracy
+        FROM mv_fighter_stats
+        WHERE weight_class_id = :weight_class_id
+            AND strike_detail_fights >= :min_fights
+            AND ground_strikes_attempts > 0
         ORDER BY total_ground_landed DESC
         LIMIT :limit
-    """), params)
+    """), _scope_params(weight_class_id, min_fights=min_fights, limit=limit))
     return [dict(row) for row in result.mappings().all()]
 
 
 async def get_submission_efficiency_fighters(
     session: AsyncSession, weight_class_id: Optional[int] = None, min_fights: int = 10, limit: int = 10
 ) -> List[Dict[str, Any]]:
-    wc_clause, params = _wc_filter(weight_class_id)
-    params["min_fights"] = min_fights
-    params["limit"] = limit
-    result = await session.execute(text(f"""
-        WITH per_fight AS (
-            SELECT
-                fm.fighter_id,
-                fm.match_id,
-                SUM(ms.submission_attempts) AS fight_sub_attempts,
-                MAX(CASE WHEN m.method LIKE 'SUB-%%' AND fm.result = 'win'
-                         THEN 1 ELSE 0 END) AS is_sub_win
-            FROM match_statistics ms
-            JOIN fighter_match fm ON ms.fighter_match_id = fm.id
-            JOIN match m ON fm.match_id = m.id
-            WHERE 1=1 {wc_clause}
-            GROUP BY fm.fighter_id, fm.match_id
-        )
+    result = await session.execute(text("""
         SELECT
-            f.id AS fighter_id,
-            f.name,
-            GREATEST(SUM(pf.fight_sub_attempts), SUM(pf.is_sub_win))::int AS total_sub_attempts,
-            SUM(pf.is_sub_win)::int AS sub_finishes
-        FROM per_fight pf
-        JOIN fighter f ON pf.fighter_id = f.id
-        GROUP BY f.id, f.name
-        HAVING COUNT(*) >= :min_fights
+            fighter_id,
+            name,
+            GREATEST(submission_attempts, stat_sub_wins)::int AS total_sub_attempts,
+            stat_sub_wins::int AS sub_finishes
+        FROM mv_fighter_stats
+        WHERE weight_class_id = :weight_class_id
+            AND stat_fights >= :min_fights
         ORDER BY sub_finishes DESC
         LIMIT :limit
-    """), params)
+    """), _scope_params(weight_class_id, min_fights=min_fights, limit=limit))
     return [dict(row) for row in result.mappings().all()]
 
 
@@ -655,6 +563,9 @@ async def get_category_leaders(session: AsyncSession) -> List[Dict[str, Any]]:
     """8개 분야별 역대 1위 선수 조회"""
     result = await session.execute(text("""
         WITH
+        totals AS (
+            SELECT * FROM mv_fighter_stats WHERE weight_class_id = 0
+        ),
         most_wins AS (
             SELECT 'most_wins' AS category, '최다승' AS label, f.id AS fighter_id, f.name,
                    f.wins::numeric AS value, 'wins' AS unit
@@ -668,63 +579,48 @@ async def get_category_leaders(session: AsyncSession) -> List[Dict[str, Any]]:
             ORDER BY value DESC LIMIT 1
         ),
         most_ko_tko AS (
-            SELECT 'most_ko_tko' AS category, 'KO/TKO 최다' AS label, f.id AS fighter_id, f.name,
-                   COUNT(*)::numeric AS value, 'finishes' AS unit
-            FROM fighter_match fm
-            JOIN fighter f ON fm.fighter_id = f.id
-            JOIN match m ON fm.match_id = m.id
-            WHERE fm.result = 'win' AND m.method LIKE 'KO/TKO%'
-            GROUP BY f.id, f.name ORDER BY value DESC LIMIT 1
+            SELECT 'most_ko_tko' AS category, 'KO/TKO 최다' AS label, t.fighter_id, t.name,
+                   t.ko_tko_wins::numeric AS value, 'finishes' AS unit
+            FROM totals t
+            WHERE t.ko_tko_wins > 0
+            ORDER BY value DESC LIMIT 1
         ),
         most_submissions AS (
-            SELECT 'most_submissions' AS category, '서브미션 최다' AS label, f.id AS fighter_id, f.name,
-                   COUNT(*)::numeric AS value, 'finishes' AS unit
-            FROM fighter_match fm
-            JOIN fighter f ON fm.fighter_id = f.id
-            JOIN match m ON fm.match_id = m.id
-            WHERE fm.result = 'win' AND m.method LIKE 'SUB-%'
-            GROUP BY f.id, f.name ORDER BY value DESC LIMIT 1
+            SELECT 'most_submissions' AS category, '서브미션 최다' AS label, t.fighter_id, t.name,
+                   t.sub_wins::numeric AS value, 'finishes' AS unit
+            FROM totals t
+            WHERE t.sub_wins > 0
+            ORDER BY value DESC LIMIT 1
         ),
         best_striking_acc AS (
-            SELECT 'best_striking_acc' AS category, '타격 정확도' AS label, f.id AS fighter_id, f.name,
-                   ROUND(SUM(ms.sig_str_landed) * 100.0 / NULLIF(SUM(ms.sig_str_attempted), 0), 1) AS value,
+            SELECT 'best_striking_acc' AS category, '타격 정확도' AS label, t.fighter_id, t.name,
+                   ROUND(t.sig_str_landed * 100.0 / NULLIF(t.sig_str_attempted, 0), 1) AS value,
                    '%' AS unit
-            FROM match_statistics ms
-            JOIN fighter_match fm ON ms.fighter_match_id = fm.id
-            JOIN fighter f ON fm.fighter_id = f.id
-            GROUP BY f.id, f.name
-            HAVING COUNT(DISTINCT fm.match_id) >= 10 AND SUM(ms.sig_str_attempted) > 0
+            FROM totals t
+            WHERE t.stat_fights >= 10 AND t.sig_str_attempted > 0
             ORDER BY value DESC LIMIT 1
         ),
         most_sig_str AS (
-            SELECT 'most_sig_str' AS category, '경기당 유효타격' AS label, f.id AS fighter_id, f.name,
-                   ROUND(SUM(ms.sig_str_landed)::numeric / COUNT(DISTINCT fm.match_id), 2) AS value,
+            SELECT 'most_sig_str' AS category, '경기당 유효타격' AS label, t.fighter_id, t.name,
+                   ROUND(t.sig_str_landed::numeric / t.stat_fights, 2) AS value,
                    'per fight' AS unit
-            FROM match_statistics ms
-            JOIN fighter_match fm ON ms.fighter_match_id = fm.id
-            JOIN fighter f ON fm.fighter_id = f.id
-            GROUP BY f.id, f.name
-            HAVING COUNT(DISTINCT fm.match_id) >= 10
+            FROM totals t
+            WHERE t.stat_fights >= 10
             ORDER BY value DESC LIMIT 1
         ),
         best_td_acc AS (
-            SELECT 'best_td_acc' AS category, '테이크다운 성공률' AS label, f.id AS fighter_id, f.name,
-                   ROUND(SUM(ms.td_landed) * 100.0 / NULLIF(SUM(ms.td_attempted), 0), 1) AS value,
+            SELECT 'best_td_acc' AS category, '테이크다운 성공률' AS label, t.fighter_id, t.name,
+                   ROUND(t.td_landed * 100.0 / NULLIF(t.td_attempted, 0), 1) AS value,
                    '%' AS unit
-            FROM match_statistics ms
-            JOIN fighter_match fm ON ms.fighter_match_id = fm.id
-            JOIN fighter f ON fm.fighter_id = f.id
-            GROUP BY f.id, f.name
-            HAVING COUNT(DISTINCT fm.match_id) >= 10 AND SUM(ms.td_attempted) >= 10
+            FROM totals t
+            WHERE t.stat_fights >= 10 AND t.td_attempted >= 10
             ORDER BY value DESC LIMIT 1
         ),
         most_knockdowns AS (
-            SELECT 'most_knockdowns' AS category, '넉다운 최다' AS label, f.id AS fighter_id, f.name,
-                   SUM(ms.knockdowns)::numeric AS value, 'knockdowns' AS unit
-            FROM match_statistics ms
-            JOIN fighter_match fm ON ms.fighter_match_id = fm.id
-            JOIN fighter f ON fm.fighter_id = f.id
-            GROUP BY f.id, f.name
+            SELECT 'most_knockdowns' AS category, '넉다운 최다' AS label, t.fighter_id, t.name,
+                   t.knockdowns::numeric AS value, 'knockdowns' AS unit
+            FROM totals t
+            WHERE t.stat_fights > 0
             ORDER BY value DESC LIMIT 1
         )
         SELECT * FROM most_wins
@@ -802,42 +698,30 @@ async def get_nationality_distribution(
 async def get_knockdown_leaders(
     session: AsyncSession, weight_class_id: Optional[int] = None, limit: int = 10
 ) -> List[Dict[str, Any]]:
-    wc_clause, params = _wc_filter(weight_class_id)
-    params["limit"] = limit
-    result = await session.execute(text(f"""
+    result = await session.execute(text("""
         SELECT
-            f.id AS fighter_id,
-            f.name,
-            SUM(ms.knockdowns) AS total_knockdowns,
-            COUNT(DISTINCT fm.match_id) AS total_fights,
-            ROUND(SUM(ms.knockdowns)::numeric / COUNT(DISTINCT fm.match_id), 2) AS kd_per_fight
-        FROM match_statistics ms
-        JOIN fighter_match fm ON ms.fighter_match_id = fm.id
-        JOIN fighter f ON fm.fighter_id = f.id
-        JOIN match m ON fm.match_id = m.id
-        WHERE ms.knockdowns > 0
-            {wc_clause}
-        GROUP BY f.id, f.name
-        HAVING SUM(ms.knockdowns) > 0
+            fighter_id,
+            name,
+            knockdowns AS total_knockdowns,
+            knockdown_fights AS total_fights,
+            ROUND(knockdowns::numeric / knockdown_fights, 2) AS kd_per_fight
+        FROM mv_fighter_stats
+        WHERE weight_class_id = :weight_class_id
+            AND knockdown_fights > 0
         ORDER BY total_knockdowns DESC
         LIMIT :limit
-    """), params)
+    """), _scope_params(weight_class_id, limit=limit))
     return [dict(row) for row in result.mappings().all()]
 
 
 async def get_sig_strikes_by_weight_class(session: AsyncSession) -> List[Dict[str, Any]]:
     result = await session.execute(text("""
         SELECT
-            wc.name AS weight_class,
-            ROUND(
-                SUM(ms.sig_str_landed)::numeric / COUNT(DISTINCT fm.match_id), 2
-            ) AS avg_sig_str_per_fight,
-            COUNT(DISTINCT fm.match_id) AS total_fights
-        FROM match_statistics ms
-        JOIN fighter_match fm ON ms.fighter_match_id = fm.id
-        JOIN match m ON fm.match_id = m.id
-        JOIN weight_class wc ON m.weight_class_id = wc.id
-        GROUP BY wc.id, wc.name
+            weight_class,
+            ROUND(sig_str_landed::numeric / stat_fights, 2) AS avg_sig_str_per_fight,
+            stat_fights AS total_fights
+        FROM mv_weight_class_stats
+        WHERE stat_fights > 0
         ORDER BY avg_sig_str_per_fight DESC
     """))
     return [dict(row) for row in result.mappings().all()]
@@ -849,34 +733,22 @@ async def get_strike_exchange_ratio(
     min_fights: int = 10,
     limit: int = 10,
 ) -> List[Dict[str, Any]]:
-    wc_clause, params = _wc_filter(weight_class_id)
-    params["min_fights"] = min_fights
-    params["limit"] = limit
-    result = await session.execute(text(f"""
+    result = await session.execute(text("""
         SELECT
-            f.id AS fighter_id,
-            f.name,
-            COUNT(DISTINCT fm_mine.match_id) AS total_fights,
-            ROUND(SUM(ms_mine.sig_str_landed)::numeric / COUNT(DISTINCT fm_mine.match_id), 2) AS sig_landed_per_fight,
-            ROUND(SUM(ms_opp.sig_str_landed)::numeric / COUNT(DISTINCT fm_mine.match_id), 2) AS sig_absorbed_per_fight,
+            fighter_id,
+            name,
+            exchange_fights AS total_fights,
+            ROUND(exchange_sig_landed::numeric / exchange_fights, 2) AS sig_landed_per_fight,
+            ROUND(exchange_sig_absorbed::numeric / exchange_fights, 2) AS sig_absorbed_per_fight,
             ROUND(
-                (SUM(ms_mine.sig_str_landed) - SUM(ms_opp.sig_str_landed))::numeric
-                / COUNT(DISTINCT fm_mine.match_id), 2
+                (exchange_sig_landed - exchange_sig_absorbed)::numeric / exchange_fights, 2
             ) AS differential_per_fight
-        FROM fighter_match fm_mine
-        JOIN fighter_match fm_opp
-            ON fm_mine.match_id = fm_opp.match_id AND fm_mine.id != fm_opp.id
-        JOIN match_statistics ms_mine ON fm_mine.id = ms_mine.fighter_match_id
-        JOIN match_statistics ms_opp ON fm_opp.id = ms_opp.fighter_match_id
-        JOIN fighter f ON fm_mine.fighter_id = f.id
-        JOIN match m ON fm_mine.match_id = m.id
-        WHERE ms_mine.round = ms_opp.round
-            {wc_clause}
-        GROUP BY f.id, f.name
-        HAVING COUNT(DISTINCT fm_mine.match_id) >= :min_fights
+        FROM mv_fighter_stats
+        WHERE weight_class_id = :weight_class_id
+            AND exchange_fights >= :min_fights
         ORDER BY differential_per_fight DESC
         LIMIT :limit
-    """), params)
+    """), _scope_params(weight_class_id, min_fights=min_fights, limit=limit))
     return [dict(row) for row in result.mappings().all()]
 
 
@@ -921,44 +793,30 @@ async def get_td_attempts_leaders(
     limit: int = 10,
 ) -> Dict[str, Any]:
     """경기당 TD 시도 TOP + 평균값"""
-    wc_clause, params = _wc_filter(weight_class_id)
-    params["min_fights"] = min_fights
-    params["limit"] = limit
+    params = _scope_params(weight_class_id, min_fights=min_fights, limit=limit)
 
-    leaders_result = await session.execute(text(f"""
+    leaders_result = await session.execute(text("""
         SELECT
-            f.id AS fighter_id,
-            f.name,
-            ROUND(SUM(ms.td_attempted)::numeric / COUNT(DISTINCT fm.match_id), 2) AS td_attempts_per_fight,
-            SUM(ms.td_attempted) AS total_td_attempted,
-            SUM(ms.td_landed) AS total_td_landed,
-            COUNT(DISTINCT fm.match_id) AS total_fights
-        FROM match_statistics ms
-        JOIN fighter_match fm ON ms.fighter_match_id = fm.id
-        JOIN fighter f ON fm.fighter_id = f.id
-        JOIN match m ON fm.match_id = m.id
-        WHERE 1=1
-            {wc_clause}
-        GROUP BY f.id, f.name
-        HAVING COUNT(DISTINCT fm.match_id) >= :min_fights
+            fighter_id,
+            name,
+            ROUND(td_attempted::numeric / stat_fights, 2) AS td_attempts_per_fight,
+            td_attempted AS total_td_attempted,
+            td_landed AS total_td_landed,
+            stat_fights AS total_fights
+        FROM mv_fighter_stats
+        WHERE weight_class_id = :weight_class_id
+            AND stat_fights >= :min_fights
         ORDER BY td_attempts_per_fight DESC
         LIMIT :limit
     """), params)
     leaders = [dict(row) for row in leaders_result.mappings().all()]
 
     avg_params = {k: v for k, v in params.items() if k != "limit"}
-    avg_result = await session.execute(text(f"""
-        SELECT ROUND(AVG(td_attempts_per_fight)::numeric, 2) AS avg_td_attempts
-        FROM (
-            SELECT SUM(ms.td_attempted)::numeric / COUNT(DISTINCT fm.match_id) AS td_attempts_per_fight
-            FROM match_statistics ms
-            JOIN fighter_match fm ON ms.fighter_match_id = fm.id
-            JOIN match m ON fm.match_id = m.id
-            WHERE 1=1
-                {wc_clause}
-            GROUP BY fm.fighter_id
-            HAVING COUNT(DISTINCT fm.match_id) >= :min_fights
-        ) sub
+    avg_result = await session.execute(text("""
+        SELECT ROUND(AVG(td_attempted::numeric / stat_fights), 2) AS avg_td_attempts
+        FROM mv_fighter_stats
+        WHERE weight_class_id = :weight_class_id
+            AND stat_fights >= :min_fights
     """), avg_params)
     avg_row = avg_result.mappings().one()
 
@@ -1074,70 +932,39 @@ async def get_td_defense_leaders(
     min_fights: int = 10,
     limit: int = 10,
 ) -> List[Dict[str, Any]]:
-    wc_clause, params = _wc_filter(weight_class_id)
-    params["min_fights"] = min_fights
-    params["limit"] = limit
-    result = await session.execute(text(f"""
+    result = await session.execute(text("""
         SELECT
-            f.id AS fighter_id,
-            f.name,
-            SUM(ms_opp.td_attempted) AS opp_td_attempted,
-            SUM(ms_opp.td_landed) AS opp_td_landed,
-            SUM(ms_opp.td_attempted) - SUM(ms_opp.td_landed) AS td_defended,
+            fighter_id,
+            name,
+            opp_td_attempted,
+            opp_td_landed,
+            opp_td_attempted - opp_td_landed AS td_defended,
             ROUND(
-                (SUM(ms_opp.td_attempted) - SUM(ms_opp.td_landed)) * 100.0
-                / NULLIF(SUM(ms_opp.td_attempted), 0), 1
+                (opp_td_attempted - opp_td_landed) * 100.0
+                / NULLIF(opp_td_attempted, 0), 1
             ) AS td_defense_rate
-        FROM fighter_match fm_mine
-        JOIN fighter_match fm_opp
-            ON fm_mine.match_id = fm_opp.match_id AND fm_mine.id != fm_opp.id
-        JOIN match_statistics ms_opp ON fm_opp.id = ms_opp.fighter_match_id
-        JOIN fighter f ON fm_mine.fighter_id = f.id
-        JOIN match m ON fm_mine.match_id = m.id
-        WHERE ms_opp.round > 0
-            {wc_clause}
-        GROUP BY f.id, f.name
-        HAVING COUNT(DISTINCT fm_mine.match_id) >= :min_fights
-            AND SUM(ms_opp.td_attempted) >= 5
+        FROM mv_fighter_stats
+        WHERE weight_class_id = :weight_class_id
+            AND opp_td_fights >= :min_fights
+            AND opp_td_attempted >= 5
         ORDER BY td_defense_rate DESC
         LIMIT :limit
-    """), params)
+    """), _scope_params(weight_class_id, min_fights=min_fights, limit=limit))
     return [dict(row) for row in result.mappings().all()]
 
 
 async def get_submission_efficiency_avg_ratio(
     session: AsyncSession, weight_class_id: Optional[int] = None, min_fights: int = 10
 ) -> float:
-    wc_clause, params = _wc_filter(weight_class_id)
-    params["min_fights"] = min_fights
-    result = await session.execute(text(f"""
-        WITH per_fight AS (
-            SELECT
-                fm.fighter_id,
-                fm.match_id,
-                SUM(ms.submission_attempts) AS fight_sub_attempts,
-                MAX(CASE WHEN m.method LIKE 'SUB-%%' AND fm.result = 'win'
-                         THEN 1 ELSE 0 END) AS is_sub_win
-            FROM match_statistics ms
-            JOIN fighter_match fm ON ms.fighter_match_id = fm.id
-            JOIN match m ON fm.match_id = m.id
-            WHERE 1=1 {wc_clause}
-            GROUP BY fm.fighter_id, fm.match_id
-        ),
-        per_fighter AS (
-            SELECT
-                fighter_id,
-                GREATEST(SUM(fight_sub_attempts), SUM(is_sub_win)) AS total_sub_attempts,
-                SUM(is_sub_win) AS sub_finishes
-            FROM per_fight
-            GROUP BY fighter_id
-            HAVING COUNT(*) >= :min_fights
-        )
+    result = await session.execute(text("""
         SELECT
             ROUND(
-                SUM(sub_finishes)::numeric / NULLIF(SUM(total_sub_attempts), 0), 3
+                SUM(stat_sub_wins)::numeric
+                / NULLIF(SUM(GREATEST(submission_attempts, stat_sub_wins)), 0), 3
             ) AS avg_efficiency_ratio
-        FROM per_fighter
-    """), params)
+        FROM mv_fighter_stats
+        WHERE weight_class_id = :weight_class_id
+            AND stat_fights >= :min_fights
+    """), _scope_params(weight_class_id, min_fights=min_fights))
     row = result.mappings().one()
     return float(row["avg_efficiency_ratio"]) if row["avg_efficiency_ratio"] is not None else 0.0
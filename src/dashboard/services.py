@@ -2,9 +2,11 @@
 Dashboard 서비스 레이어
 Redis 캐싱 + Repository 호출 조합
 """
+import asyncio
 import json
 import logging
-from typing import List, Optional, Type, TypeVar
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Type, TypeVar
 from collections import defaultdict
 
 from pydantic import BaseModel, ValidationError
@@ -34,7 +36,9 @@ from dashboard.dto import (
     TdDefenseLeaderDTO, TdDefenseLeaderboardDTO,
 )
 from dashboard.exceptions import DashboardQueryError
-from database.connection.redis_conn import redis_client
+from config import Config
+from database.connection.postgres_conn import get_async_db_context, get_async_readonly_db_context
+from database.connection.redis_conn import async_redis_client
 
 logger = logging.getLogger(__name__)
 
@@ -42,12 +46,19 @@ logger = logging.getLogger(__name__)
 CACHE_TTL = 60 * 60 * 24 * 7  # 7일
 
 
-def invalidate_all_cache() -> int:
+async def invalidate_all_cache() -> int:
     """dashboard:* 패턴의 캐시를 모두 삭제. 삭제된 키 수 반환."""
-    keys = redis_client.keys("dashboard:*")
+    keys = [key async for key in async_redis_client.scan_iter(match="dashboard:*")]
     if not keys:
         return 0
-    return redis_client.delete(*keys)
+    return await async_redis_client.delete(*keys)
+
+
+async def refresh_stats_views() -> None:
+    """집계 materialized view 갱신. 수집 flow 종료 시 캐시 무효화 직전에 호출."""
+    async with get_async_db_context() as session:
+        await dashboard_repo.refresh_stats_views(session)
+        await session.commit()
 
 
 def _cache_key(
@@ -70,9 +81,9 @@ def _cache_key(
     return key
 
 
-def _get_cached(key: str) -> Optional[dict]:
+async def _get_cached(key: str) -> Optional[dict]:
     try:
-        data = redis_client.get(key)
+        data = await async_redis_client.get(key)
         if data:
             return json.loads(data)
     except Exception as e:
@@ -80,9 +91,9 @@ def _get_cached(key: str) -> Optional[dict]:
     return None
 
 
-def _set_cache(key: str, data: dict) -> None:
+async def _set_cache(key: str, data: dict) -> None:
     try:
-        redis_client.set(key, json.dumps(data, default=str), ex=CACHE_TTL)
+        await async_redis_client.set(key, json.dumps(data, default=str), ex=CACHE_TTL)
     except Exception as e:
         logger.warning(f"Redis cache write failed for {key}: {e}")
 
@@ -90,7 +101,7 @@ def _set_cache(key: str, data: dict) -> None:
 T = TypeVar("T", bound=BaseModel)
 
 
-def _parse_cached_data(
+async def _parse_cached_data(
     cache_key: str, model: Type[T], cached: dict, is_list: bool = False,
 ) -> Optional[T | List[T]]:
     """캐시 데이터를 DTO로 변환. 실패 시 stale 캐시를 삭제하고 None 반환."""
@@ -101,39 +112,75 @@ def _parse_cached_data(
     except (ValidationError, KeyError, TypeError):
         logger.warning(f"Stale cache detected for {cache_key}, deleting")
         try:
-            redis_client.delete(cache_key)
+            await async_redis_client.delete(cache_key)
         except Exception:
             pass
         return None
 
 
+ChartCall = Callable[[AsyncSession], Awaitable[Any]]
+
+
+async def _build_tab(
+    session: Optional[AsyncSession],
+    charts: Dict[str, ChartCall],
+    session_factory=None,
+    concurrency: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    탭을 구성하는 차트 조회를 실행하고 이름별 결과를 반환.
+
+    session이 주어지면 해당 세션에서 순차 실행 (AsyncSession은 동시 쿼리 불가).
+    없으면 차트마다 독립 readonly 세션을 열어 Semaphore로 동시 실행 수를 제한하며 병렬 조회.
+    """
+    if session is not None:
+        return {name: await call(session) for name, call in charts.items()}
+
+    session_factory = session_factory or get_async_readonly_db_context
+    semaphore = asyncio.Semaphore(concurrency or Config.DASHBOARD_TAB_CONCURRENCY)
+
+    async def _run(call: ChartCall) -> Any:
+        async with semaphore:
+            async with session_factory() as chart_session:
+                return await call(chart_session)
+
+    results = await asyncio.gather(*(_run(call) for call in charts.values()))
+    return dict(zip(charts.keys(), results))
+
+
 # ===========================
 # Tab 1: Home
 # ===========================
 
-async def get_home(session: AsyncSession) -> HomeResponseDTO:
+async def get_home(*, session: Optional[AsyncSession] = None) -> HomeResponseDTO:
     cache_key = _cache_key("home")
-    cached = _get_cached(cache_key)
+    cached = await _get_cached(cache_key)
     if cached:
         if "event_map" not in cached or "nationality_distribution" not in cached:
             try:
-                redis_client.delete(cache_key)
+                await async_redis_client.delete(cache_key)
             except Exception:
                 pass
             cached = None
     if cached:
-        result = _parse_cached_data(cache_key, HomeResponseDTO, cached)
+        result = await _parse_cached_data(cache_key, HomeResponseDTO, cached)
         if result:
             return result
 
     try:
-        summary_data = await dashboard_repo.get_summary(session)
-        recent_events_data = await dashboard_repo.get_recent_events(session)
-        upcoming_events_data = await dashboard_repo.get_upcoming_events(session)
-        rankings_data = await dashboard_repo.get_rankings(session)
-        category_leaders = await get_chart_category_leaders(session)
-        event_map = await get_chart_event_map(session)
-        nationality_distribution = await get_chart_nationality_distribution(session)
+        charts = await _build_tab(session, {
+            "summary": dashboard_repo.get_summary,
+            "recent_events": dashboard_repo.get_recent_events,
+            "upcoming_events": dashboard_repo.get_upcoming_events,
+            "rankings": dashboard_repo.get_rankings,
+            "category_leaders": get_chart_category_leaders,
+            "event_map": get_chart_event_map,
+            "nationality_distribution": get_chart_nationality_distribution,
+        })
+        summary_data = charts["summary"]
+        recent_events_data = charts["recent_events"]
+        upcoming_events_data = charts["upcoming_events"]
+        rankings_data = charts["rankings"]
 
         # rankings를 체급별로 그룹핑
         divisions = defaultdict(list)
@@ -164,12 +211,12 @@ async def get_home(session: AsyncSession) -> HomeResponseDTO:
             recent_events=[RecentEventDTO(**e) for e in recent_events_data],
             upcoming_events=[UpcomingEventDTO(**e) for e in upcoming_events_data],
             rankings=rankings,
-            category_leaders=category_leaders,
-            event_map=event_map,
-            nationality_distribution=nationality_distribution,
+            category_leaders=charts["category_leaders"],
+            event_map=charts["event_map"],
+            nationality_distribution=charts["nationality_distribution"],
         )
 
-        _set_cache(cache_key, response.model_dump())
+        await _set_cache(cache_key, response.model_dump())
         return response
 
     except Exception as e:
@@ -187,16 +234,16 @@ async def get_chart_finish_methods(
     weight_class_id: Optional[int] = None,
 ) -> List[FinishMethodDTO]:
     cache_key = _cache_key("finish_methods", weight_class_id, chart=True)
-    cached = _get_cached(cache_key)
+    cached = await _get_cached(cache_key)
     if cached:
-        parsed = _parse_cached_data(cache_key, FinishMethodDTO, cached, is_list=True)
+        parsed = await _parse_cached_data(cache_key, FinishMethodDTO, cached, is_list=True)
         if parsed is not None:
             return parsed
 
     try:
         data = await dashboard_repo.get_finish_methods(session, weight_class_id)
         result = [FinishMethodDTO(**r) for r in data]
-        _set_cache(cache_key, {"items": [item.model_dump() for item in result]})
+        await _set_cache(cache_key, {"items": [item.model_dump() for item in result]})
         return result
     except Exception as e:
         raise DashboardQueryError("get_chart_finish_methods", str(e))
@@ -207,9 +254,9 @@ async def get_chart_fight_duration(
     weight_class_id: Optional[int] = None,
 ) -> FightDurationDTO:
     cache_key = _cache_key("fight_duration", weight_class_id, chart=True)
-    cached = _get_cached(cache_key)
+    cached = await _get_cached(cache_key)
     if cached:
-        parsed = _parse_cached_data(cache_key, FightDurationDTO, cached)
+        parsed = await _parse_cached_data(cache_key, FightDurationDTO, cached)
         if parsed is not None:
             return parsed
 
@@ -223,7 +270,7 @@ async def get_chart_fight_duration(
             avg_round=avg_round,
             avg_time_seconds=avg_time,
         )
-        _set_cache(cache_key, result.model_dump())
+        await _set_cache(cache_key, result.model_dump())
         return result
     except Exception as e:
         raise DashboardQueryError("get_chart_fight_duration", str(e))
@@ -235,16 +282,16 @@ async def get_chart_leaderboard(
     ufc_only: bool = False,
 ) -> LeaderboardDTO:
     cache_key = _cache_key("leaderboard", weight_class_id, ufc_only=ufc_only, chart=True)
-    cached = _get_cached(cache_key)
+    cached = await _get_cached(cache_key)
     if cached:
         if "lose_streak" not in cached:
             try:
-                redis_client.delete(cache_key)
+                await async_redis_client.delete(cache_key)
             except Exception:
                 pass
             cached = None
     if cached:
-        parsed = _parse_cached_data(cache_key, LeaderboardDTO, cached)
+        parsed = await _parse_cached_data(cache_key, LeaderboardDTO, cached)
         if parsed is not None:
             return parsed
 
@@ -258,7 +305,7 @@ async def get_chart_leaderboard(
             win_streak=[WinStreakFighterDTO(**r) for r in win_streak_data],
             lose_streak=[LoseStreakFighterDTO(**r) for r in lose_streak_data],
         )
-        _set_cache(cache_key, result.model_dump())
+        await _set_cache(cache_key, result.model_dump())
         return result
     except Exception as e:
         raise DashboardQueryError("get_chart_leaderboard", str(e))
@@ -271,16 +318,16 @@ async def get_chart_strike_targets(
     weight_class_id: Optional[int] = None,
 ) -> List[StrikeTargetDTO]:
     cache_key = _cache_key("strike_targets", weight_class_id, chart=True)
-    cached = _get_cached(cache_key)
+    cached = await _get_cached(cache_key)
     if cached:
-        parsed = _parse_cached_data(cache_key, StrikeTargetDTO, cached, is_list=True)
+        parsed = await _parse_cached_data(cache_key, StrikeTargetDTO, cached, is_list=True)
         if parsed is not None:
             return parsed
 
     try:
         data = await dashboard_repo.get_strike_targets(session, weight_class_id)
         result = [StrikeTargetDTO(**r) for r in data]
-        _set_cache(cache_key, {"items": [item.model_dump() for item in result]})
+        await _set_cache(cache_key, {"items": [item.model_dump() for item in result]})
         return result
     except Exception as e:
         raise DashboardQueryError("get_chart_strike_targets", str(e))
@@ -293,9 +340,9 @@ async def get_chart_striking_accuracy(
     limit: int = 10,
 ) -> StrikingAccuracyLeaderboardDTO:
     cache_key = _cache_key("striking_accuracy", weight_class_id, min_fights, limit, chart=True)
-    cached = _get_cached(cache_key)
+    cached = await _get_cached(cache_key)
     if cached:
-        parsed = _parse_cached_data(cache_key, StrikingAccuracyLeaderboardDTO, cached)
+        parsed = await _parse_cached_data(cache_key, StrikingAccuracyLeaderboardDTO, cached)
         if parsed is not None:
             return parsed
 
@@ -309,7 +356,7 @@ async def get_chart_striking_accuracy(
             min15=[StrikingAccuracyDTO(**r) for r in acc15],
             min20=[StrikingAccuracyDTO(**r) for r in acc20],
         )
-        _set_cache(cache_key, result.model_dump())
+        await _set_cache(cache_key, result.model_dump())
         return result
     except Exception as e:
         raise DashboardQueryError("get_chart_striking_accuracy", str(e))
@@ -321,16 +368,16 @@ async def get_chart_ko_tko_leaders(
     limit: int = 10,
 ) -> List[KoTkoLeaderDTO]:
     cache_key = _cache_key("ko_tko_leaders", weight_class_id, limit=limit, chart=True)
-    cached = _get_cached(cache_key)
+    cached = await _get_cached(cache_key)
     if cached:
-        parsed = _parse_cached_data(cache_key, KoTkoLeaderDTO, cached, is_list=True)
+        parsed = await _parse_cached_data(cache_key, KoTkoLeaderDTO, cached, is_list=True)
         if parsed is not None:
             return parsed
 
     try:
         data = await dashboard_repo.get_ko_tko_leaders(session, weight_class_id, limit)
         result = [KoTkoLeaderDTO(**r) for r in data]
-        _set_cache(cache_key, {"items": [item.model_dump() for item in result]})
+        await _set_cache(cache_key, {"items": [item.model_dump() for item in result]})
         return result
     except Exception as e:
         raise DashboardQueryError("get_chart_ko_tko_leaders", str(e))
@@ -343,9 +390,9 @@ async def get_chart_sig_strikes(
     limit: int = 10,
 ) -> SigStrikesLeaderboardDTO:
     cache_key = _cache_key("sig_strikes", weight_class_id, min_fights, limit, chart=True)
-    cached = _get_cached(cache_key)
+    cached = await _get_cached(cache_key)
     if cached:
-        parsed = _parse_cached_data(cache_key, SigStrikesLeaderboardDTO, cached)
+        parsed = await _parse_cached_data(cache_key, SigStrikesLeaderboardDTO, cached)
         if parsed is not None:
             return parsed
 
@@ -359,7 +406,7 @@ async def get_chart_sig_strikes(
             min15=[SigStrikesPerFightDTO(**r) for r in sig15],
             min20=[SigStrikesPerFightDTO(**r) for r in sig20],
         )
-        _set_cache(cache_key, result.model_dump())
+        await _set_cache(cache_key, result.model_dump())
         return result
     except Exception as e:
         raise DashboardQueryError("get_chart_sig_strikes", str(e))
@@ -374,9 +421,9 @@ async def get_chart_takedown_accuracy(
     limit: int = 10,
 ) -> TakedownLeaderboardDTO:
     cache_key = _cache_key("takedown_accuracy", weight_class_id, min_fights, limit, chart=True)
-    cached = _get_cached(cache_key)
+    cached = await _get_cached(cache_key)
     if cached:
-        parsed = _parse_cached_data(cache_key, TakedownLeaderboardDTO, cached)
+        parsed = await _parse_cached_data(cache_key, TakedownLeaderboardDTO, cached)
         if parsed is not None:
             return parsed
 
@@ -390,7 +437,7 @@ async def get_chart_takedown_accuracy(
             min15=[TakedownAccuracyDTO(**r) for r in td15],
             min20=[TakedownAccuracyDTO(**r) for r in td20],
         )
-        _set_cache(cache_key, result.model_dump())
+        await _set_cache(cache_key, result.model_dump())
         return result
     except Exception as e:
         raise DashboardQueryError("get_chart_takedown_accuracy", str(e))
@@ -401,16 +448,16 @@ async def get_chart_submission_techniques(
     weight_class_id: Optional[int] = None,
 ) -> List[SubmissionTechniqueDTO]:
     cache_key = _cache_key("sub_techniques", weight_class_id, chart=True)
-    cached = _get_cached(cache_key)
+    cached = await _get_cached(cache_key)
     if cached:
-        parsed = _parse_cached_data(cache_key, SubmissionTechniqueDTO, cached, is_list=True)
+        parsed = await _parse_cached_data(cache_key, SubmissionTechniqueDTO, cached, is_list=True)
         if parsed is not None:
             return parsed
 
     try:
         data = await dashboard_repo.get_submission_techniques(session, weight_class_id)
         result = [SubmissionTechniqueDTO(**r) for r in data]
-        _set_cache(cache_key, {"items": [item.model_dump() for item in result]})
+        await _set_cache(cache_key, {"items": [item.model_dump() for item in result]})
         return result
     except Exception as e:
         raise DashboardQueryError("get_chart_submission_techniques", str(e))
@@ -423,16 +470,16 @@ async def get_chart_ground_strikes(
     limit: int = 10,
 ) -> List[GroundStrikesDTO]:
     cache_key = _cache_key("ground_strikes", weight_class_id, min_fights, limit, chart=True)
-    cached = _get_cached(cache_key)
+    cached = await _get_cached(cache_key)
     if cached:
-        parsed = _parse_cached_data(cache_key, GroundStrikesDTO, cached, is_list=True)
+        parsed = await _parse_cached_data(cache_key, GroundStrikesDTO, cached, is_list=True)
         if parsed is not None:
             return parsed
 
     try:
         data = await dashboard_repo.get_ground_strikes(session, weight_class_id, min_fights, limit)
         result = [GroundStrikesDTO(**r) for r in data]
-        _set_cache(cache_key, {"items": [item.model_dump() for item in result]})
+        await _set_cache(cache_key, {"items": [item.model_dump() for item in result]})
         return result
     except Exception as e:
         raise DashboardQueryError("get_chart_ground_strikes", str(e))
@@ -445,9 +492,9 @@ async def get_chart_submission_efficiency(
     limit: int = 10,
 ) -> SubmissionEfficiencyDTO:
     cache_key = _cache_key("sub_efficiency", weight_class_id, min_fights, limit, chart=True)
-    cached = _get_cached(cache_key)
+    cached = await _get_cached(cache_key)
     if cached:
-        parsed = _parse_cached_data(cache_key, SubmissionEfficiencyDTO, cached)
+        parsed = await _parse_cached_data(cache_key, SubmissionEfficiencyDTO, cached)
         if parsed is not None:
             return parsed
 
@@ -459,7 +506,7 @@ async def get_chart_submission_efficiency(
             fighters=[SubmissionEfficiencyFighterDTO(**r) for r in fighters_data],
             avg_efficiency_ratio=avg_ratio,
         )
-        _set_cache(cache_key, result.model_dump())
+        await _set_cache(cache_key, result.model_dump())
         return result
     except Exception as e:
         raise DashboardQueryError("get_chart_submission_efficiency", str(e))
@@ -471,16 +518,16 @@ async def get_chart_category_leaders(
     session: AsyncSession,
 ) -> List[CategoryLeaderDTO]:
     cache_key = _cache_key("category_leaders", chart=True)
-    cached = _get_cached(cache_key)
+    cached = await _get_cached(cache_key)
     if cached:
-        parsed = _parse_cached_data(cache_key, CategoryLeaderDTO, cached, is_list=True)
+        parsed = await _parse_cached_data(cache_key, CategoryLeaderDTO, cached, is_list=True)
         if parsed is not None:
             return parsed
 
     try:
         data = await dashboard_repo.get_category_leaders(session)
         result = [CategoryLeaderDTO(**r) for r in data]
-        _set_cache(cache_key, {"items": [item.model_dump() for item in result]})
+        await _set_cache(cache_key, {"items": [item.model_dump() for item in result]})
         return result
     except Exception as e:
         raise DashboardQueryError("get_chart_category_leaders", str(e))
@@ -490,16 +537,16 @@ async def get_chart_event_map(
     session: AsyncSession,
 ) -> List[EventMapDTO]:
     cache_key = _cache_key("event-map", chart=True)
-    cached = _get_cached(cache_key)
+    cached = await _get_cached(cache_key)
     if cached:
-        parsed = _parse_cached_data(cache_key, EventMapDTO, cached, is_list=True)
+        parsed = await _parse_cached_data(cache_key, EventMapDTO, cached, is_list=True)
         if parsed is not None:
             return parsed
 
     try:
         data = await dashboard_repo.get_event_map(session)
         result = [EventMapDTO(**r) for r in data]
-        _set_cache(cache_key, {"items": [item.model_dump() for item in result]})
+        await _set_cache(cache_key, {"items": [item.model_dump() for item in result]})
         return result
     except Exception as e:
         raise DashboardQueryError("get_chart_event_map", str(e))
@@ -510,16 +557,16 @@ async def get_chart_nationality_distribution(
     weight_class_id: Optional[int] = None,
 ) -> List[NationalityDistributionDTO]:
     cache_key = _cache_key("nationality", weight_class_id, chart=True)
-    cached = _get_cached(cache_key)
+    cached = await _get_cached(cache_key)
     if cached:
-        parsed = _parse_cached_data(cache_key, NationalityDistributionDTO, cached, is_list=True)
+        parsed = await _parse_cached_data(cache_key, NationalityDistributionDTO, cached, is_list=True)
         if parsed is not None:
             return parsed
 
     try:
         data = await dashboard_repo.get_nationality_distribution(session, weight_class_id)
         result = [NationalityDistributionDTO(**r) for r in data]
-        _set_cache(cache_key, {"items": [item.model_dump() for item in result]})
+        await _set_cache(cache_key, {"items": [item.model_dump() for item in result]})
         return result
     except Exception as e:
         raise DashboardQueryError("get_chart_nationality_distribution", str(e))
@@ -532,16 +579,16 @@ async def get_chart_finish_rate_trend(
     weight_class_id: Optional[int] = None,
 ) -> List[FinishRateTrendDTO]:
     cache_key = _cache_key("finish_rate_trend", weight_class_id, chart=True)
-    cached = _get_cached(cache_key)
+    cached = await _get_cached(cache_key)
     if cached:
-        parsed = _parse_cached_data(cache_key, FinishRateTrendDTO, cached, is_list=True)
+        parsed = await _parse_cached_data(cache_key, FinishRateTrendDTO, cached, is_list=True)
         if parsed is not None:
             return parsed
 
     try:
         data = await dashboard_repo.get_finish_rate_trend(session, weight_class_id)
         result = [FinishRateTrendDTO(**r) for r in data]
-        _set_cache(cache_key, {"items": [item.model_dump() for item in result]})
+        await _set_cache(cache_key, {"items": [item.model_dump() for item in result]})
         return result
     except Exception as e:
         raise DashboardQueryError("get_chart_finish_rate_trend", str(e))
@@ -555,16 +602,16 @@ async def get_chart_knockdown_leaders(
     limit: int = 10,
 ) -> List[KnockdownLeaderDTO]:
     cache_key = _cache_key("knockdown_leaders", weight_class_id, limit=limit, chart=True)
-    cached = _get_cached(cache_key)
+    cached = await _get_cached(cache_key)
     if cached:
-        parsed = _parse_cached_data(cache_key, KnockdownLeaderDTO, cached, is_list=True)
+        parsed = await _parse_cached_data(cache_key, KnockdownLeaderDTO, cached, is_list=True)
         if parsed is not None:
             return parsed
 
     try:
         data = await dashboard_repo.get_knockdown_leaders(session, weight_class_id, limit)
         result = [KnockdownLeaderDTO(**r) for r in data]
-        _set_cache(cache_key, {"items": [item.model_dump() for item in result]})
+        await _set_cache(cache_key, {"items": [item.model_dump() for item in result]})
         return result
     except Exception as e:
         raise DashboardQueryError("get_chart_knockdown_leaders", str(e))
@@ -574,16 +621,16 @@ async def get_chart_sig_strikes_by_wc(
     session: AsyncSession,
 ) -> List[SigStrikesByWeightClassDTO]:
     cache_key = _cache_key("sig_strikes_by_wc", chart=True)
-    cached = _get_cached(cache_key)
+    cached = await _get_cached(cache_key)
     if cached:
-        parsed = _parse_cached_data(cache_key, SigStrikesByWeightClassDTO, cached, is_list=True)
+        parsed = await _parse_cached_data(cache_key, SigStrikesByWeightClassDTO, cached, is_list=True)
         if parsed is not None:
             return parsed
 
     try:
         data = await dashboard_repo.get_sig_strikes_by_weight_class(session)
         result = [SigStrikesByWeightClassDTO(**r) for r in data]
-        _set_cache(cache_key, {"items": [item.model_dump() for item in result]})
+        await _set_cache(cache_key, {"items": [item.model_dump() for item in result]})
         return result
     except Exception as e:
         raise DashboardQueryError("get_chart_sig_strikes_by_wc", str(e))
@@ -596,9 +643,9 @@ async def get_chart_strike_exchange(
     limit: int = 10,
 ) -> StrikeExchangeLeaderboardDTO:
     cache_key = _cache_key("strike_exchange", weight_class_id, min_fights, limit, chart=True)
-    cached = _get_cached(cache_key)
+    cached = await _get_cached(cache_key)
     if cached:
-        parsed = _parse_cached_data(cache_key, StrikeExchangeLeaderboardDTO, cached)
+        parsed = await _parse_cached_data(cache_key, StrikeExchangeLeaderboardDTO, cached)
         if parsed is not None:
             return parsed
 
@@ -612,7 +659,7 @@ async def get_chart_strike_exchange(
             min15=[StrikeExchangeDTO(**r) for r in data15],
             min20=[StrikeExchangeDTO(**r) for r in data20],
         )
-        _set_cache(cache_key, result.model_dump())
+        await _set_cache(cache_key, result.model_dump())
         return result
     except Exception as e:
         raise DashboardQueryError("get_chart_strike_exchange", str(e))
@@ -623,16 +670,16 @@ async def get_chart_stance_winrate(
     weight_class_id: Optional[int] = None,
 ) -> List[StanceWinrateDTO]:
     cache_key = _cache_key("stance_winrate", weight_class_id, chart=True)
-    cached = _get_cached(cache_key)
+    cached = await _get_cached(cache_key)
     if cached:
-        parsed = _parse_cached_data(cache_key, StanceWinrateDTO, cached, is_list=True)
+        parsed = await _parse_cached_data(cache_key, StanceWinrateDTO, cached, is_list=True)
         if parsed is not None:
             return parsed
 
     try:
         data = await dashboard_repo.get_stance_winrate(session, weight_class_id)
         result = [StanceWinrateDTO(**r) for r in data]
-        _set_cache(cache_key, {"items": [item.model_dump() for item in result]})
+        await _set_cache(cache_key, {"items": [item.model_dump() for item in result]})
         return result
     except Exception as e:
         raise DashboardQueryError("get_chart_stance_winrate", str(e))
@@ -647,9 +694,9 @@ async def get_chart_td_attempts_leaders(
     limit: int = 10,
 ) -> TdAttemptsLeaderboardDTO:
     cache_key = _cache_key("td_attempts_leaders", weight_class_id, min_fights, limit, chart=True)
-    cached = _get_cached(cache_key)
+    cached = await _get_cached(cache_key)
     if cached:
-        parsed = _parse_cached_data(cache_key, TdAttemptsLeaderboardDTO, cached)
+        parsed = await _parse_cached_data(cache_key, TdAttemptsLeaderboardDTO, cached)
         if parsed is not None:
             return parsed
 
@@ -664,7 +711,7 @@ async def get_chart_td_attempts_leaders(
             min20=[TdAttemptsLeaderDTO(**r) for r in data20["leaders"]],
             avg_td_attempts=data10["avg_td_attempts"],
         )
-        _set_cache(cache_key, result.model_dump())
+        await _set_cache(cache_key, result.model_dump())
         return result
     except Exception as e:
         raise DashboardQueryError("get_chart_td_attempts_leaders", str(e))
@@ -675,9 +722,9 @@ async def get_chart_td_sub_correlation(
     weight_class_id: Optional[int] = None,
 ) -> TdSubCorrelationDTO:
     cache_key = _cache_key("td_sub_correlation", weight_class_id, chart=True)
-    cached = _get_cached(cache_key)
+    cached = await _get_cached(cache_key)
     if cached:
-        parsed = _parse_cached_data(cache_key, TdSubCorrelationDTO, cached)
+        parsed = await _parse_cached_data(cache_key, TdSubCorrelationDTO, cached)
         if parsed is not None:
             return parsed
 
@@ -695,7 +742,7 @@ async def get_chart_td_sub_correlation(
             avg_td=data["avg_td"],
             avg_sub=data["avg_sub"],
         )
-        _set_cache(cache_key, result.model_dump())
+        await _set_cache(cache_key, result.model_dump())
         return result
     except Exception as e:
         raise DashboardQueryError("get_chart_td_sub_correlation", str(e))
@@ -708,9 +755,9 @@ async def get_chart_td_defense_leaders(
     limit: int = 10,
 ) -> TdDefenseLeaderboardDTO:
     cache_key = _cache_key("td_defense_leaders", weight_class_id, min_fights, limit, chart=True)
-    cached = _get_cached(cache_key)
+    cached = await _get_cached(cache_key)
     if cached:
-        parsed = _parse_cached_data(cache_key, TdDefenseLeaderboardDTO, cached)
+        parsed = await _parse_cached_data(cache_key, TdDefenseLeaderboardDTO, cached)
         if parsed is not None:
             return parsed
 
@@ -724,7 +771,7 @@ async def get_chart_td_defense_leaders(
             min15=[TdDefenseLeaderDTO(**r) for r in data15],
             min20=[TdDefenseLeaderDTO(**r) for r in data20],
         )
-        _set_cache(cache_key, result.model_dump())
+        await _set_cache(cache_key, result.model_dump())
         return result
     except Exception as e:
         raise DashboardQueryError("get_chart_td_defense_leaders", str(e))
@@ -735,44 +782,47 @@ async def get_chart_td_defense_leaders(
 # ===========================
 
 async def get_overview(
-    session: AsyncSession,
+    *,
+    session: Optional[AsyncSession] = None,
     weight_class_id: Optional[int] = None,
     ufc_only: bool = False,
 ) -> OverviewResponseDTO:
     cache_key = _cache_key("overview", weight_class_id, ufc_only=ufc_only)
-    cached = _get_cached(cache_key)
+    cached = await _get_cached(cache_key)
     if cached:
         # stale 캐시 감지: lose_streak 필드가 leaderboard에 없으면 캐시 무효화
         lb = cached.get("leaderboard", {})
         if "lose_streak" not in lb:
             try:
-                redis_client.delete(cache_key)
+                await async_redis_client.delete(cache_key)
             except Exception:
                 pass
             cached = None
     if cached:
-        result = _parse_cached_data(cache_key, OverviewResponseDTO, cached)
+        result = await _parse_cached_data(cache_key, OverviewResponseDTO, cached)
         if result:
             return result
 
     try:
-        finish_methods = await get_chart_finish_methods(session, weight_class_id)
-        weight_class_activity_data = await dashboard_repo.get_weight_class_activity(session)
-        events_timeline_data = await dashboard_repo.get_events_timeline(session)
-        leaderboard = await get_chart_leaderboard(session, weight_class_id, ufc_only)
-        fight_duration = await get_chart_fight_duration(session, weight_class_id)
-        finish_rate_trend = await get_chart_finish_rate_trend(session, weight_class_id)
+        charts = await _build_tab(session, {
+            "finish_methods": partial(get_chart_finish_methods, weight_class_id=weight_class_id),
+            "weight_class_activity": dashboard_repo.get_weight_class_activity,
+            "events_timeline": dashboard_repo.get_events_timeline,
+            "leaderboard": partial(get_chart_leaderboard, weight_class_id=weight_class_id, ufc_only=ufc_only),
+            "fight_duration": partial(get_chart_fight_duration, weight_class_id=weight_class_id),
+            "finish_rate_trend": partial(get_chart_finish_rate_trend, weight_class_id=weight_class_id),
+        })
 
         response = OverviewResponseDTO(
-            finish_methods=finish_methods,
-            weight_class_activity=[WeightClassActivityDTO(**r) for r in weight_class_activity_data],
-            events_timeline=[EventTimelineDTO(**r) for r in events_timeline_data],
-            leaderboard=leaderboard,
-            fight_duration=fight_duration,
-            finish_rate_trend=finish_rate_trend,
+            finish_methods=charts["finish_methods"],
+            weight_class_activity=[WeightClassActivityDTO(**r) for r in charts["weight_class_activity"]],
+            events_timeline=[EventTimelineDTO(**r) for r in charts["events_timeline"]],
+            leaderboard=charts["leaderboard"],
+            fight_duration=charts["fight_duration"],
+            finish_rate_trend=charts["finish_rate_trend"],
         )
 
-        _set_cache(cache_key, response.model_dump())
+        await _set_cache(cache_key, response.model_dump())
         return response
 
     except Exception as e:
@@ -784,37 +834,36 @@ async def get_overview(
 # ===========================
 
 async def get_striking(
-    session: AsyncSession, weight_class_id: Optional[int] = None, min_fights: int = 10, limit: int = 10
+    *, session: Optional[AsyncSession] = None, weight_class_id: Optional[int] = None, min_fights: int = 10, limit: int = 10
 ) -> StrikingResponseDTO:
     cache_key = _cache_key("striking", weight_class_id, min_fights, limit)
-    cached = _get_cached(cache_key)
+    cached = await _get_cached(cache_key)
     if cached:
-        result = _parse_cached_data(cache_key, StrikingResponseDTO, cached)
+        result = await _parse_cached_data(cache_key, StrikingResponseDTO, cached)
         if result:
             return result
 
     try:
-        strike_targets = await get_chart_strike_targets(session, weight_class_id)
-        striking_accuracy = await get_chart_striking_accuracy(session, weight_class_id, min_fights, limit)
-        ko_tko_leaders = await get_chart_ko_tko_leaders(session, weight_class_id, limit)
-        sig_strikes = await get_chart_sig_strikes(session, weight_class_id, min_fights, limit)
-        knockdown_leaders = await get_chart_knockdown_leaders(session, weight_class_id, limit)
-        sig_strikes_by_wc = await get_chart_sig_strikes_by_wc(session)
-        strike_exchange = await get_chart_strike_exchange(session, weight_class_id, min_fights, limit)
-        stance_winrate = await get_chart_stance_winrate(session, weight_class_id)
-
-        response = StrikingResponseDTO(
-            strike_targets=strike_targets,
-            striking_accuracy=striking_accuracy,
-            ko_tko_leaders=ko_tko_leaders,
-            sig_strikes_per_fight=sig_strikes,
-            knockdown_leaders=knockdown_leaders,
-            sig_strikes_by_weight_class=sig_strikes_by_wc,
-            strike_exchange=strike_exchange,
-            stance_winrate=stance_winrate,
-        )
-
-        _set_cache(cache_key, response.model_dump())
+        charts = await _build_tab(session, {
+            "strike_targets": partial(get_chart_strike_targets, weight_class_id=weight_class_id),
+            "striking_accuracy": partial(
+                get_chart_striking_accuracy, weight_class_id=weight_class_id, min_fights=min_fights, limit=limit
+            ),
+            "ko_tko_leaders": partial(get_chart_ko_tko_leaders, weight_class_id=weight_class_id, limit=limit),
+            "sig_strikes_per_fight": partial(
+                get_chart_sig_strikes, weight_class_id=weight_class_id, min_fights=min_fights, limit=limit
+            ),
+            "knockdown_leaders": partial(get_chart_knockdown_leaders, weight_class_id=weight_class_id, limit=limit),
+            "sig_strikes_by_weight_class": get_chart_sig_strikes_by_wc,
+            "strike_exchange": partial(
+                get_chart_strike_exchange, weight_class_id=weight_class_id, min_fights=min_fights, limit=limit
+            ),
+            "stance_winrate": partial(get_chart_stance_winrate, weight_class_id=weight_class_id),
+        })
+
+        response = StrikingResponseDTO(**charts)
+
+        await _set_cache(cache_key, response.model_dump())
         return response
 
     except Exception as e:
@@ -826,37 +875,32 @@ async def get_striking(
 # ===========================
 
 async def get_grappling(
-    session: AsyncSession, weight_class_id: Optional[int] = None, min_fights: int = 10, limit: int = 10
+    *, session: Optional[AsyncSession] = None, weight_class_id: Optional[int] = None, min_fights: int = 10, limit: int = 10
 ) -> GrapplingResponseDTO:
     cache_key = _cache_key("grappling", weight_class_id, min_fights, limit)
-    cached = _get_cached(cache_key)
+    cached = await _get_cached(cache_key)
     if cached:
-        result = _parse_cached_data(cache_key, GrapplingResponseDTO, cached)
+        result = await _parse_cached_data(cache_key, GrapplingResponseDTO, cached)
         if result:
             return result
 
     try:
-        takedown_accuracy = await get_chart_takedown_accuracy(session, weight_class_id, min_fights, limit)
-        submission_techniques = await get_chart_submission_techniques(session, weight_class_id)
-        control_time_data = await dashboard_repo.get_control_time(session)
-        ground_strikes = await get_chart_ground_strikes(session, weight_class_id, min_fights, limit)
-        submission_efficiency = await get_chart_submission_efficiency(session, weight_class_id, min_fights, limit)
-        td_attempts_leaders = await get_chart_td_attempts_leaders(session, weight_class_id, min_fights, limit)
-        td_sub_correlation = await get_chart_td_sub_correlation(session, weight_class_id)
-        td_defense_leaders = await get_chart_td_defense_leaders(session, weight_class_id, min_fights, limit)
-
-        response = GrapplingResponseDTO(
-            takedown_accuracy=takedown_accuracy,
-            submission_techniques=submission_techniques,
-            control_time=[ControlTimeDTO(**r) for r in control_time_data],
-            ground_strikes=ground_strikes,
-            submission_efficiency=submission_efficiency,
-            td_attempts_leaders=td_attempts_leaders,
-            td_sub_correlation=td_sub_correlation,
-            td_defense_leaders=td_defense_leaders,
-        )
-
-        _set_cache(cache_key, response.model_dump())
+        leader_params = dict(weight_class_id=weight_class_id, min_fights=min_fights, limit=limit)
+        charts = await _build_tab(session, {
+            "takedown_accuracy": partial(get_chart_takedown_accuracy, **leader_params),
+            "submission_techniques": partial(get_chart_submission_techniques, weight_class_id=weight_class_id),
+            "control_time": dashboard_repo.get_control_time,
+            "ground_strikes": partial(get_chart_ground_strikes, **leader_params),
+            "submission_efficiency": partial(get_chart_submission_efficiency, **leader_params),
+            "td_attempts_leaders": partial(get_chart_td_attempts_leaders, **leader_params),
+            "td_sub_correlation": partial(get_chart_td_sub_correlation, weight_class_id=weight_class_id),
+            "td_defense_leaders": partial(get_chart_td_defense_leaders, **leader_params),
+        })
+        charts["control_time"] = [ControlTimeDTO(**r) for r in charts["control_time"]]
+
+        response = GrapplingResponseDTO(**charts)
+
+        await _set_cache(cache_key, response.model_dump())
         return response
 
     except Exception as e:
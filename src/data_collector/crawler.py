@@ -18,6 +18,7 @@ from user_agent import generate_user_agent
 
 from config import Config
 from data_collector.driver import PlaywrightDriver, Crawl4AIDriver
+from data_collector.html_cache import cached_html, get_html_cache, read_cached_html, write_cached_html
 
 TAPOLOGY_FETCH_SUCCEEDED = "succeeded"
 TAPOLOGY_FETCH_EMPTY_RESPONSE = "empty_response"
@@ -25,6 +26,15 @@ TAPOLOGY_FETCH_WORKER_TIMEOUT = "worker_timeout"
 TAPOLOGY_FETCH_WORKER_CRASH = "worker_crash"
 TAPOLOGY_FETCH_PROTOCOL_ERROR = "protocol_error"
 TAPOLOGY_FETCH_EXCEPTION = "fetch_exception"
+TAPOLOGY_CHALLENGE_MARKERS = (
+    "just a moment...",
+    "checking if the site connection is secure",
+    "cf-challenge",
+    "challenge-platform",
+    "/cdn-cgi/challenge-platform/",
+    "cf-browser-verification",
+    "cloudflare ray id",
+)
 UFC_RANKINGS_MAX_ATTEMPTS = 3
 UFC_RANKINGS_RETRY_DELAY_SECONDS = 2.0
 UFCSTATS_FIGHT_DETAIL_MAX_ATTEMPTS = 2
@@ -115,6 +125,7 @@ def _max_playwright_attempts_for_url(url: str) -> int:
     return 1
 
 
+@cached_html
 async def crawl_with_playwright(url: str) -> str:
     driver = PlaywrightDriver()
     page = None
@@ -188,6 +199,7 @@ async def close_crawl4ai_crawlers() -> None:
     await Crawl4AIDriver.close_all()
 
 
+@cached_html
 async def crawl_with_httpx(url: str) -> str:
     headers = {
         "User-Agent": generate_user_agent(os=('mac', 'linux'), device_type='desktop')
@@ -214,6 +226,7 @@ async def crawl_with_httpx(url: str) -> str:
             return None
 
 
+@cached_html
 async def crawl_with_crawl4ai(url: str, run_config: Any = None) -> str:
     try:
         driver = Crawl4AIDriver()
@@ -224,6 +237,19 @@ async def crawl_with_crawl4ai(url: str, run_config: Any = None) -> str:
         return None
 
 
+def is_tapology_challenge_page(html: str | None) -> bool:
+    if not html:
+        return False
+    normalized = html.lower()
+    return any(marker in normalized for marker in TAPOLOGY_CHALLENGE_MARKERS)
+
+
+def _is_cacheable_tapology_html(html: str) -> bool:
+    # Cloudflare 챌린지 페이지가 TTL 동안 재생되지 않도록 캐시에서 제외
+    return not is_tapology_challenge_page(html)
+
+
+@cached_html(validator=_is_cacheable_tapology_html)
 async def crawl_tapology_with_scrapling(url: str) -> str:
     try:
         delay = random.uniform(*TAPOLOGY_SCRAPLING_DELAY_RANGE)
@@ -527,7 +553,26 @@ async def crawl_tapology_with_scrapling_worker_result(
     *,
     stage: str = "unknown",
 ) -> TapologyFetchResult:
-    return await _TAPOLOGY_SCRAPLING_WORKER.fetch(stage, url)
+    cache = get_html_cache()
+    if cache is None:
+        return await _TAPOLOGY_SCRAPLING_WORKER.fetch(stage, url)
+
+    started_at = time.perf_counter()
+    html = await read_cached_html(url, _is_cacheable_tapology_html)
+    if html is not None or cache.replay:
+        return TapologyFetchResult(
+            stage=stage,
+            url=url,
+            status=TAPOLOGY_FETCH_SUCCEEDED if html else TAPOLOGY_FETCH_EMPTY_RESPONSE,
+            html=html,
+            error=None if html else "html cache miss in replay mode",
+            elapsed_seconds=time.perf_counter() - started_at,
+        )
+
+    result = await _TAPOLOGY_SCRAPLING_WORKER.fetch(stage, url)
+    if result.status == TAPOLOGY_FETCH_SUCCEEDED:
+        await write_cached_html(url, result.html, _is_cacheable_tapology_html)
+    return result
 
 
 async def _crawl_tapology_with_scrapling_worker_fetch_result(
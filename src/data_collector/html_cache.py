@@ -0,0 +1,192 @@
+"""
+크롤러 HTML 디스크 캐시
+URL 해시를 키로 gzip 압축된 HTML을 저장하고, 소스별 TTL 안에서는 네트워크 대신 캐시를 반환한다.
+
+모드 (CRAWLER_CACHE_MODE)
+- off: 캐시 미사용 (기본값)
+- on: 캐시 hit면 반환, miss면 크롤링 후 저장
+- replay: 캐시만 사용 (TTL 무시, miss면 None) - 네트워크 없이 파서 재실행/벤치마크용
+"""
+import asyncio
+import functools
+import gzip
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Optional
+from urllib.parse import urlparse
+
+from config import Config
+
+CACHE_MODE_OFF = "off"
+CACHE_MODE_ON = "on"
+CACHE_MODE_REPLAY = "replay"
+CACHE_MODES = (CACHE_MODE_OFF, CACHE_MODE_ON, CACHE_MODE_REPLAY)
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent / ".html_cache"
+
+LOGGER = logging.getLogger(__name__)
+
+HtmlValidator = Callable[[str], bool]
+
+
+def _source_for_url(url: str) -> str:
+    host = urlparse(url).netloc.lower()
+    if host.endswith("ufcstats.com"):
+        return "ufcstats"
+    if host.endswith("tapology.com"):
+        return "tapology"
+    if host.endswith("ufc.com"):
+        return "ufc"
+    return "other"
+
+
+def _ttl_seconds_for_source(source: str) -> int:
+    return {
+        "ufcstats": Config.CRAWLER_CACHE_TTL_UFCSTATS_SECONDS,
+        "tapology": Config.CRAWLER_CACHE_TTL_TAPOLOGY_SECONDS,
+        "ufc": Config.CRAWLER_CACHE_TTL_UFC_SECONDS,
+    }.get(source, Config.CRAWLER_CACHE_TTL_SECONDS)
+
+
+class HtmlCache:
+    def __init__(self, root: Path, mode: str = CACHE_MODE_ON):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown crawler cache mode: {mode}")
+        self.root = Path(root)
+        self.mode = mode
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    @property
+    def replay(self) -> bool:
+        return self.mode == CACHE_MODE_REPLAY
+
+    def path_for(self, url: str) -> Path:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.root / _source_for_url(url) / digest[:2] / f"{digest}.html.gz"
+
+    def read(self, url: str, validator: Optional[HtmlValidator] = None) -> Optional[str]:
+        """TTL 안의 캐시 HTML 반환 (replay 모드는 TTL 무시)
+
+        validator가 거부한 HTML(검증 이전에 저장된 차단/챌린지 페이지 등)은 miss로 집계한다.
+        """
+        path = self.path_for(url)
+        try:
+            stored_at = path.stat().st_mtime
+            if not self.replay:
+                ttl = _ttl_seconds_for_source(_source_for_url(url))
+                if time.time() - stored_at > ttl:
+                    self.misses += 1
+                    return None
+            html = gzip.decompress(path.read_bytes()).decode("utf-8")
+        except (OSError, EOFError, UnicodeDecodeError):
+            self.misses += 1
+            return None
+
+        if validator is not None and not validator(html):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return html
+
+    def write(self, url: str, html: str) -> None:
+        path = self.path_for(url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # 동시 크롤링 중 반쯤 쓰인 파일을 읽지 않도록 임시 파일에 쓰고 교체
+        # (같은 키를 여러 프로세스/스레드가 쓰더라도 임시 파일 이름이 겹치지 않음)
+        with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as tmp_file:
+            tmp_file.write(gzip.compress(html.encode("utf-8"), compresslevel=6))
+        try:
+            os.replace(tmp_file.name, path)
+        except OSError:
+            os.unlink(tmp_file.name)
+            raise
+        self.writes += 1
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "writes": self.writes}
+
+
+_html_cache: Optional[HtmlCache] = None
+_configured = False
+
+
+def configure_html_cache(mode: Optional[str] = None, cache_dir: Optional[str] = None) -> Optional[HtmlCache]:
+    """캐시 설정 (인자가 없으면 Config 값 사용). off면 None"""
+    global _html_cache, _configured
+    mode = (mode or Config.CRAWLER_CACHE_MODE).lower()
+    if mode not in CACHE_MODES:
+        raise ValueError(f"Unknown crawler cache mode: {mode}")
+
+    _configured = True
+    if mode == CACHE_MODE_OFF:
+        _html_cache = None
+    else:
+        _html_cache = HtmlCache(Path(cache_dir or Config.CRAWLER_CACHE_DIR or DEFAULT_CACHE_DIR), mode)
+        LOGGER.info("Crawler HTML cache enabled: mode=%s dir=%s", mode, _html_cache.root)
+    return _html_cache
+
+
+def get_html_cache() -> Optional[HtmlCache]:
+    if not _configured:
+        configure_html_cache()
+    return _html_cache
+
+
+async def read_cached_html(url: str, validator: Optional[HtmlValidator] = None) -> Optional[str]:
+    cache = get_html_cache()
+    if cache is None:
+        return None
+    return await asyncio.to_thread(cache.read, url, validator)
+
+
+async def write_cached_html(url: str, html: Optional[str], validator: Optional[HtmlValidator] = None) -> None:
+    cache = get_html_cache()
+    if cache is None or not html:
+        return
+    if validator is not None and not validator(html):
+        LOGGER.info("Skipping crawler HTML cache write for rejected page: url=%s", url)
+        return
+    try:
+        await asyncio.to_thread(cache.write, url, html)
+    except OSError as exc:
+        LOGGER.warning("Failed to write crawler HTML cache: url=%s error=%s", url, exc)
+
+
+def cached_html(
+    fetch: Optional[Callable[..., Awaitable[Optional[str]]]] = None,
+    *,
+    validator: Optional[HtmlValidator] = None,
+) -> Callable[..., Awaitable[Optional[str]]]:
+    """`async def crawler(url, ...) -> html` 형태의 크롤러에 HTML 캐시를 적용
+
+    validator가 False를 반환하는 HTML(차단/챌린지 페이지 등)은 저장하지도, 캐시에서 반환하지도 않는다.
+    `@cached_html` 또는 `@cached_html(validator=...)` 형태로 사용한다.
+    """
+    if fetch is None:
+        return functools.partial(cached_html, validator=validator)
+
+    @functools.wraps(fetch)
+    async def wrapper(url: str, *args, **kwargs) -> Optional[str]:
+        cache = get_html_cache()
+        if cache is None:
+            return await fetch(url, *args, **kwargs)
+
+        html = await read_cached_html(url, validator)
+        if html is not None:
+            return html
+        if cache.replay:
+            LOGGER.warning("Crawler HTML cache miss in replay mode: %s", url)
+            return None
+
+        html = await fetch(url, *args, **kwargs)
+        await write_cached_html(url, html, validator)
+        return html
+
+    return wrapper
@@ -13,6 +13,7 @@ from data_collector.crawler import (
     crawl_tapology_with_scrapling_worker as crawl_tapology_with_scrapling,
     crawl_with_playwright,
 )
+from data_collector.html_cache import CACHE_MODES, configure_html_cache, get_html_cache
 from data_collector.workflows.tasks import (
     scrap_all_events_task,
     scrap_upcoming_events_task,
@@ -63,6 +64,11 @@ PLAYWRIGHT_TASKS = {
     "rankings",
     "nationality",
 }
+# 기본은 증분 수집 (미수집 / 미확정 이벤트만), --full 이면 전체 재수집
+INCREMENTAL_TASKS = {
+    "event-detail",
+    "match-detail",
+}
 SCRAPLING_TASKS = {
     "tapology-profiles",
     "tapology-bouts",
@@ -117,12 +123,13 @@ def setup_logging():
 LOGGER = logging.getLogger(__name__)
 
 
-async def run_ufc_stats_flow(tasks: Optional[List[str]] = None):
+async def run_ufc_stats_flow(tasks: Optional[List[str]] = None, full: bool = False):
     """
     UFC 통계 크롤링 실행
 
     Args:
         tasks: 실행할 태스크 목록. None이면 전체 실행
+        full: True면 event-detail / match-detail을 수집 상태와 무관하게 전체 재수집
     """
     tasks_to_run = tasks or ALL_TASKS
 
@@ -145,6 +152,8 @@ async def run_ufc_stats_flow(tasks: Optional[List[str]] = None):
             LOGGER.info(f"{display_name} scraping started")
             if task_name in NO_CRAWLER_TASKS:
                 await task_fn()
+            elif full and task_name in INCREMENTAL_TASKS:
+                await task_fn(crawler_fn, incremental=False)
             else:
                 await task_fn(crawler_fn)
             LOGGER.info(f"{display_name} scraping completed")
@@ -152,6 +161,10 @@ async def run_ufc_stats_flow(tasks: Optional[List[str]] = None):
         await close_playwright_crawler()
         await close_tapology_scrapling_worker()
 
+    html_cache = get_html_cache()
+    if html_cache:
+        LOGGER.info(f"Crawler HTML cache stats: {html_cache.stats()}")
+
     end_time = time.time()
     LOGGER.info(f"UFC 통계 크롤링 완료 - Total time: {end_time - start_time:.2f} seconds")
 
@@ -165,6 +178,8 @@ Examples:
   python run_ufc_stats_flow.py                     # 전체 실행
   python run_ufc_stats_flow.py -t event-detail     # event-detail만 실행
   python run_ufc_stats_flow.py -t fighters events  # fighters, events 실행
+  python run_ufc_stats_flow.py -t event-detail --full  # 수집 상태 무시하고 전체 재수집
+  python run_ufc_stats_flow.py -t match-detail --full --html-cache replay  # 캐시된 HTML로 파서만 재실행
   python run_ufc_stats_flow.py --list              # 사용 가능한 태스크 목록
 
 Available tasks:
@@ -186,6 +201,16 @@ Available tasks:
         choices=list(TASK_MAP.keys()),
         help="실행할 태스크 (여러 개 지정 가능)"
     )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="event-detail / match-detail 전체 재수집 (기본은 증분 수집)"
+    )
+    parser.add_argument(
+        "--html-cache",
+        choices=CACHE_MODES,
+        help="크롤러 HTML 캐시 모드 (기본값: CRAWLER_CACHE_MODE)"
+    )
     parser.add_argument(
         "--list",
         action="store_true",
@@ -208,5 +233,8 @@ if __name__ == "__main__":
     LOGGER.info(f"Log files: {all_log}")
     LOGGER.info(f"Error log: {error_log}")
 
+    if args.html_cache:
+        configure_html_cache(args.html_cache)
+
     # 비동기 이벤트 루프에서 메인 함수 실행
-    asyncio.run(run_ufc_stats_flow(args.tasks))
+    asyncio.run(run_ufc_stats_flow(args.tasks, full=args.full))
@@ -1,5 +1,5 @@
 import logging
-from typing import Dict, List, Callable
+from typing import Dict, List, Callable, Optional, Tuple
 import asyncio
 import traceback
 
@@ -85,26 +85,53 @@ def calculate_total_stats(rounds: List[Dict]) -> Dict:
     # 숫자를 문자열로 변환
     return {k: str(v) for k, v in total.items()}
 
-async def scrap_match_basic_statistics(crawler_fn: Callable, match_detail_url: str, fighter_dict: Dict[str, int] = None, fighter_match_dict: Dict[int, FighterMatchSchema] = None) -> List[BasicMatchStatSchema]:
+async def fetch_match_detail_soup(crawler_fn: Callable, match_detail_url: str) -> Optional[BeautifulSoup]:
     """
-    UFC 경기 상세 페이지에서 데이터를 추출합니다.
+    UFC 경기 상세 페이지를 한 번 받아 파싱합니다. 실패하거나 비어 있으면 None.
+    반환된 soup은 parse_match_* 파서들이 공유합니다.
     """
     try:
         html_content = await crawler_fn(match_detail_url)
         if not html_content:
             logging.warning("HTML content is empty: %s", match_detail_url)
-            return []
+            return None
 
-        soup = BeautifulSoup(html_content, 'html.parser')
+        return BeautifulSoup(html_content, 'html.parser')
     except Exception as e:
-        logging.error(f"매치 기본 통계 크롤링 중 오류 발생: {e} - {traceback.format_exc()}")
+        logging.error(f"매치 상세 페이지 크롤링 중 오류 발생: {e} - {traceback.format_exc()}")
+        return None
+
+async def scrap_match_detail(crawler_fn: Callable, match_detail_url: str, fighter_dict: Dict[str, int] = None, fighter_match_dict: Dict[int, FighterMatchSchema] = None) -> Tuple[List[BasicMatchStatSchema], List[SigStrMatchStatSchema]]:
+    """
+    UFC 경기 상세 페이지를 한 번만 받아 기본 통계와 significant strikes를 함께 추출합니다.
+    """
+    soup = await fetch_match_detail_soup(crawler_fn, match_detail_url)
+    if soup is None:
+        return [], []
+
+    return (
+        parse_match_basic_statistics(soup, match_detail_url, fighter_dict, fighter_match_dict),
+        parse_match_significant_strikes(soup, match_detail_url, fighter_dict, fighter_match_dict),
+    )
+
+async def scrap_match_basic_statistics(crawler_fn: Callable, match_detail_url: str, fighter_dict: Dict[str, int] = None, fighter_match_dict: Dict[int, FighterMatchSchema] = None) -> List[BasicMatchStatSchema]:
+    """
+    UFC 경기 상세 페이지에서 데이터를 추출합니다.
+    """
+    soup = await fetch_match_detail_soup(crawler_fn, match_detail_url)
+    if soup is None:
         return []
-    
+    return parse_match_basic_statistics(soup, match_detail_url, fighter_dict, fighter_match_dict)
+
+def parse_match_basic_statistics(soup: BeautifulSoup, match_detail_url: str, fighter_dict: Dict[str, int] = None, fighter_match_dict: Dict[int, FighterMatchSchema] = None) -> List[BasicMatchStatSchema]:
+    """
+    파싱된 경기 상세 페이지에서 라운드별 기본 통계를 추출합니다.
+    """
     # 테이블 찾기
     table = soup.find('table', {'class': 'b-fight-details__table'})
     if not table:
         logging.warning(f"테이블을 찾을 수 없습니다: {match_detail_url}")
-        return {}
+        return []
     
     # 선수별 통계 데이터 추출
     fighter_rounds = []
@@ -186,17 +213,15 @@ async def scrap_match_significant_strikes(crawler_fn: Callable, match_detail_url
     """
     UFC 경기 상세 페이지에서 significant strikes 데이터를 추출합니다.
     """
-    try:
-        html_content = await crawler_fn(match_detail_url)
-        if not html_content:
-            logging.warning("HTML content is empty: %s", match_detail_url)
-            return []
-
-        soup = BeautifulSoup(html_content, 'html.parser')
-    except Exception as e:
-        logging.error(f"유의미한 타격 통계 크롤링 중 오류 발생: {traceback.format_exc()}")
+    soup = await fetch_match_detail_soup(crawler_fn, match_detail_url)
+    if soup is None:
         return []
-    
+    return parse_match_significant_strikes(soup, match_detail_url, fighter_dict, fighter_match_dict)
+
+def parse_match_significant_strikes(soup: BeautifulSoup, match_detail_url: str, fighter_dict: Dict[str, int] = None, fighter_match_dict: Dict[int, FighterMatchSchema] = None) -> List[SigStrMatchStatSchema]:
+    """
+    파싱된 경기 상세 페이지에서 라운드별 significant strikes를 추출합니다.
+    """
     # Significant Strikes 테이블 찾기
     sig_tables = soup.find_all('table', class_='b-fight-details__table')
     sig_table = None
@@ -303,8 +328,7 @@ async def main():
             1: FighterMatchSchema(id=1, fighter_id=1, match_id=1),
             2: FighterMatchSchema(id=2, fighter_id=2, match_id=1)
         }
-        basic_stats = await scrap_match_basic_statistics(crawl_with_httpx, match_detail_url, fighter_dict, fighter_match_dict)
-        sig_stats = await scrap_match_significant_strikes(crawl_with_httpx, match_detail_url, fighter_dict, fighter_match_dict)
+        basic_stats, sig_stats = await scrap_match_detail(crawl_with_httpx, match_detail_url, fighter_dict, fighter_match_dict)
         
         logging.info(f"기본 매치 통계: {len(basic_stats)}개 항목 추출됨")
         logging.info(f"유의미한 타격 통계: {len(sig_stats)}개 항목 추출됨")
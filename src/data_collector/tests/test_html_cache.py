@@ -0,0 +1,218 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from data_collector import crawler
+from data_collector import html_cache
+from data_collector.crawler import (
+    TAPOLOGY_FETCH_EMPTY_RESPONSE,
+    TAPOLOGY_FETCH_SUCCEEDED,
+    TapologyFetchResult,
+)
+
+
+@pytest.fixture
+def cache_mode(monkeypatch, tmp_path):
+    def configure(mode):
+        monkeypatch.setattr(html_cache, "_html_cache", None)
+        monkeypatch.setattr(html_cache, "_configured", False)
+        return html_cache.configure_html_cache(mode, str(tmp_path))
+
+    yield configure
+    html_cache.configure_html_cache(html_cache.CACHE_MODE_OFF)
+
+
+def test_html_cache_round_trips_compressed_html(tmp_path):
+    cache = html_cache.HtmlCache(tmp_path)
+    url = "http://ufcstats.com/fight-details/abc"
+
+    cache.write(url, "<html>경기</html>")
+
+    path = cache.path_for(url)
+    assert path.name.endswith(".html.gz")
+    assert path.parent.parent.name == "ufcstats"
+    assert cache.read(url) == "<html>경기</html>"
+    assert cache.stats() == {"hits": 1, "misses": 0, "writes": 1}
+
+
+def test_html_cache_concurrent_writes_to_same_key_leave_no_temp_files(tmp_path):
+    cache = html_cache.HtmlCache(tmp_path)
+    url = "http://ufcstats.com/fight-details/abc"
+    pages = [f"<html>{idx}</html>" for idx in range(32)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda html: cache.write(url, html), pages))
+
+    assert cache.read(url) in pages
+    assert list(cache.path_for(url).parent.glob("*.tmp")) == []
+
+
+def test_html_cache_expires_by_source_ttl(tmp_path, monkeypatch):
+    monkeypatch.setattr(html_cache.Config, "CRAWLER_CACHE_TTL_UFC_SECONDS", 60)
+    monkeypatch.setattr(html_cache.Config, "CRAWLER_CACHE_TTL_TAPOLOGY_SECONDS", 3600)
+    cache = html_cache.HtmlCache(tmp_path)
+    rankings_url = "https://www.ufc.com/rankings"
+    tapology_url = "https://www.tapology.com/fightcenter/fighters/1"
+    cache.write(rankings_url, "<html>rankings</html>")
+    cache.write(tapology_url, "<html>fighter</html>")
+
+    stale = time.time() - 600
+    for url in (rankings_url, tapology_url):
+        os.utime(cache.path_for(url), (stale, stale))
+
+    assert cache.read(rankings_url) is None
+    assert cache.read(tapology_url) == "<html>fighter</html>"
+
+    replay_cache = html_cache.HtmlCache(tmp_path, html_cache.CACHE_MODE_REPLAY)
+    assert replay_cache.read(rankings_url) == "<html>rankings</html>"
+
+
+@pytest.mark.asyncio
+async def test_cached_crawler_fetches_once_then_serves_cache(cache_mode):
+    cache_mode(html_cache.CACHE_MODE_ON)
+    fetched = []
+
+    @html_cache.cached_html
+    async def fetch(url):
+        fetched.append(url)
+        return "<html>event</html>"
+
+    url = "http://ufcstats.com/event-details/1"
+    assert await fetch(url) == "<html>event</html>"
+    assert await fetch(url) == "<html>event</html>"
+    assert fetched == [url]
+
+
+@pytest.mark.asyncio
+async def test_cached_crawler_does_not_store_empty_response(cache_mode):
+    cache_mode(html_cache.CACHE_MODE_ON)
+    fetched = []
+
+    @html_cache.cached_html
+    async def fetch(url):
+        fetched.append(url)
+        return None
+
+    url = "http://ufcstats.com/event-details/missing"
+    assert await fetch(url) is None
+    assert await fetch(url) is None
+    assert fetched == [url, url]
+
+
+@pytest.mark.asyncio
+async def test_replay_mode_never_calls_network(cache_mode):
+    cache = cache_mode(html_cache.CACHE_MODE_REPLAY)
+    cache.write("http://ufcstats.com/fight-details/cached", "<html>cached</html>")
+
+    @html_cache.cached_html
+    async def fetch(url):
+        raise AssertionError("network access in replay mode")
+
+    assert await fetch("http://ufcstats.com/fight-details/cached") == "<html>cached</html>"
+    assert await fetch("http://ufcstats.com/fight-details/unknown") is None
+
+
+@pytest.mark.asyncio
+async def test_tapology_worker_result_uses_html_cache(cache_mode, monkeypatch):
+    cache_mode(html_cache.CACHE_MODE_ON)
+    calls = []
+
+    async def fake_fetch(stage, url):
+        calls.append(url)
+        return TapologyFetchResult(
+            stage=stage,
+            url=url,
+            status=TAPOLOGY_FETCH_SUCCEEDED,
+            html="<html>tapology</html>",
+            error=None,
+            elapsed_seconds=1.0,
+        )
+
+    monkeypatch.setattr(crawler._TAPOLOGY_SCRAPLING_WORKER, "fetch", fake_fetch)
+    url = "https://www.tapology.com/fightcenter/fighters/1"
+
+    first = await crawler.crawl_tapology_with_scrapling_worker_result(url, stage="profile")
+    second = await crawler.crawl_tapology_with_scrapling_worker_result(url, stage="profile")
+
+    assert calls == [url]
+    assert first.html == second.html == "<html>tapology</html>"
+    assert second.status == TAPOLOGY_FETCH_SUCCEEDED
+
+    cache_mode(html_cache.CACHE_MODE_REPLAY)
+    missing = await crawler.crawl_tapology_with_scrapling_worker_result(
+        "https://www.tapology.com/fightcenter/fighters/2",
+        stage="profile",
+    )
+    assert missing.status == TAPOLOGY_FETCH_EMPTY_RESPONSE
+    assert calls == [url]
+
+
+@pytest.mark.asyncio
+async def test_cached_crawler_skips_html_rejected_by_validator(cache_mode):
+    cache = cache_mode(html_cache.CACHE_MODE_ON)
+    fetched = []
+
+    @html_cache.cached_html(validator=lambda html: "blocked" not in html)
+    async def fetch(url):
+        fetched.append(url)
+        return "<html>blocked</html>"
+
+    url = "http://ufcstats.com/event-details/blocked"
+    assert await fetch(url) == "<html>blocked</html>"
+    assert await fetch(url) == "<html>blocked</html>"
+    assert fetched == [url, url]
+    assert cache.writes == 0
+
+
+@pytest.mark.asyncio
+async def test_tapology_challenge_page_is_not_cached(cache_mode, monkeypatch):
+    cache = cache_mode(html_cache.CACHE_MODE_ON)
+    challenge_html = "<html><title>Just a moment...</title></html>"
+    calls = []
+
+    async def fake_fetch(stage, url):
+        calls.append(url)
+        return TapologyFetchResult(
+            stage=stage,
+            url=url,
+            status=TAPOLOGY_FETCH_SUCCEEDED,
+            html=challenge_html,
+            error=None,
+            elapsed_seconds=1.0,
+        )
+
+    monkeypatch.setattr(crawler._TAPOLOGY_SCRAPLING_WORKER, "fetch", fake_fetch)
+    url = "https://www.tapology.com/fightcenter/fighters/3"
+
+    await crawler.crawl_tapology_with_scrapling_worker_result(url, stage="profile")
+    await crawler.crawl_tapology_with_scrapling_worker_result(url, stage="profile")
+
+    assert calls == [url, url]
+    assert cache.writes == 0
+    assert not cache.path_for(url).exists()
+
+    # 검증 도입 이전에 저장된 챌린지 페이지도 재생하지 않고 다시 가져온다
+    cache.write(url, challenge_html)
+    await crawler.crawl_tapology_with_scrapling_worker_result(url, stage="profile")
+    assert calls == [url, url, url]
+    # 거부된 캐시 페이지는 hit가 아닌 miss로 집계된다
+    assert cache.hits == 0
+    assert cache.misses == 3
+
+
+@pytest.mark.asyncio
+async def test_tapology_scrapling_crawler_does_not_cache_challenge_page(cache_mode, monkeypatch):
+    cache = cache_mode(html_cache.CACHE_MODE_ON)
+    monkeypatch.setattr(crawler, "TAPOLOGY_SCRAPLING_DELAY_RANGE", (0.0, 0.0))
+    monkeypatch.setattr(
+        crawler,
+        "_fetch_tapology_with_scrapling",
+        lambda url: "<html><div id='cf-challenge'></div></html>",
+    )
+
+    html = await crawler.crawl_tapology_with_scrapling("https://www.tapology.com/fightcenter/events/1")
+
+    assert crawler.is_tapology_challenge_page(html)
+    assert cache.writes == 0
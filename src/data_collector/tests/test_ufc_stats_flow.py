@@ -29,7 +29,19 @@ async def test_scheduled_flow_runs_tapology_profiles_with_scrapling(monkeypatch)
     monkeypatch.setattr(ufc_stats_flow, "get_run_logger", lambda: _DummyLogger())
     monkeypatch.setattr(ufc_stats_flow, "crawl_with_playwright", playwright_crawler)
     monkeypatch.setattr(ufc_stats_flow, "crawl_tapology_with_scrapling", tapology_crawler)
-    monkeypatch.setattr(ufc_stats_flow, "invalidate_all_cache", lambda: 0)
+    async def refresh_stats():
+        calls.append(("dashboard-stats", None))
+
+    async def invalidate_cache():
+        return 0
+
+    async def invalidate_sql_cache():
+        calls.append(("sql-cache", None))
+        return 0
+
+    monkeypatch.setattr(ufc_stats_flow, "refresh_stats_views", refresh_stats)
+    monkeypatch.setattr(ufc_stats_flow, "invalidate_all_cache", invalidate_cache)
+    monkeypatch.setattr(ufc_stats_flow, "invalidate_sql_cache", invalidate_sql_cache)
     monkeypatch.setattr(ufc_stats_flow, "close_playwright_crawler", close_playwright)
 
     monkeypatch.setattr(ufc_stats_flow, "scrap_all_fighter_task", make_task("fighters"))
@@ -56,5 +68,7 @@ async def test_scheduled_flow_runs_tapology_profiles_with_scrapling(monkeypatch)
         ("event-detail", playwright_crawler),
         ("match-detail", playwright_crawler),
         ("rankings", playwright_crawler),
+        ("dashboard-stats", None),
+        ("sql-cache", None),
         ("close", None),
     ]
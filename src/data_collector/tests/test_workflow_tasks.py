@@ -90,33 +90,37 @@ async def test_process_event_detail_passes_performance_bonus_to_fighter_match_sa
             }
         ]
 
-    async def save_match(session, match):
-        calls.append(("save_match", session, match.detail_url))
-        return SimpleNamespace(id=99, detail_url=match.detail_url)
-
-    async def save_fighter_match(
-        session,
-        fighter_id,
-        match_id,
-        result,
-        has_performance_of_the_night_bonus=False,
-    ):
+    async def save_matches(session, matches):
+        calls.append(("save_matches", session, [match.detail_url for match in matches]))
+        return [SimpleNamespace(id=99, detail_url=match.detail_url) for match in matches]
+
+    async def save_fighter_matches(session, fighter_matches):
         calls.append(
             (
-                "save_fighter_match",
+                "save_fighter_matches",
                 session,
-                fighter_id,
-                match_id,
-                result,
-                has_performance_of_the_night_bonus,
+                [
+                    (
+                        fighter_match.fighter_id,
+                        fighter_match.match_id,
+                        fighter_match.result,
+                        fighter_match.has_performance_of_the_night_bonus,
+                    )
+                    for fighter_match in fighter_matches
+                ],
             )
         )
 
     monkeypatch.setattr(tasks, "RANDOM_DELAY", 0)
     monkeypatch.setattr(tasks, "get_async_db_context", lambda: FakeDbContext())
     monkeypatch.setattr(tasks, "scrap_event_detail", scrap_event_detail)
-    monkeypatch.setattr(tasks, "save_match", save_match)
-    monkeypatch.setattr(tasks, "save_fighter_match", save_fighter_match)
+    monkeypatch.setattr(tasks, "save_matches", save_matches)
+    monkeypatch.setattr(tasks, "save_fighter_matches", save_fighter_matches)
+
+    async def save_event_detail_scraped(session, event_id, scraped_at):
+        calls.append(("save_event_detail_scraped", session, event_id))
+
+    monkeypatch.setattr(tasks, "save_event_detail_scraped", save_event_detail_scraped)
 
     await tasks.process_event_detail(
         0,
@@ -129,7 +133,217 @@ async def test_process_event_detail_passes_performance_bonus_to_fighter_match_sa
     )
 
     assert calls == [
-        ("save_match", fake_session, "http://ufcstats.com/fight-details/performance"),
-        ("save_fighter_match", fake_session, 10, 99, "win", True),
-        ("save_fighter_match", fake_session, 20, 99, "loss", False),
+        ("save_matches", fake_session, ["http://ufcstats.com/fight-details/performance"]),
+        (
+            "save_fighter_matches",
+            fake_session,
+            [(10, 99, "win", True), (20, 99, "loss", False)],
+        ),
+        ("save_event_detail_scraped", fake_session, 1),
     ]
+
+
+def _fighter_cell():
+    return (
+        '<td class="b-fight-details__table-col">'
+        '<a href="http://ufcstats.com/fighter-details/red">Red Fighter</a>\n'
+        '<a href="http://ufcstats.com/fighter-details/blue">Blue Fighter</a>'
+        "</td>"
+    )
+
+
+def _stat_cell(first, second):
+    return f'<td class="b-fight-details__table-col"><p>{first}</p>\n<p>{second}</p></td>'
+
+
+MATCH_DETAIL_HTML = (
+    '<table class="b-fight-details__table">'
+    '<tr class="b-fight-details__table-row"><th class="b-fight-details__table-col">Fighter</th></tr>'
+    '<tr class="b-fight-details__table-row">'
+    + _fighter_cell()
+    + _stat_cell("1", "0")
+    + _stat_cell("10 of 20", "5 of 15")
+    + _stat_cell("50%", "33%")
+    + _stat_cell("12 of 25", "8 of 20")
+    + _stat_cell("2 of 3", "0 of 1")
+    + _stat_cell("66%", "0%")
+    + _stat_cell("1", "0")
+    + _stat_cell("0", "0")
+    + _stat_cell("1:30", "0:10")
+    + "</tr></table>"
+    '<table class="b-fight-details__table">'
+    '<tr class="b-fight-details__table-row">'
+    '<th class="b-fight-details__table-col">Fighter</th>'
+    '<th class="b-fight-details__table-col">Head</th>'
+    '<th class="b-fight-details__table-col">Body</th>'
+    '<th class="b-fight-details__table-col">Leg</th></tr>'
+    '<tr class="b-fight-details__table-row">'
+    + _fighter_cell()
+    + _stat_cell("10 of 20", "5 of 15")
+    + _stat_cell("50%", "33%")
+    + _stat_cell("6 of 12", "3 of 10")
+    + _stat_cell("2 of 4", "1 of 3")
+    + _stat_cell("2 of 4", "1 of 2")
+    + _stat_cell("8 of 16", "4 of 12")
+    + _stat_cell("1 of 2", "1 of 3")
+    + _stat_cell("1 of 2", "0 of 0")
+    + "</tr></table>"
+)
+
+
+@pytest.mark.asyncio
+async def test_process_detail_url_fetches_once_for_all_parsers(monkeypatch):
+    fetched_urls = []
+    saved = {}
+    fake_session = object()
+
+    class FakeDbContext:
+        async def __aenter__(self):
+            return fake_session
+
+        async def __aexit__(self, exc_type, exc, traceback):
+            return False
+
+    async def crawler(url):
+        fetched_urls.append(url)
+        return MATCH_DETAIL_HTML
+
+    async def save_basic_match_stat(session, stats):
+        saved["basic"] = stats
+
+    async def save_sig_str_match_stat(session, stats):
+        saved["sig_str"] = stats
+
+    monkeypatch.setattr(tasks, "RANDOM_DELAY", 0)
+    monkeypatch.setattr(tasks, "get_async_db_context", lambda: FakeDbContext())
+    monkeypatch.setattr(tasks, "save_basic_match_stat", save_basic_match_stat)
+    monkeypatch.setattr(tasks, "save_sig_str_match_stat", save_sig_str_match_stat)
+
+    detail_url = "http://ufcstats.com/fight-details/once"
+    fighter_lookup = {"red fighter": 1, "blue fighter": 2}
+    fighter_matches = {
+        1: SimpleNamespace(id=101),
+        2: SimpleNamespace(id=102),
+    }
+
+    succeeded = await tasks.process_detail_url(
+        0,
+        detail_url,
+        fighter_matches,
+        crawler,
+        fighter_lookup,
+        1,
+        asyncio.Semaphore(1),
+        logging.getLogger(__name__),
+    )
+
+    assert succeeded is True
+    assert fetched_urls == [detail_url]
+    assert [(stat.fighter_match_id, stat.knockdowns, stat.control_time_seconds) for stat in saved["basic"]] == [
+        (101, 1, 90),
+        (102, 0, 10),
+    ]
+    assert [(stat.fighter_match_id, stat.head_strikes_landed) for stat in saved["sig_str"]] == [
+        (101, 6),
+        (102, 3),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_process_event_detail_does_not_mark_event_without_matches(monkeypatch):
+    marked = []
+
+    class FakeDbContext:
+        async def __aenter__(self):
+            return object()
+
+        async def __aexit__(self, exc_type, exc, traceback):
+            return False
+
+    async def scrap_event_detail(crawler_fn, event_url, event_id, fighter_lookup):
+        return []
+
+    async def save_matches(session, matches):
+        return []
+
+    async def save_fighter_matches(session, fighter_matches):
+        return None
+
+    async def save_event_detail_scraped(session, event_id, scraped_at):
+        marked.append(event_id)
+
+    monkeypatch.setattr(tasks, "RANDOM_DELAY", 0)
+    monkeypatch.setattr(tasks, "get_async_db_context", lambda: FakeDbContext())
+    monkeypatch.setattr(tasks, "scrap_event_detail", scrap_event_detail)
+    monkeypatch.setattr(tasks, "save_matches", save_matches)
+    monkeypatch.setattr(tasks, "save_fighter_matches", save_fighter_matches)
+    monkeypatch.setattr(tasks, "save_event_detail_scraped", save_event_detail_scraped)
+
+    await tasks.process_event_detail(
+        0,
+        EventSchema(id=1, name="UFC Empty", url="http://ufcstats.com/event-details/empty"),
+        object(),
+        {},
+        1,
+        asyncio.Semaphore(1),
+        logging.getLogger(__name__),
+    )
+
+    assert marked == []
+
+
+@pytest.mark.asyncio
+async def test_scrap_match_detail_task_marks_only_fully_scraped_events(monkeypatch):
+    marked = []
+
+    class FakeResult:
+        def all(self):
+            return [
+                ("http://ufcstats.com/fight-details/a1", 1),
+                ("http://ufcstats.com/fight-details/a2", 1),
+                ("http://ufcstats.com/fight-details/b1", 2),
+            ]
+
+    class FakeSession:
+        async def execute(self, stmt):
+            return FakeResult()
+
+    class FakeDbContext:
+        async def __aenter__(self):
+            return FakeSession()
+
+        async def __aexit__(self, exc_type, exc, traceback):
+            return False
+
+    async def get_all_fighter(session, page_size=None):
+        return []
+
+    async def get_events_pending_scrape(session, scraped_at_column):
+        assert scraped_at_column is tasks.EventModel.match_stats_scraped_at
+        return [EventSchema(id=1, name="A"), EventSchema(id=2, name="B")]
+
+    async def get_match_fighter_mapping(session, event_ids=None):
+        assert event_ids == [1, 2]
+        return {
+            "http://ufcstats.com/fight-details/a1": {},
+            "http://ufcstats.com/fight-details/a2": {},
+            "http://ufcstats.com/fight-details/b1": {},
+        }
+
+    async def process_detail_url(idx, detail_url, *args):
+        return detail_url != "http://ufcstats.com/fight-details/b1"
+
+    async def save_event_match_stats_scraped(session, event_ids, scraped_at):
+        marked.extend(event_ids)
+
+    monkeypatch.setattr(tasks, "get_run_logger", lambda: logging.getLogger(__name__))
+    monkeypatch.setattr(tasks, "get_async_db_context", lambda: FakeDbContext())
+    monkeypatch.setattr(tasks, "get_all_fighter", get_all_fighter)
+    monkeypatch.setattr(tasks, "get_events_pending_scrape", get_events_pending_scrape)
+    monkeypatch.setattr(tasks, "get_match_fighter_mapping", get_match_fighter_mapping)
+    monkeypatch.setattr(tasks, "process_detail_url", process_detail_url)
+    monkeypatch.setattr(tasks, "save_event_match_stats_scraped", save_event_match_stats_scraped)
+
+    await tasks.scrap_match_detail_task.fn(object())
+
+    assert marked == [1]
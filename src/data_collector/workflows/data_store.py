@@ -3,7 +3,8 @@ import re
 from datetime import datetime
 from typing import List
 
-from sqlalchemy import delete, select
+from sqlalchemy import and_, case, delete, func, literal_column, select, true, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from common.utils import normalize_name
 from fighter.models import (
@@ -57,36 +58,98 @@ UFC_PROMOTION_NAMES = {
     "ufc ultimate fighting championship",
 }
 
-async def save_fighters(session, fighters: List[FighterSchema]):
+UPSERT_EXCLUDE_FIELDS = {"id", "created_at", "updated_at"}
+
+
+def _schema_rows(schemas, key_fn=None) -> list[dict]:
+    """스키마 목록을 INSERT 파라미터로 변환. key_fn이 주어지면 같은 키는 마지막 값만 남김
+    (한 INSERT ... ON CONFLICT 문에서 같은 행을 두 번 갱신할 수 없음)"""
+    rows = [schema.model_dump(exclude=UPSERT_EXCLUDE_FIELDS) for schema in schemas]
+    if key_fn is None:
+        return rows
+    deduped = {}
+    for idx, row in enumerate(rows):
+        key = key_fn(row)
+        deduped[key if key is not None else ("__row__", idx)] = row
+    return list(deduped.values())
+
+
+def _in_input_order(rows: list[dict], returned, key_fn) -> list:
+    """executemany RETURNING 결과는 순서가 보장되지 않으므로 unique 키로 입력 순서를 복원"""
+    returned_by_key = {}
+    unkeyed = []
+    for row in returned:
+        key = key_fn(row._mapping)
+        if key is None:
+            unkeyed.append(row)
+        else:
+            returned_by_key[key] = row
+    ordered = [returned_by_key[key_fn(row)] for row in rows if key_fn(row) is not None]
+    return ordered + unkeyed
 
-    for fighter in fighters:
-        if not fighter.name:
-            continue
 
-        fighter_name = normalize_name(fighter.name)
+def _utc_now_sql():
+    """ON CONFLICT SET용 updated_at (DB 서버 기준 UTC)"""
+    return func.timezone(literal_column("'UTC'"), func.now())
 
-        # detail_url이 있으면 detail_url 기준으로 조회, 없으면 name 기준
-        if fighter.detail_url:
-            existing_model_query = await session.execute(
-                select(FighterModel).where(FighterModel.detail_url == fighter.detail_url)
-            )
-        else:
-            existing_model_query = await session.execute(
-                select(FighterModel).where(FighterModel.name == fighter_name)
-            )
 
-        existing_model = existing_model_query.scalar_one_or_none()
+def _preserve_true(column, excluded_column):
+    """기존 값이 TRUE인데 새 값이 FALSE면 TRUE 유지"""
+    return case(
+        (and_(column.is_(True), excluded_column.is_(False)), true()),
+        else_=excluded_column,
+    )
 
-        if existing_model:
-            # 업데이트 (None 값은 기존 값 유지 — 별도 스크립트로 채운 nationality 등 보호)
-            for key, value in fighter.model_dump(exclude={'id', 'created_at', 'updated_at'}).items():
-                if value is None and getattr(existing_model, key, None) is not None:
-                    continue
-                setattr(existing_model, key, value)
-        else:
-            # 새로 생성
-            new_fighter = FighterModel.from_schema(fighter)
-            session.add(new_fighter)
+
+async def save_fighters(session, fighters: List[FighterSchema]):
+    fighters = [fighter for fighter in fighters if fighter.name]
+
+    # detail_url이 있으면 uq_fighter_detail_url 기준 일괄 upsert
+    url_rows = _schema_rows(
+        [fighter for fighter in fighters if fighter.detail_url],
+        key_fn=lambda row: row["detail_url"],
+    )
+    if url_rows:
+        table = FighterModel.__table__
+        stmt = pg_insert(table)
+        # 업데이트 (None 값은 기존 값 유지 — 별도 스크립트로 채운 nationality 등 보호)
+        update_set = {
+            key: func.coalesce(stmt.excluded[key], table.c[key])
+            for key in url_rows[0]
+            if key != "detail_url"
+        }
+        update_set["updated_at"] = _utc_now_sql()
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.detail_url],
+            index_where=table.c.detail_url.is_not(None),
+            set_=update_set,
+        )
+        await session.execute(stmt, url_rows)
+
+    # detail_url이 없으면 name 기준 (unique index 없음) — 한 번에 조회 후 ORM으로 반영
+    name_only = [fighter for fighter in fighters if not fighter.detail_url]
+    if name_only:
+        existing_query = await session.execute(
+            select(FighterModel).where(
+                FighterModel.name.in_({normalize_name(fighter.name) for fighter in name_only})
+            )
+        )
+        existing_by_name = {model.name: model for model in existing_query.scalars().all()}
+
+        for fighter in name_only:
+            fighter_name = normalize_name(fighter.name)
+            existing_model = existing_by_name.get(fighter_name)
+
+            if existing_model:
+                for key, value in fighter.model_dump(exclude=UPSERT_EXCLUDE_FIELDS).items():
+                    if value is None and getattr(existing_model, key, None) is not None:
+                        continue
+                    setattr(existing_model, key, value)
+            else:
+                # 새로 생성
+                new_fighter = FighterModel.from_schema(fighter)
+                session.add(new_fighter)
+                existing_by_name[fighter_name] = new_fighter
 
     await session.commit()
 
@@ -117,6 +180,24 @@ async def save_events(session, events: List[EventSchema]):
     await session.commit()
 
 
+async def save_event_detail_scraped(session, event_id: int, scraped_at: datetime) -> None:
+    """이벤트 상세(매치 목록) 수집 완료 시각 기록"""
+    await session.execute(
+        update(EventModel).where(EventModel.id == event_id).values(detail_scraped_at=scraped_at)
+    )
+    await session.commit()
+
+
+async def save_event_match_stats_scraped(session, event_ids: List[int], scraped_at: datetime) -> None:
+    """이벤트 소속 매치 상세(라운드 통계) 수집 완료 시각 기록"""
+    if not event_ids:
+        return
+    await session.execute(
+        update(EventModel).where(EventModel.id.in_(event_ids)).values(match_stats_scraped_at=scraped_at)
+    )
+    await session.commit()
+
+
 async def save_tapology_event_url(session, event_id: int, tapology_url: str) -> EventSchema | None:
     existing_model_query = await session.execute(
         select(EventModel).where(EventModel.id == event_id)
@@ -131,30 +212,47 @@ async def save_tapology_event_url(session, event_id: int, tapology_url: str) ->
     await session.refresh(existing_model)
     return existing_model.to_schema()
 
-async def save_match(session, match: MatchSchema) -> MatchSchema:
-    existing_model_query = await session.execute(
-        select(MatchModel).where(MatchModel.detail_url == match.detail_url)
+async def save_matches(session, matches: List[MatchSchema]) -> List[MatchSchema]:
+    """
+    uq_match_detail_url 기준 일괄 upsert. 저장된 행을 RETURNING으로 함께 받아 입력 순서대로 반환
+    (detail_url 중복은 마지막 값만 저장되므로 입력과 길이가 다를 수 있음)
+    """
+    rows = _schema_rows(matches, key_fn=lambda row: row["detail_url"])
+    if not rows:
+        return []
+
+    table = MatchModel.__table__
+    stmt = pg_insert(table)
+    update_set = {}
+    for key in rows[0]:
+        if key == "detail_url":
+            continue
+        if key in TAPOLOGY_MATCH_FIELDS:
+            update_set[key] = func.coalesce(stmt.excluded[key], table.c[key])
+        elif key in PRESERVE_TRUE_MATCH_FIELDS:
+            update_set[key] = _preserve_true(table.c[key], stmt.excluded[key])
+        else:
+            update_set[key] = stmt.excluded[key]
+    update_set["updated_at"] = _utc_now_sql()
+
+    stmt = (
+        stmt.on_conflict_do_update(
+            index_elements=[table.c.detail_url],
+            index_where=table.c.detail_url.is_not(None),
+            set_=update_set,
+        )
+        .returning(*table.c)
     )
-    existing_model = existing_model_query.scalar_one_or_none()
-
-    if existing_model:
-        # 업데이트
-        for key, value in match.model_dump(exclude={'id', 'created_at', 'updated_at'}).items():
-            if key in TAPOLOGY_MATCH_FIELDS and value is None and getattr(existing_model, key, None) is not None:
-                continue
-            if key in PRESERVE_TRUE_MATCH_FIELDS and value is False and getattr(existing_model, key, None) is True:
-                continue
-            setattr(existing_model, key, value)
-        return_model = existing_model
-    else:
-        # 새로 생성
-        new_match = MatchModel.from_schema(match)
-        session.add(new_match)
-        return_model = new_match
+    returned = (await session.execute(stmt, rows)).all()
+    saved_rows = _in_input_order(rows, returned, lambda row: row["detail_url"])
 
     await session.commit()
-    await session.refresh(return_model)
-    return return_model.to_schema()
+    return [MatchModel(**row._mapping).to_schema() for row in saved_rows]
+
+
+async def save_match(session, match: MatchSchema) -> MatchSchema:
+    saved = await save_matches(session, [match])
+    return saved[0]
 
 
 async def save_tapology_fighter_enrichment(
@@ -454,6 +552,47 @@ def _normalize_match_name(value: str) -> str:
     return re.sub(r"\s+", " ", normalized).strip()
     
 
+async def save_fighter_matches(
+    session,
+    fighter_matches: List[FighterMatchSchema],
+) -> List[FighterMatchSchema]:
+    """uq_fighter_match_fighter_match 기준 일괄 upsert. 결과/보너스만 갱신"""
+    rows = [
+        {
+            "fighter_id": fighter_match.fighter_id,
+            "match_id": fighter_match.match_id,
+            "result": fighter_match.result,
+            "has_performance_of_the_night_bonus": fighter_match.has_performance_of_the_night_bonus,
+        }
+        for fighter_match in fighter_matches
+    ]
+    rows = list({(row["fighter_id"], row["match_id"]): row for row in rows}.values())
+    if not rows:
+        return []
+
+    table = FighterMatchModel.__table__
+    stmt = pg_insert(table)
+    stmt = (
+        stmt.on_conflict_do_update(
+            index_elements=[table.c.fighter_id, table.c.match_id],
+            set_={
+                "result": stmt.excluded.result,
+                "has_performance_of_the_night_bonus": _preserve_true(
+                    table.c.has_performance_of_the_night_bonus,
+                    stmt.excluded.has_performance_of_the_night_bonus,
+                ),
+                "updated_at": _utc_now_sql(),
+            },
+        )
+        .returning(*table.c)
+    )
+    returned = (await session.execute(stmt, rows)).all()
+    saved_rows = _in_input_order(rows, returned, lambda row: (row["fighter_id"], row["match_id"]))
+
+    await session.commit()
+    return [FighterMatchModel(**row._mapping).to_schema() for row in saved_rows]
+
+
 async def save_fighter_match(
     session,
     fighter_id: int,
@@ -461,75 +600,53 @@ async def save_fighter_match(
     result: str | None,
     has_performance_of_the_night_bonus: bool = False,
 ) -> FighterMatchSchema:
-    existing_model_query = await session.execute(
-        select(FighterMatchModel).where(FighterMatchModel.fighter_id == fighter_id, FighterMatchModel.match_id == match_id)
+    saved = await save_fighter_matches(
+        session,
+        [
+            FighterMatchSchema(
+                fighter_id=fighter_id,
+                match_id=match_id,
+                result=result,
+                has_performance_of_the_night_bonus=has_performance_of_the_night_bonus,
+            )
+        ],
     )
-    existing_model = existing_model_query.scalar_one_or_none()
+    return saved[0]
 
-    if existing_model:
-        # 업데이트
-        existing_model.result = result
-        if has_performance_of_the_night_bonus or existing_model.has_performance_of_the_night_bonus is not True:
-            existing_model.has_performance_of_the_night_bonus = has_performance_of_the_night_bonus
-        return_model = existing_model
-    else:
-        # 새로 생성
-        new_match = FighterMatchModel(
-            fighter_id=fighter_id,
-            match_id=match_id,
-            result=result,
-            has_performance_of_the_night_bonus=has_performance_of_the_night_bonus,
-        )
-        session.add(new_match)
-        return_model = new_match
 
+async def _upsert_round_stats(session, model, stat_list) -> List[int]:
+    """(fighter_match_id, round) unique index 기준 라운드 통계 일괄 upsert. 저장된 id 반환"""
+    rows = _schema_rows(stat_list, key_fn=lambda row: (row["fighter_match_id"], row["round"]))
+    if not rows:
+        return []
+
+    table = model.__table__
+    stmt = pg_insert(table)
+    update_set = {
+        key: stmt.excluded[key]
+        for key in rows[0]
+        if key not in ("fighter_match_id", "round")
+    }
+    update_set["updated_at"] = _utc_now_sql()
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.fighter_match_id, table.c.round],
+        set_=update_set,
+    ).returning(table.c.id, table.c.fighter_match_id, table.c.round)
+    returned = (await session.execute(stmt, rows)).all()
+    saved_rows = _in_input_order(rows, returned, lambda row: (row["fighter_match_id"], row["round"]))
+    return [row.id for row in saved_rows]
+
+
+async def save_basic_match_stat(session, basic_match_stat_list: List[BasicMatchStatSchema]) -> List[int]:
+    saved_ids = await _upsert_round_stats(session, BasicMatchStatModel, basic_match_stat_list)
     await session.commit()
-    await session.refresh(return_model)
-    return return_model.to_schema()
-
-async def save_basic_match_stat(session, basic_match_stat_list: List[BasicMatchStatSchema]):
-    for basic_match_stat in basic_match_stat_list:
-        existing_stats = await session.execute(
-            select(BasicMatchStatModel)
-            .where(
-                BasicMatchStatModel.fighter_match_id == basic_match_stat.fighter_match_id,
-                BasicMatchStatModel.round == basic_match_stat.round
-            )
-        )
-        existing_stats = existing_stats.scalar_one_or_none()
-        
-        if existing_stats:            
-            # 업데이트
-            for key, value in basic_match_stat.model_dump(exclude={'id', 'created_at', 'updated_at'}).items():
-                setattr(existing_stats, key, value)
-        else:
-            # 새로 생성
-            new_stats = BasicMatchStatModel.from_schema(basic_match_stat)
-            session.add(new_stats)
-    
-    await session.commit()
+    return saved_ids
 
-async def save_sig_str_match_stat(session, sig_str_match_stat_list: List[SigStrMatchStatSchema]):
-    for sig_str_match_stat in sig_str_match_stat_list:
-        existing_stats = await session.execute(
-            select(SigStrMatchStatModel)
-            .where(
-                SigStrMatchStatModel.fighter_match_id == sig_str_match_stat.fighter_match_id,
-                SigStrMatchStatModel.round == sig_str_match_stat.round
-            )
-        )
-        existing_stats = existing_stats.scalar_one_or_none()
-        
-        if existing_stats:            
-            # 업데이트
-            for key, value in sig_str_match_stat.model_dump(exclude={'id', 'created_at', 'updated_at'}).items():
-                setattr(existing_stats, key, value)
-        else:
-            # 새로 생성
-            new_stats = SigStrMatchStatModel.from_schema(sig_str_match_stat)
-            session.add(new_stats)
-    
+
+async def save_sig_str_match_stat(session, sig_str_match_stat_list: List[SigStrMatchStatSchema]) -> List[int]:
+    saved_ids = await _upsert_round_stats(session, SigStrMatchStatModel, sig_str_match_stat_list)
     await session.commit()
+    return saved_ids
 
 async def save_rankings(session, rankings: List[RankingSchema]):
     for ranking in rankings:
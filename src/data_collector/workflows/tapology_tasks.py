@@ -21,6 +21,7 @@ from data_collector.crawler import (
     TAPOLOGY_FETCH_SUCCEEDED,
     TAPOLOGY_FETCH_WORKER_TIMEOUT,
     TapologyFetchResult,
+    is_tapology_challenge_page,
 )
 from data_collector.scrapers.tapology_scraper import (
     TapologyBoutMetadata,
@@ -55,16 +56,6 @@ BoutSaver = Callable[[int, str | None, TapologyBoutMetadata, datetime], Awaitabl
 EventUrlSaver = Callable[[int, str], Awaitable[object]]
 AttemptStateSaver = Callable[[int, str, datetime, str | None, str | None], Awaitable[object]]
 
-_TAPOLOGY_CHALLENGE_MARKERS = (
-    "just a moment...",
-    "checking if the site connection is secure",
-    "cf-challenge",
-    "challenge-platform",
-    "/cdn-cgi/challenge-platform/",
-    "cf-browser-verification",
-    "cloudflare ray id",
-)
-
 
 @dataclass
 class TapologyLocalBoutFighter:
@@ -632,7 +623,7 @@ async def enrich_fighter_tapology_profile_batch(
                     )
                     _raise_if_guard_abort(guard, logger)
                     continue
-                if _is_tapology_challenge_page(search_html):
+                if is_tapology_challenge_page(search_html):
                     stats.failed += 1
                     reason = _challenge_failure_reason(search_html)
                     await _save_tapology_attempt_failure(
@@ -722,7 +713,7 @@ async def enrich_fighter_tapology_profile_batch(
                 logger.warning("Tapology profile page fetch failed for %s", match_result.url)
                 _raise_if_guard_abort(guard, logger)
                 continue
-            if _is_tapology_challenge_page(html):
+            if is_tapology_challenge_page(html):
                 stats.failed += 1
                 reason = _challenge_failure_reason(html)
                 await _save_tapology_attempt_failure(
@@ -882,7 +873,7 @@ async def enrich_match_tapology_metadata_batch(
                 logger.warning("Tapology bout page fetch failed for %s", bout_url)
                 _raise_if_guard_abort(guard, logger)
                 continue
-            if _is_tapology_challenge_page(html):
+            if is_tapology_challenge_page(html):
                 stats.failed += 1
                 reason = _challenge_failure_reason(html)
                 await _save_tapology_attempt_failure(
@@ -1012,7 +1003,7 @@ async def _resolve_tapology_bout_url_from_event_page(
             event_url,
         )
         return None
-    if _is_tapology_challenge_page(event_html):
+    if is_tapology_challenge_page(event_html):
         reason = _challenge_failure_reason(event_html)
         await _save_tapology_attempt_failure(
             save_attempt_state,
@@ -1122,7 +1113,7 @@ async def _resolve_tapology_event_url(
         )
         event_url_cache[cache_key] = None
         return None
-    if _is_tapology_challenge_page(search_html):
+    if is_tapology_challenge_page(search_html):
         reason = _challenge_failure_reason(search_html)
         await _save_tapology_attempt_failure(
             save_attempt_state,
@@ -1225,7 +1216,7 @@ async def _resolve_tapology_bout_url_from_direct_search(
             search_term,
         )
         return None, True
-    if _is_tapology_challenge_page(search_html):
+    if is_tapology_challenge_page(search_html):
         reason = _challenge_failure_reason(search_html)
         await _save_tapology_attempt_failure(
             save_attempt_state,
@@ -1293,13 +1284,6 @@ async def _resolve_tapology_bout_url_from_direct_search(
     return None, False
 
 
-def _is_tapology_challenge_page(html: str | None) -> bool:
-    if not html:
-        return False
-    normalized = html.lower()
-    return any(marker in normalized for marker in _TAPOLOGY_CHALLENGE_MARKERS)
-
-
 def _extract_html_title(html: str | None) -> str | None:
     if not html:
         return None
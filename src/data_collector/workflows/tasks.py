@@ -8,30 +8,36 @@ import logging
 from prefect import task
 from prefect.logging import get_run_logger
 from prefect.cache_policies import NO_CACHE
-from sqlalchemy import select, update, distinct
+from sqlalchemy import select, update, distinct, or_
 
+from config import Config
+from common.utils import utc_now
 from database.connection.postgres_conn import get_async_db_context
 from fighter.repositories import get_all_fighter, delete_all_rankings
 from fighter.models import FighterModel
 from event.repositories import get_events
 from event.models import EventSchema, EventModel
+from match.models import FighterMatchSchema, MatchModel
 from match.repositories import get_match_fighter_mapping
 from data_collector.scrapers import (
     scrap_fighters,
     scrap_all_events,
     scrap_event_detail,
-    scrap_match_basic_statistics,
-    scrap_match_significant_strikes,
+    fetch_match_detail_soup,
+    parse_match_basic_statistics,
+    parse_match_significant_strikes,
     scrap_rankings
 )
 from data_collector.workflows.data_store import (
     save_fighters,
     save_events,
-    save_match,
-    save_fighter_match,
+    save_matches,
+    save_fighter_matches,
     save_basic_match_stat,
     save_sig_str_match_stat,
-    save_rankings
+    save_rankings,
+    save_event_detail_scraped,
+    save_event_match_stats_scraped,
 )
 from data_collector.workflows.progress import format_progress
 from data_collector.workflows.tapology_tasks import (
@@ -190,6 +196,27 @@ async def scrap_upcoming_events_task(crawler_fn: Callable, batch_size: int = 30)
     logger.info(f"scrap_upcoming_events_task completed: {saved_count}/{total_events} upcoming events saved")
 
 
+def _pending_event_scrape_condition(scraped_at_column):
+    """
+    확정 기간(event_date + UFCSTATS_EVENT_SETTLE_DAYS) 이후에 수집된 적 없는 이벤트.
+    신규 / 예정 / 최근 종료 이벤트만 해당하고, 확정 후 한 번 수집된 과거 이벤트는 제외된다.
+    """
+    return or_(
+        scraped_at_column.is_(None),
+        EventModel.event_date.is_(None),
+        scraped_at_column < EventModel.event_date + Config.UFCSTATS_EVENT_SETTLE_DAYS,
+    )
+
+
+async def get_events_pending_scrape(session, scraped_at_column) -> List[EventSchema]:
+    result = await session.execute(
+        select(EventModel)
+        .where(_pending_event_scrape_condition(scraped_at_column))
+        .order_by(EventModel.event_date.desc())
+    )
+    return [event.to_schema() for event in result.scalars().all()]
+
+
 async def process_event_detail(
     idx: int,
     event: EventSchema,
@@ -216,32 +243,42 @@ async def process_event_detail(
         async with get_async_db_context() as session:
             saved_match_count = 0
             try:
+                # 이벤트 단위로 match / fighter_match를 각각 한 번의 upsert로 저장
+                saved_matches = await save_matches(session, [match_data["match"] for match_data in matches_data])
+                match_id_by_url = {
+                    saved_match.detail_url: saved_match.id
+                    for saved_match in saved_matches
+                    if saved_match.detail_url
+                }
+
+                fighter_matches = []
                 for match_data in matches_data:
-                    match = match_data["match"]
-                    saved_match = await save_match(session, match)
-                    match_id = saved_match.id
-                    detail_url = saved_match.detail_url if saved_match.detail_url else None
-                    if not detail_url:
+                    match_id = match_id_by_url.get(match_data["match"].detail_url)
+                    if match_id is None:
                         continue
 
                     for fighter_info in match_data["fighters"]:
-                        fighter_id = fighter_info["fighter_id"]
-                        result = fighter_info["result"]
-                        await save_fighter_match(
-                            session,
-                            fighter_id,
-                            match_id,
-                            result,
-                            has_performance_of_the_night_bonus=fighter_info.get(
-                                "has_performance_of_the_night_bonus",
-                                False,
-                            ),
+                        fighter_matches.append(
+                            FighterMatchSchema(
+                                fighter_id=fighter_info["fighter_id"],
+                                match_id=match_id,
+                                result=fighter_info["result"],
+                                has_performance_of_the_night_bonus=fighter_info.get(
+                                    "has_performance_of_the_night_bonus",
+                                    False,
+                                ),
+                            )
                         )
                     saved_match_count += 1
+
+                await save_fighter_matches(session, fighter_matches)
             except Exception as e:
                 logger.error("%s event detail scraping failed: event_id=%s error=%s", progress, event_id, str(e))
                 logger.error(format_exc())
                 return
+
+            if matches_data:
+                await save_event_detail_scraped(session, event_id, utc_now())
             logger.info("%s event detail scraping completed: event_id=%s saved_matches=%d", progress, event_id, saved_match_count)
 
 @task(
@@ -250,13 +287,17 @@ async def process_event_detail(
     retries=3,
     cache_policy=NO_CACHE,
 )
-async def scrap_event_detail_task(crawler_fn: Callable) -> None:
+async def scrap_event_detail_task(crawler_fn: Callable, incremental: bool = True) -> None:
     logger = get_run_logger()
-    logger.info("scrap_event_detail_task started")
+    logger.info("scrap_event_detail_task started: incremental=%s", incremental)
     async with get_async_db_context() as session:
-        events_list = await get_events(session)
+        if incremental:
+            events_list = await get_events_pending_scrape(session, EventModel.detail_scraped_at)
+        else:
+            events_list = await get_events(session)
         all_fighters = await get_all_fighter(session, page_size=None)
 
+    logger.info("event detail targets: %d events", len(events_list))
     fighter_name_to_id_map = build_fighter_lookup(all_fighters)
 
     semaphore = asyncio.Semaphore(3)
@@ -279,35 +320,46 @@ async def process_detail_url(
     total_urls: int,
     semaphore: asyncio.Semaphore,
     logger: logging.Logger,
-    ) -> None:
+    ) -> bool:
+    """매치 상세 페이지 수집. 기본 통계 / significant strikes 모두 저장되면 True"""
     async with semaphore:
         await asyncio.sleep(RANDOM_DELAY)
         if not detail_url:
-            return
+            return False
         progress = format_progress(overall_index=idx + 1, overall_total=total_urls)
 
+        # 상세 페이지는 한 번만 받아 모든 파서가 공유
+        soup = await fetch_match_detail_soup(crawler_fn, detail_url)
+        if soup is None:
+            logger.warning("%s match detail page unavailable: detail_url=%s", progress, detail_url)
+            return False
+
+        succeeded = True
         async with get_async_db_context() as session:
             try:
-                match_statistics_list = await scrap_match_basic_statistics(
-                    crawler_fn, detail_url, fighter_name_to_id_map, fighter_matches
+                match_statistics_list = parse_match_basic_statistics(
+                    soup, detail_url, fighter_name_to_id_map, fighter_matches
                 )
                 await save_basic_match_stat(session, match_statistics_list)
                 logger.info("%s BasicMatchStat scraping completed: detail_url=%s", progress, detail_url)
             except Exception as e:
+                succeeded = False
                 logger.error("%s BasicMatchStat scraping failed: detail_url=%s error=%s", progress, detail_url, str(e))
                 logger.error(format_exc())
 
             try:
-                strike_details_list = await scrap_match_significant_strikes(
-                    crawler_fn, detail_url, fighter_name_to_id_map, fighter_matches
+                strike_details_list = parse_match_significant_strikes(
+                    soup, detail_url, fighter_name_to_id_map, fighter_matches
                 )
                 await save_sig_str_match_stat(session, strike_details_list)
                 logger.info("%s SigStrMatchStat scraping completed: detail_url=%s", progress, detail_url)
             except Exception as e:
+                succeeded = False
                 logger.error("%s SigStrMatchStat scraping failed: detail_url=%s error=%s", progress, detail_url, str(e))
                 logger.error(format_exc())
 
         logger.info("%s match detail scraping completed: detail_url=%s", progress, detail_url)
+        return succeeded
 
 
 @task(
@@ -316,27 +368,61 @@ async def process_detail_url(
     retries=3,
     cache_policy=NO_CACHE,
 )
-async def scrap_match_detail_task(crawler_fn: Callable) -> None:
+async def scrap_match_detail_task(crawler_fn: Callable, incremental: bool = True) -> None:
     logger = get_run_logger()
-    logger.info("scrap_match_detail_task started")
+    logger.info("scrap_match_detail_task started: incremental=%s", incremental)
 
+    event_id_by_url = {}
     async with get_async_db_context() as session:
         all_fighters = await get_all_fighter(session, page_size=None)
-        fighter_match_dict = await get_match_fighter_mapping(session)
+        if incremental:
+            pending_events = await get_events_pending_scrape(session, EventModel.match_stats_scraped_at)
+            pending_event_ids = [event.id for event in pending_events]
+            fighter_match_dict = await get_match_fighter_mapping(session, event_ids=pending_event_ids)
+            rows = await session.execute(
+                select(MatchModel.detail_url, MatchModel.event_id)
+                .where(MatchModel.event_id.in_(pending_event_ids), MatchModel.detail_url.is_not(None))
+            )
+            event_id_by_url = dict(rows.all())
+        else:
+            pending_event_ids = []
+            fighter_match_dict = await get_match_fighter_mapping(session)
 
+    logger.info(
+        "match detail targets: %d detail urls across %d pending events",
+        len(fighter_match_dict),
+        len(pending_event_ids),
+    )
     fighter_name_to_id_map = build_fighter_lookup(all_fighters)
 
     semaphore = asyncio.Semaphore(3)
 
+    detail_urls = list(fighter_match_dict.keys())
     tasks = [
         process_detail_url(
-            idx, detail_url, fighter_matches, crawler_fn,
+            idx, detail_url, fighter_match_dict[detail_url], crawler_fn,
             fighter_name_to_id_map, len(fighter_match_dict), semaphore, logger
         )
-        for idx, (detail_url, fighter_matches) in enumerate(fighter_match_dict.items())
+        for idx, detail_url in enumerate(detail_urls)
     ]
 
-    await asyncio.gather(*tasks, return_exceptions=True)
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    if incremental:
+        # 소속 매치 상세가 모두 저장된 이벤트만 수집 완료로 기록
+        failed_event_ids = {
+            event_id_by_url.get(detail_url)
+            for detail_url, result in zip(detail_urls, results)
+            if result is not True
+        }
+        completed_event_ids = [event_id for event_id in pending_event_ids if event_id not in failed_event_ids]
+        async with get_async_db_context() as session:
+            await save_event_match_stats_scraped(session, completed_event_ids, utc_now())
+        logger.info(
+            "match stats scrape state updated: completed_events=%d failed_events=%d",
+            len(completed_event_ids),
+            len(failed_event_ids),
+        )
 
     logger.info("scrap_match_detail_task completed")
 
@@ -9,7 +9,8 @@ from data_collector.crawler import (
     crawl_tapology_with_scrapling_worker as crawl_tapology_with_scrapling,
     crawl_with_playwright,
 )
-from dashboard.services import invalidate_all_cache
+from dashboard.services import invalidate_all_cache, refresh_stats_views
+from llm.tools.sql_tool import invalidate_sql_cache
 from data_collector.workflows.tasks import (
     scrap_all_fighter_task,
     scrap_all_events_task,
@@ -71,9 +72,18 @@ async def run_ufc_stats_flow():
         await scrap_rankings_task(crawl_with_playwright)
         logger.info("Rankings scraping completed")
 
+        # refresh dashboard aggregate views before dropping cached responses
+        logger.info("Dashboard stats refresh started")
+        await refresh_stats_views()
+        logger.info("Dashboard stats refresh completed")
+
         # invalidate dashboard cache so stale data is not served
-        deleted = invalidate_all_cache()
+        deleted = await invalidate_all_cache()
         logger.info(f"Dashboard cache invalidated ({deleted} keys deleted)")
+
+        # LLM SQL tool 결과 캐시도 새 데이터 기준으로 다시 채워지도록 삭제
+        deleted = await invalidate_sql_cache()
+        logger.info(f"SQL tool cache invalidated ({deleted} keys deleted)")
     finally:
         await close_playwright_crawler()
         await close_tapology_scrapling_worker()
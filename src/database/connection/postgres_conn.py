@@ -1,11 +1,15 @@
-from typing import AsyncGenerator, Generator
+from typing import AsyncGenerator, Callable, Dict, Generator, Optional
 from contextlib import asynccontextmanager, contextmanager
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
+import logging
 import os
+import time
 
-from config import get_database_url, Config, Config
+from config import get_database_url, get_replica_database_url, Config
+
+LOGGER = logging.getLogger(__name__)
 
 DATABASE_URL = get_database_url()
 
@@ -156,11 +160,130 @@ async def get_async_readonly_db_context() -> AsyncGenerator[AsyncSession, None]:
     읽기 전용 비동기 데이터베이스 세션 (SELECT만 가능)
     LangGraph SQL 에이전트의 비동기 SQL 실행용
     """
-    session = AsyncReadonlySessionLocal()
+    session = await readonly_router.open_session()
     try:
         yield session
     except Exception as e:
         await session.rollback()
         raise e
     finally:
-        await session.close()
\ No newline at end of file
+        await session.close()
+
+# ===== Read replica 라우팅 =====
+class ReadReplicaRouter:
+    """
+    읽기 전용 세션 라우터
+    replica가 설정되어 있으면(DB_REPLICA_HOST) replica 세션을 열고,
+    커넥션 획득에 실패하면 DB_REPLICA_RETRY_SECONDS 동안 replica를 건너뛰고 primary 세션을 사용한다.
+    - 커넥션 획득 이후(쿼리 도중)의 replica 장애는 우회하지 않고 그대로 전파
+    - replica는 비동기 복제이므로 방금 쓴 데이터를 바로 읽어야 하는 경로에는 사용하지 않는다
+    """
+
+    def __init__(
+        self,
+        primary_factory: Callable[[], AsyncSession],
+        replica_url_factory: Callable[[], Optional[str]],
+    ):
+        self._primary_factory = primary_factory
+        self._replica_url_factory = replica_url_factory
+        self._replica_engine = None
+        self._replica_factory: Optional[Callable[[], AsyncSession]] = None
+        self._down_until = 0.0
+        self.replica_sessions = 0
+        self.primary_sessions = 0
+        self.fallbacks = 0
+
+    def _get_replica_factory(self) -> Optional[Callable[[], AsyncSession]]:
+        url = self._replica_url_factory()
+        if url is None:
+            return None
+        if self._replica_factory is None:
+            # 엔진은 첫 사용 시점에 생성 (replica 미사용 환경에서는 풀을 만들지 않음)
+            self._replica_engine = create_async_engine(
+                url,
+                pool_size=Config.DB_READONLY_POOL_SIZE,
+                max_overflow=Config.DB_READONLY_MAX_OVERFLOW,
+                pool_pre_ping=True,
+                connect_args={"timeout": Config.DB_REPLICA_CONNECT_TIMEOUT_SECONDS},
+            )
+            self._replica_factory = sessionmaker(
+                self._replica_engine, class_=AsyncSession, autocommit=False, autoflush=False,
+                expire_on_commit=False,
+            )
+        return self._replica_factory
+
+    @property
+    def replica_available(self) -> bool:
+        return time.monotonic() >= self._down_until
+
+    async def open_session(self) -> AsyncSession:
+        """replica 세션(커넥션 확보 완료) 또는 primary 세션 반환"""
+        replica_factory = self._get_replica_factory()
+        if replica_factory is not None and self.replica_available:
+            session = replica_factory()
+            try:
+                # 커넥션을 미리 잡아 replica 장애를 쿼리 실행 전에 감지
+                await session.connection()
+                self.replica_sessions += 1
+                return session
+            except Exception as e:
+                await session.close()
+                self._down_until = time.monotonic() + Config.DB_REPLICA_RETRY_SECONDS
+                self.fallbacks += 1
+                LOGGER.warning(
+                    f"Read replica 연결 실패, {Config.DB_REPLICA_RETRY_SECONDS:.0f}초간 primary 사용: {str(e)}"
+                )
+
+        self.primary_sessions += 1
+        return self._primary_factory()
+
+    async def dispose(self) -> None:
+        if self._replica_engine is not None:
+            await self._replica_engine.dispose()
+            self._replica_engine = None
+            self._replica_factory = None
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "replica_configured": self._replica_url_factory() is not None,
+            "replica_available": self.replica_available,
+            "replica_sessions": self.replica_sessions,
+            "primary_sessions": self.primary_sessions,
+            "fallbacks": self.fallbacks,
+        }
+
+
+# API 읽기 전용 요청용 (primary 계정)
+read_router = ReadReplicaRouter(
+    AsyncSessionLocal,
+    lambda: get_replica_database_url(Config.DB_USER, Config.DB_PASSWORD),
+)
+
+# SELECT 전용 계정 세션용 (LLM SQL 도구, Dashboard 탭 차트 쿼리)
+readonly_router = ReadReplicaRouter(
+    AsyncReadonlySessionLocal,
+    lambda: get_replica_database_url(Config.DB_READONLY_USER, Config.DB_READONLY_PASSWORD),
+)
+
+def get_read_routing_stats() -> Dict[str, Dict[str, object]]:
+    """read replica 라우팅 통계 (API 읽기 요청 / SELECT 전용 계정)"""
+    return {"api": read_router.stats(), "readonly": readonly_router.stats()}
+
+
+async def dispose_read_replicas() -> None:
+    """지연 생성된 replica 엔진 정리 (애플리케이션 종료 시 호출)"""
+    await read_router.dispose()
+    await readonly_router.dispose()
+
+
+async def get_async_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    읽기 전용 API 라우트용 세션 dependency
+    replica가 설정되어 있으면 replica, 연결 불가 시 primary로 우회. 커밋하지 않는다.
+    """
+    session = await read_router.open_session()
+    try:
+        yield session
+    finally:
+        await session.rollback()
+        await session.close()
@@ -4,8 +4,10 @@ from traceback import format_exc
 import logging
 
 import redis
+from redis import asyncio as aioredis
 
 from config import Config
+from database.connection.redis_conn_memory import InMemoryAsyncRedis
 
 # 로거 설정
 LOGGER = logging.getLogger(__name__)
@@ -21,6 +23,39 @@ redis_client = redis.Redis(
     retry_on_timeout=Config.REDIS_RETRY_ON_TIMEOUT   # 타임아웃 시 재시도
 )
 
+# ===== 비동기 Redis 클라이언트 (캐시 경로용, 별도 커넥션 풀) =====
+def _create_async_redis_client():
+    if Config.REDIS_CACHE_BACKEND == "memory":
+        LOGGER.info("Async Redis backend: in-memory")
+        return InMemoryAsyncRedis()
+
+    pool = aioredis.ConnectionPool(
+        host=Config.REDIS_HOST,
+        port=Config.REDIS_PORT,
+        password=Config.REDIS_PASSWORD,
+        decode_responses=True,
+        socket_timeout=Config.REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout=Config.REDIS_SOCKET_CONNECT_TIMEOUT,
+        retry_on_timeout=Config.REDIS_RETRY_ON_TIMEOUT,
+        max_connections=Config.REDIS_ASYNC_MAX_CONNECTIONS,
+    )
+    return aioredis.Redis(connection_pool=pool)
+
+
+async_redis_client = _create_async_redis_client()
+
+
+async def close_async_redis() -> None:
+    """비동기 Redis 클라이언트와 커넥션 풀 정리 (애플리케이션 종료 시 호출)"""
+    try:
+        await async_redis_client.aclose()
+        pool = getattr(async_redis_client, "connection_pool", None)
+        if pool is not None:
+            await pool.disconnect()
+    except Exception as e:
+        LOGGER.warning(f"Async Redis close failed: {str(e)}")
+
+
 @contextmanager
 def redis_connection() -> redis.Redis:
     """
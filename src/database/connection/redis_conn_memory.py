@@ -0,0 +1,65 @@
+"""
+In-process Redis 대체 구현
+Redis 서버 없이 테스트/로컬 개발 시 사용하는 비동기 클라이언트 (REDIS_CACHE_BACKEND=memory)
+"""
+import fnmatch
+import time
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+
+class InMemoryAsyncRedis:
+    """
+    redis.asyncio.Redis 중 캐시 경로에서 사용하는 명령만 지원하는 단일 프로세스용 구현.
+    decode_responses=True 클라이언트처럼 문자열을 저장/반환한다.
+    """
+
+    def __init__(self):
+        # key -> (value, 만료 시각(monotonic) 또는 None)
+        self._store: Dict[str, Tuple[str, Optional[float]]] = {}
+
+    def _alive(self, key: str) -> bool:
+        entry = self._store.get(key)
+        if entry is None:
+            return False
+        expires_at = entry[1]
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._store[key]
+            return False
+        return True
+
+    async def ping(self) -> bool:
+        return True
+
+    async def get(self, key: str) -> Optional[str]:
+        if not self._alive(key):
+            return None
+        return self._store[key][0]
+
+    async def set(self, key: str, value, ex: Optional[int] = None, nx: bool = False) -> Optional[bool]:
+        if nx and self._alive(key):
+            return None
+        expires_at = time.monotonic() + ex if ex else None
+        self._store[key] = (str(value), expires_at)
+        return True
+
+    async def delete(self, *keys: str) -> int:
+        deleted = 0
+        for key in keys:
+            if self._alive(key):
+                del self._store[key]
+                deleted += 1
+        return deleted
+
+    async def keys(self, pattern: str = "*") -> List[str]:
+        return [key for key in list(self._store) if fnmatch.fnmatchcase(key, pattern) and self._alive(key)]
+
+    async def scan_iter(self, match: str = "*", count: Optional[int] = None) -> AsyncIterator[str]:
+        for key in await self.keys(match):
+            yield key
+
+    async def flushdb(self) -> bool:
+        self._store.clear()
+        return True
+
+    async def aclose(self) -> None:
+        return None
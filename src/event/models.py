@@ -1,7 +1,7 @@
 from datetime import date
 from typing import Optional
 
-from sqlalchemy import Column, String, Date, Float
+from sqlalchemy import Column, String, Date, DateTime, Float
 from sqlalchemy.orm import relationship
 from pydantic import ConfigDict
 
@@ -36,6 +36,9 @@ class EventModel(BaseModel):
     tapology_url = Column(String)
     latitude = Column(Float)
     longitude = Column(Float)
+    # UFCStats 증분 수집 상태 (collector 전용)
+    detail_scraped_at = Column(DateTime)
+    match_stats_scraped_at = Column(DateTime)
 
     matches = relationship("MatchModel", back_populates="event")
 
@@ -1,10 +1,10 @@
-from datetime import date
-from typing import Optional, List
-from calendar import monthrange
+from collections import defaultdict
+from typing import Dict, Optional, List
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from event import repositories as event_repo
+from event.models import EventSchema
 from match import repositories as match_repo
 from event.dto import (
     EventListDTO, EventSearchDTO, EventSearchResultDTO,
@@ -124,6 +124,24 @@ async def search_events(
         raise EventQueryError("search_events", {"query": query, "search_type": search_type, "limit": limit}, str(e))
 
 
+def _group_events_by_day(events: List[EventSchema]) -> Dict[str, List[EventSchema]]:
+    """이벤트를 한 번 순회하며 일(day)별로 그룹화합니다. 키는 일자 오름차순 ("1" ~ "31")."""
+    by_day: Dict[int, List[EventSchema]] = defaultdict(list)
+    for event in events:
+        if event.event_date:
+            by_day[event.event_date.day].append(event)
+    return {str(day): by_day[day] for day in sorted(by_day)}
+
+
+def _group_events_by_month(events: List[EventSchema]) -> Dict[str, List[EventSchema]]:
+    """이벤트를 한 번 순회하며 월별("01" ~ "12")로 그룹화합니다."""
+    by_month: Dict[str, List[EventSchema]] = {}
+    for event in events:
+        if event.event_date:
+            by_month.setdefault(f"{event.event_date.month:02d}", []).append(event)
+    return by_month
+
+
 async def get_events_calendar(
         session: AsyncSession, 
         year: int, 
@@ -145,34 +163,16 @@ async def get_events_calendar(
         if month is not None:
             events = await event_repo.get_events_by_period(session, year, month)
             
-            # 월별 캘린더 생성
-            _, days_in_month = monthrange(year, month)
-            calendar_data = {}
-            
-            for day in range(1, days_in_month + 1):
-                day_date = date(year, month, day)
-                day_events = [e for e in events if e.event_date == day_date]
-                if day_events:
-                    calendar_data[str(day)] = day_events
-            
             return MonthlyCalendarDTO(
                 type="monthly",
                 year=year,
                 month=month,
                 total_events=len(events),
-                calendar=calendar_data
+                calendar=_group_events_by_day(events)
             )
         else:
             events = await event_repo.get_events_by_period(session, year)
-            
-            # 연도별 월단위 그룹화
-            monthly_data = {}
-            for event in events:
-                if event.event_date:
-                    month_key = event.event_date.strftime("%m")
-                    if month_key not in monthly_data:
-                        monthly_data[month_key] = []
-                    monthly_data[month_key].append(event)
+            monthly_data = _group_events_by_month(events)
             
             return YearlyCalendarDTO(
                 type="yearly",
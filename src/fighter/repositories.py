@@ -3,21 +3,21 @@ import re
 
 from typing import List, Optional, Dict, Literal
 
-from sqlalchemy import select, delete, or_, text, func
+from sqlalchemy import JSON, String, select, delete, or_, text, func, literal
 from sqlalchemy.orm import aliased
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from config import Config
 from fighter.models import (
-    FighterMethodRecordModel,
     FighterMethodRecordSchema,
     FighterModel,
-    FighterPromotionRecordModel,
     FighterPromotionRecordSchema,
     FighterSchema,
     RankingModel,
     RankingSchema,
 )
 from match.models import FighterMatchModel, MatchModel, BasicMatchStatModel, SigStrMatchStatModel
+from match.dto import FighterBasicStatsAggregateDTO, FighterSigStrStatsAggregateDTO
 from event.models import EventModel
 from common.utils import normalize_name
 
@@ -182,40 +182,22 @@ async def get_ranking_by_fighter_id(session: AsyncSession, fighter_id: int) -> L
     return [ranking.to_schema() for ranking in rankings]
 
 
-async def get_fighter_promotion_records(
-    session: AsyncSession,
-    fighter_id: int,
-) -> List[FighterPromotionRecordSchema]:
+async def get_rankings_by_fighter_ids(session: AsyncSession, fighter_ids: List[int]) -> Dict[int, List[RankingSchema]]:
     """
-    fighter_id로 해당 선수의 non-UFC promotion 기록을 조회합니다.
+    여러 fighter_id의 랭킹을 단일 쿼리로 조회합니다.
+    {fighter_id: [RankingSchema, ...]} 형태로 반환하며 랭킹이 없는 선수는 키가 없습니다.
     """
-    result = await session.execute(
-        select(FighterPromotionRecordModel)
-        .where(FighterPromotionRecordModel.fighter_id == fighter_id)
-        .order_by(FighterPromotionRecordModel.promotion_name)
-    )
-    records = result.scalars().all()
-    return [record.to_schema() for record in records]
-
+    if not fighter_ids:
+        return {}
 
-async def get_fighter_method_records(
-    session: AsyncSession,
-    fighter_id: int,
-) -> List[FighterMethodRecordSchema]:
-    """
-    fighter_id로 해당 선수의 non-UFC method 기록을 조회합니다.
-    """
     result = await session.execute(
-        select(FighterMethodRecordModel)
-        .where(FighterMethodRecordModel.fighter_id == fighter_id)
-        .order_by(
-            FighterMethodRecordModel.scope,
-            FighterMethodRecordModel.result,
-            FighterMethodRecordModel.method_category,
-        )
+        select(RankingModel).where(RankingModel.fighter_id.in_(set(fighter_ids)))
     )
-    records = result.scalars().all()
-    return [record.to_schema() for record in records]
+    rankings_by_fighter: Dict[int, List[RankingSchema]] = {}
+    for ranking in result.scalars().all():
+        rankings_by_fighter.setdefault(ranking.fighter_id, []).append(ranking.to_schema())
+    return rankings_by_fighter
+
 
 async def get_fighters_by_weight_class_ranking(session: AsyncSession, weight_class_id: int) -> List[FighterSchema]:
     """
@@ -267,21 +249,65 @@ async def delete_all_rankings(session: AsyncSession) -> None:
     await session.execute(delete(RankingModel))
     await session.commit()
 
-async def search_fighters_by_name(session: AsyncSession, search_term: str, limit: int = 10) -> List[FighterSchema]:
+_pg_trgm_available: Optional[bool] = None
+
+
+async def _has_pg_trgm(session: AsyncSession) -> bool:
+    """pg_trgm 확장 설치 여부 (프로세스당 1회만 조회)"""
+    global _pg_trgm_available
+    if _pg_trgm_available is None:
+        result = await session.execute(text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'"))
+        _pg_trgm_available = result.scalar() is not None
+    return _pg_trgm_available
+
+
+def _trigram_search_stmt(normalized_search: str, limit: int):
     """
-    이름이나 닉네임으로 파이터를 검색합니다. (부분 매칭)
+    부분 매칭 + pg_trgm word similarity 검색 (idx_fighter_*_trgm 인덱스 사용).
+    부분 매칭 결과를 먼저, 그 다음 유사도 높은 순으로 정렬합니다.
     """
-    normalized_search = normalize_name(search_term)
-    result = await session.execute(
+    name = func.lower(FighterModel.name)
+    nickname = func.lower(FighterModel.nickname)
+    pattern = f'%{normalized_search}%'
+    substring_match = or_(name.ilike(pattern), nickname.ilike(pattern))
+    similarity = func.greatest(
+        func.word_similarity(normalized_search, name),
+        func.coalesce(func.word_similarity(normalized_search, nickname), 0),
+    )
+    return (
         select(FighterModel)
         .where(
             or_(
-                FighterModel.name.ilike(f'%{normalized_search}%'),
-                FighterModel.nickname.ilike(f'%{normalized_search}%')
+                substring_match,
+                literal(normalized_search).op("<%")(name),
+                literal(normalized_search).op("<%")(nickname),
             )
         )
+        .order_by(substring_match.desc(), similarity.desc(), FighterModel.wins.desc(), FighterModel.id)
         .limit(limit)
     )
+
+
+async def search_fighters_by_name(session: AsyncSession, search_term: str, limit: int = 10) -> List[FighterSchema]:
+    """
+    이름이나 닉네임으로 파이터를 검색합니다. (부분 매칭)
+    pg_trgm이 설치되어 있으면 오타/음역 차이도 유사도로 매칭하고 관련도 순으로 정렬합니다.
+    """
+    normalized_search = normalize_name(search_term)
+    if Config.FIGHTER_SEARCH_TRIGRAM_ENABLED and await _has_pg_trgm(session):
+        stmt = _trigram_search_stmt(normalized_search, limit)
+    else:
+        stmt = (
+            select(FighterModel)
+            .where(
+                or_(
+                    FighterModel.name.ilike(f'%{normalized_search}%'),
+                    FighterModel.nickname.ilike(f'%{normalized_search}%')
+                )
+            )
+            .limit(limit)
+        )
+    result = await session.execute(stmt)
     fighters = result.scalars().all()
     return [fighter.to_schema() for fighter in fighters]
 
@@ -328,10 +354,13 @@ async def get_ranked_fighters_by_weight_class(
 # Fighter Detail queries
 # ===========================
 
-async def get_fight_history(session: AsyncSession, fighter_id: int) -> list[dict]:
+async def get_fight_history_with_stats(
+    session: AsyncSession,
+    fighter_id: int,
+) -> tuple[list[dict], dict[int, dict]]:
     """
-    파이터의 전체 경기 이력을 단일 쿼리로 조회합니다.
-    상대 선수, 이벤트 정보를 JOIN으로 한번에 가져옵니다.
+    경기 이력(상대 선수, 이벤트 정보 JOIN)과 경기별 스탯(round=0)을 단일 쿼리로 조회합니다.
+    (rows, {fighter_match_id: {"basic": ..., "sig_str": ...}})를 반환하며 rows는 최신 경기 순입니다.
     """
     opp_fm = aliased(FighterMatchModel)
     opp_f = aliased(FighterModel)
@@ -352,6 +381,8 @@ async def get_fight_history(session: AsyncSession, fighter_id: int) -> list[dict
             opp_f.id.label("opponent_id"),
             opp_f.name.label("opponent_name"),
             opp_f.nationality.label("opponent_nationality"),
+            BasicMatchStatModel,
+            SigStrMatchStatModel,
         )
         .join(MatchModel, MatchModel.id == FighterMatchModel.match_id)
         .outerjoin(EventModel, EventModel.id == MatchModel.event_id)
@@ -360,97 +391,163 @@ async def get_fight_history(session: AsyncSession, fighter_id: int) -> list[dict
             (opp_fm.match_id == FighterMatchModel.match_id) & (opp_fm.fighter_id != fighter_id),
         )
         .outerjoin(opp_f, opp_f.id == opp_fm.fighter_id)
+        .outerjoin(
+            BasicMatchStatModel,
+            (BasicMatchStatModel.fighter_match_id == FighterMatchModel.id) & (BasicMatchStatModel.round == 0),
+        )
+        .outerjoin(
+            SigStrMatchStatModel,
+            (SigStrMatchStatModel.fighter_match_id == FighterMatchModel.id) & (SigStrMatchStatModel.round == 0),
+        )
         .where(FighterMatchModel.fighter_id == fighter_id)
         .order_by(EventModel.event_date.desc().nullslast())
     )
-
     result = await session.execute(stmt)
-    rows = result.mappings().all()
-    return [dict(row) for row in rows]
-
-
-async def get_per_match_stats(session: AsyncSession, fighter_match_ids: list[int]) -> dict[int, dict]:
-    """
-    여러 fighter_match_id에 대한 경기별 스탯을 배치 조회합니다.
-    round=0 (전체 합산) 행만 가져옵니다.
-    """
-    if not fighter_match_ids:
-        return {}
 
-    # basic stats 배치 조회
-    basic_result = await session.execute(
-        select(BasicMatchStatModel).where(
-            BasicMatchStatModel.fighter_match_id.in_(fighter_match_ids),
-            BasicMatchStatModel.round == 0,
-        )
-    )
-    basic_rows = basic_result.scalars().all()
-
-    # sig_str stats 배치 조회
-    sig_str_result = await session.execute(
-        select(SigStrMatchStatModel).where(
-            SigStrMatchStatModel.fighter_match_id.in_(fighter_match_ids),
-            SigStrMatchStatModel.round == 0,
-        )
-    )
-    sig_str_rows = sig_str_result.scalars().all()
-
-    # {fm_id: {"basic": ..., "sig_str": ...}} 조합
+    rows: list[dict] = []
     stats_map: dict[int, dict] = {}
-    for row in basic_rows:
-        fm_id = row.fighter_match_id
-        if fm_id not in stats_map:
-            stats_map[fm_id] = {}
-        stats_map[fm_id]["basic"] = row.to_schema()
-
-    for row in sig_str_rows:
-        fm_id = row.fighter_match_id
-        if fm_id not in stats_map:
-            stats_map[fm_id] = {}
-        stats_map[fm_id]["sig_str"] = row.to_schema()
-
-    return stats_map
-
-
-async def get_finish_breakdown(session: AsyncSession, fighter_id: int) -> dict:
-    """
-    파이터의 승리 방법별 집계를 단일 쿼리로 조회합니다.
-    """
-    stmt = text("""
+    for row in result.all():
+        mapping = dict(row._mapping)
+        basic = mapping.pop(BasicMatchStatModel.__name__, None)
+        sig_str = mapping.pop(SigStrMatchStatModel.__name__, None)
+        rows.append(mapping)
+
+        fm_stats = {}
+        if basic is not None:
+            fm_stats["basic"] = basic.to_schema()
+        if sig_str is not None:
+            fm_stats["sig_str"] = sig_str.to_schema()
+        if fm_stats:
+            stats_map[mapping["fighter_match_id"]] = fm_stats
+
+    return rows, stats_map
+
+
+FIGHTER_DETAIL_SUMMARY_SQL = text("""
+    WITH fm AS (
+        SELECT id, match_id, result FROM fighter_match WHERE fighter_id = :fighter_id
+    ),
+    basic AS (
+        SELECT
+            COALESCE(SUM(bs.knockdowns), 0) AS knockdowns,
+            COALESCE(SUM(bs.control_time_seconds), 0) AS control_time_seconds,
+            COALESCE(SUM(bs.submission_attempts), 0) AS submission_attempts,
+            COALESCE(SUM(bs.sig_str_landed), 0) AS sig_str_landed,
+            COALESCE(SUM(bs.sig_str_attempted), 0) AS sig_str_attempted,
+            COALESCE(SUM(bs.total_str_landed), 0) AS total_str_landed,
+            COALESCE(SUM(bs.total_str_attempted), 0) AS total_str_attempted,
+            COALESCE(SUM(bs.td_landed), 0) AS td_landed,
+            COALESCE(SUM(bs.td_attempted), 0) AS td_attempted,
+            COUNT(*) AS match_count
+        FROM match_statistics bs
+        JOIN fm ON fm.id = bs.fighter_match_id
+    ),
+    opp AS (
+        SELECT
+            COALESCE(SUM(opp_bs.td_landed), 0) AS opp_td_landed,
+            COALESCE(SUM(opp_bs.td_attempted), 0) AS opp_td_attempted,
+            COALESCE(SUM(opp_bs.knockdowns), 0) AS opp_knockdowns
+        FROM fm
+        JOIN fighter_match opp_fm
+            ON opp_fm.match_id = fm.match_id AND opp_fm.fighter_id != :fighter_id
+        JOIN match_statistics opp_bs
+            ON opp_bs.fighter_match_id = opp_fm.id
+    ),
+    sig AS (
+        SELECT
+            COALESCE(SUM(ss.head_strikes_landed), 0) AS head_strikes_landed,
+            COALESCE(SUM(ss.head_strikes_attempts), 0) AS head_strikes_attempts,
+            COALESCE(SUM(ss.body_strikes_landed), 0) AS body_strikes_landed,
+            COALESCE(SUM(ss.body_strikes_attempts), 0) AS body_strikes_attempts,
+            COALESCE(SUM(ss.leg_strikes_landed), 0) AS leg_strikes_landed,
+            COALESCE(SUM(ss.leg_strikes_attempts), 0) AS leg_strikes_attempts,
+            COALESCE(SUM(ss.takedowns_landed), 0) AS takedowns_landed,
+            COALESCE(SUM(ss.takedowns_attempts), 0) AS takedowns_attempts,
+            COALESCE(SUM(ss.clinch_strikes_landed), 0) AS clinch_strikes_landed,
+            COALESCE(SUM(ss.clinch_strikes_attempts), 0) AS clinch_strikes_attempts,
+            COALESCE(SUM(ss.ground_strikes_landed), 0) AS ground_strikes_landed,
+            COALESCE(SUM(ss.ground_strikes_attempts), 0) AS ground_strikes_attempts,
+            COUNT(*) AS match_count
+        FROM strike_detail ss
+        JOIN fm ON fm.id = ss.fighter_match_id
+    ),
+    finish AS (
         SELECT
             COUNT(*) FILTER (WHERE m.method ILIKE '%%ko%%' OR m.method ILIKE '%%tko%%') AS ko_tko,
             COUNT(*) FILTER (WHERE m.method ILIKE '%%sub%%') AS submission,
             COUNT(*) FILTER (WHERE m.method ILIKE '%%dec%%') AS decision
-        FROM fighter_match fm
+        FROM fm
         JOIN "match" m ON m.id = fm.match_id
-        WHERE fm.fighter_id = :fighter_id AND LOWER(fm.result) = 'win'
-    """)
-    result = await session.execute(stmt, {"fighter_id": fighter_id})
-    row = result.mappings().one()
-    return {
-        "ko_tko": row["ko_tko"] or 0,
-        "submission": row["submission"] or 0,
-        "decision": row["decision"] or 0,
-    }
+        WHERE LOWER(fm.result) = 'win'
+    )
+    SELECT
+        row_to_json(f) AS fighter,
+        (
+            SELECT COALESCE(json_agg(row_to_json(r)), '[]'::json)
+            FROM ranking r WHERE r.fighter_id = f.id
+        ) AS rankings,
+        (
+            SELECT COALESCE(json_agg(row_to_json(pr) ORDER BY pr.promotion_name), '[]'::json)
+            FROM fighter_promotion_record pr WHERE pr.fighter_id = f.id
+        ) AS promotion_records,
+        (
+            SELECT COALESCE(
+                json_agg(row_to_json(mr) ORDER BY mr.scope, mr.result, mr.method_category),
+                '[]'::json
+            )
+            FROM fighter_method_record mr WHERE mr.fighter_id = f.id
+        ) AS method_records,
+        (
+            SELECT REPLACE(m.method, 'SUB-', '')
+            FROM fm
+            JOIN "match" m ON m.id = fm.match_id
+            WHERE LOWER(fm.result) = 'win' AND m.method LIKE 'SUB-%%'
+            GROUP BY m.method
+            ORDER BY COUNT(*) DESC
+            LIMIT 1
+        ) AS top_submission,
+        row_to_json(basic) AS basic,
+        row_to_json(opp) AS opp,
+        row_to_json(sig) AS sig_str,
+        row_to_json(finish) AS finish
+    FROM fighter f
+    CROSS JOIN basic
+    CROSS JOIN opp
+    CROSS JOIN sig
+    CROSS JOIN finish
+    WHERE f.id = :fighter_id
+""").columns(
+    fighter=JSON,
+    rankings=JSON,
+    promotion_records=JSON,
+    method_records=JSON,
+    top_submission=String,
+    basic=JSON,
+    opp=JSON,
+    sig_str=JSON,
+    finish=JSON,
+)
 
 
-async def get_top_submission_technique(session: AsyncSession, fighter_id: int) -> Optional[str]:
+async def get_fighter_detail_summary(session: AsyncSession, fighter_id: int) -> Optional[dict]:
     """
-    파이터의 가장 많이 성공한 서브미션 기술을 반환합니다.
+    파이터 상세 페이지에 필요한 경기 이력 외 데이터를 단일 쿼리로 조회합니다.
+    fighter, rankings, non-UFC 기록, finish breakdown, top submission,
+    커리어 집계(basic/상대 TD/sig_str)를 한 번의 round trip으로 가져옵니다.
+    파이터가 없으면 None을 반환합니다.
     """
-    stmt = text("""
-        SELECT
-            REPLACE(m.method, 'SUB-', '') AS technique,
-            COUNT(*) AS cnt
-        FROM fighter_match fm
-        JOIN "match" m ON m.id = fm.match_id
-        WHERE fm.fighter_id = :fighter_id
-          AND LOWER(fm.result) = 'win'
-          AND m.method LIKE 'SUB-%%'
-        GROUP BY m.method
-        ORDER BY cnt DESC
-        LIMIT 1
-    """)
-    result = await session.execute(stmt, {"fighter_id": fighter_id})
+    result = await session.execute(FIGHTER_DETAIL_SUMMARY_SQL, {"fighter_id": fighter_id})
     row = result.mappings().one_or_none()
-    return row["technique"] if row else None
+    if row is None:
+        return None
+
+    return {
+        "fighter": FighterSchema.model_validate(row["fighter"]),
+        "rankings": [RankingSchema.model_validate(r) for r in row["rankings"]],
+        "promotion_records": [FighterPromotionRecordSchema.model_validate(r) for r in row["promotion_records"]],
+        "method_records": [FighterMethodRecordSchema.model_validate(r) for r in row["method_records"]],
+        "finish_breakdown": row["finish"],
+        "top_submission": row["top_submission"],
+        "basic_agg": FighterBasicStatsAggregateDTO(**row["basic"], **row["opp"]),
+        "sig_str_agg": FighterSigStrStatsAggregateDTO(**row["sig_str"]),
+    }
@@ -12,18 +12,15 @@ from fighter.dto import (
     OpponentDTO, PerMatchBasicStatsDTO, PerMatchSigStrDTO, PerMatchStatsDTO,
     FightHistoryItemDTO, FighterDetailResponseDTO,
 )
-from fighter.models import FighterSchema
+from fighter.models import FighterSchema, RankingSchema
 from fighter import repositories as fighter_repo
 from common.utils import _calculate_percentage
-from match import repositories as match_repo
 from fighter.exceptions import (
     FighterNotFoundError, FighterValidationError, FighterQueryError,
     FighterWeightClassError, FighterSearchError
 )
 
-async def _build_fighter_with_rankings(session: AsyncSession, fighter: FighterSchema) -> Optional[FighterWithRankingsDTO]:
-    rankings = await fighter_repo.get_ranking_by_fighter_id(session, fighter.id)
-    
+def _to_fighter_with_rankings(fighter: FighterSchema, rankings: List[RankingSchema]) -> FighterWithRankingsDTO:
     ranking_result = {}
     for ranking_obj in rankings:
         weight_class_name = WeightClassSchema.get_name_by_id(ranking_obj.weight_class_id)
@@ -35,6 +32,20 @@ async def _build_fighter_with_rankings(session: AsyncSession, fighter: FighterSc
         rankings=ranking_result
     )
 
+async def _build_fighter_with_rankings(session: AsyncSession, fighter: FighterSchema) -> Optional[FighterWithRankingsDTO]:
+    rankings = await fighter_repo.get_ranking_by_fighter_id(session, fighter.id)
+    return _to_fighter_with_rankings(fighter, rankings)
+
+async def _build_fighters_with_rankings(session: AsyncSession, fighters: List[FighterSchema]) -> List[FighterWithRankingsDTO]:
+    """여러 파이터의 랭킹을 한 번에 조회하여 결합 (결과 수와 무관하게 쿼리 1회)"""
+    rankings_by_fighter = await fighter_repo.get_rankings_by_fighter_ids(
+        session, [fighter.id for fighter in fighters]
+    )
+    return [
+        _to_fighter_with_rankings(fighter, rankings_by_fighter.get(fighter.id, []))
+        for fighter in fighters
+    ]
+
 async def get_fighter_by_id(session: AsyncSession, fighter_id: int) -> FighterWithRankingsDTO:
     """
     fighter_id로 fighter 조회.
@@ -148,14 +159,7 @@ async def search_fighters(session: AsyncSession, search_term: str, limit: int =
     
     try:
         fighters = await fighter_repo.search_fighters_by_name(session, search_term, limit)
-        
-        results = []
-        for fighter in fighters:
-            fighter_with_rankings = await _build_fighter_with_rankings(session, fighter)
-            if fighter_with_rankings:
-                results.append(fighter_with_rankings)
-        
-        return results
+        return await _build_fighters_with_rankings(session, fighters)
     
     except FighterValidationError:
         raise
@@ -168,14 +172,7 @@ async def get_all_champions(session: AsyncSession) -> List[FighterWithRankingsDT
     """
     try:
         champions = await fighter_repo.get_champions(session)
-        
-        results = []
-        for champion in champions:
-            champion_with_rankings = await _build_fighter_with_rankings(session, champion)
-            if champion_with_rankings:
-                results.append(champion_with_rankings)
-        
-        return results
+        return await _build_fighters_with_rankings(session, champions)
     
     except Exception as e:
         raise FighterQueryError("get_all_champions", {}, str(e)) from e
@@ -220,37 +217,27 @@ async def get_fighter_detail(session: AsyncSession, fighter_id: int) -> FighterD
         raise FighterValidationError("fighter_id", fighter_id, "fighter_id must be a positive integer")
 
     try:
-        # 1. fighter 기본 정보
-        fighter = await fighter_repo.get_fighter_by_id(session, fighter_id)
-        if not fighter:
+        # 1. fighter + rankings + non-UFC 기록 + finish breakdown + 커리어 집계 (1 round trip)
+        summary = await fighter_repo.get_fighter_detail_summary(session, fighter_id)
+        if not summary:
             raise FighterNotFoundError(fighter_id, "id")
 
-        # 2. rankings
-        rankings_list = await fighter_repo.get_ranking_by_fighter_id(session, fighter_id)
+        fighter = summary["fighter"]
+        promotion_record_rows = summary["promotion_records"]
+        method_record_rows = summary["method_records"]
+        finish_data = summary["finish_breakdown"]
+        basic_agg = summary["basic_agg"]
+        sig_str_agg = summary["sig_str_agg"]
+        top_sub = summary["top_submission"]
+
         rankings_dict: dict[str, int] = {}
-        for r in rankings_list:
+        for r in summary["rankings"]:
             wc_name = WeightClassSchema.get_name_by_id(r.weight_class_id)
             if wc_name:
                 rankings_dict[wc_name] = r.ranking
 
-        # 3. fight history
-        fight_history_rows = await fighter_repo.get_fight_history(session, fighter_id)
-
-        # 4. non-UFC career records
-        promotion_record_rows = await fighter_repo.get_fighter_promotion_records(session, fighter_id)
-        method_record_rows = await fighter_repo.get_fighter_method_records(session, fighter_id)
-
-        # 5. finish breakdown
-        finish_data = await fighter_repo.get_finish_breakdown(session, fighter_id)
-
-        # 6. career aggregate stats (기존 함수 재사용)
-        basic_agg = await match_repo.get_fighter_basic_stats_aggregate(session, fighter_id)
-        sig_str_agg = await match_repo.get_fighter_sig_str_stats_aggregate(session, fighter_id)
-        top_sub = await fighter_repo.get_top_submission_technique(session, fighter_id)
-
-        # 7. per-match stats 배치 조회
-        fm_ids = [row["fighter_match_id"] for row in fight_history_rows]
-        per_match_map = await fighter_repo.get_per_match_stats(session, fm_ids) if fm_ids else {}
+        # 2. fight history + per-match stats (1 round trip)
+        fight_history_rows, per_match_map = await fighter_repo.get_fight_history_with_stats(session, fighter_id)
 
         # === Profile ===
         birthdate_str = str(fighter.birthdate) if fighter.birthdate else None
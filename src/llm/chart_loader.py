@@ -1,17 +1,34 @@
 """
 Supported Charts 동적 로딩 유틸리티
 
-JSON 파일에서 지원되는 차트 정보를 실시간으로 로드하여
-런타임 중 변경사항을 반영할 수 있도록 합니다.
+JSON 파일에서 지원되는 차트 정보를 프로세스당 한 번 로드하여 캐시합니다.
+런타임 중 변경사항은 reload_charts()로 반영합니다.
 """
 
 import json
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from pathlib import Path
 
+_charts_cache: Optional[Dict[str, Any]] = None
+_charts_prompt_cache: Optional[str] = None
+
+
 def get_supported_charts() -> Dict[str, Any]:
     """
-    지원되는 차트 정보를 JSON 파일에서 동적으로 로드
+    지원되는 차트 정보 반환 (최초 호출 시 JSON 파일에서 로드 후 캐시)
+    
+    Returns:
+        Dict[str, Any]: 차트 ID를 키로 하는 차트 정보 딕셔너리
+    """
+    global _charts_cache
+    if _charts_cache is None:
+        _charts_cache = _load_supported_charts()
+    return _charts_cache
+
+
+def _load_supported_charts() -> Dict[str, Any]:
+    """
+    지원되는 차트 정보를 JSON 파일에서 로드
     
     Returns:
         Dict[str, Any]: 차트 ID를 키로 하는 차트 정보 딕셔너리
@@ -88,6 +105,10 @@ def get_charts_for_prompt() -> str:
     Returns:
         str: 프롬프트용 차트 설명 문자열
     """
+    global _charts_prompt_cache
+    if _charts_prompt_cache is not None:
+        return _charts_prompt_cache
+
     charts = get_supported_charts()
     
     chart_descriptions = []
@@ -98,7 +119,8 @@ def get_charts_for_prompt() -> str:
         
         chart_descriptions.append(f"{description}\n{best_for}\n{data_req}")
     
-    return "\n\n".join(chart_descriptions)
+    _charts_prompt_cache = "\n\n".join(chart_descriptions)
+    return _charts_prompt_cache
 
 def reload_charts() -> Dict[str, Any]:
     """
@@ -107,4 +129,7 @@ def reload_charts() -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: 새로 로드된 차트 정보
     """
+    global _charts_cache, _charts_prompt_cache
+    _charts_cache = None
+    _charts_prompt_cache = None
     return get_supported_charts()
\ No newline at end of file
@@ -27,6 +27,8 @@ from llm.graph.nodes import (
     direct_response_node,
     mma_analysis_node,
     fighter_comparison_node,
+    build_mma_analysis_agent,
+    build_fighter_comparison_agent,
     critic_node,
     text_response_node,
     visualize_node,
@@ -87,8 +89,12 @@ def build_analysis_subgraph(main_llm, sub_llm):
     graph = StateGraph(AnalysisState)
 
     # 노드 등록
-    graph.add_node("mma_analysis", partial(mma_analysis_node, llm=main_llm))
-    graph.add_node("fighter_comparison", partial(fighter_comparison_node, llm=main_llm))
+    # ReAct 서브 에이전트는 그래프 빌드 시 한 번만 컴파일하여 요청/재시도 간 재사용
+    graph.add_node("mma_analysis", partial(mma_analysis_node, llm=main_llm, agent=build_mma_analysis_agent(main_llm)))
+    graph.add_node(
+        "fighter_comparison",
+        partial(fighter_comparison_node, llm=main_llm, agent=build_fighter_comparison_agent(main_llm)),
+    )
     graph.add_node("critic", partial(critic_node, llm=sub_llm))
 
     # fan-in: 분석 → critic
@@ -1,8 +1,8 @@
 """StateGraph 노드 모듈"""
 from .conversation_manager import conversation_manager_node
 from .supervisor import supervisor_node
-from .mma_analysis import mma_analysis_node
-from .fighter_comparison import fighter_comparison_node
+from .mma_analysis import mma_analysis_node, build_mma_analysis_agent
+from .fighter_comparison import fighter_comparison_node, build_fighter_comparison_agent
 from .critic import critic_node
 from .direct_response import direct_response_node
 from .text_response import text_response_node
@@ -13,6 +13,8 @@ __all__ = [
     'supervisor_node',
     'mma_analysis_node',
     'fighter_comparison_node',
+    'build_mma_analysis_agent',
+    'build_fighter_comparison_agent',
     'critic_node',
     'direct_response_node',
     'text_response_node',
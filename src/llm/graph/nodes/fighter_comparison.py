@@ -22,19 +22,22 @@ FC_AGENT_TIMEOUT_SECONDS = 30
 FC_AGENT_RECURSION_LIMIT = 10
 
 
-def _build_comparison_agent(llm):
-    """Fighter 비교 SQL 에이전트 생성"""
+def build_fighter_comparison_agent(llm):
+    """
+    Fighter 비교 SQL 에이전트 생성 (그래프 빌드 시 한 번 컴파일하여 재사용)
+    시스템 프롬프트는 LLM 호출마다 get_fighter_comparison_prompt()로 평가 (날짜별 캐시)
+    """
     tools = [execute_raw_sql_query]
-    system_prompt = get_fighter_comparison_prompt()
-    return build_react_agent(model=llm, tools=tools, prompt=system_prompt)
+    return build_react_agent(model=llm, tools=tools, prompt=get_fighter_comparison_prompt)
 
 
-async def fighter_comparison_node(state: MainState, llm) -> dict:
+async def fighter_comparison_node(state: MainState, llm, agent=None) -> dict:
     """
     Fighter 비교 에이전트 노드
 
     MMA 분석과 동일한 구조로 build_react_agent를 사용하되,
     비교 전용 프롬프트로 다중 선수 비교에 특화.
+    agent가 주어지면 (그래프 빌드 시 컴파일된 에이전트) 재사용하고, 없으면 새로 생성.
     """
     messages = state.get("compressed_messages") or state.get("messages", [])
     critic_feedback = state.get("critic_feedback")
@@ -47,7 +50,8 @@ async def fighter_comparison_node(state: MainState, llm) -> dict:
         messages = list(messages) + [feedback_msg]
 
     try:
-        agent = _build_comparison_agent(llm)
+        if agent is None:
+            agent = build_fighter_comparison_agent(llm)
 
         result = await asyncio.wait_for(
             agent.ainvoke(
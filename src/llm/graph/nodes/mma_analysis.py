@@ -60,11 +60,13 @@ def _extract_reasoning(messages) -> str:
     return ""
 
 
-def _build_agent(llm):
-    """MMA 분석 SQL 에이전트 생성"""
+def build_mma_analysis_agent(llm):
+    """
+    MMA 분석 SQL 에이전트 생성 (그래프 빌드 시 한 번 컴파일하여 재사용)
+    시스템 프롬프트는 LLM 호출마다 get_phase1_prompt()로 평가 (날짜별 캐시)
+    """
     tools = [execute_raw_sql_query]
-    system_prompt = get_phase1_prompt()
-    return build_react_agent(model=llm, tools=tools, prompt=system_prompt)
+    return build_react_agent(model=llm, tools=tools, prompt=get_phase1_prompt)
 
 
 def _build_agent_results(agent_name: str, sql_results: list[dict], reasoning: str) -> list[dict]:
@@ -88,12 +90,13 @@ def _build_agent_results(agent_name: str, sql_results: list[dict], reasoning: st
     return agent_results
 
 
-async def mma_analysis_node(state: MainState, llm) -> dict:
+async def mma_analysis_node(state: MainState, llm, agent=None) -> dict:
     """
     MMA 분석 에이전트 노드
 
     build_react_agent로 SQL 쿼리를 실행하고 결과를 AgentResult로 반환.
     Critic 피드백이 있으면 메시지에 포함하여 재실행.
+    agent가 주어지면 (그래프 빌드 시 컴파일된 에이전트) 재사용하고, 없으면 새로 생성.
     """
     messages = state.get("compressed_messages") or state.get("messages", [])
     critic_feedback = state.get("critic_feedback")
@@ -106,7 +109,8 @@ async def mma_analysis_node(state: MainState, llm) -> dict:
         messages = list(messages) + [feedback_msg]
 
     try:
-        agent = _build_agent(llm)
+        if agent is None:
+            agent = build_mma_analysis_agent(llm)
 
         result = await asyncio.wait_for(
             agent.ainvoke(
@@ -1,47 +1,66 @@
+import asyncio
+from typing import Callable
+
 from langgraph.graph import StateGraph, MessagesState, START, END
 from langchain_core.messages import SystemMessage, ToolMessage
 
+from config import Config
+
 
-def build_react_agent(model, tools: list, prompt: str | None = None):
+def build_react_agent(
+    model,
+    tools: list,
+    prompt: str | Callable[[], str] | None = None,
+    max_concurrency: int | None = None,
+):
     """
     StateGraph 기반 ReAct 에이전트를 컴파일하여 반환.
 
     Args:
         model: LangChain ChatModel (tool calling 지원)
         tools: 바인딩할 도구 리스트
-        prompt: 시스템 프롬프트 (선택)
+        prompt: 시스템 프롬프트 (선택). callable이면 LLM 호출마다 평가 —
+                한 번 컴파일한 에이전트를 재사용하면서 날짜 등 동적 값을 반영할 때 사용
+        max_concurrency: 한 턴에서 동시에 실행할 tool call 수 (기본값: Config.AGENT_TOOL_CONCURRENCY)
 
     Returns:
         CompiledGraph — .ainvoke({"messages": [...]}, config={...}) 로 호출
     """
+    max_concurrency = max(1, max_concurrency or Config.AGENT_TOOL_CONCURRENCY)
     model_with_tools = model.bind_tools(tools)
     tools_by_name = {tool.name: tool for tool in tools}
 
     async def llm_call(state: MessagesState):
         messages = state["messages"]
-        if prompt:
-            messages = [SystemMessage(content=prompt)] + list(messages)
+        system_prompt = prompt() if callable(prompt) else prompt
+        if system_prompt:
+            messages = [SystemMessage(content=system_prompt)] + list(messages)
         return {"messages": [await model_with_tools.ainvoke(messages)]}
 
-    async def tool_node(state: MessagesState):
-        results = []
-        for tc in state["messages"][-1].tool_calls:
-            tool = tools_by_name.get(tc["name"])
-            if tool is None:
-                results.append(ToolMessage(
-                    content=f"Error: tool '{tc['name']}' not found",
-                    tool_call_id=tc["id"],
-                ))
-                continue
+    async def run_tool_call(tc, semaphore: asyncio.Semaphore) -> ToolMessage:
+        tool = tools_by_name.get(tc["name"])
+        if tool is None:
+            return ToolMessage(
+                content=f"Error: tool '{tc['name']}' not found",
+                tool_call_id=tc["id"],
+            )
+        async with semaphore:
             try:
                 observation = await tool.ainvoke(tc["args"])
             except Exception as e:
                 observation = f"Error executing tool: {e}"
-            results.append(ToolMessage(
-                content=str(observation),
-                tool_call_id=tc["id"],
-            ))
-        return {"messages": results}
+        return ToolMessage(
+            content=str(observation),
+            tool_call_id=tc["id"],
+        )
+
+    async def tool_node(state: MessagesState):
+        # 한 턴의 tool call들을 동시에 실행 (턴당 동시 실행 수 제한), 결과는 tool call 순서 유지
+        semaphore = asyncio.Semaphore(max_concurrency)
+        results = await asyncio.gather(
+            *(run_tool_call(tc, semaphore) for tc in state["messages"][-1].tool_calls)
+        )
+        return {"messages": list(results)}
 
     def should_continue(state: MessagesState):
         if state["messages"][-1].tool_calls:
@@ -10,6 +10,7 @@ from common.logging_config import get_logger
 from common.enums import LLMProvider
 from llm.providers import get_anthropic_llm, get_huggingface_llm, get_chat_model_llm
 from llm.providers.openrouter_provider import get_openrouter_llm
+from llm.providers.fake_provider import get_fake_llm
 from llm.callbacks import get_anthropic_callback_handler, get_huggingface_callback_handler
 from llm.callbacks.openrouter_callback import get_openrouter_callback_handler
 
@@ -58,6 +59,10 @@ def create_llm_with_callbacks(
             
         elif selected_provider == LLMProvider.OPENAI.value:
             return get_openai_model_and_callback(message_id, conversation_id, **model_kwargs)
+
+        elif selected_provider == LLMProvider.FAKE.value:
+            # 오프라인 scripted 모델 - 과금/토큰 추적 대상이 아니므로 콜백 없음
+            return get_fake_llm(), None
             
         else:
             available = [p.value for p in LLMProvider]
@@ -315,6 +320,8 @@ def _create_model_from_spec(provider: str, model_name: str):
             max_tokens=Config.DEFAULT_MAX_TOKENS,
             streaming=True,
         )
+    elif provider == LLMProvider.FAKE.value:
+        return get_fake_llm()
     else:
         available = [p.value for p in LLMProvider]
         raise ValueError(f"Unsupported provider: {provider}. Available: {available}")
@@ -365,6 +372,10 @@ def get_available_providers() -> List[str]:
                 elif provider == LLMProvider.OPENAI:
                     # TODO: OpenAI import 테스트
                     pass
+
+                elif provider == LLMProvider.FAKE:
+                    # 벤치마크/테스트 전용 - 사용 가능 목록에는 노출하지 않음
+                    pass
                     
         except ImportError:
             LOGGER.debug(f"Provider {provider.value} not available due to missing dependencies")
@@ -411,6 +422,9 @@ def validate_provider_config(provider: str) -> bool:
         if not valid:
             LOGGER.warning("⚠️ OpenAI API key not configured")
         return valid
+
+    elif provider == LLMProvider.FAKE.value:
+        return True
         
     else:
         LOGGER.warning(f"⚠️ Unknown provider: {provider}")
@@ -1,6 +1,12 @@
 """
 SQL Agent system prompts — MMA 분석 및 비교 에이전트용
 """
+from datetime import date
+from functools import lru_cache
+from typing import Optional
+
+from common.utils import load_schema_prompt, reload_schema_prompt
+from llm.chart_loader import reload_charts
 
 CANONICAL_VIEW_USAGE = """## Canonical View Usage
 - Prefer canonical views from the schema prompt for supported query families.
@@ -204,28 +210,38 @@ Begin execution now. First action: Identify the fighters to compare.
 # Prompt Generation
 # =============================================================================
 
-def get_phase1_prompt() -> str:
+def get_phase1_prompt(current_date: Optional[str] = None) -> str:
     """
     Return SQL agent prompt with dynamic schema and current date.
 
+    Args:
+        current_date: ISO date to inject (default: today)
+
     Returns:
         str: SQL agent prompt with database schema and today's date injected
     """
-    from datetime import date
-    from common.utils import load_schema_prompt
+    return _render_phase1_prompt(current_date or date.today().isoformat())
+
 
-    schema_text = load_schema_prompt()
-    today = date.today().isoformat()
+def get_fighter_comparison_prompt(current_date: Optional[str] = None) -> str:
+    """Return Fighter Comparison agent prompt with dynamic schema and current date."""
+    return _render_fighter_comparison_prompt(current_date or date.today().isoformat())
 
-    return SQL_AGENT_PROMPT.format(schema_info=schema_text, current_date=today)
 
+# 날짜별로 한 번만 렌더링 (스키마는 load_schema_prompt에서 프로세스당 한 번 로드)
+@lru_cache(maxsize=2)
+def _render_phase1_prompt(current_date: str) -> str:
+    return SQL_AGENT_PROMPT.format(schema_info=load_schema_prompt(), current_date=current_date)
 
-def get_fighter_comparison_prompt() -> str:
-    """Return Fighter Comparison agent prompt with dynamic schema and current date."""
-    from datetime import date
-    from common.utils import load_schema_prompt
 
-    schema_text = load_schema_prompt()
-    today = date.today().isoformat()
+@lru_cache(maxsize=2)
+def _render_fighter_comparison_prompt(current_date: str) -> str:
+    return FIGHTER_COMPARISON_PROMPT.format(schema_info=load_schema_prompt(), current_date=current_date)
+
 
-    return FIGHTER_COMPARISON_PROMPT.format(schema_info=schema_text, current_date=today)
+def reload_prompt_artifacts() -> None:
+    """schema.json / supported_charts.json 변경을 반영하도록 캐시 초기화 (개발용)"""
+    reload_schema_prompt()
+    reload_charts()
+    _render_phase1_prompt.cache_clear()
+    _render_fighter_comparison_prompt.cache_clear()
@@ -0,0 +1,221 @@
+"""
+Scripted fake chat model provider
+네트워크 없이 그래프 전체(supervisor → agent → critic → text/visualization)를
+실행/벤치마크하기 위한 결정적 LLM 대체 구현 (LLM_PROVIDER=fake 또는 MAIN_MODEL=fake/<name>)
+
+스크립트 형식 (FAKE_LLM_SCRIPT_PATH JSON, 생략 시 DEFAULT_FAKE_SCRIPT):
+- structured: {스키마 클래스명: 필드 dict} — with_structured_output() 응답
+- tool_calls: [{"name": ..., "args": {...}}] — bind_tools() 후 첫 호출에서 요청할 tool call
+- tool_answer: tool 결과를 받은 뒤의 최종 답변
+- text: 일반 호출 응답 (스트리밍 시 토큰 단위로 분할)
+"""
+import asyncio
+import copy
+import json
+import re
+import time
+import types
+import typing
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.runnables import RunnableLambda
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from pydantic import BaseModel, Field
+
+from config import Config
+from common.logging_config import get_logger
+
+LOGGER = get_logger(__name__)
+
+DEFAULT_FAKE_SCRIPT: Dict[str, Any] = {
+    "structured": {
+        "SupervisorRouting": {"route": "mma_analysis", "agents": ["mma_analysis"]},
+        "CriticLLMOutput": {"passed": True, "feedback": ""},
+        "VisualizationDecision": {
+            "selected_visualization": "bar_chart",
+            "title": "KO 승리 순위",
+            "x_axis": "name",
+            "y_axis": "ko_wins",
+            "insights": ["상위 파이터 간 KO 승수 차이가 크지 않습니다."],
+        },
+    },
+    "tool_calls": [
+        {
+            "name": "execute_raw_sql_query",
+            "args": {
+                "query": (
+                    "SELECT f.name, COUNT(*) AS ko_wins FROM fighter f "
+                    "JOIN fighter_match fm ON f.id = fm.fighter_id "
+                    "JOIN match m ON fm.match_id = m.id "
+                    "WHERE fm.result = 'win' AND m.method LIKE 'KO/TKO%' "
+                    "GROUP BY f.name ORDER BY ko_wins DESC LIMIT 5"
+                )
+            },
+        }
+    ],
+    "tool_answer": "KO 승리 상위 5명을 조회했습니다.",
+    "text": "KO 승리 상위 파이터들은 꾸준한 타격 압박으로 경기를 끝냈습니다. 1위와 2위의 차이는 한 경기입니다.",
+}
+
+_TOKEN_PATTERN = re.compile(r"\S+\s*")
+
+
+def _default_value(annotation: Any) -> Any:
+    """스크립트에 없는 스키마 필드의 기본값 (Literal은 첫 번째 값)"""
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is typing.Literal:
+        return args[0]
+    if origin in (typing.Union, types.UnionType):
+        return None if type(None) in args else _default_value(args[0])
+    if origin in (list, List):
+        return []
+    if origin in (dict, Dict):
+        return {}
+    return {str: "", bool: True, int: 0, float: 0.0}.get(annotation)
+
+
+def _build_structured(schema: type[BaseModel], values: Dict[str, Any]) -> BaseModel:
+    data = {
+        name: _default_value(field.annotation)
+        for name, field in schema.model_fields.items()
+        if field.is_required()
+    }
+    data.update(values)
+    return schema(**data)
+
+
+class ScriptedChatModel(BaseChatModel):
+    """스크립트대로 응답하는 결정적 채팅 모델 (structured output / tool call / 토큰 스트리밍 지원)"""
+
+    script: Dict[str, Any] = Field(default_factory=lambda: copy.deepcopy(DEFAULT_FAKE_SCRIPT))
+    latency_seconds: float = 0.0
+    token_latency_seconds: float = 0.0
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted-fake"
+
+    def _next_message(self, messages: List[BaseMessage], tools: Optional[List[str]] = None) -> AIMessage:
+        # tool 바인딩 상태에서 아직 tool 결과가 없으면 tool call, 있으면 최종 답변
+        if tools and not (messages and isinstance(messages[-1], ToolMessage)):
+            tool_calls = [
+                {"name": call["name"], "args": call.get("args", {}), "id": f"fake_call_{idx}"}
+                for idx, call in enumerate(self.script.get("tool_calls", []))
+                if call["name"] in tools
+            ]
+            if tool_calls:
+                return AIMessage(content="", tool_calls=tool_calls)
+        if tools:
+            return AIMessage(content=self.script.get("tool_answer", ""))
+        return AIMessage(content=self.script.get("text", ""))
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        time.sleep(self.latency_seconds)
+        message = self._next_message(messages, kwargs.get("tools"))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        await asyncio.sleep(self.latency_seconds)
+        message = self._next_message(messages, kwargs.get("tools"))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _stream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        time.sleep(self.latency_seconds)
+        for chunk in self._chunks(self._next_message(messages, kwargs.get("tools"))):
+            time.sleep(self.token_latency_seconds)
+            if run_manager and chunk.message.content:
+                run_manager.on_llm_new_token(chunk.message.content, chunk=chunk)
+            yield chunk
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        await asyncio.sleep(self.latency_seconds)
+        for chunk in self._chunks(self._next_message(messages, kwargs.get("tools"))):
+            await asyncio.sleep(self.token_latency_seconds)
+            if run_manager and chunk.message.content:
+                await run_manager.on_llm_new_token(chunk.message.content, chunk=chunk)
+            yield chunk
+
+    @staticmethod
+    def _chunks(message: AIMessage) -> List[ChatGenerationChunk]:
+        if message.tool_calls:
+            return [ChatGenerationChunk(message=AIMessageChunk(
+                content="",
+                tool_call_chunks=[
+                    {"name": call["name"], "args": json.dumps(call["args"]), "id": call["id"], "index": idx}
+                    for idx, call in enumerate(message.tool_calls)
+                ],
+            ))]
+        tokens = _TOKEN_PATTERN.findall(message.content) or [message.content]
+        return [ChatGenerationChunk(message=AIMessageChunk(content=token)) for token in tokens]
+
+    def bind_tools(self, tools: List[Any], **kwargs: Any):
+        tool_names = [convert_to_openai_tool(tool)["function"]["name"] for tool in tools]
+        return self.bind(tools=tool_names, **kwargs)
+
+    def with_structured_output(self, schema: type[BaseModel], **kwargs: Any):
+        values = self.script.get("structured", {}).get(schema.__name__, {})
+
+        def invoke(_input: Any) -> BaseModel:
+            time.sleep(self.latency_seconds)
+            return _build_structured(schema, values)
+
+        async def ainvoke(_input: Any) -> BaseModel:
+            await asyncio.sleep(self.latency_seconds)
+            return _build_structured(schema, values)
+
+        return RunnableLambda(invoke, afunc=ainvoke)
+
+
+def load_fake_script(path: Optional[str] = None) -> Dict[str, Any]:
+    """스크립트 JSON 로드 (키 단위로 DEFAULT_FAKE_SCRIPT를 덮어씀)"""
+    script = copy.deepcopy(DEFAULT_FAKE_SCRIPT)
+    path = path or Config.FAKE_LLM_SCRIPT_PATH
+    if path:
+        with open(path, "r", encoding="utf-8") as f:
+            script.update(json.load(f))
+    return script
+
+
+def get_fake_llm(
+    script: Optional[Dict[str, Any]] = None,
+    latency_ms: Optional[float] = None,
+    token_latency_ms: Optional[float] = None,
+) -> ScriptedChatModel:
+    """Config 기반 ScriptedChatModel 생성"""
+    latency_ms = Config.FAKE_LLM_LATENCY_MS if latency_ms is None else latency_ms
+    token_latency_ms = Config.FAKE_LLM_TOKEN_LATENCY_MS if token_latency_ms is None else token_latency_ms
+    LOGGER.info(f"🧪 Scripted fake LLM created (latency={latency_ms}ms, token_latency={token_latency_ms}ms)")
+    return ScriptedChatModel(
+        script=script if script is not None else load_fake_script(),
+        latency_seconds=latency_ms / 1000,
+        token_latency_seconds=token_latency_ms / 1000,
+    )
@@ -12,6 +12,8 @@ from config import Config
 from llm.model_factory import create_llm_with_callbacks, get_main_model, get_sub_model
 from llm.graph import build_mma_graph
 from llm.exceptions import LLMException
+from llm.tools.sql_tool import get_sql_cache_stats
+from database.connection.postgres_conn import get_read_routing_stats
 from common.logging_config import get_logger
 from common.utils import utc_now
 from common.ws_types import ErrorCode
@@ -355,6 +357,8 @@ class MMAGraphService:
             "status": "healthy",
             "provider": self.provider,
             "graph_compiled": self._compiled_graph is not None,
+            "sql_cache": get_sql_cache_stats(),
+            "db_read_routing": get_read_routing_stats(),
             "timestamp": utc_now().isoformat(),
         }
 
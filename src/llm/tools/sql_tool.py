@@ -1,8 +1,12 @@
 """SQL 실행 도구 모듈"""
+import hashlib
 import json
 import re
+from typing import Dict, Optional
 from langchain_core.tools import tool
+from config import Config
 from database.connection.postgres_conn import get_async_readonly_db_context
+from database.connection.redis_conn import async_redis_client
 from sqlalchemy import text
 from common.logging_config import get_logger
 
@@ -10,6 +14,57 @@ LOGGER = get_logger(__name__)
 
 MAX_RESULT_ROWS = 100
 
+# 정규화된 SQL(_clean_query 결과) → 성공 응답 JSON 캐시. 수집 flow 종료 시 무효화
+SQL_CACHE_PREFIX = "sql_tool:"
+_sql_cache_stats = {"hits": 0, "misses": 0}
+
+
+def _sql_cache_key(cleaned_query: str) -> str:
+    normalized = cleaned_query.strip().rstrip(";").strip()
+    return SQL_CACHE_PREFIX + hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+async def _get_cached_result(cleaned_query: str) -> Optional[str]:
+    if not Config.SQL_TOOL_CACHE_ENABLED:
+        return None
+    try:
+        cached = await async_redis_client.get(_sql_cache_key(cleaned_query))
+    except Exception as e:
+        LOGGER.warning(f"⚠️ [SQL Tool] Cache read failed: {e}")
+        cached = None
+
+    if cached:
+        _sql_cache_stats["hits"] += 1
+    else:
+        _sql_cache_stats["misses"] += 1
+    return cached
+
+
+async def _set_cached_result(cleaned_query: str, response_json: str) -> None:
+    if not Config.SQL_TOOL_CACHE_ENABLED:
+        return
+    try:
+        await async_redis_client.set(
+            _sql_cache_key(cleaned_query),
+            response_json,
+            ex=Config.SQL_TOOL_CACHE_TTL_SECONDS,
+        )
+    except Exception as e:
+        LOGGER.warning(f"⚠️ [SQL Tool] Cache write failed: {e}")
+
+
+async def invalidate_sql_cache() -> int:
+    """sql_tool:* 캐시를 모두 삭제. 삭제된 키 수 반환."""
+    keys = [key async for key in async_redis_client.scan_iter(match=f"{SQL_CACHE_PREFIX}*")]
+    if not keys:
+        return 0
+    return await async_redis_client.delete(*keys)
+
+
+def get_sql_cache_stats() -> Dict[str, int]:
+    """현재 프로세스의 SQL 결과 캐시 hit/miss 카운터"""
+    return dict(_sql_cache_stats)
+
 
 @tool
 async def execute_raw_sql_query(query: str) -> str:
@@ -37,27 +92,44 @@ async def execute_raw_sql_query(query: str) -> str:
         cleaned_query = _clean_query(query)
         _validate_query(cleaned_query)
 
+        cached = await _get_cached_result(cleaned_query)
+        if cached:
+            LOGGER.info("✅ [SQL Tool] Cache hit")
+            return cached
+
         async with get_async_readonly_db_context() as session:
-            result = await session.execute(text(cleaned_query))
+            # 트랜잭션 범위에서만 적용되는 statement timeout
+            await session.execute(
+                text(f"SET LOCAL statement_timeout = {int(Config.SQL_TOOL_STATEMENT_TIMEOUT_MS)}")
+            )
+            result = await session.execute(
+                text(_limit_query(cleaned_query)),
+                {"_row_limit": MAX_RESULT_ROWS + 1},
+            )
             rows = result.fetchall()
             columns = result.keys()
 
-            data = [dict(zip(columns, row)) for row in rows]
+            # LIMIT MAX_RESULT_ROWS + 1 로 가져와 초과 여부만 판단
+            truncated = len(rows) > MAX_RESULT_ROWS
+            if truncated:
+                LOGGER.warning(f"⚠️ [SQL Tool] Result truncated to {MAX_RESULT_ROWS} rows")
+                rows = rows[:MAX_RESULT_ROWS]
 
-            if len(data) > MAX_RESULT_ROWS:
-                LOGGER.warning(f"⚠️ [SQL Tool] Result truncated: {len(data)} → {MAX_RESULT_ROWS} rows")
-                data = data[:MAX_RESULT_ROWS]
+            data = [dict(zip(columns, row)) for row in rows]
 
             response = {
                 "query": cleaned_query,
                 "success": True,
                 "data": data,
                 "columns": list(columns),
-                "row_count": len(data)
+                "row_count": len(data),
+                "truncated": truncated,
             }
 
-            LOGGER.info(f"✅ [SQL Tool] Query executed successfully: {len(data)} rows")
-            return json.dumps(response, ensure_ascii=False, default=str)
+        LOGGER.info(f"✅ [SQL Tool] Query executed successfully: {len(data)} rows")
+        response_json = json.dumps(response, ensure_ascii=False, default=str)
+        await _set_cached_result(cleaned_query, response_json)
+        return response_json
 
     except Exception as e:
         error_response = {
@@ -85,6 +157,15 @@ DANGEROUS_PATTERNS = re.compile(
 )
 
 
+def _limit_query(query: str) -> str:
+    """
+    DB에서 행 수를 제한하도록 쿼리를 서브쿼리로 감싼다.
+    원본 쿼리가 주석으로 끝나도 닫는 괄호가 주석에 포함되지 않도록 줄바꿈 후 닫는다.
+    """
+    inner = query.strip().rstrip(';').strip()
+    return f"SELECT * FROM (\n{inner}\n) AS _llm_query LIMIT :_row_limit"
+
+
 def _validate_query(query: str) -> None:
     """
     SQL 쿼리 안전성 검증
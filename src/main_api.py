@@ -22,11 +22,24 @@ async def lifespan(app: FastAPI):
     from user.services import create_admin_user_if_needed
     await create_admin_user_if_needed(Config.ADMIN_USERNAME, Config.ADMIN_PW)
 
+    # 워커 간 WebSocket 이벤트 구독 시작
+    from api.websocket.manager import connection_manager
+    await connection_manager.start_broker()
+
     yield
 
     # 종료시 실행
     print("🛑 MMA Savant API shutting down...")
 
+    await connection_manager.stop_broker()
+    await connection_manager.compression_worker.stop()
+
+    from database.connection.redis_conn import close_async_redis
+    await close_async_redis()
+
+    from database.connection.postgres_conn import dispose_read_replicas
+    await dispose_read_replicas()
+
 
 # FastAPI 애플리케이션 생성
 app = FastAPI(
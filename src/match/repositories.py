@@ -1,6 +1,6 @@
 from typing import List, Optional, Dict
 
-from sqlalchemy import select, func, text
+from sqlalchemy import select, func
 from sqlalchemy.orm import aliased
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -21,8 +21,6 @@ from match.dto import (
     FighterMatchStatDTO,
     CombinedMatchStatsDTO,
     MatchStatisticsDTO,
-    FighterBasicStatsAggregateDTO,
-    FighterSigStrStatsAggregateDTO
 )
 from fighter.repositories import get_fighter_by_id
 
@@ -110,109 +108,6 @@ async def get_sig_str_match_stats(
     sig_str_match_stat = result.scalar_one_or_none()
     return sig_str_match_stat.to_schema() if sig_str_match_stat else None
 
-async def get_fighter_basic_stats_aggregate(session: AsyncSession, fighter_id: int) -> FighterBasicStatsAggregateDTO:
-    """
-    특정 선수의 기본 통계 데이터를 데이터베이스 레벨에서 집계하여 가져옵니다.
-    상대의 테이크다운 통계도 함께 집계합니다 (TD 방어율 산출용).
-    """
-    result = await session.execute(
-        select(
-            func.sum(BasicMatchStatModel.knockdowns).label("knockdowns"),
-            func.sum(BasicMatchStatModel.control_time_seconds).label("control_time_seconds"),
-            func.sum(BasicMatchStatModel.submission_attempts).label("submission_attempts"),
-            func.sum(BasicMatchStatModel.sig_str_landed).label("sig_str_landed"),
-            func.sum(BasicMatchStatModel.sig_str_attempted).label("sig_str_attempted"),
-            func.sum(BasicMatchStatModel.total_str_landed).label("total_str_landed"),
-            func.sum(BasicMatchStatModel.total_str_attempted).label("total_str_attempted"),
-            func.sum(BasicMatchStatModel.td_landed).label("td_landed"),
-            func.sum(BasicMatchStatModel.td_attempted).label("td_attempted"),
-            func.count().label("match_count")
-        )
-        .join(FighterMatchModel)
-        .where(FighterMatchModel.fighter_id == fighter_id)
-    )
-
-    stats = result.mappings().one_or_none()
-
-    # 상대 TD 집계 (방어율 산출용)
-    opp_result = await session.execute(
-        text("""
-            SELECT
-                COALESCE(SUM(opp_bs.td_landed), 0) AS opp_td_landed,
-                COALESCE(SUM(opp_bs.td_attempted), 0) AS opp_td_attempted,
-                COALESCE(SUM(opp_bs.knockdowns), 0) AS opp_knockdowns
-            FROM fighter_match fm
-            JOIN fighter_match opp_fm
-                ON opp_fm.match_id = fm.match_id AND opp_fm.fighter_id != fm.fighter_id
-            JOIN match_statistics opp_bs
-                ON opp_bs.fighter_match_id = opp_fm.id
-            WHERE fm.fighter_id = :fighter_id
-        """),
-        {"fighter_id": fighter_id},
-    )
-    opp_stats = opp_result.mappings().one()
-
-    if stats:
-        return FighterBasicStatsAggregateDTO(
-            knockdowns=stats["knockdowns"] or 0,
-            control_time_seconds=stats["control_time_seconds"] or 0,
-            submission_attempts=stats["submission_attempts"] or 0,
-            sig_str_landed=stats["sig_str_landed"] or 0,
-            sig_str_attempted=stats["sig_str_attempted"] or 0,
-            total_str_landed=stats["total_str_landed"] or 0,
-            total_str_attempted=stats["total_str_attempted"] or 0,
-            td_landed=stats["td_landed"] or 0,
-            td_attempted=stats["td_attempted"] or 0,
-            opp_td_landed=opp_stats["opp_td_landed"],
-            opp_td_attempted=opp_stats["opp_td_attempted"],
-            opp_knockdowns=opp_stats["opp_knockdowns"],
-            match_count=stats["match_count"] or 0
-        )
-    return FighterBasicStatsAggregateDTO()
-
-async def get_fighter_sig_str_stats_aggregate(session: AsyncSession, fighter_id: int) -> FighterSigStrStatsAggregateDTO:
-    """
-    특정 선수의 유효 타격 통계 데이터를 데이터베이스 레벨에서 집계하여 가져옵니다.
-    """
-    result = await session.execute(
-        select(
-            func.sum(SigStrMatchStatModel.head_strikes_landed).label("head_strikes_landed"),
-            func.sum(SigStrMatchStatModel.head_strikes_attempts).label("head_strikes_attempts"),
-            func.sum(SigStrMatchStatModel.body_strikes_landed).label("body_strikes_landed"),
-            func.sum(SigStrMatchStatModel.body_strikes_attempts).label("body_strikes_attempts"),
-            func.sum(SigStrMatchStatModel.leg_strikes_landed).label("leg_strikes_landed"),
-            func.sum(SigStrMatchStatModel.leg_strikes_attempts).label("leg_strikes_attempts"),
-            func.sum(SigStrMatchStatModel.takedowns_landed).label("takedowns_landed"),
-            func.sum(SigStrMatchStatModel.takedowns_attempts).label("takedowns_attempts"),
-            func.sum(SigStrMatchStatModel.clinch_strikes_landed).label("clinch_strikes_landed"),
-            func.sum(SigStrMatchStatModel.clinch_strikes_attempts).label("clinch_strikes_attempts"),
-            func.sum(SigStrMatchStatModel.ground_strikes_landed).label("ground_strikes_landed"),
-            func.sum(SigStrMatchStatModel.ground_strikes_attempts).label("ground_strikes_attempts"),
-            func.count().label("match_count")
-        )
-        .join(FighterMatchModel)
-        .where(FighterMatchModel.fighter_id == fighter_id)
-    )
-
-    stats = result.mappings().one_or_none()
-    if stats:
-        return FighterSigStrStatsAggregateDTO(
-            head_strikes_landed=stats["head_strikes_landed"] or 0,
-            head_strikes_attempts=stats["head_strikes_attempts"] or 0,
-            body_strikes_landed=stats["body_strikes_landed"] or 0,
-            body_strikes_attempts=stats["body_strikes_attempts"] or 0,
-            leg_strikes_landed=stats["leg_strikes_landed"] or 0,
-            leg_strikes_attempts=stats["leg_strikes_attempts"] or 0,
-            takedowns_landed=stats["takedowns_landed"] or 0,
-            takedowns_attempts=stats["takedowns_attempts"] or 0,
-            clinch_strikes_landed=stats["clinch_strikes_landed"] or 0,
-            clinch_strikes_attempts=stats["clinch_strikes_attempts"] or 0,
-            ground_strikes_landed=stats["ground_strikes_landed"] or 0,
-            ground_strikes_attempts=stats["ground_strikes_attempts"] or 0,
-            match_count=stats["match_count"] or 0
-        )
-    return FighterSigStrStatsAggregateDTO()
-
 async def get_basic_stats_aggregate_by_fighter_match_ids(
     session: AsyncSession, fighter_match_ids: List[int]
 ) -> Dict[int, BasicMatchStatSchema]:
@@ -370,8 +265,11 @@ async def get_fighter_match_by_match_id(
     return [fighter_match.to_schema() for fighter_match in fighter_matches]
 
 # function for scraping
-async def get_match_fighter_mapping(session: AsyncSession) -> Dict[str, Dict[int, FighterMatchSchema]]:
-    """detail_url을 키로 하고 fighter_id를 서브키로 하는 딕셔너리 반환"""
+async def get_match_fighter_mapping(
+    session: AsyncSession,
+    event_ids: Optional[List[int]] = None,
+) -> Dict[str, Dict[int, FighterMatchSchema]]:
+    """detail_url을 키로 하고 fighter_id를 서브키로 하는 딕셔너리 반환 (event_ids가 주어지면 해당 이벤트만)"""
     result_dict = {}
     
     # Match와 FighterMatch 조인하여 한 번에 가져오기
@@ -380,6 +278,8 @@ async def get_match_fighter_mapping(session: AsyncSession) -> Dict[str, Dict[int
         .join(FighterMatchModel, FighterMatchModel.match_id == MatchModel.id)
         .where(MatchModel.detail_url.is_not(None))
     )
+    if event_ids is not None:
+        stmt = stmt.where(MatchModel.event_id.in_(event_ids))
     
     result = await session.execute(stmt)
     rows = result.all()
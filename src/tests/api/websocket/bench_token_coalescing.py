@@ -0,0 +1,85 @@
+"""WebSocket stream_token 병합 benchmark
+
+실행: uv run python tests/api/websocket/bench_token_coalescing.py [--tokens N] [--token-interval-ms MS]
+
+ConnectionManager._process_llm_streaming_response를 fake 스트림/fake WebSocket으로 실행하여
+토큰당 1 프레임(window=0, 기존 방식)과 병합 모드의 전송 프레임 수, 프레임/초,
+서버 CPU 시간(process_time)을 비교한다. 네트워크/DB/LLM 접근은 없다.
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+# src/ 디렉토리를 path에 추가 (tests/api/websocket/ → tests/api/ → tests/ → src/)
+sys.path.insert(
+    0,
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))),
+)
+
+from config import Config
+from api.websocket.manager import ConnectionManager
+
+
+class _CountingWebSocket:
+    """send_text 호출 수/바이트만 기록하는 WebSocket"""
+
+    def __init__(self):
+        self.client_state = SimpleNamespace(name="CONNECTED")
+        self.frames = 0
+        self.bytes = 0
+
+    async def send_text(self, data: str):
+        self.frames += 1
+        self.bytes += len(data.encode("utf-8"))
+
+
+async def _run(label: str, window_ms: float, tokens: int, interval_ms: float) -> None:
+    Config.WS_TOKEN_COALESCE_WINDOW_MS = window_ms
+
+    manager = ConnectionManager()
+    websocket = _CountingWebSocket()
+    manager.active_connections["bench"] = websocket
+    manager._save_successful_conversation = AsyncMock(return_value=1)
+    manager.compression_worker.enqueue = MagicMock()
+
+    async def stream(**kwargs):
+        yield {"type": "stream_start", "timestamp": "t"}
+        for idx in range(tokens):
+            if interval_ms:
+                await asyncio.sleep(interval_ms / 1000)
+            yield {"type": "stream_token", "token": f"토큰{idx} "}
+        yield {"type": "final_result", "content": "", "timestamp": "t"}
+
+    manager.llm_service = MagicMock()
+    manager.llm_service.generate_streaming_chat_response = stream
+
+    cpu_started = time.process_time()
+    wall_started = time.perf_counter()
+    await manager._process_llm_streaming_response("bench", "질문", 1, MagicMock())
+    wall = time.perf_counter() - wall_started
+    cpu = time.process_time() - cpu_started
+
+    print(
+        f"{label:<22} frames={websocket.frames:6d} "
+        f"frames/s={websocket.frames / wall:10.0f} "
+        f"bytes={websocket.bytes:8d} "
+        f"wall={wall * 1000:8.1f} ms cpu={cpu * 1000:8.1f} ms"
+    )
+
+
+async def main(tokens: int, interval_ms: float, window_ms: float):
+    await _run("per-token (window=0)", 0, tokens, interval_ms)
+    await _run(f"batched (window={window_ms:g}ms)", window_ms, tokens, interval_ms)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="stream_token coalescing benchmark")
+    parser.add_argument("--tokens", type=int, default=5000)
+    parser.add_argument("--token-interval-ms", type=float, default=0.0, help="토큰 간 도착 간격")
+    parser.add_argument("--window-ms", type=float, default=Config.WS_TOKEN_COALESCE_WINDOW_MS)
+    args = parser.parse_args()
+    asyncio.run(main(args.tokens, args.token_interval_ms, args.window_ms))
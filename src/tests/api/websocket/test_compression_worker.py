@@ -0,0 +1,186 @@
+"""
+대화 압축 백그라운드 워커 테스트
+"""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from api.websocket.compression_worker import CompressionWorker
+from api.websocket.manager import ConnectionManager
+
+
+class TestCompressionWorker:
+    @pytest.mark.asyncio
+    async def test_pending_conversation_is_deduplicated(self):
+        calls = []
+
+        async def job(conversation_id):
+            calls.append(conversation_id)
+
+        worker = CompressionWorker(job)
+        assert worker.enqueue(1) is True
+        assert worker.enqueue(1) is False
+        assert worker.enqueue(2) is True
+        await worker.join()
+
+        assert calls == [1, 2]
+        assert worker.stats()["deduplicated"] == 1
+        await worker.stop()
+
+    @pytest.mark.asyncio
+    async def test_request_during_run_triggers_single_rerun(self):
+        started = asyncio.Event()
+        release = asyncio.Event()
+        calls = []
+
+        async def job(conversation_id):
+            calls.append(conversation_id)
+            started.set()
+            await release.wait()
+
+        worker = CompressionWorker(job)
+        worker.enqueue(7)
+        await started.wait()
+        worker.enqueue(7)
+        worker.enqueue(7)
+        release.set()
+        await worker.join()
+
+        assert calls == [7, 7]
+        await worker.stop()
+
+    @pytest.mark.asyncio
+    async def test_job_failure_does_not_stop_worker(self):
+        calls = []
+
+        async def job(conversation_id):
+            calls.append(conversation_id)
+            if conversation_id == 1:
+                raise RuntimeError("LLM timeout")
+
+        worker = CompressionWorker(job)
+        worker.enqueue(1)
+        worker.enqueue(2)
+        await worker.join()
+
+        assert calls == [1, 2]
+        assert worker.stats()["failed"] == 1
+        assert worker.stats()["completed"] == 1
+        await worker.stop()
+
+    @pytest.mark.asyncio
+    async def test_dead_workers_are_restarted_on_enqueue(self):
+        calls = []
+
+        async def job(conversation_id):
+            calls.append(conversation_id)
+
+        worker = CompressionWorker(job)
+        worker.enqueue(1)
+        await worker.join()
+        for task in worker._workers:
+            task.cancel()
+        await asyncio.gather(*worker._workers, return_exceptions=True)
+
+        worker.enqueue(2)
+        await worker.join()
+
+        assert calls == [1, 2]
+        await worker.stop()
+
+
+class TestBackgroundCompression:
+    @pytest.mark.asyncio
+    async def test_final_result_is_sent_before_compression_finishes(self):
+        manager = ConnectionManager()
+        release = asyncio.Event()
+        compressed = []
+
+        async def slow_compress(conversation_id):
+            await release.wait()
+            compressed.append(conversation_id)
+
+        manager.compression_worker = CompressionWorker(slow_compress)
+
+        async def stream(**kwargs):
+            yield {"type": "final_result", "content": "답변", "timestamp": "t"}
+
+        manager.llm_service = MagicMock()
+        manager.llm_service.generate_streaming_chat_response = stream
+        manager.send_to_connection = AsyncMock()
+        manager._save_successful_conversation = AsyncMock(return_value=42)
+
+        await asyncio.wait_for(
+            manager._process_llm_streaming_response("conn", "질문", 1, MagicMock()),
+            timeout=1,
+        )
+
+        sent_types = [call.args[1]["type"] for call in manager.send_to_connection.call_args_list]
+        assert "final_result" in sent_types
+        assert sent_types[-1] == "response_end"
+        assert compressed == []
+
+        release.set()
+        await manager.compression_worker.join()
+        assert compressed == [42]
+        await manager.compression_worker.stop()
+
+    @pytest.mark.asyncio
+    async def test_background_job_uses_its_own_db_session(self):
+        manager = ConnectionManager()
+        manager.llm_service = MagicMock()
+        manager._maybe_compress_conversation = AsyncMock()
+        session = MagicMock()
+
+        context = MagicMock()
+        context.__aenter__ = AsyncMock(return_value=session)
+        context.__aexit__ = AsyncMock(return_value=False)
+
+        with patch("api.websocket.manager.get_async_db_context", return_value=context):
+            await manager._compress_in_background(5)
+
+        manager._maybe_compress_conversation.assert_awaited_once_with(session, 5)
+
+    def _manager_with_messages(self, compress_conversation):
+        manager = ConnectionManager()
+        manager.llm_service = MagicMock()
+        manager.llm_service.compress_conversation = compress_conversation
+        messages = [
+            MagicMock(role="user", content=f"질문 {i}", tool_results=None, message_id=i)
+            for i in range(manager.COMPRESS_THRESHOLD + 2)
+        ]
+
+        context = MagicMock()
+        context.__aenter__ = AsyncMock(return_value=AsyncMock())
+        context.__aexit__ = AsyncMock(return_value=False)
+        patches = [
+            patch("api.websocket.manager.get_async_db_context", return_value=context),
+            patch("api.websocket.manager.get_conversation_compression", AsyncMock(return_value=None)),
+            patch("api.websocket.manager.get_message_count_after", AsyncMock(return_value=len(messages))),
+            patch("api.websocket.manager.get_recent_messages", AsyncMock(return_value=messages)),
+            patch("api.websocket.manager.update_conversation_compression", AsyncMock()),
+        ]
+        return manager, patches
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("compress_conversation", [
+        AsyncMock(side_effect=RuntimeError("LLM timeout")),
+        AsyncMock(return_value=None),
+    ], ids=["raises", "returns_none"])
+    async def test_compression_failure_is_counted_by_worker(self, compress_conversation):
+        manager, patches = self._manager_with_messages(compress_conversation)
+
+        for p in patches:
+            p.start()
+        try:
+            manager.compression_worker.enqueue(9)
+            await manager.compression_worker.join()
+        finally:
+            for p in patches:
+                p.stop()
+
+        compress_conversation.assert_awaited_once()
+        assert manager.compression_worker.stats()["failed"] == 1
+        assert manager.compression_worker.stats()["completed"] == 0
+        await manager.compression_worker.stop()
@@ -0,0 +1,106 @@
+"""
+WebSocket stream_token 병합 테스트
+"""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from api.websocket.manager import ConnectionManager
+from api.websocket.token_coalescer import TokenCoalescer
+
+
+def _collector():
+    frames = []
+
+    async def send(token):
+        frames.append(token)
+
+    return frames, send
+
+
+class TestTokenCoalescer:
+    @pytest.mark.asyncio
+    async def test_disabled_window_sends_every_token(self):
+        frames, send = _collector()
+        coalescer = TokenCoalescer(send, window_ms=0, max_chars=100)
+
+        for token in ["a", "b", "c"]:
+            await coalescer.add(token)
+
+        assert frames == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_burst_is_sent_as_first_token_then_one_batch(self):
+        frames, send = _collector()
+        coalescer = TokenCoalescer(send, window_ms=50, max_chars=100)
+
+        for token in ["첫", "토", "큰", "들"]:
+            await coalescer.add(token)
+        await coalescer.flush()
+
+        assert frames == ["첫", "토큰들"]
+        assert (coalescer.tokens, coalescer.frames) == (4, 2)
+
+    @pytest.mark.asyncio
+    async def test_max_chars_forces_flush_inside_window(self):
+        frames, send = _collector()
+        coalescer = TokenCoalescer(send, window_ms=1000, max_chars=4)
+
+        for token in ["a", "bb", "cc", "d"]:
+            await coalescer.add(token)
+
+        assert frames == ["a", "bbcc"]
+        await coalescer.aclose()
+
+    @pytest.mark.asyncio
+    async def test_timer_flushes_trailing_tokens_without_new_input(self):
+        frames, send = _collector()
+        coalescer = TokenCoalescer(send, window_ms=10, max_chars=100)
+
+        await coalescer.add("a")
+        await coalescer.add("b")
+        await asyncio.sleep(0.05)
+
+        assert frames == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_timer_send_error_is_raised_on_next_call(self):
+        async def send(token):
+            if token == "b":
+                raise ConnectionError("closed")
+
+        coalescer = TokenCoalescer(send, window_ms=10, max_chars=100)
+        await coalescer.add("a")
+        await coalescer.add("b")
+        await asyncio.sleep(0.05)
+
+        with pytest.raises(ConnectionError):
+            await coalescer.add("c")
+
+
+class TestStreamingCoalescing:
+    @pytest.mark.asyncio
+    async def test_tokens_are_flushed_before_following_events(self):
+        manager = ConnectionManager()
+
+        async def stream(**kwargs):
+            yield {"type": "stream_start", "timestamp": "t"}
+            for token in ["안", "녕", "하", "세요"]:
+                yield {"type": "stream_token", "token": token}
+            yield {"type": "error", "error": "boom", "timestamp": "t"}
+
+        manager.llm_service = MagicMock()
+        manager.llm_service.generate_streaming_chat_response = stream
+        manager.send_to_connection = AsyncMock()
+
+        with patch("api.websocket.manager.Config.WS_TOKEN_COALESCE_WINDOW_MS", 1000):
+            await manager._process_llm_streaming_response("conn", "질문", 1, MagicMock())
+
+        sent = [call.args[1] for call in manager.send_to_connection.call_args_list]
+        types = [message["type"] for message in sent]
+        tokens = [message["token"] for message in sent if message["type"] == "stream_token"]
+
+        assert "".join(tokens) == "안녕하세요"
+        assert tokens == ["안", "녕하세요"]
+        assert types.index("typing") > max(i for i, t in enumerate(types) if t == "stream_token")
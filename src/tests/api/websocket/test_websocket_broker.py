@@ -0,0 +1,210 @@
+"""
+WebSocket 워커 간 fan-out 브로커 테스트
+"""
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from api.websocket.broker import (
+    InMemoryBroker,
+    InMemoryBrokerHub,
+    RedisBroker,
+    WebSocketBroker,
+    create_broker,
+)
+from api.websocket.manager import ConnectionManager
+from user.principal_cache import principal_cache
+
+
+def _user(user_id):
+    user = MagicMock()
+    user.id = user_id
+    return user
+
+
+def _user_schema(user_id):
+    from user.models import UserSchema
+    return UserSchema(id=user_id, username=f"user{user_id}")
+
+
+def _websocket():
+    websocket = MagicMock()
+    websocket.client_state.name = "CONNECTED"
+    websocket.send_text = AsyncMock()
+    return websocket
+
+
+def _sent(websocket):
+    return [json.loads(call.args[0]) for call in websocket.send_text.call_args_list]
+
+
+@pytest.fixture
+async def workers():
+    """같은 hub를 공유하는 두 워커의 ConnectionManager"""
+    hub = InMemoryBrokerHub()
+    managers = []
+    for _ in range(2):
+        manager = ConnectionManager()
+        manager.broker = InMemoryBroker(hub)
+        await manager.start_broker()
+        managers.append(manager)
+    yield managers
+    for manager in managers:
+        await manager.stop_broker()
+
+
+class TestCrossWorkerFanOut:
+    @pytest.mark.asyncio
+    async def test_send_to_user_reaches_connection_on_other_worker(self, workers):
+        worker_a, worker_b = workers
+        ws_a, ws_b = _websocket(), _websocket()
+        await worker_a.connect(ws_a, _user(1))
+        await worker_b.connect(ws_b, _user(1))
+
+        await worker_a.send_to_user(1, {"type": "notice", "text": "안녕"})
+
+        assert _sent(ws_a) == [{"type": "notice", "text": "안녕"}]
+        assert _sent(ws_b) == [{"type": "notice", "text": "안녕"}]
+
+    @pytest.mark.asyncio
+    async def test_send_to_conversation_only_targets_that_conversation(self, workers):
+        worker_a, worker_b = workers
+        ws_in, ws_out = _websocket(), _websocket()
+        await worker_b.connect(ws_in, _user(1), conversation_id=10)
+        await worker_b.connect(ws_out, _user(2), conversation_id=20)
+
+        await worker_a.send_to_conversation(10, {"type": "update"})
+
+        assert _sent(ws_in) == [{"type": "update"}]
+        assert _sent(ws_out) == []
+
+    @pytest.mark.asyncio
+    async def test_broadcast_delivers_once_per_connection(self, workers):
+        worker_a, worker_b = workers
+        ws_a, ws_b = _websocket(), _websocket()
+        await worker_a.connect(ws_a, _user(1))
+        await worker_b.connect(ws_b, _user(2))
+
+        await worker_a.broadcast({"type": "maintenance"})
+
+        assert len(_sent(ws_a)) == 1
+        assert len(_sent(ws_b)) == 1
+        assert worker_b.broker.stats()["received"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stopped_worker_no_longer_receives(self, workers):
+        worker_a, worker_b = workers
+        ws_b = _websocket()
+        await worker_b.connect(ws_b, _user(1))
+        await worker_b.stop_broker()
+
+        await worker_a.send_to_user(1, {"type": "notice"})
+
+        assert _sent(ws_b) == []
+
+
+class TestBrokerBackends:
+    def test_create_broker_by_backend(self):
+        assert type(create_broker("local")) is WebSocketBroker
+        assert isinstance(create_broker("memory"), InMemoryBroker)
+        assert isinstance(create_broker("redis"), RedisBroker)
+        with pytest.raises(ValueError):
+            create_broker("kafka")
+
+    @pytest.mark.asyncio
+    async def test_local_broker_keeps_single_worker_behavior(self):
+        manager = ConnectionManager()
+        manager.broker = create_broker("local")
+        websocket = _websocket()
+        await manager.connect(websocket, _user(1))
+
+        await manager.send_to_user(1, {"type": "notice"})
+
+        assert _sent(websocket) == [{"type": "notice"}]
+        assert manager.broker.stats()["published"] == 0
+
+    @pytest.mark.asyncio
+    async def test_redis_broker_publishes_envelope_and_ignores_own_events(self):
+        client = MagicMock()
+        client.publish = AsyncMock()
+        broker = RedisBroker(channel="test:ws", client=client)
+        handler = AsyncMock()
+        broker._handler = handler
+
+        await broker.publish("user", 3, {"type": "notice"})
+
+        channel, payload = client.publish.await_args.args
+        envelope = json.loads(payload)
+        assert channel == "test:ws"
+        assert envelope["target"] == "user" and envelope["target_id"] == 3
+
+        await broker._dispatch(envelope)
+        handler.assert_not_awaited()
+
+        await broker._dispatch({**envelope, "origin": "other-worker"})
+        handler.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_redis_publish_failure_does_not_raise(self):
+        client = MagicMock()
+        client.publish = AsyncMock(side_effect=ConnectionError("redis down"))
+        broker = RedisBroker(channel="test:ws", client=client)
+
+        await broker.publish("broadcast", None, {"type": "notice"})
+
+        assert broker.stats()["published"] == 0
+
+
+class TestDeliveryOrder:
+    @pytest.mark.asyncio
+    async def test_local_delivery_happens_before_publish(self):
+        manager = ConnectionManager()
+        websocket = _websocket()
+        await manager.connect(websocket, _user(1))
+        sent_before_publish = []
+
+        async def publish(target, target_id, message):
+            sent_before_publish.append(websocket.send_text.await_count)
+
+        manager.broker.publish = publish
+
+        await manager.send_to_user(1, {"type": "notice"})
+
+        assert sent_before_publish == [1]
+
+    @pytest.mark.asyncio
+    async def test_publish_runs_even_if_local_delivery_fails(self):
+        manager = ConnectionManager()
+        websocket = _websocket()
+        websocket.send_text = AsyncMock(side_effect=RuntimeError("websocket is not connected"))
+        await manager.connect(websocket, _user(1))
+        manager.broker.publish = AsyncMock()
+
+        with pytest.raises(ConnectionError):
+            await manager.send_to_user(1, {"type": "notice"})
+
+        manager.broker.publish.assert_awaited_once_with("user", 1, {"type": "notice"})
+
+
+class TestPrincipalInvalidation:
+    @pytest.mark.asyncio
+    async def test_principal_event_invalidates_local_cache(self):
+        manager = ConnectionManager()
+        principal_cache.set("id:1", _user_schema(1))
+
+        await manager._handle_broker_event({"origin": "other", "target": "principal", "target_id": 1})
+
+        assert principal_cache.get("id:1") is None
+
+    @pytest.mark.asyncio
+    async def test_started_broker_publishes_principal_invalidations(self, workers):
+        from user import principal_cache as principal_cache_module
+
+        worker_a, _ = workers
+        worker_a.broker.publish = AsyncMock()
+        await worker_a.start_broker()
+
+        await principal_cache_module._invalidation_publisher(7)
+
+        worker_a.broker.publish.assert_awaited_once_with("principal", 7, {})
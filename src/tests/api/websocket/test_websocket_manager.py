@@ -3,10 +3,20 @@ WebSocket Manager 테스트
 api/websocket/manager.py의 단위 테스트
 """
 import pytest
+import pytest_asyncio
 import json
+import uuid
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
 
 from api.websocket.manager import ConnectionManager
+from common.utils import utc_now
+from config import get_database_url
+from user import repositories as user_repo
+from user.models import UserModel, UserSchema
 
 
 class TestValidateMessageData:
@@ -368,8 +378,8 @@ class TestValidateUserConnection:
             assert "timestamp" in call_args[1]
 
 
-class TestCheckUsageLimit:
-    """_check_usage_limit 메서드 단위 테스트"""
+class TestReserveUsage:
+    """_reserve_usage 메서드 단위 테스트"""
 
     def setup_method(self):
         """각 테스트 전 ConnectionManager 인스턴스 생성"""
@@ -382,33 +392,34 @@ class TestCheckUsageLimit:
         return AsyncMock()
 
     @pytest.mark.asyncio
-    async def test_check_usage_within_limit_returns_true(self, mock_db_session):
-        """사용량 제한 내 → True 반환"""
-        with patch('api.websocket.manager.check_usage_limit', new_callable=AsyncMock) as mock_check:
-            mock_check.return_value = True
+    async def test_reserve_within_limit_returns_true_and_commits(self, mock_db_session):
+        """사용량 제한 내 → 선차감 후 commit, True 반환"""
+        with patch('api.websocket.manager.user_repo.consume_daily_requests', new_callable=AsyncMock) as mock_consume:
+            mock_consume.return_value = MagicMock()
 
             with patch.object(self.manager, 'send_to_connection', new_callable=AsyncMock):
-                result = await self.manager._check_usage_limit(
+                result = await self.manager._reserve_usage(
                     self.connection_id, mock_db_session, user_id=1
                 )
 
             assert result is True
-            mock_check.assert_called_once_with(mock_db_session, 1)
+            mock_consume.assert_called_once_with(mock_db_session, 1, 1, 100)
+            mock_db_session.commit.assert_awaited_once()
 
     @pytest.mark.asyncio
-    async def test_check_usage_exceeded_returns_false_and_sends_message(self, mock_db_session):
+    async def test_reserve_exceeded_returns_false_and_sends_message(self, mock_db_session):
         """사용량 초과 시 False 반환 및 클라이언트에 제한 메시지 전송"""
         mock_usage = MagicMock()
         mock_usage.daily_requests = 50
         mock_usage.daily_limit = 50
 
-        with patch('api.websocket.manager.check_usage_limit', new_callable=AsyncMock) as mock_check:
+        with patch('api.websocket.manager.user_repo.consume_daily_requests', new_callable=AsyncMock) as mock_consume:
             with patch('api.websocket.manager.get_user_usage', new_callable=AsyncMock) as mock_get_usage:
-                mock_check.return_value = False
+                mock_consume.return_value = None
                 mock_get_usage.return_value = mock_usage
 
                 with patch.object(self.manager, 'send_to_connection', new_callable=AsyncMock) as mock_send:
-                    result = await self.manager._check_usage_limit(
+                    result = await self.manager._reserve_usage(
                         self.connection_id, mock_db_session, user_id=1
                     )
 
@@ -427,18 +438,19 @@ class TestCheckUsageLimit:
                     assert call_args[1]["remaining_requests"] == 0
 
     @pytest.mark.asyncio
-    async def test_check_usage_error_returns_false_for_fail_closed(self, mock_db_session):
-        """사용량 체크 에러 시 fail-closed: False 반환 + 에러 메시지 전송"""
-        with patch('api.websocket.manager.check_usage_limit', new_callable=AsyncMock) as mock_check:
-            mock_check.side_effect = Exception("Database error")
+    async def test_reserve_error_returns_false_for_fail_closed(self, mock_db_session):
+        """선차감 에러 시 fail-closed: False 반환 + 에러 메시지 전송"""
+        with patch('api.websocket.manager.user_repo.consume_daily_requests', new_callable=AsyncMock) as mock_consume:
+            mock_consume.side_effect = Exception("Database error")
 
             with patch.object(self.manager, 'send_to_connection', new_callable=AsyncMock) as mock_send:
-                result = await self.manager._check_usage_limit(
+                result = await self.manager._reserve_usage(
                     self.connection_id, mock_db_session, user_id=1
                 )
 
             # fail-closed: 에러 발생 시 False 반환
             assert result is False
+            mock_db_session.rollback.assert_awaited_once()
             # 에러 메시지가 전송되었는지 확인
             mock_send.assert_called_once()
             sent_msg = mock_send.call_args[0][1]
@@ -447,14 +459,14 @@ class TestCheckUsageLimit:
             assert sent_msg["recoverable"] is True
 
     @pytest.mark.asyncio
-    async def test_check_usage_calls_get_user_usage_only_when_exceeded(self, mock_db_session):
+    async def test_reserve_calls_get_user_usage_only_when_exceeded(self, mock_db_session):
         """사용량 초과 시에만 get_user_usage 호출"""
-        with patch('api.websocket.manager.check_usage_limit', new_callable=AsyncMock) as mock_check:
+        with patch('api.websocket.manager.user_repo.consume_daily_requests', new_callable=AsyncMock) as mock_consume:
             with patch('api.websocket.manager.get_user_usage', new_callable=AsyncMock) as mock_get_usage:
-                mock_check.return_value = True  # 제한 내
+                mock_consume.return_value = MagicMock()  # 제한 내
 
                 with patch.object(self.manager, 'send_to_connection', new_callable=AsyncMock):
-                    await self.manager._check_usage_limit(
+                    await self.manager._reserve_usage(
                         self.connection_id, mock_db_session, user_id=1
                     )
 
@@ -462,6 +474,109 @@ class TestCheckUsageLimit:
                 mock_get_usage.assert_not_called()
 
 
+class TestHandleUserMessageUsage:
+    """handle_user_message 사용량 선차감 통합 테스트 (실제 테스트 DB 사용)"""
+
+    @pytest_asyncio.fixture
+    async def session_factory(self):
+        """요청마다 별도 세션을 쓰기 위한 세션 팩토리"""
+        engine = create_async_engine(get_database_url(is_test=True), echo=False, pool_size=10)
+        yield sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        await engine.dispose()
+
+    @pytest_asyncio.fixture
+    async def limited_user(self, session_factory):
+        """일일 제한 직전(99/100)의 사용자 — 테스트 후 삭제"""
+        async with session_factory() as session:
+            user = await user_repo.create_user(session, UserSchema(
+                username=f"ws_usage_{uuid.uuid4().hex[:12]}",
+                password_hash="hash",
+                daily_requests=99,
+                last_request_date=utc_now(),
+            ))
+            await session.commit()
+
+        yield user
+
+        async with session_factory() as session:
+            await session.execute(delete(UserModel).where(UserModel.id == user.id))
+            await session.commit()
+
+    def _make_manager(self, user, stream):
+        manager = ConnectionManager()
+        manager.llm_service = MagicMock()
+        manager.llm_service.generate_streaming_chat_response = stream
+        manager.send_to_connection = AsyncMock()
+        manager._save_successful_conversation = AsyncMock(return_value=1)
+        manager.compression_worker.enqueue = MagicMock()
+        for i in range(5):
+            manager.connection_users[f"conn-{i}"] = user
+        return manager
+
+    async def _handle(self, manager, session_factory, connection_id):
+        async with session_factory() as session:
+            await manager.handle_user_message(connection_id, {"content": "질문"}, session)
+
+    async def _daily_requests(self, session_factory, user_id):
+        async with session_factory() as session:
+            return (await user_repo.get_user_by_id(session, user_id)).daily_requests
+
+    @pytest.mark.asyncio
+    async def test_concurrent_messages_at_limit_serve_only_one(self, session_factory, limited_user):
+        """limit-1 사용자의 동시 요청 → LLM은 1회만 호출, 나머지는 usage_limit_exceeded"""
+        llm_calls = []
+
+        async def stream(**kwargs):
+            llm_calls.append(kwargs["user_message"])
+            await asyncio.sleep(0.05)
+            yield {"type": "final_result", "content": "답변", "timestamp": "t"}
+
+        manager = self._make_manager(limited_user, stream)
+
+        await asyncio.gather(*(
+            self._handle(manager, session_factory, f"conn-{i}") for i in range(5)
+        ))
+
+        sent_types = [call.args[1]["type"] for call in manager.send_to_connection.call_args_list]
+        assert len(llm_calls) == 1
+        assert sent_types.count("usage_limit_exceeded") == 4
+        assert sent_types.count("response_end") == 1
+        assert await self._daily_requests(session_factory, limited_user.id) == 100
+
+    @pytest.mark.asyncio
+    async def test_llm_failure_refunds_reserved_request(self, session_factory, limited_user):
+        """LLM 에러로 응답이 저장되지 않으면 선차감이 환불됨"""
+        async def stream(**kwargs):
+            raise RuntimeError("LLM down")
+            yield  # pragma: no cover
+
+        manager = self._make_manager(limited_user, stream)
+        manager._handle_message_error = AsyncMock()
+
+        await self._handle(manager, session_factory, "conn-0")
+
+        manager._save_successful_conversation.assert_not_awaited()
+        manager._handle_message_error.assert_awaited_once()
+        assert await self._daily_requests(session_factory, limited_user.id) == 99
+
+    @pytest.mark.asyncio
+    async def test_send_failure_after_save_keeps_reserved_request(self, session_factory, limited_user):
+        """응답 저장 후 final_result 전송이 ConnectionError 외 예외로 실패해도 환불하지 않음"""
+        async def stream(**kwargs):
+            # timestamp 누락 → _send_final_result에서 KeyError
+            yield {"type": "final_result", "content": "답변"}
+
+        manager = self._make_manager(limited_user, stream)
+        manager._handle_message_error = AsyncMock()
+
+        await self._handle(manager, session_factory, "conn-0")
+
+        manager._save_successful_conversation.assert_awaited_once()
+        manager._handle_message_error.assert_not_awaited()
+        manager.compression_worker.enqueue.assert_called_once_with(1)
+        assert await self._daily_requests(session_factory, limited_user.id) == 100
+
+
 if __name__ == "__main__":
     print("WebSocket Manager 테스트 실행...")
     print("uv run pytest tests/api/websocket/test_websocket_manager.py -v")
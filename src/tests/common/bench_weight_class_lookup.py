@@ -0,0 +1,64 @@
+"""WeightClassSchema.get_name_by_id micro-benchmark
+
+실행: uv run python tests/common/bench_weight_class_lookup.py [--payloads N]
+
+랭킹 화면 한 번 분량(체급 16개 x 15명)과 파이터 상세 경기 이력(30경기)의 행에
+체급 이름을 붙여 직렬화하는 payload를 만들고, 호출마다 역방향 dict를 새로 만들던
+기존 조회(before)와 import 시 만들어 둔 WEIGHT_CLASS_NAMES 조회(after)를 비교한다.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+# src/ 디렉토리를 path에 추가 (tests/common/ → tests/ → src/)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from common.models import WeightClassSchema
+
+
+def _legacy_get_name_by_id(weight_class_id):
+    """기존 구현: 호출마다 역방향 매핑 생성"""
+    names = {v: k for k, v in WeightClassSchema.WEIGHT_CLASS_IDS.items()}
+    return names.get(weight_class_id)
+
+
+def _make_rows():
+    ranking_rows = [
+        {"fighter_id": wc_id * 100 + rank, "weight_class_id": wc_id, "ranking": rank}
+        for wc_id in range(1, 17)
+        for rank in range(15)
+    ]
+    history_rows = [
+        {"match_id": idx, "weight_class_id": idx % 8 + 1, "result": "win"}
+        for idx in range(30)
+    ]
+    return ranking_rows + history_rows
+
+
+def _serialize(rows, get_name) -> str:
+    return json.dumps([{**row, "weight_class": get_name(row["weight_class_id"])} for row in rows])
+
+
+def _run(label: str, rows, get_name, payloads: int) -> str:
+    started_at = time.perf_counter()
+    for _ in range(payloads):
+        payload = _serialize(rows, get_name)
+    per_payload_us = (time.perf_counter() - started_at) / payloads * 1_000_000
+    print(f"{label:<8} rows/payload={len(rows)} {per_payload_us:9.1f} us/payload")
+    return payload
+
+
+def main(payloads: int):
+    rows = _make_rows()
+    before = _run("before", rows, _legacy_get_name_by_id, payloads)
+    after = _run("after", rows, WeightClassSchema.get_name_by_id, payloads)
+    assert before == after, "serialized payloads differ"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="weight class name lookup benchmark")
+    parser.add_argument("--payloads", type=int, default=2000)
+    args = parser.parse_args()
+    main(args.payloads)
@@ -0,0 +1,24 @@
+"""WeightClassSchema 체급 ID/이름 조회 단위 테스트"""
+from common.enums import WeightClassEnum
+from common.models import WeightClassSchema
+
+
+class TestWeightClassLookup:
+    def test_lookup_tables_are_inverse(self):
+        for name, weight_class_id in WeightClassSchema.WEIGHT_CLASS_IDS.items():
+            assert WeightClassSchema.get_name_by_id(weight_class_id) == name
+            assert WeightClassSchema.get_id_by_name(name) == weight_class_id
+
+    def test_every_enum_value_has_id(self):
+        assert {e.value for e in WeightClassEnum} <= set(WeightClassSchema.WEIGHT_CLASS_IDS)
+
+    def test_name_lookup_is_case_insensitive(self):
+        assert WeightClassSchema.get_id_by_name("Light Heavyweight") == 7
+
+    def test_unknown_values_return_none(self):
+        assert WeightClassSchema.get_name_by_id(999) is None
+        assert WeightClassSchema.get_name_by_id(None) is None
+        assert WeightClassSchema.get_id_by_name("super heavyweight") is None
+
+    def test_lookup_tables_are_not_model_fields(self):
+        assert "WEIGHT_CLASS_NAMES" not in WeightClassSchema.model_fields
@@ -2,9 +2,13 @@
 테스트용 공통 fixture 정의
 모든 테스트에서 사용될 공통 fixture들을 정의
 """
+import os
 import sys
 from unittest.mock import MagicMock
 
+# Redis 서버 없이 캐시 경로를 실행하도록 in-process 비동기 클라이언트 사용
+os.environ.setdefault("REDIS_CACHE_BACKEND", "memory")
+
 # redis 모듈이 설치되지 않은 환경에서도 서비스 테스트 가능하도록 mock 처리
 if "redis" not in sys.modules:
     sys.modules["redis"] = MagicMock()
@@ -36,6 +40,15 @@ async def setup_test_database():
     yield
 
 
+@pytest.fixture(autouse=True)
+def clear_principal_cache():
+    """테스트 간 인증 principal 캐시 격리 (테스트 DB의 user id가 재사용됨)"""
+    from user.principal_cache import principal_cache
+    principal_cache.clear()
+    yield
+    principal_cache.clear()
+
+
 @pytest_asyncio.fixture
 async def clean_test_session():
     """
@@ -962,6 +975,10 @@ async def dashboard_data(clean_test_session):
     session.add_all(rankings)
     await session.flush()
 
+    # 차트 쿼리가 읽는 집계 materialized view 갱신 (트랜잭션 내부라 CONCURRENTLY 불필요)
+    from dashboard.repositories import refresh_stats_views
+    await refresh_stats_views(session, concurrently=False)
+
     return {
         "fighters": [fighter_a, fighter_b, fighter_c],
         "events": events,
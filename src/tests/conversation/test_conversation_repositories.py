@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from conversation import repositories as conversation_repo
 from conversation.models import ChatSessionResponse, ChatMessageResponse, ChatHistoryResponse
+from conversation.exceptions import InvalidPageCursorError
 from user.models import UserSchema
 from user import repositories as user_repo
 
@@ -174,6 +175,86 @@ async def test_get_user_chat_sessions_pagination(clean_test_session: AsyncSessio
     assert page1_ids.isdisjoint(page2_ids)
 
 
+@pytest.mark.asyncio
+async def test_get_user_chat_sessions_cursor_pagination(clean_test_session: AsyncSession):
+    """(last_activity_at, id) 커서로 세션 목록을 끝까지 조회"""
+    # Given: 5개 세션
+    test_user = await create_test_user(clean_test_session, "get_cursor")
+    created = [
+        await conversation_repo.create_chat_session(
+            clean_test_session, user_id=test_user.id, title=f"세션 {i+1}"
+        )
+        for i in range(5)
+    ]
+
+    # When: 2개씩 커서 페이지네이션
+    seen = []
+    cursor = None
+    while True:
+        page, cursor = await conversation_repo.get_user_chat_sessions_page(
+            clean_test_session, user_id=test_user.id, limit=2, cursor=cursor
+        )
+        seen.extend(s.id for s in page)
+        if cursor is None:
+            break
+
+    # Then: 최신순, 중복/누락 없음
+    assert seen == [s.id for s in reversed(created)]
+
+
+@pytest.mark.asyncio
+async def test_get_user_chat_sessions_page_exactly_full_last_page_has_no_cursor(clean_test_session: AsyncSession):
+    """마지막 페이지가 limit만큼 꽉 차도 다음 페이지가 없으면 커서를 주지 않음"""
+    # Given: 4개 세션
+    test_user = await create_test_user(clean_test_session, "full_page")
+    for i in range(4):
+        await conversation_repo.create_chat_session(
+            clean_test_session, user_id=test_user.id, title=f"세션 {i+1}"
+        )
+
+    # When: 2개씩 조회
+    first, cursor = await conversation_repo.get_user_chat_sessions_page(
+        clean_test_session, user_id=test_user.id, limit=2
+    )
+    second, last_cursor = await conversation_repo.get_user_chat_sessions_page(
+        clean_test_session, user_id=test_user.id, limit=2, cursor=cursor
+    )
+
+    # Then: 두 번째(마지막) 페이지는 꽉 찼지만 커서 없음
+    assert len(first) == 2 and cursor is not None
+    assert len(second) == 2
+    assert last_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_new_message_moves_session_to_top(clean_test_session: AsyncSession):
+    """메시지가 추가되면 last_activity_at/message_count가 갱신되어 목록 맨 앞으로"""
+    # Given: 두 세션 중 오래된 세션에 메시지 추가
+    test_user = await create_test_user(clean_test_session, "activity")
+    older = await conversation_repo.create_chat_session(
+        clean_test_session, user_id=test_user.id, title="오래된 세션"
+    )
+    await conversation_repo.create_chat_session(
+        clean_test_session, user_id=test_user.id, title="최신 세션"
+    )
+    await conversation_repo.add_message_direct(
+        clean_test_session, conversation_id=older.id, content="안녕", role="user"
+    )
+
+    # When
+    sessions = await conversation_repo.get_user_chat_sessions(
+        clean_test_session, user_id=test_user.id
+    )
+    history = await conversation_repo.get_chat_history(
+        clean_test_session, conversation_id=older.id, user_id=test_user.id
+    )
+
+    # Then
+    assert sessions[0].id == older.id
+    assert sessions[0].last_message_at > older.last_message_at
+    assert history.total_messages == 1
+
+
 @pytest.mark.asyncio
 async def test_get_user_chat_sessions_empty(clean_test_session: AsyncSession):
     """세션이 없는 사용자 조회 테스트"""
@@ -736,6 +817,74 @@ async def test_get_chat_history_pagination(clean_test_session: AsyncSession):
     assert page3.has_more is False
 
 
+@pytest.mark.asyncio
+async def test_get_chat_history_cursor_pagination(clean_test_session: AsyncSession):
+    """next_cursor로 이어서 조회하면 중복/누락 없이 시간순 전체 메시지"""
+    # Given: 5개 메시지
+    test_user = await create_test_user(clean_test_session, "hist_cursor")
+    chat_session = await conversation_repo.create_chat_session(
+        clean_test_session, user_id=test_user.id, title="커서 테스트"
+    )
+    for i in range(5):
+        await conversation_repo.add_message_to_session(
+            clean_test_session,
+            conversation_id=chat_session.id,
+            user_id=test_user.id,
+            content=f"메시지 {i+1}",
+            role="user"
+        )
+
+    # When: 커서로 2개씩 끝까지 조회
+    contents = []
+    cursor = None
+    pages = 0
+    while True:
+        page = await conversation_repo.get_chat_history(
+            clean_test_session,
+            conversation_id=chat_session.id,
+            user_id=test_user.id,
+            limit=2,
+            cursor=cursor,
+        )
+        pages += 1
+        contents.extend(m.content for m in page.messages)
+        assert page.total_messages == 5
+        if not page.has_more:
+            assert page.next_cursor is None
+            break
+        cursor = page.next_cursor
+
+    # Then
+    assert pages == 3
+    assert contents == [f"메시지 {i+1}" for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_get_chat_history_invalid_cursor(clean_test_session: AsyncSession):
+    """잘못된 커서는 InvalidPageCursorError"""
+    test_user = await create_test_user(clean_test_session, "hist_bad_cursor")
+    chat_session = await conversation_repo.create_chat_session(
+        clean_test_session, user_id=test_user.id, title="잘못된 커서"
+    )
+
+    with pytest.raises(InvalidPageCursorError):
+        await conversation_repo.get_chat_history(
+            clean_test_session,
+            conversation_id=chat_session.id,
+            user_id=test_user.id,
+            cursor="not-a-cursor",
+        )
+
+
+def test_page_cursor_round_trip():
+    """커서 인코딩/디코딩 왕복"""
+    timestamp = datetime(2025, 3, 1, 12, 30, 45, 123456)
+
+    cursor = conversation_repo.encode_page_cursor(timestamp, 42)
+
+    assert conversation_repo.decode_page_cursor(cursor) == (timestamp, 42)
+
+
 @pytest.mark.asyncio
 async def test_get_chat_history_empty(clean_test_session: AsyncSession):
     """메시지가 없는 세션의 히스토리 조회"""
@@ -172,6 +172,31 @@ async def test_get_user_sessions_pagination(clean_test_session: AsyncSession):
     assert page1_ids.isdisjoint(page2_ids)
 
 
+@pytest.mark.asyncio
+async def test_get_user_sessions_next_cursor(clean_test_session: AsyncSession):
+    """다음 페이지가 있으면 next_cursor를 주고, 커서로 다음 페이지 조회"""
+    # Given: 3개 세션
+    test_user = await create_test_user(clean_test_session, "next_cursor")
+    for i in range(3):
+        await conv_svc.create_new_session(
+            db=clean_test_session,
+            user_id=test_user.id,
+            session_data=ChatSessionCreate(title=f"세션 {i+1}")
+        )
+
+    # When
+    page1 = await conv_svc.get_user_sessions(db=clean_test_session, user_id=test_user.id, limit=2)
+    page2 = await conv_svc.get_user_sessions(
+        db=clean_test_session, user_id=test_user.id, limit=2, cursor=page1.next_cursor
+    )
+
+    # Then
+    assert page1.next_cursor is not None
+    assert len(page2.sessions) == 1
+    assert page2.next_cursor is None
+    assert {s.id for s in page1.sessions}.isdisjoint({s.id for s in page2.sessions})
+
+
 @pytest.mark.asyncio
 async def test_get_user_sessions_returns_list_response_structure(clean_test_session: AsyncSession):
     """get_user_sessions가 ChatSessionListResponse 구조로 반환하는지 검증"""
@@ -2,11 +2,16 @@
 Dashboard Service 테스트
 Redis 캐싱은 mock 처리, DB 쿼리는 실제 테스트 DB 사용
 """
+import asyncio
 import json
+import time
+from contextlib import asynccontextmanager
 
 import pytest
-from unittest.mock import patch, call
+from unittest.mock import AsyncMock, patch, call
 
+from dashboard import repositories as dashboard_repo
+from database.connection.redis_conn_memory import InMemoryAsyncRedis
 from dashboard import services as dashboard_service
 from dashboard.dto import (
     HomeResponseDTO,
@@ -35,7 +40,7 @@ from dashboard.dto import (
     TdDefenseLeaderboardDTO,
 )
 
-REDIS_PATCH = "dashboard.services.redis_client"
+REDIS_PATCH = "dashboard.services.async_redis_client"
 
 
 # =============================================================================
@@ -44,10 +49,10 @@ REDIS_PATCH = "dashboard.services.redis_client"
 
 @pytest.mark.asyncio
 async def test_get_home_cache_miss(clean_test_session, dashboard_data):
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = None
 
-        result = await dashboard_service.get_home(clean_test_session)
+        result = await dashboard_service.get_home(session=clean_test_session)
 
         assert isinstance(result, HomeResponseDTO)
         assert result.summary.total_fighters == 3
@@ -72,10 +77,10 @@ async def test_get_home_cache_hit(clean_test_session):
         "event_map": [],
         "nationality_distribution": [],
     }
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = json.dumps(cached)
 
-        result = await dashboard_service.get_home(clean_test_session)
+        result = await dashboard_service.get_home(session=clean_test_session)
 
         assert isinstance(result, HomeResponseDTO)
         assert result.summary.total_fighters == 100
@@ -88,10 +93,10 @@ async def test_get_home_cache_hit(clean_test_session):
 
 @pytest.mark.asyncio
 async def test_get_overview_cache_miss(clean_test_session, dashboard_data):
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = None
 
-        result = await dashboard_service.get_overview(clean_test_session)
+        result = await dashboard_service.get_overview(session=clean_test_session)
 
         assert isinstance(result, OverviewResponseDTO)
         assert len(result.finish_methods) > 0
@@ -107,10 +112,10 @@ async def test_get_overview_cache_miss(clean_test_session, dashboard_data):
 
 @pytest.mark.asyncio
 async def test_get_overview_with_weight_class(clean_test_session, dashboard_data):
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = None
 
-        result = await dashboard_service.get_overview(clean_test_session, weight_class_id=4)
+        result = await dashboard_service.get_overview(session=clean_test_session, weight_class_id=4)
 
         assert isinstance(result, OverviewResponseDTO)
         assert len(result.finish_methods) > 0
@@ -122,10 +127,10 @@ async def test_get_overview_with_weight_class(clean_test_session, dashboard_data
 
 @pytest.mark.asyncio
 async def test_get_striking_cache_miss(clean_test_session, dashboard_data):
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = None
 
-        result = await dashboard_service.get_striking(clean_test_session)
+        result = await dashboard_service.get_striking(session=clean_test_session)
 
         assert isinstance(result, StrikingResponseDTO)
         assert len(result.strike_targets) == 5
@@ -150,10 +155,10 @@ async def test_get_striking_cache_hit(clean_test_session):
         "ko_tko_leaders": [],
         "sig_strikes_per_fight": {"min10": [], "min15": [], "min20": []},
     }
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = json.dumps(cached)
 
-        result = await dashboard_service.get_striking(clean_test_session)
+        result = await dashboard_service.get_striking(session=clean_test_session)
 
         assert isinstance(result, StrikingResponseDTO)
         assert result.strike_targets[0].landed == 500
@@ -166,10 +171,10 @@ async def test_get_striking_cache_hit(clean_test_session):
 
 @pytest.mark.asyncio
 async def test_get_grappling_cache_miss(clean_test_session, dashboard_data):
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = None
 
-        result = await dashboard_service.get_grappling(clean_test_session)
+        result = await dashboard_service.get_grappling(session=clean_test_session)
 
         assert isinstance(result, GrapplingResponseDTO)
         assert len(result.takedown_accuracy.min10) >= 0
@@ -192,10 +197,10 @@ async def test_get_grappling_cache_hit(clean_test_session):
             "avg_efficiency_ratio": 0.15,
         },
     }
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = json.dumps(cached)
 
-        result = await dashboard_service.get_grappling(clean_test_session)
+        result = await dashboard_service.get_grappling(session=clean_test_session)
 
         assert isinstance(result, GrapplingResponseDTO)
         assert result.submission_efficiency.avg_efficiency_ratio == 0.15
@@ -205,23 +210,146 @@ async def test_get_grappling_cache_hit(clean_test_session):
 @pytest.mark.asyncio
 async def test_get_grappling_redis_error(clean_test_session, dashboard_data):
     """Redis 에러 시에도 DB 쿼리로 정상 동작"""
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.side_effect = Exception("Redis connection failed")
         mock_redis.set.side_effect = Exception("Redis connection failed")
 
-        result = await dashboard_service.get_grappling(clean_test_session)
+        result = await dashboard_service.get_grappling(session=clean_test_session)
 
         assert isinstance(result, GrapplingResponseDTO)
         assert len(result.takedown_accuracy.min10) >= 0
 
 
+# =============================================================================
+# Cache (in-process async Redis)
+# =============================================================================
+
+@pytest.mark.asyncio
+async def test_cache_roundtrip_with_in_memory_client():
+    client = InMemoryAsyncRedis()
+    with patch(REDIS_PATCH, client):
+        await dashboard_service._set_cache("dashboard:chart:test:all", {"items": [1, 2]})
+        assert await dashboard_service._get_cached("dashboard:chart:test:all") == {"items": [1, 2]}
+        assert await dashboard_service._get_cached("dashboard:chart:missing:all") is None
+
+
+@pytest.mark.asyncio
+async def test_invalidate_all_cache_deletes_only_dashboard_keys():
+    client = InMemoryAsyncRedis()
+    await client.set("dashboard:home:all", "{}")
+    await client.set("dashboard:chart:finish_methods:all", "{}")
+    await client.set("other:key", "1")
+    with patch(REDIS_PATCH, client):
+        deleted = await dashboard_service.invalidate_all_cache()
+
+    assert deleted == 2
+    assert await client.keys("*") == ["other:key"]
+
+
+@pytest.mark.asyncio
+async def test_in_memory_client_expires_keys():
+    client = InMemoryAsyncRedis()
+    await client.set("dashboard:home:all", "{}", ex=60)
+    with patch("database.connection.redis_conn_memory.time.monotonic", return_value=time.monotonic() + 61):
+        assert await client.get("dashboard:home:all") is None
+
+
+@pytest.mark.asyncio
+async def test_stale_cache_is_deleted_from_in_memory_client():
+    client = InMemoryAsyncRedis()
+    await client.set("dashboard:chart:finish_methods:all", json.dumps({"items": [{"bad": 1}]}))
+    with patch(REDIS_PATCH, client):
+        parsed = await dashboard_service._parse_cached_data(
+            "dashboard:chart:finish_methods:all", FinishMethodDTO, {"items": [{"bad": 1}]}, is_list=True,
+        )
+
+    assert parsed is None
+    assert await client.get("dashboard:chart:finish_methods:all") is None
+
+
+# =============================================================================
+# Tab Builder
+# =============================================================================
+
+def _tracking_session_factory(opened: list):
+    """차트마다 새 세션 객체를 돌려주는 가짜 session factory"""
+    @asynccontextmanager
+    async def factory():
+        session = object()
+        opened.append(session)
+        yield session
+    return factory
+
+
+@pytest.mark.asyncio
+async def test_build_tab_runs_charts_concurrently_with_limit():
+    opened = []
+    running = 0
+    peak = 0
+
+    def chart(value):
+        async def call(session):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return (value, session)
+        return call
+
+    charts = {f"chart_{i}": chart(i) for i in range(6)}
+    result = await dashboard_service._build_tab(
+        None, charts, session_factory=_tracking_session_factory(opened), concurrency=2,
+    )
+
+    assert list(result.keys()) == list(charts.keys())
+    assert [value for value, _ in result.values()] == list(range(6))
+    # 차트마다 독립 세션 사용
+    assert len(opened) == 6
+    assert len({id(session) for _, session in result.values()}) == 6
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_build_tab_with_session_runs_sequentially():
+    session = object()
+    opened = []
+
+    async def chart(s):
+        return s
+
+    result = await dashboard_service._build_tab(
+        session, {"a": chart, "b": chart}, session_factory=_tracking_session_factory(opened),
+    )
+
+    assert result == {"a": session, "b": session}
+    assert opened == []
+
+
+@pytest.mark.asyncio
+async def test_get_striking_without_session_uses_readonly_sessions():
+    opened = []
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis, \
+         patch("dashboard.services.get_async_readonly_db_context", _tracking_session_factory(opened)), \
+         patch("dashboard.services.dashboard_repo") as mock_repo:
+        mock_redis.get.return_value = None
+        for name in dir(dashboard_repo):
+            if name.startswith("get_"):
+                setattr(mock_repo, name, AsyncMock(return_value=[]))
+
+        result = await dashboard_service.get_striking()
+
+        assert isinstance(result, StrikingResponseDTO)
+        assert len(opened) == 8
+
+
 # =============================================================================
 # Chart: Finish Methods
 # =============================================================================
 
 @pytest.mark.asyncio
 async def test_get_chart_finish_methods_cache_miss(clean_test_session, dashboard_data):
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = None
 
         result = await dashboard_service.get_chart_finish_methods(clean_test_session)
@@ -240,7 +368,7 @@ async def test_get_chart_finish_methods_cache_hit(clean_test_session):
         {"method_category": "KO/TKO", "count": 100},
         {"method_category": "SUB", "count": 50},
     ]}
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = json.dumps(cached)
 
         result = await dashboard_service.get_chart_finish_methods(clean_test_session)
@@ -256,7 +384,7 @@ async def test_get_chart_finish_methods_cache_hit(clean_test_session):
 
 @pytest.mark.asyncio
 async def test_get_chart_fight_duration_cache_miss(clean_test_session, dashboard_data):
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = None
 
         result = await dashboard_service.get_chart_fight_duration(clean_test_session)
@@ -275,7 +403,7 @@ async def test_get_chart_fight_duration_cache_hit(clean_test_session):
         "avg_round": 1.5,
         "avg_time_seconds": 300,
     }
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = json.dumps(cached)
 
         result = await dashboard_service.get_chart_fight_duration(clean_test_session)
@@ -292,7 +420,7 @@ async def test_get_chart_fight_duration_cache_hit(clean_test_session):
 
 @pytest.mark.asyncio
 async def test_get_chart_leaderboard_cache_miss(clean_test_session, dashboard_data):
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = None
 
         result = await dashboard_service.get_chart_leaderboard(clean_test_session)
@@ -311,7 +439,7 @@ async def test_get_chart_leaderboard_cache_hit(clean_test_session):
         "win_streak": [{"fighter_id": 1, "name": "Test", "win_streak": 5, "wins": 10, "losses": 1, "draws": 0}],
         "lose_streak": [{"fighter_id": 1, "name": "Test", "lose_streak": 2, "wins": 10, "losses": 1, "draws": 0}],
     }
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = json.dumps(cached)
 
         result = await dashboard_service.get_chart_leaderboard(clean_test_session)
@@ -324,7 +452,7 @@ async def test_get_chart_leaderboard_cache_hit(clean_test_session):
 @pytest.mark.asyncio
 async def test_get_chart_leaderboard_ufc_only(clean_test_session, dashboard_data):
     """ufc_only=True 시 fighter_match 기반 결과"""
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = None
 
         result = await dashboard_service.get_chart_leaderboard(
@@ -343,7 +471,7 @@ async def test_get_chart_leaderboard_ufc_only(clean_test_session, dashboard_data
 
 @pytest.mark.asyncio
 async def test_get_chart_strike_targets_cache_miss(clean_test_session, dashboard_data):
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = None
 
         result = await dashboard_service.get_chart_strike_targets(clean_test_session)
@@ -365,7 +493,7 @@ async def test_get_chart_strike_targets_cache_hit(clean_test_session):
         {"target": "Clinch", "landed": 100},
         {"target": "Ground", "landed": 50},
     ]}
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = json.dumps(cached)
 
         result = await dashboard_service.get_chart_strike_targets(clean_test_session)
@@ -381,7 +509,7 @@ async def test_get_chart_strike_targets_cache_hit(clean_test_session):
 
 @pytest.mark.asyncio
 async def test_get_chart_striking_accuracy_cache_miss(clean_test_session, dashboard_data):
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = None
 
         result = await dashboard_service.get_chart_striking_accuracy(clean_test_session)
@@ -400,7 +528,7 @@ async def test_get_chart_striking_accuracy_cache_hit(clean_test_session):
         "min15": [],
         "min20": [],
     }
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = json.dumps(cached)
 
         result = await dashboard_service.get_chart_striking_accuracy(clean_test_session)
@@ -417,7 +545,7 @@ async def test_get_chart_striking_accuracy_cache_hit(clean_test_session):
 
 @pytest.mark.asyncio
 async def test_get_chart_ko_tko_leaders_cache_miss(clean_test_session, dashboard_data):
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = None
 
         result = await dashboard_service.get_chart_ko_tko_leaders(clean_test_session)
@@ -435,7 +563,7 @@ async def test_get_chart_ko_tko_leaders_cache_hit(clean_test_session):
     cached = {"items": [
         {"fighter_id": 1, "name": "Test Fighter", "ko_tko_finishes": 15},
     ]}
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = json.dumps(cached)
 
         result = await dashboard_service.get_chart_ko_tko_leaders(clean_test_session)
@@ -451,7 +579,7 @@ async def test_get_chart_ko_tko_leaders_cache_hit(clean_test_session):
 
 @pytest.mark.asyncio
 async def test_get_chart_sig_strikes_cache_miss(clean_test_session, dashboard_data):
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = None
 
         result = await dashboard_service.get_chart_sig_strikes(clean_test_session)
@@ -470,7 +598,7 @@ async def test_get_chart_sig_strikes_cache_hit(clean_test_session):
         "min15": [],
         "min20": [],
     }
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = json.dumps(cached)
 
         result = await dashboard_service.get_chart_sig_strikes(clean_test_session)
@@ -487,7 +615,7 @@ async def test_get_chart_sig_strikes_cache_hit(clean_test_session):
 
 @pytest.mark.asyncio
 async def test_get_chart_takedown_accuracy_cache_miss(clean_test_session, dashboard_data):
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = None
 
         result = await dashboard_service.get_chart_takedown_accuracy(clean_test_session)
@@ -506,7 +634,7 @@ async def test_get_chart_takedown_accuracy_cache_hit(clean_test_session):
         "min15": [],
         "min20": [],
     }
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = json.dumps(cached)
 
         result = await dashboard_service.get_chart_takedown_accuracy(clean_test_session)
@@ -523,7 +651,7 @@ async def test_get_chart_takedown_accuracy_cache_hit(clean_test_session):
 
 @pytest.mark.asyncio
 async def test_get_chart_submission_techniques_cache_miss(clean_test_session, dashboard_data):
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = None
 
         result = await dashboard_service.get_chart_submission_techniques(clean_test_session)
@@ -542,7 +670,7 @@ async def test_get_chart_submission_techniques_cache_hit(clean_test_session):
         {"technique": "Armbar", "count": 50},
         {"technique": "Rear Naked Choke", "count": 80},
     ]}
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = json.dumps(cached)
 
         result = await dashboard_service.get_chart_submission_techniques(clean_test_session)
@@ -558,7 +686,7 @@ async def test_get_chart_submission_techniques_cache_hit(clean_test_session):
 
 @pytest.mark.asyncio
 async def test_get_chart_ground_strikes_cache_miss(clean_test_session, dashboard_data):
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = None
 
         result = await dashboard_service.get_chart_ground_strikes(clean_test_session)
@@ -573,7 +701,7 @@ async def test_get_chart_ground_strikes_cache_hit(clean_test_session):
     cached = {"items": [
         {"fighter_id": 1, "name": "A", "total_ground_landed": 200, "total_ground_attempted": 350, "accuracy": 57.1},
     ]}
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = json.dumps(cached)
 
         result = await dashboard_service.get_chart_ground_strikes(clean_test_session)
@@ -589,7 +717,7 @@ async def test_get_chart_ground_strikes_cache_hit(clean_test_session):
 
 @pytest.mark.asyncio
 async def test_get_chart_submission_efficiency_cache_miss(clean_test_session, dashboard_data):
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = None
 
         result = await dashboard_service.get_chart_submission_efficiency(clean_test_session)
@@ -609,7 +737,7 @@ async def test_get_chart_submission_efficiency_cache_hit(clean_test_session):
         ],
         "avg_efficiency_ratio": 0.45,
     }
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = json.dumps(cached)
 
         result = await dashboard_service.get_chart_submission_efficiency(clean_test_session)
@@ -626,7 +754,7 @@ async def test_get_chart_submission_efficiency_cache_hit(clean_test_session):
 
 @pytest.mark.asyncio
 async def test_get_chart_category_leaders_cache_miss(clean_test_session, dashboard_data):
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = None
 
         result = await dashboard_service.get_chart_category_leaders(clean_test_session)
@@ -642,7 +770,7 @@ async def test_get_chart_category_leaders_cache_hit(clean_test_session):
     cached = {"items": [
         {"category": "striking", "label": "Sig Strikes/Fight", "fighter_id": 1, "name": "Test", "value": 10.5, "unit": "strikes"},
     ]}
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = json.dumps(cached)
 
         result = await dashboard_service.get_chart_category_leaders(clean_test_session)
@@ -659,7 +787,7 @@ async def test_get_chart_category_leaders_cache_hit(clean_test_session):
 
 @pytest.mark.asyncio
 async def test_get_chart_finish_rate_trend_cache_miss(clean_test_session, dashboard_data):
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = None
 
         result = await dashboard_service.get_chart_finish_rate_trend(clean_test_session)
@@ -677,7 +805,7 @@ async def test_get_chart_finish_rate_trend_cache_hit(clean_test_session):
         {"year": 2020, "total_fights": 100, "ko_tko_rate": 0.35, "sub_rate": 0.10, "dec_rate": 0.55},
         {"year": 2021, "total_fights": 120, "ko_tko_rate": 0.40, "sub_rate": 0.12, "dec_rate": 0.48},
     ]}
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = json.dumps(cached)
 
         result = await dashboard_service.get_chart_finish_rate_trend(clean_test_session)
@@ -694,7 +822,7 @@ async def test_get_chart_finish_rate_trend_cache_hit(clean_test_session):
 
 @pytest.mark.asyncio
 async def test_get_chart_knockdown_leaders_cache_miss(clean_test_session, dashboard_data):
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = None
 
         result = await dashboard_service.get_chart_knockdown_leaders(clean_test_session)
@@ -710,7 +838,7 @@ async def test_get_chart_knockdown_leaders_cache_hit(clean_test_session):
     cached = {"items": [
         {"fighter_id": 1, "name": "Test Fighter", "total_knockdowns": 25, "total_fights": 15, "kd_per_fight": 1.67},
     ]}
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = json.dumps(cached)
 
         result = await dashboard_service.get_chart_knockdown_leaders(clean_test_session)
@@ -727,7 +855,7 @@ async def test_get_chart_knockdown_leaders_cache_hit(clean_test_session):
 
 @pytest.mark.asyncio
 async def test_get_chart_sig_strikes_by_wc_cache_miss(clean_test_session, dashboard_data):
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = None
 
         result = await dashboard_service.get_chart_sig_strikes_by_wc(clean_test_session)
@@ -743,7 +871,7 @@ async def test_get_chart_sig_strikes_by_wc_cache_hit(clean_test_session):
     cached = {"items": [
         {"weight_class": "Lightweight", "avg_sig_str_per_fight": 8.5, "total_fights": 200},
     ]}
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = json.dumps(cached)
 
         result = await dashboard_service.get_chart_sig_strikes_by_wc(clean_test_session)
@@ -760,7 +888,7 @@ async def test_get_chart_sig_strikes_by_wc_cache_hit(clean_test_session):
 
 @pytest.mark.asyncio
 async def test_get_chart_strike_exchange_cache_miss(clean_test_session, dashboard_data):
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = None
 
         result = await dashboard_service.get_chart_strike_exchange(clean_test_session)
@@ -778,7 +906,7 @@ async def test_get_chart_strike_exchange_cache_hit(clean_test_session):
         "min15": [],
         "min20": [],
     }
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = json.dumps(cached)
 
         result = await dashboard_service.get_chart_strike_exchange(clean_test_session)
@@ -795,7 +923,7 @@ async def test_get_chart_strike_exchange_cache_hit(clean_test_session):
 
 @pytest.mark.asyncio
 async def test_get_chart_stance_winrate_cache_miss(clean_test_session, dashboard_data):
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = None
 
         result = await dashboard_service.get_chart_stance_winrate(clean_test_session)
@@ -812,7 +940,7 @@ async def test_get_chart_stance_winrate_cache_hit(clean_test_session):
     cached = {"items": [
         {"winner_stance": "Orthodox", "loser_stance": "Southpaw", "wins": 150, "win_rate": 0.65},
     ]}
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = json.dumps(cached)
 
         result = await dashboard_service.get_chart_stance_winrate(clean_test_session)
@@ -829,7 +957,7 @@ async def test_get_chart_stance_winrate_cache_hit(clean_test_session):
 
 @pytest.mark.asyncio
 async def test_get_chart_td_attempts_leaders_cache_miss(clean_test_session, dashboard_data):
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = None
 
         result = await dashboard_service.get_chart_td_attempts_leaders(clean_test_session)
@@ -848,7 +976,7 @@ async def test_get_chart_td_attempts_leaders_cache_hit(clean_test_session):
         "min20": [],
         "avg_td_attempts": 3.2,
     }
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = json.dumps(cached)
 
         result = await dashboard_service.get_chart_td_attempts_leaders(clean_test_session)
@@ -866,7 +994,7 @@ async def test_get_chart_td_attempts_leaders_cache_hit(clean_test_session):
 
 @pytest.mark.asyncio
 async def test_get_chart_td_sub_correlation_cache_miss(clean_test_session, dashboard_data):
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = None
 
         result = await dashboard_service.get_chart_td_sub_correlation(clean_test_session)
@@ -894,7 +1022,7 @@ async def test_get_chart_td_sub_correlation_cache_hit(clean_test_session):
         "avg_td": 4.5,
         "avg_sub": 0.8,
     }
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = json.dumps(cached)
 
         result = await dashboard_service.get_chart_td_sub_correlation(clean_test_session)
@@ -912,7 +1040,7 @@ async def test_get_chart_td_sub_correlation_cache_hit(clean_test_session):
 
 @pytest.mark.asyncio
 async def test_get_chart_td_defense_leaders_cache_miss(clean_test_session, dashboard_data):
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = None
 
         result = await dashboard_service.get_chart_td_defense_leaders(clean_test_session)
@@ -930,7 +1058,7 @@ async def test_get_chart_td_defense_leaders_cache_hit(clean_test_session):
         "min15": [],
         "min20": [],
     }
-    with patch(REDIS_PATCH) as mock_redis:
+    with patch(REDIS_PATCH, new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = json.dumps(cached)
 
         result = await dashboard_service.get_chart_td_defense_leaders(clean_test_session)
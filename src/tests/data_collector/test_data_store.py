@@ -1,12 +1,24 @@
-from datetime import date
+from datetime import date, datetime, timedelta
 from pathlib import Path
 
 import pytest
 import pytest_asyncio
 from sqlalchemy import text
 
-from data_collector.workflows.data_store import save_fighter_match, save_match
-from match.models import MatchSchema
+from data_collector.workflows.data_store import (
+    save_basic_match_stat,
+    save_event_detail_scraped,
+    save_event_match_stats_scraped,
+    save_fighter_match,
+    save_fighter_matches,
+    save_fighters,
+    save_match,
+    save_matches,
+)
+from data_collector.workflows.tasks import get_events_pending_scrape
+from event.models import EventModel
+from fighter.models import FighterSchema
+from match.models import BasicMatchStatSchema, FighterMatchSchema, MatchSchema
 
 
 BONUS_METADATA_SQL_PATH = (
@@ -15,6 +27,9 @@ BONUS_METADATA_SQL_PATH = (
 TAPOLOGY_ENRICHMENT_SQL_PATH = (
     Path(__file__).resolve().parents[3] / "init_sqls" / "05_add_tapology_enrichment.sql"
 )
+EVENT_SCRAPE_STATE_SQL_PATH = (
+    Path(__file__).resolve().parents[3] / "init_sqls" / "08_add_event_scrape_state.sql"
+)
 
 
 async def _apply_bonus_metadata_sql(session):
@@ -32,6 +47,35 @@ async def _scalar_id(session, statement: str, **params):
 
 
 async def _cleanup_bonus_data_store_rows(session):
+    await session.execute(
+        text(
+            """
+            DELETE FROM match_statistics
+            WHERE fighter_match_id IN (
+                SELECT fm.id FROM fighter_match fm
+                JOIN match m ON fm.match_id = m.id
+                WHERE m.detail_url LIKE 'http://ufcstats.com/fight-details/bulk-%'
+            )
+            """
+        )
+    )
+    await session.execute(
+        text(
+            """
+            DELETE FROM fighter_match
+            WHERE match_id IN (
+                SELECT id FROM match
+                WHERE detail_url LIKE 'http://ufcstats.com/fight-details/bulk-%'
+            )
+            """
+        )
+    )
+    await session.execute(
+        text("DELETE FROM match WHERE detail_url LIKE 'http://ufcstats.com/fight-details/bulk-%'")
+    )
+    await session.execute(
+        text("DELETE FROM fighter WHERE detail_url LIKE 'http://ufcstats.com/fighter-details/bulk-%'")
+    )
     await session.execute(
         text(
             """
@@ -57,8 +101,9 @@ async def _cleanup_bonus_data_store_rows(session):
             """
         )
     )
-    await session.execute(text("DELETE FROM fighter WHERE name = 'Bonus Winner'"))
+    await session.execute(text("DELETE FROM fighter WHERE name IN ('Bonus Winner', 'Bulk Red', 'Bulk Blue')"))
     await session.execute(text("DELETE FROM event WHERE name = 'UFC Bonus Test'"))
+    await session.execute(text("DELETE FROM event WHERE name LIKE 'UFC Scrape State %'"))
     await session.commit()
 
 
@@ -74,7 +119,7 @@ async def test_save_match_preserves_existing_true_bonus_flags(clean_test_session
     await _apply_bonus_metadata_sql(clean_test_session)
     event_id = await _scalar_id(
         clean_test_session,
-        "INSERT INTO event (name, event_date) VALUES (:name, :event_date) RETURNING id",
+        "INSERT INTO event (name, location, event_date) VALUES (:name, 'Las Vegas', :event_date) RETURNING id",
         name="UFC Bonus Test",
         event_date=date(2024, 1, 1),
     )
@@ -113,7 +158,7 @@ async def test_save_fighter_match_preserves_existing_performance_bonus(clean_tes
     )
     event_id = await _scalar_id(
         clean_test_session,
-        "INSERT INTO event (name, event_date) VALUES (:name, :event_date) RETURNING id",
+        "INSERT INTO event (name, location, event_date) VALUES (:name, 'Las Vegas', :event_date) RETURNING id",
         name="UFC Bonus Test",
         event_date=date(2024, 1, 1),
     )
@@ -144,3 +189,152 @@ async def test_save_fighter_match_preserves_existing_performance_bonus(clean_tes
     )
 
     assert refreshed.has_performance_of_the_night_bonus is True
+
+
+@pytest.mark.asyncio
+async def test_save_matches_upserts_in_one_statement_and_keeps_ids(clean_test_session):
+    await _apply_bonus_metadata_sql(clean_test_session)
+    event_id = await _scalar_id(
+        clean_test_session,
+        "INSERT INTO event (name, location, event_date) VALUES (:name, 'Las Vegas', :event_date) RETURNING id",
+        name="UFC Bonus Test",
+        event_date=date(2024, 1, 1),
+    )
+    urls = [f"http://ufcstats.com/fight-details/bulk-{i}" for i in range(3)]
+
+    saved = await save_matches(
+        clean_test_session,
+        [
+            MatchSchema(event_id=event_id, detail_url=url, order=i, tapology_bout_url=f"https://tapology/{i}")
+            for i, url in enumerate(urls)
+        ],
+    )
+    assert [match.detail_url for match in saved] == urls
+
+    refreshed = await save_matches(
+        clean_test_session,
+        [MatchSchema(event_id=event_id, detail_url=url, order=10 + i) for i, url in enumerate(reversed(urls))],
+    )
+
+    saved_ids = {match.detail_url: match.id for match in saved}
+    assert [match.detail_url for match in refreshed] == list(reversed(urls))
+    assert all(match.id == saved_ids[match.detail_url] for match in refreshed)
+    assert [match.order for match in refreshed] == [10, 11, 12]
+    # Tapology 필드는 None이면 기존 값 유지
+    assert refreshed[0].tapology_bout_url == "https://tapology/2"
+
+
+@pytest.mark.asyncio
+async def test_save_fighter_matches_and_round_stats_upsert(clean_test_session):
+    await _apply_bonus_metadata_sql(clean_test_session)
+    event_id = await _scalar_id(
+        clean_test_session,
+        "INSERT INTO event (name, location, event_date) VALUES (:name, 'Las Vegas', :event_date) RETURNING id",
+        name="UFC Bonus Test",
+        event_date=date(2024, 1, 1),
+    )
+    red_id = await _scalar_id(clean_test_session, "INSERT INTO fighter (name) VALUES ('Bulk Red') RETURNING id")
+    blue_id = await _scalar_id(clean_test_session, "INSERT INTO fighter (name) VALUES ('Bulk Blue') RETURNING id")
+    match = await save_match(
+        clean_test_session,
+        MatchSchema(event_id=event_id, detail_url="http://ufcstats.com/fight-details/bulk-stats"),
+    )
+
+    fighter_matches = await save_fighter_matches(
+        clean_test_session,
+        [
+            FighterMatchSchema(fighter_id=red_id, match_id=match.id, result="win"),
+            FighterMatchSchema(fighter_id=blue_id, match_id=match.id, result="loss"),
+        ],
+    )
+    assert [fm.fighter_id for fm in fighter_matches] == [red_id, blue_id]
+    red_fm_id = fighter_matches[0].id
+
+    first_ids = await save_basic_match_stat(
+        clean_test_session,
+        [
+            BasicMatchStatSchema(fighter_match_id=red_fm_id, round=1, knockdowns=0),
+            BasicMatchStatSchema(fighter_match_id=red_fm_id, round=2, knockdowns=1),
+        ],
+    )
+    second_ids = await save_basic_match_stat(
+        clean_test_session,
+        [BasicMatchStatSchema(fighter_match_id=red_fm_id, round=2, knockdowns=2)],
+    )
+
+    assert len(first_ids) == 2
+    assert second_ids == [first_ids[1]]
+    knockdowns = await _scalar_id(
+        clean_test_session,
+        "SELECT knockdowns FROM match_statistics WHERE id = :id",
+        id=first_ids[1],
+    )
+    assert knockdowns == 2
+
+
+@pytest.mark.asyncio
+async def test_save_fighters_upserts_by_detail_url_and_keeps_existing_values(clean_test_session):
+    detail_url = "http://ufcstats.com/fighter-details/bulk-red"
+    await save_fighters(
+        clean_test_session,
+        [FighterSchema(name="Bulk Red", detail_url=detail_url, nationality="Korea", wins=1)],
+    )
+    await save_fighters(
+        clean_test_session,
+        [
+            FighterSchema(name="Bulk Red", detail_url=detail_url, nationality=None, wins=2),
+            FighterSchema(name="Bulk Red", detail_url=detail_url, nationality=None, wins=3),
+        ],
+    )
+
+    result = await clean_test_session.execute(
+        text("SELECT COUNT(*), MAX(wins), MAX(nationality) FROM fighter WHERE detail_url = :url"),
+        {"url": detail_url},
+    )
+    count, wins, nationality = result.one()
+    assert count == 1
+    assert wins == 3
+    assert nationality == "Korea"
+
+
+@pytest.mark.asyncio
+async def test_pending_scrape_events_skip_settled_events(clean_test_session):
+    session = clean_test_session
+    for statement in EVENT_SCRAPE_STATE_SQL_PATH.read_text(encoding="utf-8").split(";"):
+        # 주석만 남은 조각은 건너뛴다
+        statement = statement.strip()
+        if statement and "ALTER" in statement:
+            await session.execute(text(statement))
+
+    today = date.today()
+    old_date = today - timedelta(days=400)
+    recent_date = today - timedelta(days=2)
+    ids = {}
+    for name, event_date in (
+        ("UFC Scrape State Never", old_date),
+        ("UFC Scrape State Settled", old_date),
+        ("UFC Scrape State Unsettled", recent_date),
+    ):
+        ids[name] = await _scalar_id(
+            session,
+            "INSERT INTO event (name, location, event_date) VALUES (:name, 'Las Vegas', :event_date) RETURNING id",
+            name=name,
+            event_date=event_date,
+        )
+    await session.commit()
+
+    # 확정 이후 수집된 과거 이벤트 / 확정 전에 수집된 최근 이벤트
+    await save_event_detail_scraped(session, ids["UFC Scrape State Settled"], datetime.combine(today, datetime.min.time()))
+    await save_event_detail_scraped(session, ids["UFC Scrape State Unsettled"], datetime.combine(today, datetime.min.time()))
+    await save_event_match_stats_scraped(session, list(ids.values()), datetime.combine(today, datetime.min.time()))
+
+    pending_detail = await get_events_pending_scrape(session, EventModel.detail_scraped_at)
+    pending_detail_ids = {event.id for event in pending_detail}
+    assert ids["UFC Scrape State Never"] in pending_detail_ids
+    assert ids["UFC Scrape State Unsettled"] in pending_detail_ids
+    assert ids["UFC Scrape State Settled"] not in pending_detail_ids
+
+    pending_stats = await get_events_pending_scrape(session, EventModel.match_stats_scraped_at)
+    pending_stats_ids = {event.id for event in pending_stats}
+    assert ids["UFC Scrape State Unsettled"] in pending_stats_ids
+    assert ids["UFC Scrape State Never"] not in pending_stats_ids
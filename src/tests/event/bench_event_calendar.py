@@ -0,0 +1,72 @@
+"""이벤트 캘린더 그룹화 benchmark
+
+실행: uv run python tests/event/bench_event_calendar.py [--years N] [--events-per-day N]
+
+get_events_calendar의 일별 그룹화를 기존 방식(달력의 각 날짜마다 그 달 이벤트 전체를 훑는 방식)과
+한 번 순회로 그룹화하는 방식(event.services._group_events_by_day)으로 비교한다.
+여러 해에 걸친 합성 이벤트로 모든 월 캘린더를 만들며 DB 접근은 없다.
+"""
+import argparse
+import os
+import sys
+import time
+from calendar import monthrange
+from datetime import date
+
+# src/ 디렉토리를 path에 추가 (tests/event/ → tests/ → src/)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from event.models import EventSchema
+from event.services import _group_events_by_day
+
+START_YEAR = 2000
+
+
+def _legacy_group_by_day(events, year, month):
+    """기존 구현: 날짜마다 월 전체 이벤트 스캔 (days × events)"""
+    _, days_in_month = monthrange(year, month)
+    calendar_data = {}
+    for day in range(1, days_in_month + 1):
+        day_date = date(year, month, day)
+        day_events = [e for e in events if e.event_date == day_date]
+        if day_events:
+            calendar_data[str(day)] = day_events
+    return calendar_data
+
+
+def _make_events(years: int, events_per_day: int) -> dict:
+    """(year, month) → 해당 월 이벤트 목록"""
+    by_month = {}
+    for year in range(START_YEAR, START_YEAR + years):
+        for month in range(1, 13):
+            _, days_in_month = monthrange(year, month)
+            by_month[(year, month)] = [
+                EventSchema(name=f"Event {year}-{month}-{day}-{idx}", event_date=date(year, month, day))
+                for day in range(1, days_in_month + 1)
+                for idx in range(events_per_day)
+            ]
+    return by_month
+
+
+def _run(label: str, by_month: dict, build) -> dict:
+    started_at = time.perf_counter()
+    calendars = {key: build(events, *key) for key, events in by_month.items()}
+    elapsed_ms = (time.perf_counter() - started_at) * 1000
+    total_events = sum(len(events) for events in by_month.values())
+    print(f"{label:<12} months={len(by_month):4d} events={total_events:7d} {elapsed_ms:9.1f} ms")
+    return calendars
+
+
+def main(years: int, events_per_day: int):
+    by_month = _make_events(years, events_per_day)
+    before = _run("per-day scan", by_month, _legacy_group_by_day)
+    after = _run("single pass", by_month, lambda events, year, month: _group_events_by_day(events))
+    assert before == after, "grouping results differ"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="event calendar grouping benchmark")
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--events-per-day", type=int, default=3)
+    args = parser.parse_args()
+    main(args.years, args.events_per_day)
@@ -215,6 +215,38 @@ async def test_get_events_calendar_yearly(multiple_events_different_dates, clean
     assert isinstance(result.monthly_breakdown, dict)
 
 
+def test_group_events_by_day_single_pass_sorted_keys():
+    """일별 그룹화: 입력 순서와 무관하게 일자 오름차순 키, 같은 날 이벤트는 입력 순서 유지"""
+    from event.models import EventSchema
+
+    events = [
+        EventSchema(name="C", event_date=date(2024, 8, 17)),
+        EventSchema(name="A", event_date=date(2024, 8, 3)),
+        EventSchema(name="B", event_date=date(2024, 8, 17)),
+        EventSchema(name="No Date", event_date=None),
+    ]
+
+    calendar = event_service._group_events_by_day(events)
+
+    assert list(calendar.keys()) == ["3", "17"]
+    assert [e.name for e in calendar["17"]] == ["C", "B"]
+
+
+def test_group_events_by_month():
+    """월별 그룹화: 0으로 채운 두 자리 월 키"""
+    from event.models import EventSchema
+
+    events = [
+        EventSchema(name="Jan", event_date=date(2024, 1, 20)),
+        EventSchema(name="Oct", event_date=date(2024, 10, 5)),
+        EventSchema(name="Oct 2", event_date=date(2024, 10, 26)),
+    ]
+
+    breakdown = event_service._group_events_by_month(events)
+
+    assert {key: len(value) for key, value in breakdown.items()} == {"01": 1, "10": 2}
+
+
 @pytest.mark.asyncio
 async def test_get_events_calendar_invalid_year(clean_test_session):
     """잘못된 연도로 캘린더 조회"""
@@ -1,12 +1,13 @@
 """
 Fighter Detail 기능 테스트
-- Repository: get_fight_history, get_per_match_stats, get_finish_breakdown
+- Repository: get_fight_history_with_stats, get_fighter_detail_summary
 - Service: get_fighter_detail
 - Helper: _calc_current_streak, _calc_age
 """
 import pytest
 import pytest_asyncio
 from datetime import date, timedelta
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from fighter.models import (
@@ -18,6 +19,7 @@ from fighter.models import (
 from match.models import MatchModel, FighterMatchModel, BasicMatchStatModel, SigStrMatchStatModel
 from event.models import EventModel
 from fighter import repositories as fighter_repo
+from match.dto import FighterBasicStatsAggregateDTO, FighterSigStrStatsAggregateDTO
 from fighter import services as fighter_services
 from fighter.services import _calc_current_streak, _calc_age
 from fighter.dto import FighterDetailResponseDTO
@@ -309,16 +311,16 @@ class TestCalcAge:
 
 
 # =============================================================================
-# Repository 테스트: get_fight_history
+# Repository 테스트: get_fight_history_with_stats
 # =============================================================================
 
 @pytest.mark.asyncio
-async def test_get_fight_history_success(fighter_detail_data, clean_test_session):
-    """파이터의 경기 이력을 정상 조회"""
+async def test_get_fight_history_with_stats_success(fighter_detail_data, clean_test_session):
+    """파이터의 경기 이력과 경기별 스탯을 정상 조회"""
     data = fighter_detail_data
     fighter_a = data["fighter_a"]
 
-    rows = await fighter_repo.get_fight_history(clean_test_session, fighter_a.id)
+    rows, stats_map = await fighter_repo.get_fight_history_with_stats(clean_test_session, fighter_a.id)
 
     # 3경기 조회
     assert len(rows) == 3
@@ -339,40 +341,12 @@ async def test_get_fight_history_success(fighter_detail_data, clean_test_session
     assert first["opponent_nationality"] == "United States"
     assert first["fighter_match_id"] is not None
 
-
-@pytest.mark.asyncio
-async def test_get_fight_history_no_matches(fighter_no_matches, clean_test_session):
-    """경기가 없는 파이터의 이력 조회"""
-    rows = await fighter_repo.get_fight_history(clean_test_session, fighter_no_matches.id)
-    assert rows == []
-
-
-@pytest.mark.asyncio
-async def test_get_fight_history_nonexistent_fighter(clean_test_session):
-    """존재하지 않는 파이터 ID"""
-    rows = await fighter_repo.get_fight_history(clean_test_session, 99999)
-    assert rows == []
-
-
-# =============================================================================
-# Repository 테스트: get_per_match_stats
-# =============================================================================
-
-@pytest.mark.asyncio
-async def test_get_per_match_stats_success(fighter_detail_data, clean_test_session):
-    """경기별 스탯 배치 조회"""
-    fms_a = fighter_detail_data["fms_a"]
-    fm_ids = [fm.id for fm in fms_a]
-
-    stats_map = await fighter_repo.get_per_match_stats(clean_test_session, fm_ids)
-
     # 3개 fighter_match에 대해 모두 스탯 존재
-    assert len(stats_map) == 3
-
-    for fm_id in fm_ids:
-        assert fm_id in stats_map
-        assert "basic" in stats_map[fm_id]
-        assert "sig_str" in stats_map[fm_id]
+    fms_a = data["fms_a"]
+    assert stats_map.keys() == {fm.id for fm in fms_a}
+    for fm_stats in stats_map.values():
+        assert "basic" in fm_stats
+        assert "sig_str" in fm_stats
 
     # 첫 번째 매치 basic 스탯 값 확인
     basic_0 = stats_map[fms_a[0].id]["basic"]
@@ -388,53 +362,180 @@ async def test_get_per_match_stats_success(fighter_detail_data, clean_test_sessi
 
 
 @pytest.mark.asyncio
-async def test_get_per_match_stats_empty_list(clean_test_session):
-    """빈 리스트면 빈 dict 반환"""
-    stats_map = await fighter_repo.get_per_match_stats(clean_test_session, [])
+async def test_get_fight_history_with_stats_without_stats(fighter_detail_data, clean_test_session):
+    """스탯이 없는 경기는 이력에는 포함되고 stats_map에는 없음"""
+    fighter_b = fighter_detail_data["fighter_b"]
+
+    rows, stats_map = await fighter_repo.get_fight_history_with_stats(clean_test_session, fighter_b.id)
+
+    assert len(rows) == 3
     assert stats_map == {}
 
 
 @pytest.mark.asyncio
-async def test_get_per_match_stats_nonexistent_ids(clean_test_session):
-    """존재하지 않는 ID들"""
-    stats_map = await fighter_repo.get_per_match_stats(clean_test_session, [99998, 99999])
-    assert stats_map == {}
+async def test_get_fight_history_with_stats_no_matches(fighter_no_matches, clean_test_session):
+    """경기가 없는 파이터의 이력 조회"""
+    assert await fighter_repo.get_fight_history_with_stats(clean_test_session, fighter_no_matches.id) == ([], {})
+
+
+@pytest.mark.asyncio
+async def test_get_fight_history_with_stats_nonexistent_fighter(clean_test_session):
+    """존재하지 않는 파이터 ID"""
+    assert await fighter_repo.get_fight_history_with_stats(clean_test_session, 99999) == ([], {})
 
 
 # =============================================================================
-# Repository 테스트: get_finish_breakdown
+# Repository 테스트: get_fighter_detail_summary
 # =============================================================================
 
 @pytest.mark.asyncio
-async def test_get_finish_breakdown_success(fighter_detail_data, clean_test_session):
-    """피니시 방법별 집계"""
-    fighter_a = fighter_detail_data["fighter_a"]
+async def test_get_fighter_detail_summary_success(fighter_detail_data, clean_test_session):
+    """fighter, 랭킹, non-UFC 기록, 피니시 집계를 한 번에 조회"""
+    data = fighter_detail_data
+    fighter_id = data["fighter_a"].id
+
+    summary = await fighter_repo.get_fighter_detail_summary(clean_test_session, fighter_id)
+
+    fighter = await fighter_repo.get_fighter_by_id(clean_test_session, fighter_id)
+    assert summary["fighter"].model_dump(exclude={"created_at", "updated_at"}) == \
+        fighter.model_dump(exclude={"created_at", "updated_at"})
+    assert [(r.weight_class_id, r.ranking) for r in summary["rankings"]] == [(4, 0)]
+    # promotion_name 순서
+    assert [(r.promotion_name, r.wins, r.losses) for r in summary["promotion_records"]] == [
+        ("LFA - Legacy Fighting Alliance", 2, 0),
+        ("PFL - Professional Fighters League", 1, 1),
+    ]
+    # scope/result/method_category 순서
+    assert [(r.scope, r.result, r.method_category, r.count) for r in summary["method_records"]] == [
+        ("non_ufc", "loss", "DEC", 1),
+        ("non_ufc", "win", "KO/TKO", 2),
+    ]
+    assert summary["finish_breakdown"] == {"ko_tko": 1, "submission": 1, "decision": 1}
+    # "Submission"은 SUB- 기술 표기가 아니므로 top submission 없음
+    assert summary["top_submission"] is None
+
+
+@pytest.mark.asyncio
+async def test_get_fighter_detail_summary_career_aggregates(fighter_detail_data, clean_test_session):
+    """커리어 집계: basic/sig_str 합산 + 상대 TD/넉다운"""
+    summary = await fighter_repo.get_fighter_detail_summary(
+        clean_test_session, fighter_detail_data["fighter_a"].id
+    )
+
+    basic = summary["basic_agg"]
+    assert isinstance(basic, FighterBasicStatsAggregateDTO)
+    assert basic.match_count == 3
+    assert basic.knockdowns == 1
+    assert basic.sig_str_landed == 100
+    assert basic.sig_str_attempted == 175
+    assert basic.td_landed == 6
+    assert basic.td_attempted == 10
+    assert basic.control_time_seconds == 420
+    assert basic.submission_attempts == 3
+    # 상대(fighter_b)는 스탯이 없음
+    assert basic.opp_td_landed == 0
+    assert basic.opp_td_attempted == 0
+    assert basic.opp_knockdowns == 0
+
+    sig_str = summary["sig_str_agg"]
+    assert isinstance(sig_str, FighterSigStrStatsAggregateDTO)
+    assert sig_str.match_count == 3
+    assert sig_str.head_strikes_landed == 52
+    assert sig_str.body_strikes_landed == 30
+    assert sig_str.leg_strikes_landed == 18
+    assert sig_str.clinch_strikes_landed == 6
+    assert sig_str.ground_strikes_landed == 3
+
+
+@pytest.mark.asyncio
+async def test_get_fighter_detail_summary_opponent_takedowns(match_with_statistics, clean_test_session):
+    """상대의 TD/넉다운이 opp_* 필드로 집계됨 (TD 방어율 산출용)"""
+    match, fighters, fighter_matches, basic_stats, strike_stats = match_with_statistics
+
+    summary = await fighter_repo.get_fighter_detail_summary(clean_test_session, fighters[0].id)
+
+    basic = summary["basic_agg"]
+    assert basic.match_count == 1
+    assert basic.knockdowns == 1
+    assert basic.control_time_seconds == 240
+    assert basic.submission_attempts == 2
+    assert basic.opp_td_landed == 1
+    assert basic.opp_td_attempted == 4
+    assert basic.opp_knockdowns == 0
 
-    breakdown = await fighter_repo.get_finish_breakdown(clean_test_session, fighter_a.id)
+    sig_str = summary["sig_str_agg"]
+    assert sig_str.match_count == 1
+    assert sig_str.head_strikes_landed == 25
+    assert sig_str.head_strikes_attempts == 40
+    assert sig_str.body_strikes_landed == 15
+    assert sig_str.takedowns_landed == 3
 
-    assert breakdown["ko_tko"] == 1
-    assert breakdown["submission"] == 1
-    assert breakdown["decision"] == 1
+
+@pytest.mark.asyncio
+async def test_get_fighter_detail_summary_top_submission(clean_test_session):
+    """가장 많이 성공한 SUB- 기술 (패배한 서브미션은 제외)"""
+    session = clean_test_session
+    fighter = FighterModel(name="Submission Specialist", wins=3, losses=1, draws=0)
+    session.add(fighter)
+    await session.flush()
+
+    methods = [
+        ("SUB-Rear Naked Choke", "Win"),
+        ("SUB-Armbar", "Win"),
+        ("SUB-Rear Naked Choke", "Win"),
+        ("SUB-Armbar", "Loss"),
+        ("SUB-Armbar", "Loss"),
+    ]
+    for idx, (method, result) in enumerate(methods):
+        match = MatchModel(weight_class_id=4, method=method, result_round=1, order=idx + 1)
+        session.add(match)
+        await session.flush()
+        session.add(FighterMatchModel(fighter_id=fighter.id, match_id=match.id, result=result))
+    await session.flush()
+
+    summary = await fighter_repo.get_fighter_detail_summary(session, fighter.id)
+
+    assert summary["top_submission"] == "Rear Naked Choke"
+    assert summary["finish_breakdown"]["submission"] == 3
 
 
 @pytest.mark.asyncio
-async def test_get_finish_breakdown_no_wins(fighter_no_matches, clean_test_session):
-    """승리가 없는 파이터"""
-    breakdown = await fighter_repo.get_finish_breakdown(clean_test_session, fighter_no_matches.id)
+async def test_get_fighter_detail_summary_no_matches(fighter_no_matches, clean_test_session):
+    """경기/기록이 없으면 빈 리스트와 0 집계"""
+    summary = await fighter_repo.get_fighter_detail_summary(clean_test_session, fighter_no_matches.id)
 
-    assert breakdown["ko_tko"] == 0
-    assert breakdown["submission"] == 0
-    assert breakdown["decision"] == 0
+    assert summary["fighter"].name == "No Match Fighter"
+    assert summary["rankings"] == []
+    assert summary["promotion_records"] == []
+    assert summary["method_records"] == []
+    assert summary["top_submission"] is None
+    assert summary["finish_breakdown"] == {"ko_tko": 0, "submission": 0, "decision": 0}
+    assert summary["basic_agg"] == FighterBasicStatsAggregateDTO()
+    assert summary["sig_str_agg"] == FighterSigStrStatsAggregateDTO()
 
 
 @pytest.mark.asyncio
-async def test_get_finish_breakdown_nonexistent_fighter(clean_test_session):
-    """존재하지 않는 파이터"""
-    breakdown = await fighter_repo.get_finish_breakdown(clean_test_session, 99999)
+async def test_get_fighter_detail_summary_nonexistent_fighter(clean_test_session):
+    """존재하지 않는 파이터는 None"""
+    assert await fighter_repo.get_fighter_detail_summary(clean_test_session, 99999) is None
+
+
+@pytest.mark.asyncio
+async def test_get_fighter_detail_uses_two_round_trips(fighter_detail_data, clean_test_session):
+    """경기 수와 무관하게 상세 조회는 2번의 쿼리로 끝난다"""
+    statements = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = clean_test_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", count_statement)
+    try:
+        await fighter_services.get_fighter_detail(clean_test_session, fighter_detail_data["fighter_a"].id)
+    finally:
+        event.remove(engine, "before_cursor_execute", count_statement)
 
-    assert breakdown["ko_tko"] == 0
-    assert breakdown["submission"] == 0
-    assert breakdown["decision"] == 0
+    assert len(statements) == 2
 
 
 # =============================================================================
@@ -331,12 +331,32 @@ async def test_get_ranking_by_fighter_id_no_rankings(clean_test_session):
     assert len(result) == 0
 
 
+@pytest.mark.asyncio
+async def test_get_rankings_by_fighter_ids_groups_by_fighter(fighter_with_rankings, clean_test_session):
+    """여러 파이터의 랭킹을 fighter_id별로 묶어서 조회"""
+    fighter, rankings = fighter_with_rankings
+    unranked = FighterModel(name="Unranked Batch Prospect", wins=1, losses=0, draws=0)
+    clean_test_session.add(unranked)
+    await clean_test_session.flush()
+
+    result = await fighter_repo.get_rankings_by_fighter_ids(clean_test_session, [fighter.id, unranked.id])
+
+    assert set(result.keys()) == {fighter.id}
+    assert {r.weight_class_id: r.ranking for r in result[fighter.id]} == {4: 3, 5: 5}
+
+
+@pytest.mark.asyncio
+async def test_get_rankings_by_fighter_ids_empty(clean_test_session):
+    """빈 id 목록이면 쿼리 없이 빈 dict"""
+    assert await fighter_repo.get_rankings_by_fighter_ids(clean_test_session, []) == {}
+
+
 # =============================================================================
-# get_fighter_promotion_records / get_fighter_method_records 테스트
+# get_fighter_detail_summary non-UFC 기록 테스트
 # =============================================================================
 
 @pytest.mark.asyncio
-async def test_get_fighter_promotion_records_ordered(clean_test_session):
+async def test_get_fighter_detail_summary_promotion_records_ordered(clean_test_session):
     """non-UFC promotion 기록을 promotion_name 순서로 조회"""
     fighter = FighterModel(name="Promotion Record Fighter", wins=10, losses=2, draws=0)
     clean_test_session.add(fighter)
@@ -359,7 +379,8 @@ async def test_get_fighter_promotion_records_ordered(clean_test_session):
     clean_test_session.add_all(records)
     await clean_test_session.flush()
 
-    result = await fighter_repo.get_fighter_promotion_records(clean_test_session, fighter.id)
+    summary = await fighter_repo.get_fighter_detail_summary(clean_test_session, fighter.id)
+    result = summary["promotion_records"]
 
     assert [(record.promotion_name, record.wins, record.losses) for record in result] == [
         ("LFA", 2, 0),
@@ -368,7 +389,7 @@ async def test_get_fighter_promotion_records_ordered(clean_test_session):
 
 
 @pytest.mark.asyncio
-async def test_get_fighter_method_records_ordered(clean_test_session):
+async def test_get_fighter_detail_summary_method_records_ordered(clean_test_session):
     """non-UFC method 기록을 scope/result/method_category 순서로 조회"""
     fighter = FighterModel(name="Method Record Fighter", wins=10, losses=2, draws=0)
     clean_test_session.add(fighter)
@@ -400,7 +421,8 @@ async def test_get_fighter_method_records_ordered(clean_test_session):
     clean_test_session.add_all(records)
     await clean_test_session.flush()
 
-    result = await fighter_repo.get_fighter_method_records(clean_test_session, fighter.id)
+    summary = await fighter_repo.get_fighter_detail_summary(clean_test_session, fighter.id)
+    result = summary["method_records"]
 
     assert [
         (record.scope, record.result, record.method_category, record.count)
@@ -413,16 +435,16 @@ async def test_get_fighter_method_records_ordered(clean_test_session):
 
 
 @pytest.mark.asyncio
-async def test_get_fighter_non_ufc_records_empty(clean_test_session):
-    """기록이 없거나 존재하지 않는 fighter_id는 빈 리스트 반환"""
+async def test_get_fighter_detail_summary_non_ufc_records_empty(clean_test_session):
+    """기록이 없으면 빈 리스트 반환"""
     fighter = FighterModel(name="No Non UFC Records Fighter", wins=4, losses=1, draws=0)
     clean_test_session.add(fighter)
     await clean_test_session.flush()
 
-    assert await fighter_repo.get_fighter_promotion_records(clean_test_session, fighter.id) == []
-    assert await fighter_repo.get_fighter_method_records(clean_test_session, fighter.id) == []
-    assert await fighter_repo.get_fighter_promotion_records(clean_test_session, 99999) == []
-    assert await fighter_repo.get_fighter_method_records(clean_test_session, 99999) == []
+    summary = await fighter_repo.get_fighter_detail_summary(clean_test_session, fighter.id)
+
+    assert summary["promotion_records"] == []
+    assert summary["method_records"] == []
 
 
 # =============================================================================
@@ -538,6 +560,62 @@ async def test_search_fighters_by_nickname(clean_test_session):
     assert result[0].name == "Jon Jones"
 
 
+@pytest.mark.asyncio
+async def test_search_fighters_falls_back_to_ilike_without_pg_trgm(clean_test_session, monkeypatch):
+    """pg_trgm이 없으면 기존 부분 매칭 검색"""
+    monkeypatch.setattr(fighter_repo, "_pg_trgm_available", False)
+    clean_test_session.add(FighterModel(name="khabib nurmagomedov", nickname="the eagle", wins=29, losses=0, draws=0))
+    await clean_test_session.flush()
+
+    result = await fighter_repo.search_fighters_by_name(clean_test_session, "Nurmagomedov", limit=10)
+
+    assert [f.name for f in result] == ["khabib nurmagomedov"]
+
+
+@pytest.mark.asyncio
+async def test_pg_trgm_detection_is_cached(clean_test_session, monkeypatch):
+    """pg_trgm 설치 여부는 프로세스당 한 번만 조회"""
+    monkeypatch.setattr(fighter_repo, "_pg_trgm_available", None)
+
+    first = await fighter_repo._has_pg_trgm(clean_test_session)
+
+    async def fail_execute(*args, **kwargs):
+        raise AssertionError("pg_extension queried twice")
+
+    monkeypatch.setattr(clean_test_session, "execute", fail_execute)
+    assert await fighter_repo._has_pg_trgm(clean_test_session) is first
+
+
+def test_trigram_search_stmt_uses_word_similarity():
+    """trigram 검색은 <% 연산자와 word_similarity 정렬을 사용"""
+    from sqlalchemy.dialects import postgresql
+
+    sql = str(fighter_repo._trigram_search_stmt("jon jnes", 5).compile(dialect=postgresql.dialect()))
+
+    assert "<%" in sql
+    assert "word_similarity" in sql
+    assert "lower(fighter.name)" in sql
+
+
+@pytest.mark.asyncio
+async def test_search_fighters_tolerates_typos_with_pg_trgm(clean_test_session):
+    """pg_trgm이 있으면 오타도 유사도 순으로 후보 반환"""
+    if not await fighter_repo._has_pg_trgm(clean_test_session):
+        pytest.skip("pg_trgm extension is not installed")
+
+    clean_test_session.add_all([
+        FighterModel(name="khabib nurmagomedov", nickname="the eagle", wins=29, losses=0, draws=0),
+        FighterModel(name="umar nurmagomedov", nickname=None, wins=18, losses=1, draws=0),
+        FighterModel(name="jon jones", nickname="bones", wins=27, losses=1, draws=0),
+    ])
+    await clean_test_session.flush()
+
+    result = await fighter_repo.search_fighters_by_name(clean_test_session, "Khabib Nurmagomedv", limit=10)
+
+    assert result[0].name == "khabib nurmagomedov"
+    assert "jon jones" not in [f.name for f in result]
+
+
 # =============================================================================
 # get_champions 테스트
 # =============================================================================
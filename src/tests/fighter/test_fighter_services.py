@@ -4,6 +4,7 @@ Fighter Services 통합 테스트
 """
 import pytest
 from datetime import datetime
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from fighter.models import FighterModel, FighterSchema, RankingModel, RankingSchema
@@ -426,6 +427,41 @@ async def test_build_fighter_with_rankings_no_rankings(clean_test_session: Async
     assert result.rankings == {}
 
 
+@pytest.mark.asyncio
+async def test_search_fighters_loads_rankings_in_one_query(clean_test_session: AsyncSession):
+    """검색 결과 수와 무관하게 랭킹 조회는 한 번 (N+1 없음)"""
+    # Given: 랭킹을 가진 파이터 여러 명
+    fighters = [
+        await create_test_fighter(clean_test_session, f"Batch Ranked {idx}", wins=10 + idx)
+        for idx in range(5)
+    ]
+    for idx, fighter in enumerate(fighters):
+        await create_test_ranking(clean_test_session, fighter.id, 4, idx + 1)
+    await clean_test_session.flush()
+
+    # pg_trgm 감지는 프로세스당 1회 조회이므로 미리 수행
+    await fighter_services.search_fighters(clean_test_session, "Batch Ranked", limit=1)
+
+    statements = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    # When: 검색
+    engine = clean_test_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", count_statement)
+    try:
+        result = await fighter_services.search_fighters(clean_test_session, "Batch Ranked", limit=50)
+    finally:
+        event.remove(engine, "before_cursor_execute", count_statement)
+
+    # Then: 검색 1회 + 랭킹 1회, 각 파이터의 랭킹이 정확히 매핑
+    assert len(statements) == 2
+    rankings_by_id = {r.fighter.id: r.rankings for r in result}
+    for idx, fighter in enumerate(fighters):
+        assert rankings_by_id[fighter.id] == {"lightweight": idx + 1}
+
+
 # =============================================================================
 # 통합 시나리오 테스트
 # =============================================================================
@@ -0,0 +1,98 @@
+"""MMA 그래프 오케스트레이션 오버헤드 benchmark (오프라인)
+
+실행: uv run python tests/llm/bench_graph_orchestration.py [--iterations N] [--latency-ms MS] [--token-latency-ms MS]
+
+scripted fake LLM(llm/providers/fake_provider.py)과 고정 SQL 결과로
+conversation_manager → supervisor → mma_analysis(tool call) → critic → text_response/visualization
+전체 경로를 service와 동일한 astream(stream_mode=["messages", "values"])으로 실행한다.
+LLM/DB/Redis 접근이 없으므로 측정값은 순수 그래프/노드 오케스트레이션 비용이다.
+--latency-ms를 주면 LLM 호출당 지연을 흉내 내어 병렬화/중복 호출 변화를 확인할 수 있다.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from contextlib import asynccontextmanager
+
+# src/ 디렉토리를 path에 추가 (tests/llm/ → tests/ → src/)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from langchain_core.messages import HumanMessage
+
+from config import Config
+from llm.graph.graph_builder import build_mma_graph
+from llm.providers.fake_provider import get_fake_llm
+from llm.tools import sql_tool
+
+KO_ROWS = [("Fighter A", 9), ("Fighter B", 8), ("Fighter C", 7), ("Fighter D", 6), ("Fighter E", 5)]
+
+
+class _CannedResult:
+    def fetchall(self):
+        return KO_ROWS
+
+    def keys(self):
+        return ["name", "ko_wins"]
+
+
+class _CannedSession:
+    async def execute(self, *args, **kwargs):
+        return _CannedResult()
+
+
+@asynccontextmanager
+async def _canned_readonly_context():
+    yield _CannedSession()
+
+
+async def _run_once(graph) -> tuple[float, int, dict]:
+    graph_input = {
+        "messages": [HumanMessage(content="KO 승리가 가장 많은 파이터 5명은?")],
+        "sql_context": [],
+        "user_id": 1,
+        "conversation_id": 0,
+    }
+    tokens = 0
+    final_state: dict = {}
+    started_at = time.perf_counter()
+    async for part in graph.astream(graph_input, stream_mode=["messages", "values"], version="v2"):
+        if part["type"] == "messages":
+            tokens += 1
+        else:
+            final_state = part["data"]
+    return (time.perf_counter() - started_at) * 1000, tokens, final_state
+
+
+async def main(iterations: int, latency_ms: float, token_latency_ms: float):
+    # 매 요청이 tool 경로를 타도록 SQL 결과 캐시는 끄고 DB 세션은 고정 결과로 대체
+    Config.SQL_TOOL_CACHE_ENABLED = False
+    sql_tool.get_async_readonly_db_context = _canned_readonly_context
+
+    graph = build_mma_graph(get_fake_llm(latency_ms=latency_ms, token_latency_ms=token_latency_ms))
+
+    # 워밍업 (import / 프롬프트 로드 / 컴파일 캐시)
+    _, tokens, final_state = await _run_once(graph)
+    print(
+        f"route={final_state.get('route')} "
+        f"visualization={final_state.get('visualization_type')} "
+        f"stream_events={tokens}"
+    )
+
+    timings = [(await _run_once(graph))[0] for _ in range(iterations)]
+    timings.sort()
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    print(f"{'iterations':<24} {iterations:8d}")
+    print(f"{'mean':<24} {statistics.mean(timings):8.3f} ms/request")
+    print(f"{'p50':<24} {statistics.median(timings):8.3f} ms/request")
+    print(f"{'p95':<24} {p95:8.3f} ms/request")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="MMA graph orchestration benchmark (fake LLM)")
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="LLM 호출당 지연")
+    parser.add_argument("--token-latency-ms", type=float, default=0.0, help="스트리밍 토큰당 지연")
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations, args.latency_ms, args.token_latency_ms))
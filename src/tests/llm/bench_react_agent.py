@@ -0,0 +1,58 @@
+"""ReAct 서브 에이전트 컴파일 비용 micro-benchmark
+
+실행: uv run python tests/llm/bench_react_agent.py  (직접 실행)
+
+요청마다 build_mma_analysis_agent()로 StateGraph를 컴파일하던 기존 방식(before)과
+그래프 빌드 시 한 번 컴파일한 에이전트를 재사용하는 방식(after)의 요청당 오버헤드를 비교한다.
+LLM은 tool call 없이 즉시 응답하는 fake 모델을 사용하므로 네트워크/DB 접근은 없다.
+"""
+import asyncio
+import os
+import sys
+import time
+
+# src/ 디렉토리를 path에 추가 (tests/llm/ → tests/ → src/)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from llm.graph.nodes.mma_analysis import build_mma_analysis_agent
+
+ITERATIONS = 200
+
+
+class _InstantModel:
+    """bind_tools / ainvoke만 지원하는 즉시 응답 모델"""
+
+    def bind_tools(self, tools):
+        return self
+
+    async def ainvoke(self, messages):
+        return AIMessage(content="done")
+
+
+async def _run(label: str, get_agent) -> float:
+    messages = [HumanMessage(content="존 존스 전적 알려줘")]
+    started_at = time.perf_counter()
+    for _ in range(ITERATIONS):
+        agent = get_agent()
+        await agent.ainvoke({"messages": messages}, config={"recursion_limit": 10})
+    per_request_ms = (time.perf_counter() - started_at) / ITERATIONS * 1000
+    print(f"{label:<32} {per_request_ms:8.3f} ms/request")
+    return per_request_ms
+
+
+async def main():
+    llm = _InstantModel()
+
+    # 워밍업 (import / 스키마 파일 로드)
+    prebuilt = build_mma_analysis_agent(llm)
+    await prebuilt.ainvoke({"messages": [HumanMessage(content="warmup")]})
+
+    before = await _run("before: build per request", lambda: build_mma_analysis_agent(llm))
+    after = await _run("after: prebuilt agent", lambda: prebuilt)
+    print(f"{'saved per request':<32} {before - after:8.3f} ms ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -6,6 +6,7 @@ chart_loader.py의 모든 함수에 대한 포괄적인 테스트를 제공합
 
 import pytest
 from unittest.mock import patch, mock_open
+from llm import chart_loader
 from llm.chart_loader import (
     get_supported_charts,
     get_chart_info,
@@ -16,6 +17,13 @@ from llm.chart_loader import (
 )
 
 
+@pytest.fixture(autouse=True)
+def fresh_chart_cache():
+    reload_charts()
+    yield
+    reload_charts()
+
+
 # =============================================================================
 # get_supported_charts() 테스트
 # =============================================================================
@@ -55,8 +63,8 @@ def test_get_supported_charts_file_not_found_returns_fallback():
     """JSON 파일이 없으면 text_summary만 포함한 fallback을 반환한다"""
     # Given: JSON 파일이 존재하지 않을 때
     with patch("builtins.open", side_effect=FileNotFoundError()):
-        # When: get_supported_charts를 호출하면
-        result = get_supported_charts()
+        # When: 캐시를 다시 로드하면
+        result = reload_charts()
 
         # Then: text_summary만 포함한 fallback이 반환되어야 한다
         assert "text_summary" in result
@@ -70,8 +78,8 @@ def test_get_supported_charts_json_decode_error_returns_fallback():
     """JSON 파싱 오류 시 text_summary만 포함한 fallback을 반환한다"""
     # Given: 잘못된 JSON 형식의 파일이 있을 때
     with patch("builtins.open", mock_open(read_data="invalid json {")):
-        # When: get_supported_charts를 호출하면
-        result = get_supported_charts()
+        # When: 캐시를 다시 로드하면
+        result = reload_charts()
 
         # Then: text_summary만 포함한 fallback이 반환되어야 한다
         assert "text_summary" in result
@@ -279,3 +287,19 @@ def test_reload_charts_returns_same_data_as_get_supported_charts():
     # Then: 두 결과가 동일해야 한다
     assert reload_result == get_result
     assert set(reload_result.keys()) == set(get_result.keys())
+
+
+def test_get_supported_charts_reads_file_once_until_reload():
+    """차트 정보는 한 번만 로드되고 reload_charts 호출 시에만 다시 읽는다"""
+    # Given: 차트 정보가 이미 로드된 상태에서
+    get_supported_charts()
+
+    # When: 파일을 읽을 수 없게 된 뒤 다시 호출하면
+    with patch("builtins.open", side_effect=AssertionError("file re-read")):
+        cached = get_supported_charts()
+        prompt = get_charts_for_prompt()
+
+    # Then: 캐시된 결과가 반환되어야 한다
+    assert "bar_chart" in cached
+    assert prompt is get_charts_for_prompt()
+    assert chart_loader._charts_cache is cached
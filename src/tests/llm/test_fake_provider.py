@@ -0,0 +1,132 @@
+import json
+from contextlib import asynccontextmanager
+
+import pytest
+from langchain_core.messages import AIMessageChunk, HumanMessage
+from langchain_core.tools import tool
+
+from llm import model_factory
+from llm.graph.graph_builder import build_mma_graph
+from llm.graph.nodes.critic import CriticLLMOutput
+from llm.graph.react_agent import build_react_agent
+from llm.graph.schemas import SupervisorRouting, VisualizationDecision
+from llm.providers.fake_provider import ScriptedChatModel, get_fake_llm, load_fake_script
+from llm.tools import sql_tool
+
+KO_ROWS = [("Fighter A", 5), ("Fighter B", 4), ("Fighter C", 3)]
+
+
+class _FakeResult:
+    def fetchall(self):
+        return KO_ROWS
+
+    def keys(self):
+        return ["name", "ko_wins"]
+
+
+class _FakeSession:
+    async def execute(self, *args, **kwargs):
+        return _FakeResult()
+
+
+@asynccontextmanager
+async def _fake_readonly_context():
+    yield _FakeSession()
+
+
+@pytest.mark.asyncio
+async def test_structured_output_uses_script_values_and_defaults():
+    llm = ScriptedChatModel(script={"structured": {"SupervisorRouting": {"route": "general"}}})
+
+    routing = await llm.with_structured_output(SupervisorRouting).ainvoke([])
+    critic = await llm.with_structured_output(CriticLLMOutput).ainvoke([])
+
+    assert routing.route == "general"
+    assert isinstance(critic.passed, bool)
+
+
+@pytest.mark.asyncio
+async def test_default_script_produces_valid_visualization_decision():
+    decision = await get_fake_llm().with_structured_output(VisualizationDecision).ainvoke([])
+
+    assert decision.selected_visualization == "bar_chart"
+    assert (decision.x_axis, decision.y_axis) == ("name", "ko_wins")
+
+
+@pytest.mark.asyncio
+async def test_react_agent_runs_scripted_tool_call_then_answers():
+    calls = []
+
+    @tool
+    async def lookup(name: str) -> str:
+        """파이터 조회"""
+        calls.append(name)
+        return "ok"
+
+    llm = ScriptedChatModel(script={
+        "tool_calls": [{"name": "lookup", "args": {"name": "Jon Jones"}}],
+        "tool_answer": "조회 완료",
+    })
+    agent = build_react_agent(llm, [lookup], "system")
+
+    result = await agent.ainvoke({"messages": [HumanMessage(content="존 존스")]})
+
+    assert calls == ["Jon Jones"]
+    assert result["messages"][-1].content == "조회 완료"
+
+
+@pytest.mark.asyncio
+async def test_streaming_splits_text_into_token_chunks():
+    llm = ScriptedChatModel(script={"text": "하나 둘 셋"})
+
+    chunks = [chunk async for chunk in llm.astream([HumanMessage(content="hi")])]
+
+    assert all(isinstance(chunk, AIMessageChunk) for chunk in chunks)
+    assert [chunk.content for chunk in chunks if chunk.content] == ["하나 ", "둘 ", "셋"]
+
+
+def test_load_fake_script_overrides_default_keys(tmp_path):
+    path = tmp_path / "script.json"
+    path.write_text(json.dumps({"text": "custom"}), encoding="utf-8")
+
+    script = load_fake_script(str(path))
+
+    assert script["text"] == "custom"
+    assert "structured" in script
+
+
+def test_model_factory_selects_fake_provider(monkeypatch):
+    monkeypatch.setattr(model_factory.Config, "MAIN_MODEL", "fake/scripted")
+
+    llm, callback = model_factory.create_llm_with_callbacks("msg", 1, provider="fake")
+
+    assert isinstance(llm, ScriptedChatModel)
+    assert callback is None
+    assert isinstance(model_factory.get_main_model(), ScriptedChatModel)
+    assert model_factory.validate_provider_config("fake") is True
+    assert "fake" not in model_factory.get_available_providers()
+
+
+@pytest.mark.asyncio
+async def test_mma_graph_runs_end_to_end_with_fake_llm(monkeypatch):
+    monkeypatch.setattr(sql_tool.Config, "SQL_TOOL_CACHE_ENABLED", False)
+    monkeypatch.setattr(sql_tool, "get_async_readonly_db_context", _fake_readonly_context)
+    graph = build_mma_graph(get_fake_llm())
+
+    streamed_nodes = set()
+    final_state = {}
+    async for part in graph.astream(
+        {"messages": [HumanMessage(content="KO 승리 순위")], "sql_context": [], "user_id": 1, "conversation_id": 0},
+        stream_mode=["messages", "values"],
+        version="v2",
+    ):
+        if part["type"] == "messages":
+            streamed_nodes.add(part["data"][1].get("langgraph_node"))
+        else:
+            final_state = part["data"]
+
+    assert final_state["route"] == "mma_analysis"
+    assert final_state["agent_results"][0]["row_count"] == len(KO_ROWS)
+    assert final_state["final_response"]
+    assert final_state["visualization_type"] == "bar_chart"
+    assert "text_response" in streamed_nodes
@@ -148,6 +148,58 @@ class TestGraphBuilder:
         compiled = build_mma_graph(MagicMock(), MagicMock())
         assert compiled is not None
 
+    def test_react_sub_agents_compiled_once_per_graph(self, monkeypatch):
+        from llm.graph import graph_builder
+        from llm.graph.nodes import mma_analysis, fighter_comparison
+
+        built = []
+
+        def fake_build_react_agent(model, tools, prompt=None):
+            built.append(prompt)
+            return MagicMock()
+
+        monkeypatch.setattr(mma_analysis, "build_react_agent", fake_build_react_agent)
+        monkeypatch.setattr(fighter_comparison, "build_react_agent", fake_build_react_agent)
+
+        graph_builder.build_mma_graph(MagicMock(), MagicMock())
+
+        assert built == [mma_analysis.get_phase1_prompt, fighter_comparison.get_fighter_comparison_prompt]
+
+    @pytest.mark.asyncio
+    async def test_analysis_node_reuses_prebuilt_agent(self, monkeypatch):
+        from llm.graph.nodes import mma_analysis
+
+        def fail_build(llm):
+            raise AssertionError("agent must not be rebuilt per request")
+
+        monkeypatch.setattr(mma_analysis, "build_mma_analysis_agent", fail_build)
+        agent = MagicMock()
+        agent.ainvoke = AsyncMock(return_value={"messages": [AIMessage(content="done")]})
+        state = {"messages": [HumanMessage(content="q")], "critic_feedback": "retry"}
+
+        await mma_analysis.mma_analysis_node(state, llm=MagicMock(), agent=agent)
+        await mma_analysis.mma_analysis_node(state, llm=MagicMock(), agent=agent)
+
+        assert agent.ainvoke.await_count == 2
+        last_messages = agent.ainvoke.await_args.args[0]["messages"]
+        assert "retry" in last_messages[-1].content
+
+    def test_sub_agent_prompt_is_rendered_once_per_date(self, monkeypatch):
+        from llm import prompts
+
+        loads = []
+        prompts.reload_prompt_artifacts()
+        monkeypatch.setattr(prompts, "load_schema_prompt", lambda: loads.append(1) or "SCHEMA")
+
+        first = prompts.get_phase1_prompt("2026-01-01")
+        assert prompts.get_phase1_prompt("2026-01-01") is first
+        assert "2026-01-01" in first and "SCHEMA" in first
+        assert "2026-01-02" in prompts.get_phase1_prompt("2026-01-02")
+        assert len(loads) == 2
+
+        monkeypatch.undo()
+        prompts.reload_prompt_artifacts()
+
     def test_supervisor_dispatch_general(self):
         from llm.graph.graph_builder import supervisor_dispatch
         sends = supervisor_dispatch({"route": "general"})
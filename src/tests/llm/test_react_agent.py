@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langchain_core.tools import tool
+
+from llm.graph.react_agent import build_react_agent
+
+
+class _ScriptedModel:
+    """첫 호출에 tool call들을, 이후 호출에 최종 답변을 반환"""
+
+    def __init__(self, tool_calls):
+        self.tool_calls = tool_calls
+        self.calls = 0
+
+    def bind_tools(self, tools):
+        return self
+
+    async def ainvoke(self, messages):
+        self.calls += 1
+        if self.calls == 1:
+            return AIMessage(content="", tool_calls=self.tool_calls)
+        return AIMessage(content="done")
+
+
+def _tool_calls(delays):
+    return [
+        {"name": "slow_query", "args": {"delay": delay, "label": f"q{idx}"}, "id": f"call_{idx}"}
+        for idx, delay in enumerate(delays)
+    ]
+
+
+@pytest.fixture
+def slow_query_tool():
+    state = {"running": 0, "peak": 0}
+
+    @tool
+    async def slow_query(delay: float, label: str) -> str:
+        """지정한 시간 동안 대기 후 label 반환"""
+        state["running"] += 1
+        state["peak"] = max(state["peak"], state["running"])
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            state["running"] -= 1
+        return label
+
+    return slow_query, state
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_run_concurrently_and_keep_call_order(slow_query_tool):
+    slow_query, state = slow_query_tool
+    # 먼저 호출된 tool이 가장 늦게 끝나도 ToolMessage 순서는 tool call 순서
+    agent = build_react_agent(_ScriptedModel(_tool_calls([0.05, 0.02, 0.0])), [slow_query], max_concurrency=3)
+
+    result = await agent.ainvoke({"messages": [HumanMessage(content="compare")]})
+
+    tool_messages = [msg for msg in result["messages"] if isinstance(msg, ToolMessage)]
+    assert [msg.tool_call_id for msg in tool_messages] == ["call_0", "call_1", "call_2"]
+    assert [msg.content for msg in tool_messages] == ["q0", "q1", "q2"]
+    assert state["peak"] == 3
+
+
+@pytest.mark.asyncio
+async def test_tool_call_concurrency_is_capped(slow_query_tool):
+    slow_query, state = slow_query_tool
+    agent = build_react_agent(_ScriptedModel(_tool_calls([0.01] * 5)), [slow_query], max_concurrency=2)
+
+    await agent.ainvoke({"messages": [HumanMessage(content="compare")]})
+
+    assert state["peak"] == 2
+
+
+@pytest.mark.asyncio
+async def test_unknown_tool_and_tool_error_are_reported_in_place(slow_query_tool):
+    slow_query, _ = slow_query_tool
+    tool_calls = [
+        {"name": "missing_tool", "args": {}, "id": "call_missing"},
+        {"name": "slow_query", "args": {"delay": "not-a-number", "label": "x"}, "id": "call_bad"},
+        {"name": "slow_query", "args": {"delay": 0, "label": "ok"}, "id": "call_ok"},
+    ]
+    agent = build_react_agent(_ScriptedModel(tool_calls), [slow_query])
+
+    result = await agent.ainvoke({"messages": [HumanMessage(content="compare")]})
+
+    tool_messages = [msg for msg in result["messages"] if isinstance(msg, ToolMessage)]
+    assert [msg.tool_call_id for msg in tool_messages] == ["call_missing", "call_bad", "call_ok"]
+    assert "not found" in tool_messages[0].content
+    assert tool_messages[1].content.startswith("Error executing tool")
+    assert tool_messages[2].content == "ok"
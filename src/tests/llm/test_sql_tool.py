@@ -0,0 +1,126 @@
+import json
+
+import pytest
+from sqlalchemy import text
+
+from database.connection.redis_conn_memory import InMemoryAsyncRedis
+from llm.tools import sql_tool
+
+
+class _FakeResult:
+    def __init__(self, rows, columns):
+        self._rows = rows
+        self._columns = columns
+
+    def fetchall(self):
+        return self._rows
+
+    def keys(self):
+        return self._columns
+
+
+class _FakeSession:
+    def __init__(self, executed, rows=None):
+        self.executed = executed
+        self.rows = rows if rows is not None else [("Jon Jones", 10)]
+
+    async def execute(self, statement, params=None):
+        if str(statement).startswith("SET LOCAL"):
+            return None
+        self.executed.append((str(statement), params))
+        return _FakeResult(self.rows[: params["_row_limit"]], ["name", "ko_wins"])
+
+
+@pytest.fixture
+def sql_cache(monkeypatch):
+    executed = []
+
+    class FakeReadonlyContext:
+        async def __aenter__(self):
+            return _FakeSession(executed)
+
+        async def __aexit__(self, exc_type, exc, traceback):
+            return False
+
+    monkeypatch.setattr(sql_tool, "async_redis_client", InMemoryAsyncRedis())
+    monkeypatch.setattr(sql_tool, "get_async_readonly_db_context", lambda: FakeReadonlyContext())
+    monkeypatch.setattr(sql_tool.Config, "SQL_TOOL_CACHE_ENABLED", True)
+    monkeypatch.setattr(sql_tool, "_sql_cache_stats", {"hits": 0, "misses": 0})
+    return executed
+
+@pytest.mark.asyncio
+async def test_identical_normalized_queries_hit_cache(sql_cache):
+    first = await sql_tool.execute_raw_sql_query.ainvoke(
+        {"query": "SELECT name, ko_wins FROM v_leaders LIMIT 3;"}
+    )
+    second = await sql_tool.execute_raw_sql_query.ainvoke(
+        {"query": "```sql\nSELECT name, ko_wins FROM v_leaders LIMIT 3\n```"}
+    )
+
+    assert len(sql_cache) == 1
+    assert json.loads(second)["data"] == [{"name": "Jon Jones", "ko_wins": 10}]
+    assert json.loads(first)["data"] == json.loads(second)["data"]
+    assert sql_tool.get_sql_cache_stats() == {"hits": 1, "misses": 1}
+
+
+@pytest.mark.asyncio
+async def test_failed_queries_are_not_cached(sql_cache):
+    for _ in range(2):
+        result = json.loads(await sql_tool.execute_raw_sql_query.ainvoke({"query": "DELETE FROM fighter"}))
+        assert result["success"] is False
+
+    assert sql_cache == []
+    assert [key async for key in sql_tool.async_redis_client.scan_iter(match="sql_tool:*")] == []
+
+
+@pytest.mark.asyncio
+async def test_invalidate_sql_cache_forces_database_round_trip(sql_cache):
+    query = {"query": "SELECT name, ko_wins FROM v_leaders"}
+    await sql_tool.execute_raw_sql_query.ainvoke(query)
+
+    assert await sql_tool.invalidate_sql_cache() == 1
+    await sql_tool.execute_raw_sql_query.ainvoke(query)
+
+    assert len(sql_cache) == 2
+    assert sql_tool.get_sql_cache_stats() == {"hits": 0, "misses": 2}
+
+
+@pytest.mark.asyncio
+async def test_row_cap_is_applied_in_sql_and_truncation_reported(sql_cache, monkeypatch):
+    monkeypatch.setattr(sql_tool, "MAX_RESULT_ROWS", 2)
+    monkeypatch.setattr(sql_tool.Config, "SQL_TOOL_CACHE_ENABLED", False)
+    executed = []
+    rows = [("A", 3), ("B", 2), ("C", 1)]
+
+    class FakeReadonlyContext:
+        async def __aenter__(self):
+            return _FakeSession(executed, rows)
+
+        async def __aexit__(self, exc_type, exc, traceback):
+            return False
+
+    monkeypatch.setattr(sql_tool, "get_async_readonly_db_context", lambda: FakeReadonlyContext())
+
+    result = json.loads(
+        await sql_tool.execute_raw_sql_query.ainvoke({"query": "SELECT name, ko_wins FROM v_leaders;"})
+    )
+
+    statement, params = executed[0]
+    assert statement.startswith("SELECT * FROM (")
+    assert "LIMIT :_row_limit" in statement
+    assert params == {"_row_limit": 3}
+    assert result["row_count"] == 2
+    assert result["truncated"] is True
+    assert [row["name"] for row in result["data"]] == ["A", "B"]
+
+
+@pytest.mark.asyncio
+async def test_limit_query_preserves_cte_order_and_trailing_comment(clean_test_session):
+    query = sql_tool._clean_query(
+        "WITH nums AS (SELECT generate_series(1, 50) AS n) "
+        "SELECT n, n AS n FROM nums ORDER BY n DESC -- top numbers"
+    )
+
+    result = await clean_test_session.execute(text(sql_tool._limit_query(query)), {"_row_limit": 3})
+
+    assert [row[0] for row in result.fetchall()] == [50, 49, 48]
@@ -7,8 +7,6 @@ import pytest
 from match import repositories as match_repo
 from match.models import MatchSchema, FighterMatchSchema, BasicMatchStatSchema, SigStrMatchStatSchema
 from match.dto import (
-    FighterBasicStatsAggregateDTO,
-    FighterSigStrStatsAggregateDTO,
     MatchWithResultDTO,
     MatchWithFightersDTO,
     MatchStatisticsDTO
@@ -262,119 +260,6 @@ async def test_get_match_fighter_mapping(match_with_fighters, clean_test_session
             assert fighter_match_schema.match_id == match.id
 
 
-@pytest.mark.asyncio
-async def test_get_fighter_basic_stats_aggregate(match_with_statistics, clean_test_session):
-    """파이터 기본 통계 집계 테스트"""
-    # Given: match_with_statistics fixture 사용 (추가 매치 데이터 필요하면 생성)
-    match, fighters, fighter_matches, basic_stats, strike_stats = match_with_statistics
-
-    # When: 첫 번째 파이터의 기본 통계 집계 조회
-    result = await match_repo.get_fighter_basic_stats_aggregate(clean_test_session, fighters[0].id)
-
-    # Then: 집계된 통계 DTO 반환
-    assert result is not None
-    assert isinstance(result, FighterBasicStatsAggregateDTO)
-
-    # DTO 필드들 확인
-    assert isinstance(result.match_count, int)
-    assert isinstance(result.knockdowns, int)
-    assert isinstance(result.control_time_seconds, int)
-    assert isinstance(result.submission_attempts, int)
-    assert isinstance(result.sig_str_landed, int)
-    assert isinstance(result.sig_str_attempted, int)
-    assert isinstance(result.total_str_landed, int)
-    assert isinstance(result.total_str_attempted, int)
-    assert isinstance(result.td_landed, int)
-    assert isinstance(result.td_attempted, int)
-
-    # 실제 값 확인 (현재 1개 매치)
-    assert result.match_count == 1
-    assert result.knockdowns == 1
-    assert result.control_time_seconds == 240
-    assert result.submission_attempts == 2
-
-
-@pytest.mark.asyncio
-async def test_get_fighter_sig_str_stats_aggregate(match_with_statistics, clean_test_session):
-    """파이터 스트라이크 통계 집계 테스트"""
-    # Given: match_with_statistics fixture 사용
-    match, fighters, fighter_matches, basic_stats, strike_stats = match_with_statistics
-
-    # When: 첫 번째 파이터의 스트라이크 통계 집계 조회
-    result = await match_repo.get_fighter_sig_str_stats_aggregate(clean_test_session, fighters[0].id)
-
-    # Then: 집계된 스트라이크 통계 DTO 반환
-    assert result is not None
-    assert isinstance(result, FighterSigStrStatsAggregateDTO)
-
-    # DTO 필드들 확인
-    assert isinstance(result.match_count, int)
-    assert isinstance(result.head_strikes_landed, int)
-    assert isinstance(result.head_strikes_attempts, int)
-    assert isinstance(result.body_strikes_landed, int)
-    assert isinstance(result.body_strikes_attempts, int)
-    assert isinstance(result.leg_strikes_landed, int)
-    assert isinstance(result.leg_strikes_attempts, int)
-    assert isinstance(result.takedowns_landed, int)
-    assert isinstance(result.takedowns_attempts, int)
-    assert isinstance(result.clinch_strikes_landed, int)
-    assert isinstance(result.clinch_strikes_attempts, int)
-    assert isinstance(result.ground_strikes_landed, int)
-    assert isinstance(result.ground_strikes_attempts, int)
-
-    # 실제 값 확인 (현재 1개 매치)
-    assert result.match_count == 1
-    assert result.head_strikes_landed == 25
-    assert result.head_strikes_attempts == 40
-    assert result.body_strikes_landed == 15
-    assert result.takedowns_landed == 3
-
-
-@pytest.mark.asyncio
-async def test_get_fighter_basic_stats_aggregate_no_matches(sample_fighter, clean_test_session):
-    """매치가 없는 파이터 기본 통계 집계 테스트"""
-    # When: 매치가 없는 파이터의 기본 통계 집계 조회
-    result = await match_repo.get_fighter_basic_stats_aggregate(clean_test_session, sample_fighter.id)
-
-    # Then: 모든 값이 0인 DTO 반환
-    assert result is not None
-    assert isinstance(result, FighterBasicStatsAggregateDTO)
-    assert result.match_count == 0
-    assert result.knockdowns == 0
-    assert result.control_time_seconds == 0
-    assert result.submission_attempts == 0
-    assert result.sig_str_landed == 0
-    assert result.sig_str_attempted == 0
-    assert result.total_str_landed == 0
-    assert result.total_str_attempted == 0
-    assert result.td_landed == 0
-    assert result.td_attempted == 0
-
-
-@pytest.mark.asyncio
-async def test_get_fighter_sig_str_stats_aggregate_no_matches(sample_fighter, clean_test_session):
-    """매치가 없는 파이터 스트라이크 통계 집계 테스트"""
-    # When: 매치가 없는 파이터의 스트라이크 통계 집계 조회
-    result = await match_repo.get_fighter_sig_str_stats_aggregate(clean_test_session, sample_fighter.id)
-
-    # Then: 모든 값이 0인 DTO 반환
-    assert result is not None
-    assert isinstance(result, FighterSigStrStatsAggregateDTO)
-    assert result.match_count == 0
-    assert result.head_strikes_landed == 0
-    assert result.head_strikes_attempts == 0
-    assert result.body_strikes_landed == 0
-    assert result.body_strikes_attempts == 0
-    assert result.leg_strikes_landed == 0
-    assert result.leg_strikes_attempts == 0
-    assert result.takedowns_landed == 0
-    assert result.takedowns_attempts == 0
-    assert result.clinch_strikes_landed == 0
-    assert result.clinch_strikes_attempts == 0
-    assert result.ground_strikes_landed == 0
-    assert result.ground_strikes_attempts == 0
-
-
 @pytest.mark.asyncio
 async def test_get_matches_by_nonexistent_event(clean_test_session):
     """존재하지 않는 이벤트 ID로 매치 조회 테스트"""
@@ -0,0 +1,229 @@
+"""
+인증 principal 캐시 테스트
+user/principal_cache.py 단위 테스트 + get_user_from_token_data 캐시 경로/무효화 통합 테스트
+"""
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from api.auth.dependencies import get_user_from_token_data
+from api.auth.jwt_handler import TokenData
+from config import get_database_url
+from user import repositories as user_repo
+from user.models import UserProfileUpdate, UserSchema
+from user.principal_cache import (
+    PrincipalCache,
+    principal_cache,
+    principal_cache_key,
+    set_invalidation_publisher,
+)
+
+
+def _user(user_id: int, **kwargs) -> UserSchema:
+    return UserSchema(id=user_id, username=f"user{user_id}", **kwargs)
+
+
+# ===== PrincipalCache 단위 테스트 =====
+
+def test_cache_key_follows_token_subject_priority():
+    assert principal_cache_key(1, "a@b.com", "sub") == "id:1"
+    assert principal_cache_key(None, "A@B.com", "sub") == "email:A@B.com"
+    assert principal_cache_key(None, None, "google-123") == "sub:google-123"
+
+
+def test_cache_hit_miss_and_hit_rate():
+    cache = PrincipalCache()
+
+    assert cache.get("id:1") is None
+    cache.set("id:1", _user(1))
+    assert cache.get("id:1").id == 1
+
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["hit_rate"] == 0.5
+
+
+def test_cache_entry_expires_after_ttl(monkeypatch):
+    monkeypatch.setattr("user.principal_cache.Config.AUTH_PRINCIPAL_CACHE_TTL_SECONDS", 30)
+    cache = PrincipalCache()
+    cache.set("id:1", _user(1))
+
+    now = time.monotonic()
+    monkeypatch.setattr("user.principal_cache.time.monotonic", lambda: now + 31)
+
+    assert cache.get("id:1") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_invalidate_user_removes_all_keys_for_user():
+    cache = PrincipalCache()
+    cache.set("id:1", _user(1))
+    cache.set("email:a@b.com", _user(1))
+    cache.set("id:2", _user(2))
+
+    cache.invalidate_user(1)
+
+    assert cache.get("id:1") is None
+    assert cache.get("email:a@b.com") is None
+    assert cache.get("id:2") is not None
+
+
+def test_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr("user.principal_cache.Config.AUTH_PRINCIPAL_CACHE_MAX_SIZE", 2)
+    cache = PrincipalCache()
+    cache.set("id:1", _user(1))
+    cache.set("id:2", _user(2))
+    cache.get("id:1")
+    cache.set("id:3", _user(3))
+
+    assert cache.get("id:2") is None
+    assert cache.get("id:1") is not None
+    assert cache.get("id:3") is not None
+
+
+def test_set_skipped_when_invalidated_during_load():
+    cache = PrincipalCache()
+    generation = cache.generation
+
+    # 조회 도중 다른 요청의 commit으로 무효화됨 → 조회 결과(이전 row)는 캐시하지 않음
+    cache.invalidate_user(1)
+    cache.set("id:1", _user(1), generation=generation)
+
+    assert cache.get("id:1") is None
+
+
+def test_zero_ttl_disables_cache(monkeypatch):
+    monkeypatch.setattr("user.principal_cache.Config.AUTH_PRINCIPAL_CACHE_TTL_SECONDS", 0)
+    cache = PrincipalCache()
+    cache.set("id:1", _user(1))
+
+    assert cache.get("id:1") is None
+    assert cache.stats()["size"] == 0
+
+
+# ===== get_user_from_token_data 통합 테스트 =====
+
+@pytest_asyncio.fixture
+async def committing_session():
+    """
+    commit(after_commit hook)까지 실행하되 테스트 후 전체 롤백되는 세션
+    바깥 트랜잭션 안에서 세션 commit은 SAVEPOINT로 처리된다.
+    """
+    engine = create_async_engine(get_database_url(is_test=True))
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        session = AsyncSession(
+            bind=connection, join_transaction_mode="create_savepoint", expire_on_commit=False,
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await transaction.rollback()
+    await engine.dispose()
+
+
+async def _create_user(session: AsyncSession, username: str) -> UserSchema:
+    return await user_repo.create_user(session, UserSchema(
+        username=username, password_hash="hashed", is_active=True,
+    ))
+
+
+@pytest.mark.asyncio
+async def test_second_lookup_is_served_from_cache(clean_test_session: AsyncSession, monkeypatch):
+    created = await _create_user(clean_test_session, "cacheduser")
+    token_data = TokenData(sub=str(created.id), user_id=created.id)
+
+    first = await get_user_from_token_data(token_data, clean_test_session)
+
+    async def fail_lookup(*args, **kwargs):
+        raise AssertionError("DB lookup on cache hit")
+
+    monkeypatch.setattr(user_repo, "get_user_by_id", fail_lookup)
+    second = await get_user_from_token_data(token_data, clean_test_session)
+
+    assert first.id == second.id == created.id
+    assert first is not second
+    assert principal_cache.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_profile_update_invalidates_cached_principal_after_commit(committing_session: AsyncSession):
+    created = await _create_user(committing_session, "renameduser")
+    await committing_session.commit()
+    token_data = TokenData(sub=str(created.id), user_id=created.id)
+    await get_user_from_token_data(token_data, committing_session)
+
+    await user_repo.update_user_profile(
+        committing_session, created.id, UserProfileUpdate(name="새 이름"),
+    )
+    # commit 전에는 다른 요청이 이전 row를 보므로 캐시도 유지
+    assert principal_cache.get(f"id:{created.id}") is not None
+
+    await committing_session.commit()
+    user = await get_user_from_token_data(token_data, committing_session)
+
+    assert user.name == "새 이름"
+
+
+@pytest.mark.asyncio
+async def test_deactivation_invalidates_cached_principal(committing_session: AsyncSession):
+    created = await _create_user(committing_session, "deactivateduser")
+    await committing_session.commit()
+    token_data = TokenData(sub=str(created.id), user_id=created.id)
+    await get_user_from_token_data(token_data, committing_session)
+
+    await user_repo.update_active_status(committing_session, created.id, False)
+    await committing_session.commit()
+
+    with pytest.raises(HTTPException) as exc_info:
+        await get_user_from_token_data(token_data, committing_session)
+    assert exc_info.value.detail == "Inactive user"
+
+
+@pytest.mark.asyncio
+async def test_invalidation_is_published_to_other_workers_after_commit(committing_session: AsyncSession):
+    publisher = AsyncMock()
+    set_invalidation_publisher(publisher)
+    try:
+        created = await _create_user(committing_session, "publisheduser")
+        await user_repo.update_active_status(committing_session, created.id, False)
+        publisher.assert_not_called()
+
+        await committing_session.commit()
+        await asyncio.sleep(0)
+
+        publisher.assert_awaited_once_with(created.id)
+    finally:
+        set_invalidation_publisher(None)
+
+
+@pytest.mark.asyncio
+async def test_auto_created_oauth_user_is_not_cached(clean_test_session: AsyncSession):
+    token_data = TokenData(sub="google-999", email="new-oauth@example.com", name="OAuth")
+
+    user = await get_user_from_token_data(token_data, clean_test_session)
+
+    assert user.email == "new-oauth@example.com"
+    assert principal_cache.stats()["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_emails_differing_only_in_case_do_not_share_cache_entry(clean_test_session: AsyncSession):
+    created = await user_repo.create_oauth_user(
+        clean_test_session, email="Case.User@example.com", provider_id="google-case",
+    )
+    owner_token = TokenData(sub="google-case", email="Case.User@example.com")
+    await get_user_from_token_data(owner_token, clean_test_session)
+    assert principal_cache.get("email:Case.User@example.com").id == created.id
+
+    # 대소문자만 다른 이메일은 DB 조회와 동일하게 별도 사용자로 취급 (캐시된 principal 재사용 금지)
+    other_token = TokenData(sub="google-other", email="case.user@example.com")
+    with pytest.raises(HTTPException) as exc_info:
+        await get_user_from_token_data(other_token, clean_test_session, auto_create_oauth_user=False)
+    assert exc_info.value.detail == "User not found"
@@ -254,7 +254,7 @@ async def test_update_user_profile_no_changes(clean_test_session: AsyncSession):
 # ===== 사용량 업데이트 및 조회 테스트 =====
 
 @pytest.mark.asyncio
-async def test_update_user_usage_increment(clean_test_session: AsyncSession):
+async def test_consume_daily_requests_increment(clean_test_session: AsyncSession):
     """사용자 사용량 증가 테스트 (같은 날에 요청하는 경우)"""
     # Given: 오늘 날짜로 마지막 요청이 있는 사용자 생성
     user = await user_repo.create_user(
@@ -270,7 +270,7 @@ async def test_update_user_usage_increment(clean_test_session: AsyncSession):
     )
 
     # When: 사용량 업데이트
-    updated_user = await user_repo.update_user_usage(clean_test_session, user.id, increment=3)
+    updated_user = await user_repo.consume_daily_requests(clean_test_session, user.id, 3, 100)
 
     # Then: 사용량 증가 확인
     assert updated_user is not None
@@ -280,7 +280,7 @@ async def test_update_user_usage_increment(clean_test_session: AsyncSession):
 
 
 @pytest.mark.asyncio
-async def test_update_user_usage_daily_reset(clean_test_session: AsyncSession):
+async def test_consume_daily_requests_daily_reset(clean_test_session: AsyncSession):
     """날짜가 바뀌면 일일 사용량 리셋 테스트"""
     # Given: 어제 날짜로 사용량이 있는 사용자
     user = await user_repo.create_user(
@@ -296,7 +296,7 @@ async def test_update_user_usage_daily_reset(clean_test_session: AsyncSession):
     )
 
     # When: 오늘 사용량 업데이트
-    updated_user = await user_repo.update_user_usage(clean_test_session, user.id, increment=5)
+    updated_user = await user_repo.consume_daily_requests(clean_test_session, user.id, 5, 100)
 
     # Then: daily_requests 리셋되고 새로 증가
     assert updated_user.total_requests == 55  # 50 + 5
@@ -304,6 +304,39 @@ async def test_update_user_usage_daily_reset(clean_test_session: AsyncSession):
     assert updated_user.last_request_date.date() == utc_today()
 
 
+@pytest.mark.asyncio
+async def test_refund_daily_requests_reverts_and_stops_at_zero(clean_test_session: AsyncSession):
+    """선차감 환불: 같은 날은 1 감소, 집계일이 바뀐 사용자는 0 아래로 내려가지 않음"""
+    # Given: 오늘 사용한 사용자와 2일 전 마지막으로 사용한 사용자
+    today_user = await user_repo.create_user(
+        clean_test_session,
+        UserSchema(
+            username="refund_today_user", password_hash="hash",
+            total_requests=10, daily_requests=5, last_request_date=utc_now(),
+        )
+    )
+    stale_user = await user_repo.create_user(
+        clean_test_session,
+        UserSchema(
+            username="refund_stale_user", password_hash="hash",
+            total_requests=0, daily_requests=30, last_request_date=utc_now() - timedelta(days=2),
+        )
+    )
+
+    # When: 각각 환불
+    await user_repo.refund_daily_requests(clean_test_session, today_user.id)
+    await user_repo.refund_daily_requests(clean_test_session, stale_user.id)
+
+    # Then
+    today_stats = await user_repo.get_user_usage_stats(clean_test_session, today_user.id)
+    assert today_stats["total_requests"] == 9
+    assert today_stats["daily_requests"] == 4
+
+    stale = await user_repo.get_user_by_id(clean_test_session, stale_user.id)
+    assert stale.total_requests == 0
+    assert stale.daily_requests == 0
+
+
 @pytest.mark.asyncio
 async def test_get_user_usage_stats_success(clean_test_session: AsyncSession):
     """사용자 사용량 통계 조회 성공 테스트"""
@@ -475,7 +508,7 @@ async def test_full_user_lifecycle(clean_test_session: AsyncSession):
     assert found_user.id == user.id
 
     # 3. 사용량 업데이트
-    await user_repo.update_user_usage(clean_test_session, user.id, increment=5)
+    await user_repo.consume_daily_requests(clean_test_session, user.id, 5, 100)
     updated = await user_repo.get_user_by_id(clean_test_session, user.id)
     assert updated.total_requests == 5
     assert updated.daily_requests == 5
@@ -496,3 +529,67 @@ if __name__ == "__main__":
     print("실제 테스트 DB를 사용한 데이터베이스 레이어 검증")
     print("\n테스트 실행:")
     print("uv run pytest src/tests/user/test_user_repositories.py -v")
+
+
+# ===== 사용량 리셋 타임존 테스트 =====
+
+def test_usage_day_start_follows_reset_timezone(monkeypatch):
+    """Asia/Seoul 자정은 UTC 15:00 (naive UTC로 반환)"""
+    monkeypatch.setattr(user_repo.Config, "USAGE_RESET_TIMEZONE", "Asia/Seoul")
+
+    day_start = user_repo.usage_day_start()
+
+    assert day_start.tzinfo is None
+    assert (day_start.hour, day_start.minute) == (15, 0)
+    assert timedelta(0) <= utc_now() - day_start < timedelta(days=1)
+
+
+def test_is_new_usage_day_uses_reset_boundary(monkeypatch):
+    """리셋 경계 직전/직후 요청 판별"""
+    monkeypatch.setattr(user_repo.Config, "USAGE_RESET_TIMEZONE", "America/New_York")
+    day_start = user_repo.usage_day_start()
+
+    assert user_repo.is_new_usage_day(None)
+    assert user_repo.is_new_usage_day(day_start - timedelta(minutes=1))
+    assert not user_repo.is_new_usage_day(day_start + timedelta(minutes=1))
+
+
+@pytest.mark.asyncio
+async def test_consume_daily_requests_resets_by_reset_timezone(clean_test_session: AsyncSession, monkeypatch):
+    """UTC 기준으로는 같은 날이어도 리셋 타임존 기준 새 날이면 리셋"""
+    monkeypatch.setattr(user_repo.Config, "USAGE_RESET_TIMEZONE", "Asia/Seoul")
+    day_start = user_repo.usage_day_start()
+    user = await user_repo.create_user(
+        clean_test_session,
+        UserSchema(
+            username="tz_reset_user",
+            password_hash="hash",
+            daily_requests=100,
+            last_request_date=day_start - timedelta(minutes=1),
+            is_active=True
+        )
+    )
+
+    updated = await user_repo.consume_daily_requests(clean_test_session, user.id, 1, 100)
+
+    assert updated is not None
+    assert updated.daily_requests == 1
+
+
+@pytest.mark.asyncio
+async def test_consume_daily_requests_returns_none_at_limit(clean_test_session: AsyncSession):
+    """제한에 도달하면 갱신하지 않고 None"""
+    user = await user_repo.create_user(
+        clean_test_session,
+        UserSchema(
+            username="limit_user",
+            password_hash="hash",
+            daily_requests=100,
+            daily_request_limit=100,
+            last_request_date=utc_now(),
+            is_active=True
+        )
+    )
+
+    assert await user_repo.consume_daily_requests(clean_test_session, user.id, 1, 100) is None
+    assert (await user_repo.get_user_by_id(clean_test_session, user.id)).daily_requests == 100
@@ -653,3 +653,109 @@ if __name__ == "__main__":
     print("실제 테스트 DB를 사용한 서비스 레이어 검증")
     print("\n테스트 실행:")
     print("uv run pytest src/tests/user/test_user_services.py -v")
+
+
+# =============================================================================
+# 원자적 사용량 증가 테스트
+# =============================================================================
+
+@pytest.mark.asyncio
+async def test_update_user_usage_stops_exactly_at_limit(clean_test_session: AsyncSession):
+    """제한 직전 사용자는 한 번만 증가하고 이후 요청은 카운터 변경 없이 거부"""
+    user = await create_test_user_directly(
+        clean_test_session,
+        username=generate_unique_username("at_limit"),
+        daily_requests=99,
+        last_request_date=utc_now()
+    )
+
+    result = await user_service.update_user_usage(
+        clean_test_session, UserUsageUpdateDTO(user_id=user.id, increment_requests=1)
+    )
+    assert result.daily_requests == 100
+    assert result.remaining_requests == 0
+
+    with pytest.raises(UserUsageLimitError):
+        await user_service.update_user_usage(
+            clean_test_session, UserUsageUpdateDTO(user_id=user.id, increment_requests=1)
+        )
+
+    usage = await user_service.get_user_usage(clean_test_session, user.id)
+    assert usage.daily_requests == 100
+
+
+@pytest.mark.asyncio
+async def test_update_user_usage_resets_stale_day_atomically(clean_test_session: AsyncSession):
+    """전날 제한에 도달한 사용자도 새 집계일에는 증가 가능"""
+    user = await create_test_user_directly(
+        clean_test_session,
+        username=generate_unique_username("stale_day"),
+        total_requests=300,
+        daily_requests=100,
+        last_request_date=utc_now() - timedelta(days=2)
+    )
+
+    result = await user_service.update_user_usage(
+        clean_test_session, UserUsageUpdateDTO(user_id=user.id, increment_requests=1)
+    )
+
+    assert result.daily_requests == 1
+    assert result.total_requests == 301
+
+
+@pytest.mark.asyncio
+async def test_update_user_usage_not_found(clean_test_session: AsyncSession):
+    """존재하지 않는 사용자는 UserNotFoundError"""
+    with pytest.raises(UserNotFoundError):
+        await user_service.update_user_usage(
+            clean_test_session, UserUsageUpdateDTO(user_id=999999, increment_requests=1)
+        )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_usage_updates_never_exceed_limit():
+    """동시 요청(별도 세션/트랜잭션)이 일일 제한을 넘기지 못함"""
+    import asyncio
+    from sqlalchemy import delete
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.orm import sessionmaker
+    from config import get_database_url
+    from user.models import UserModel
+
+    engine = create_async_engine(get_database_url(is_test=True), echo=False, pool_size=10)
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with session_factory() as session:
+        user = await create_test_user_directly(
+            session,
+            username=generate_unique_username("concurrent"),
+            daily_requests=95,
+            last_request_date=utc_now()
+        )
+        await session.commit()
+
+    async def consume():
+        async with session_factory() as session:
+            try:
+                await user_service.update_user_usage(
+                    session, UserUsageUpdateDTO(user_id=user.id, increment_requests=1)
+                )
+                await session.commit()
+                return True
+            except UserUsageLimitError:
+                await session.rollback()
+                return False
+
+    try:
+        results = await asyncio.gather(*(consume() for _ in range(10)))
+
+        async with session_factory() as session:
+            usage = await user_service.get_user_usage(session, user.id)
+
+        assert results.count(True) == 5
+        assert usage.daily_requests == 100
+    finally:
+        async with session_factory() as session:
+            await session.execute(delete(UserModel).where(UserModel.id == user.id))
+            await session.commit()
+        await engine.dispose()
@@ -0,0 +1,167 @@
+"""
+인증 principal 캐시
+JWT subject(user_id / email / provider_id) → UserSchema를 짧은 TTL 동안 프로세스 메모리에 보관하여
+인증된 hot path(대시보드 폴링, WebSocket 연결 등)가 요청마다 DB 커넥션을 잡지 않도록 한다.
+
+- 사용자 변경(프로필/활성 상태/권한/일일 제한)은 user.repositories에서 invalidate_principal()로
+  무효화를 예약하고, 트랜잭션 commit 직후(after_commit) 캐시에서 제거한다.
+  commit 전에 지우면 동시 요청이 아직 commit되지 않은 이전 row를 다시 읽어 캐시할 수 있기 때문.
+- 조회 도중 무효화가 일어나면(generation 변경) 조회 결과를 캐시하지 않는다.
+- 다른 워커에는 WebSocket 브로커(WS_BROKER_BACKEND=redis)로 무효화를 전달한다.
+  브로커가 local이면 다른 워커의 캐시는 TTL(AUTH_PRINCIPAL_CACHE_TTL_SECONDS) 동안 stale 가능
+  (비활성화/관리자 권한 회수가 다른 워커에 반영되기까지 최대 TTL).
+- 사용량 카운터(daily_requests 등)는 캐시된 값을 쓰지 말고 user.services 조회를 사용
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from config import Config
+from user.models import UserSchema
+
+# commit 후 무효화할 user id 목록을 보관하는 Session.info 키
+PENDING_INVALIDATIONS_KEY = "principal_invalidations"
+
+InvalidationPublisher = Callable[[int], Awaitable[None]]
+
+
+def principal_cache_key(user_id: Optional[int], email: Optional[str], sub: Optional[str]) -> str:
+    """토큰 subject 기준 캐시 키 (get_user_from_token_data의 조회 우선순위와 동일)
+
+    email은 get_user_by_email이 대소문자를 구분해 조회하므로 정규화하지 않는다
+    (대소문자만 다른 두 토큰이 서로의 principal을 공유하지 않도록).
+    """
+    if user_id:
+        return f"id:{user_id}"
+    if email:
+        return f"email:{email}"
+    return f"sub:{sub}"
+
+
+class PrincipalCache:
+    """TTL + LRU 크기 제한 principal 캐시"""
+
+    def __init__(self):
+        self._entries: "OrderedDict[str, Tuple[float, UserSchema]]" = OrderedDict()
+        self._keys_by_user: Dict[int, Set[str]] = {}
+        # 무효화마다 증가 - 조회 시작 시점 값과 다르면 조회 결과를 캐시하지 않음
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return Config.AUTH_PRINCIPAL_CACHE_TTL_SECONDS > 0
+
+    def get(self, key: str) -> Optional[UserSchema]:
+        if not self.enabled:
+            return None
+
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: str, user: UserSchema, generation: Optional[int] = None) -> None:
+        """generation: 조회 시작 전 self.generation 값 (그 사이 무효화가 있었으면 저장하지 않음)"""
+        if not self.enabled or user.id is None:
+            return
+        if generation is not None and generation != self.generation:
+            return
+
+        self._remove(key)
+        self._entries[key] = (time.monotonic() + Config.AUTH_PRINCIPAL_CACHE_TTL_SECONDS, user)
+        self._keys_by_user.setdefault(user.id, set()).add(key)
+
+        while len(self._entries) > Config.AUTH_PRINCIPAL_CACHE_MAX_SIZE:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+
+    def invalidate_user(self, user_id: int) -> None:
+        self.generation += 1
+        keys = self._keys_by_user.pop(user_id, set())
+        for key in keys:
+            self._entries.pop(key, None)
+        if keys:
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._keys_by_user.clear()
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        user_keys = self._keys_by_user.get(entry[1].id)
+        if user_keys is not None:
+            user_keys.discard(key)
+            if not user_keys:
+                del self._keys_by_user[entry[1].id]
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+principal_cache = PrincipalCache()
+
+
+_invalidation_publisher: Optional[InvalidationPublisher] = None
+_publish_tasks: Set[asyncio.Task] = set()
+
+
+def set_invalidation_publisher(publisher: Optional[InvalidationPublisher]) -> None:
+    """다른 워커로 무효화를 전달할 publisher 등록 (ConnectionManager.start_broker에서 등록)"""
+    global _invalidation_publisher
+    _invalidation_publisher = publisher
+
+
+def invalidate_principal(session, user_id: int) -> None:
+    """사용자 변경 시 해당 사용자의 캐시 무효화를 현재 트랜잭션 commit 이후로 예약"""
+    sync_session = getattr(session, "sync_session", session)
+    sync_session.info.setdefault(PENDING_INVALIDATIONS_KEY, set()).add(user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    user_ids = session.info.pop(PENDING_INVALIDATIONS_KEY, None)
+    if not user_ids:
+        return
+    for user_id in user_ids:
+        principal_cache.invalidate_user(user_id)
+        _publish_invalidation(user_id)
+
+
+def _publish_invalidation(user_id: int) -> None:
+    """after_commit은 동기 hook이므로 publish는 이벤트 루프 task로 실행"""
+    if _invalidation_publisher is None:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    task = loop.create_task(_invalidation_publisher(user_id))
+    _publish_tasks.add(task)
+    task.add_done_callback(_publish_tasks.discard)
+
+
+def get_principal_cache_stats() -> Dict[str, float]:
+    return principal_cache.stats()
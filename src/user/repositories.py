@@ -1,11 +1,40 @@
 from typing import List, Optional, Tuple
-from datetime import datetime
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
 
-from sqlalchemy import select, update, func, or_
+from sqlalchemy import select, update, func, or_, case
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from config import Config
 from user.models import UserModel, UserSchema, UserProfileUpdate
-from common.utils import utc_now, utc_today
+from user.principal_cache import invalidate_principal
+from common.utils import utc_now
+
+
+def usage_day_start() -> datetime:
+    """
+    현재 사용량 집계일의 시작 시각 (USAGE_RESET_TIMEZONE 자정 → naive UTC).
+    last_request_date는 naive UTC로 저장되므로 DB/서버 타임존과 무관하게 이 값과 비교한다.
+    """
+    local_now = datetime.now(ZoneInfo(Config.USAGE_RESET_TIMEZONE))
+    local_midnight = local_now.replace(hour=0, minute=0, second=0, microsecond=0)
+    return local_midnight.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def is_new_usage_day(last_request_date: Optional[datetime], day_start: Optional[datetime] = None) -> bool:
+    """마지막 요청이 현재 집계일 이전이면 True (daily_requests lazy reset 대상)"""
+    if last_request_date is None:
+        return True
+    return last_request_date < (day_start or usage_day_start())
+
+
+def _current_daily_requests(day_start: datetime):
+    """SQL: 집계일이 바뀌었으면 0, 아니면 저장된 daily_requests"""
+    return case(
+        (or_(UserModel.last_request_date.is_(None), UserModel.last_request_date < day_start), 0),
+        else_=UserModel.daily_requests,
+    )
+
 
 async def get_user_by_id(session: AsyncSession, user_id: int) -> Optional[UserSchema]:
     """
@@ -114,42 +143,61 @@ async def update_user_profile(
         .values(**update_data)
     )
     await session.flush()
+    invalidate_principal(session, user_id)
 
     return await get_user_by_id(session, user_id)
 
 
-async def update_user_usage(session: AsyncSession, user_id: int, increment: int = 1) -> Optional[UserSchema]:
+async def consume_daily_requests(
+    session: AsyncSession,
+    user_id: int,
+    increment: int,
+    default_limit: int,
+) -> Optional[UserSchema]:
     """
-    사용자의 사용량을 업데이트합니다.
-    새로운 날짜라면 daily_requests를 리셋하고, 같은 날이라면 증가시킵니다.
+    일일 제한 검사와 사용량 증가를 한 번의 조건부 UPDATE로 처리합니다.
+    행 잠금 후 WHERE 조건을 다시 평가하므로 동시 요청이 제한을 넘길 수 없습니다.
+
+    Returns:
+        갱신된 사용자. 제한 초과 또는 사용자 없음이면 None
     """
-    today = utc_today()
+    day_start = usage_day_start()
+    current_daily = _current_daily_requests(day_start)
+    # daily_request_limit가 0이면 기본값 사용 (services.get_user_usage와 동일한 규칙)
+    daily_limit = func.coalesce(func.nullif(UserModel.daily_request_limit, 0), default_limit)
 
-    # 현재 사용자 정보 조회
-    user = await get_user_by_id(session, user_id)
-    if not user:
-        return None
+    result = await session.execute(
+        update(UserModel)
+        .where(
+            UserModel.id == user_id,
+            current_daily + increment <= daily_limit,
+        )
+        .values(
+            total_requests=UserModel.total_requests + increment,
+            daily_requests=current_daily + increment,
+            last_request_date=utc_now()
+        )
+        .returning(UserModel)
+        .execution_options(populate_existing=True)
+    )
+    user = result.scalar_one_or_none()
+    return user.to_schema() if user else None
 
-    # 날짜 체크 - 새로운 날이면 daily_requests 리셋
-    daily_requests = user.daily_requests
-    if user.last_request_date is None or user.last_request_date.date() < today:
-        daily_requests = 0
 
-    # 사용량 업데이트
+async def refund_daily_requests(session: AsyncSession, user_id: int, decrement: int = 1) -> None:
+    """
+    consume_daily_requests로 선차감한 사용량을 되돌립니다 (응답 실패 시).
+    집계일이 바뀌었으면 이미 0으로 간주되므로 음수가 되지 않도록 0에서 멈춥니다.
+    """
+    day_start = usage_day_start()
     await session.execute(
         update(UserModel)
         .where(UserModel.id == user_id)
         .values(
-            total_requests=UserModel.total_requests + increment,
-            daily_requests=daily_requests + increment,
-            last_request_date=utc_now()
+            total_requests=func.greatest(UserModel.total_requests - decrement, 0),
+            daily_requests=func.greatest(_current_daily_requests(day_start) - decrement, 0),
         )
     )
-    
-    await session.flush()
-
-    # 업데이트된 사용자 정보 반환
-    return await get_user_by_id(session, user_id)
 
 
 async def get_user_usage_stats(session: AsyncSession, user_id: int) -> Optional[dict]:
@@ -160,11 +208,10 @@ async def get_user_usage_stats(session: AsyncSession, user_id: int) -> Optional[
     if not user:
         return None
 
-    today = utc_today()
     daily_requests = user.daily_requests
 
     # 날짜가 바뀌었다면 daily_requests는 0으로 계산
-    if user.last_request_date is None or user.last_request_date.date() < today:
+    if is_new_usage_day(user.last_request_date):
         daily_requests = 0
     
     return {
@@ -201,12 +248,9 @@ async def get_today_total_requests(session: AsyncSession) -> int:
     """
     오늘 총 요청 수를 조회합니다.
     """
-    today = utc_today()
     result = await session.execute(
         select(func.sum(UserModel.daily_requests))
-        .where(
-            UserModel.last_request_date >= datetime.combine(today, datetime.min.time())
-        )
+        .where(UserModel.last_request_date >= usage_day_start())
     )
     return result.scalar() or 0
 
@@ -221,6 +265,7 @@ async def deactivate_user(session: AsyncSession, user_id: int) -> bool:
         .values(is_active=False)
     )
     await session.flush()
+    invalidate_principal(session, user_id)
     return result.rowcount > 0
 
 
@@ -234,6 +279,7 @@ async def activate_user(session: AsyncSession, user_id: int) -> bool:
         .values(is_active=True)
     )
     await session.flush()
+    invalidate_principal(session, user_id)
     return result.rowcount > 0
 
 
@@ -292,6 +338,7 @@ async def update_daily_limit(
         .values(daily_request_limit=limit, updated_at=utc_now())
     )
     await session.flush()
+    invalidate_principal(session, user_id)
 
     result = await session.execute(
         select(UserModel).where(UserModel.id == user_id)
@@ -313,6 +360,7 @@ async def update_admin_status(
         .values(is_admin=is_admin, updated_at=utc_now())
     )
     await session.flush()
+    invalidate_principal(session, user_id)
 
     result = await session.execute(
         select(UserModel).where(UserModel.id == user_id)
@@ -334,6 +382,7 @@ async def update_active_status(
         .values(is_active=is_active, updated_at=utc_now())
     )
     await session.flush()
+    invalidate_principal(session, user_id)
 
     result = await session.execute(
         select(UserModel).where(UserModel.id == user_id)
@@ -18,7 +18,6 @@ from user.exceptions import (
     UserNotFoundError, UserValidationError, UserAuthenticationError,
     UserDuplicateError, UserPasswordError, UserUsageLimitError, UserQueryError
 )
-from common.utils import utc_today
 
 
 # 기본 설정
@@ -256,7 +255,8 @@ async def get_user_usage(session: AsyncSession, user_id: int) -> UserUsageDTO:
 async def update_user_usage(session: AsyncSession, usage_data: UserUsageUpdateDTO) -> UserUsageDTO:
     """
     사용자의 사용량을 업데이트합니다.
-    일일 제한을 초과하면 예외를 발생시킵니다.
+    일일 제한 검사와 증가는 단일 조건부 UPDATE로 원자적으로 처리되며,
+    제한을 초과하면 예외를 발생시킵니다.
     """
     try:
         if not isinstance(usage_data.user_id, int) or usage_data.user_id <= 0:
@@ -265,25 +265,29 @@ async def update_user_usage(session: AsyncSession, usage_data: UserUsageUpdateDT
         if not isinstance(usage_data.increment_requests, int) or usage_data.increment_requests < 0:
             raise UserValidationError("increment_requests", usage_data.increment_requests, "increment_requests must be a non-negative integer")
         
-        # 현재 사용량 조회
-        current_usage = await get_user_usage(session, usage_data.user_id)
-        
-        # 일일 제한 체크
-        new_daily_requests = current_usage.daily_requests + usage_data.increment_requests
-        if new_daily_requests > current_usage.daily_limit:
+        updated_user = await user_repo.consume_daily_requests(
+            session, usage_data.user_id, usage_data.increment_requests, DEFAULT_DAILY_LIMIT,
+        )
+
+        if not updated_user:
+            # 제한 초과 또는 사용자 없음 — 실패 경로에서만 현재 사용량 조회
+            current_usage = await get_user_usage(session, usage_data.user_id)
             raise UserUsageLimitError(
                 current_usage.username or f"user_{usage_data.user_id}",
-                new_daily_requests,
+                current_usage.daily_requests + usage_data.increment_requests,
                 current_usage.daily_limit
             )
-        
-        # 사용량 업데이트
-        updated_user = await user_repo.update_user_usage(session, usage_data.user_id, usage_data.increment_requests)
-        if not updated_user:
-            raise UserNotFoundError(usage_data.user_id, "id")
-        
-        # 업데이트된 사용량 반환
-        return await get_user_usage(session, usage_data.user_id)
+
+        daily_limit = updated_user.daily_request_limit or DEFAULT_DAILY_LIMIT
+        return UserUsageDTO(
+            user_id=updated_user.id,
+            username=updated_user.username,
+            total_requests=updated_user.total_requests,
+            daily_requests=updated_user.daily_requests,
+            last_request_date=updated_user.last_request_date,
+            daily_limit=daily_limit,
+            remaining_requests=max(0, daily_limit - updated_user.daily_requests)
+        )
         
     except (UserValidationError, UserNotFoundError, UserUsageLimitError):
         raise
@@ -504,7 +508,7 @@ async def get_oauth_user_profile(session: AsyncSession, user_id: int) -> UserPro
 
         # 일일 사용량 계산 (날짜가 바뀌었으면 0으로 리셋)
         daily_requests = user.daily_requests
-        if user.last_request_date is None or user.last_request_date.date() < utc_today():
+        if user_repo.is_new_usage_day(user.last_request_date):
             daily_requests = 0
 
         remaining_requests = max(0, user.daily_request_limit - daily_requests)